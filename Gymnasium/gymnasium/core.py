@@ -198,6 +198,38 @@ class Env(Generic[ObsType, ActType]):
         """
         pass
 
+    def get_state(self) -> dict[str, Any]:
+        """Returns a snapshot of the environment's state that can be restored with :meth:`set_state`.
+
+        The snapshot is a dictionary of copies of the state variables, e.g., NumPy arrays, and the state of
+        :attr:`np_random`, such that an environment restored with the snapshot continues identically. This is cheaper
+        than cloning the environment with ``copy.deepcopy``, e.g., for tree search or rollouts from a checkpoint.
+        The state of wrappers, e.g., the elapsed steps of :class:`gymnasium.wrappers.TimeLimit`, is not included.
+
+        Example:
+            >>> import gymnasium as gym
+            >>> env = gym.make("MountainCar-v0")
+            >>> _ = env.reset(seed=123)
+            >>> state = env.get_state()
+            >>> obs, *_ = env.step(0)
+            >>> env.set_state(state)
+            >>> restored_obs, *_ = env.step(0)
+            >>> bool((obs == restored_obs).all())
+            True
+
+        Returns:
+            The environment's state
+        """
+        raise NotImplementedError
+
+    def set_state(self, state: dict[str, Any]):
+        """Restores the environment's state from a snapshot of :meth:`get_state`.
+
+        Args:
+            state: The environment's state
+        """
+        raise NotImplementedError
+
     @property
     def unwrapped(self) -> Env[ObsType, ActType]:
         """Returns the base non-wrapped environment.
@@ -340,6 +372,14 @@ class Wrapper(
         """Closes the wrapper and :attr:`env`."""
         return self.env.close()
 
+    def get_state(self) -> dict[str, Any]:
+        """Uses the :meth:`get_state` of the :attr:`env`."""
+        return self.env.get_state()
+
+    def set_state(self, state: dict[str, Any]):
+        """Uses the :meth:`set_state` of the :attr:`env`."""
+        self.env.set_state(state)
+
     @property
     def np_random_seed(self) -> int | None:
         """Returns the base environment's :attr:`np_random_seed`."""
@@ -276,6 +276,7 @@ register(
 register(
     id="HalfCheetah-v5",
     entry_point="gymnasium.envs.mujoco.half_cheetah_v5:HalfCheetahEnv",
+    vector_entry_point="gymnasium.envs.mujoco.half_cheetah_v5:HalfCheetahVectorEnv",
     max_episode_steps=1000,
     reward_threshold=4800.0,
 )
@@ -294,6 +295,7 @@ register(
 register(
     id="Hopper-v5",
     entry_point="gymnasium.envs.mujoco.hopper_v5:HopperEnv",
+    vector_entry_point="gymnasium.envs.mujoco.hopper_v5:HopperVectorEnv",
     max_episode_steps=1000,
     reward_threshold=3800.0,
 )
@@ -312,6 +314,7 @@ register(
 register(
     id="Swimmer-v5",
     entry_point="gymnasium.envs.mujoco.swimmer_v5:SwimmerEnv",
+    vector_entry_point="gymnasium.envs.mujoco.swimmer_v5:SwimmerVectorEnv",
     max_episode_steps=1000,
     reward_threshold=360.0,
 )
@@ -329,6 +332,7 @@ register(
 register(
     id="Walker2d-v5",
     entry_point="gymnasium.envs.mujoco.walker2d_v5:Walker2dEnv",
+    vector_entry_point="gymnasium.envs.mujoco.walker2d_v5:Walker2dVectorEnv",
     max_episode_steps=1000,
 )
 
@@ -346,6 +350,7 @@ register(
 register(
     id="Ant-v5",
     entry_point="gymnasium.envs.mujoco.ant_v5:AntEnv",
+    vector_entry_point="gymnasium.envs.mujoco.ant_v5:AntVectorEnv",
     max_episode_steps=1000,
     reward_threshold=6000.0,
 )
@@ -363,6 +368,7 @@ register(
 register(
     id="Humanoid-v5",
     entry_point="gymnasium.envs.mujoco.humanoid_v5:HumanoidEnv",
+    vector_entry_point="gymnasium.envs.mujoco.humanoid_v5:HumanoidVectorEnv",
     max_episode_steps=1000,
 )
 
@@ -5,7 +5,7 @@ from numpy import cos, pi, sin
 
 import gymnasium as gym
 from gymnasium import Env, spaces
-from gymnasium.envs.classic_control import utils
+from gymnasium.envs.classic_control import rendering, utils
 from gymnasium.error import DependencyNotInstalled
 
 
@@ -174,6 +174,7 @@ class AcrobotEnv(Env):
         self.render_mode = render_mode
         self.screen = None
         self.clock = None
+        self.background = None
         self.isopen = True
         high = np.array(
             [1.0, 1.0, 1.0, 1.0, self.MAX_VEL_1, self.MAX_VEL_2], dtype=np.float32
@@ -277,6 +278,19 @@ class AcrobotEnv(Env):
         ddtheta1 = -(d2 * ddtheta2 + phi1) / d1
         return dtheta1, dtheta2, ddtheta1, ddtheta2, 0.0
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert self.state is not None, "Call reset before using get_state method."
+        return {
+            "state": np.array(self.state),
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.state = np.array(state["state"])
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -307,8 +321,6 @@ class AcrobotEnv(Env):
         if self.clock is None:
             self.clock = pygame.time.Clock()
 
-        surf = pygame.Surface((self.SCREEN_DIM, self.SCREEN_DIM))
-        surf.fill((255, 255, 255))
         s = self.state
 
         bound = self.LINK_LENGTH_1 + self.LINK_LENGTH_2 + 0.2  # 2.2 for default
@@ -318,6 +330,18 @@ class AcrobotEnv(Env):
         if s is None:
             return None
 
+        # The horizontal line is static, so is only drawn once onto a cached background
+        if self.background is None:
+            self.background = pygame.Surface((self.SCREEN_DIM, self.SCREEN_DIM))
+            self.background.fill((255, 255, 255))
+            pygame.draw.line(
+                self.background,
+                start_pos=(-2.2 * scale + offset, 1 * scale + offset),
+                end_pos=(2.2 * scale + offset, 1 * scale + offset),
+                color=(0, 0, 0),
+            )
+        surf = self.background.copy()
+
         p1 = [
             -self.LINK_LENGTH_1 * cos(s[0]) * scale,
             self.LINK_LENGTH_1 * sin(s[0]) * scale,
@@ -332,13 +356,6 @@ class AcrobotEnv(Env):
         thetas = [s[0] - pi / 2, s[0] + s[1] - pi / 2]
         link_lengths = [self.LINK_LENGTH_1 * scale, self.LINK_LENGTH_2 * scale]
 
-        pygame.draw.line(
-            surf,
-            start_pos=(-2.2 * scale + offset, 1 * scale + offset),
-            end_pos=(2.2 * scale + offset, 1 * scale + offset),
-            color=(0, 0, 0),
-        )
-
         for (x, y), th, llen in zip(xys, thetas, link_lengths):
             x = x + offset
             y = y + offset
@@ -364,9 +381,7 @@ class AcrobotEnv(Env):
             pygame.display.flip()
 
         elif self.render_mode == "rgb_array":
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.screen)
 
     def close(self):
         if self.screen is not None:
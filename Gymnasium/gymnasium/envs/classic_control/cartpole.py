@@ -11,7 +11,7 @@ import numpy as np
 
 import gymnasium as gym
 from gymnasium import logger, spaces
-from gymnasium.envs.classic_control import utils
+from gymnasium.envs.classic_control import rendering, utils
 from gymnasium.error import DependencyNotInstalled
 from gymnasium.vector import AutoresetMode, VectorEnv
 from gymnasium.vector.utils import batch_space
@@ -244,6 +244,21 @@ class CartPoleEnv(gym.Env[np.ndarray, Union[int, np.ndarray]]):
             self.render()
         return np.array(self.state, dtype=np.float32), {}
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert self.state is not None, "Call reset before using get_state method."
+        return {
+            "state": np.array(self.state),
+            "steps_beyond_terminated": self.steps_beyond_terminated,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.state = np.array(state["state"])
+        self.steps_beyond_terminated = state["steps_beyond_terminated"]
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -338,9 +353,7 @@ class CartPoleEnv(gym.Env[np.ndarray, Union[int, np.ndarray]]):
             pygame.display.flip()
 
         elif self.render_mode == "rgb_array":
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.screen)
 
     def close(self):
         if self.screen is not None:
@@ -412,8 +425,6 @@ class CartPoleVectorEnv(VectorEnv):
 
         self.screen_width = 600
         self.screen_height = 400
-        self.screens = None
-        self.surf = None
 
         self.steps_beyond_terminated = None
 
@@ -503,7 +514,32 @@ class CartPoleVectorEnv(VectorEnv):
 
         return self.state.T.astype(np.float32), {}
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the batched state of the sub-environments, see :meth:`gymnasium.vector.VectorEnv.get_state`."""
+        assert self.state is not None, "Call reset before using get_state method."
+        return {
+            "state": np.array(self.state),
+            "steps": np.array(self.steps),
+            "prev_done": np.array(self.prev_done),
+            "low": self.low,
+            "high": self.high,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the batched state of the sub-environments from a snapshot of :meth:`get_state`."""
+        self.state = np.array(state["state"])
+        self.steps = np.array(state["steps"])
+        self.prev_done = np.array(state["prev_done"])
+        self.low, self.high = state["low"], state["high"]
+        self.np_random.bit_generator.state = state["np_random"]
+
+    def autoreset_next_step(self, env_mask: np.ndarray):
+        """Marks the sub-environments of ``env_mask`` to be reset on the next step, see :meth:`gymnasium.vector.VectorEnv.autoreset_next_step`."""
+        self.prev_done = np.logical_or(self.prev_done, env_mask)
+
     def render(self):
+        """Renders the sub-environments' frames together with NumPy rasterization (without anti-aliasing)."""
         if self.render_mode is None:
             assert self.spec is not None
             gym.logger.warn(
@@ -513,22 +549,11 @@ class CartPoleVectorEnv(VectorEnv):
             )
             return
 
-        try:
-            import pygame
-            from pygame import gfxdraw
-        except ImportError:
-            raise DependencyNotInstalled(
-                'pygame is not installed, run `pip install "gymnasium[classic_control]"`'
+        if self.state is None:
+            raise ValueError(
+                "Cartpole's state is None, it probably hasn't be reset yet."
             )
 
-        if self.screens is None:
-            pygame.init()
-
-            self.screens = [
-                pygame.Surface((self.screen_width, self.screen_height))
-                for _ in range(self.num_envs)
-            ]
-
         world_width = self.x_threshold * 2
         scale = self.screen_width / world_width
         polewidth = 10.0
@@ -536,68 +561,57 @@ class CartPoleVectorEnv(VectorEnv):
         cartwidth = 50.0
         cartheight = 30.0
 
-        if self.state is None:
-            raise ValueError(
-                "Cartpole's state is None, it probably hasn't be reset yet."
-            )
-
-        for x, screen in zip(self.state.T, self.screens):
-            assert isinstance(x, np.ndarray) and x.shape == (4,)
-
-            self.surf = pygame.Surface((self.screen_width, self.screen_height))
-            self.surf.fill((255, 255, 255))
-
-            l, r, t, b = -cartwidth / 2, cartwidth / 2, cartheight / 2, -cartheight / 2
-            axleoffset = cartheight / 4.0
-            cartx = x[0] * scale + self.screen_width / 2.0  # MIDDLE OF CART
-            carty = 100  # TOP OF CART
-            cart_coords = [(l, b), (l, t), (r, t), (r, b)]
-            cart_coords = [(c[0] + cartx, c[1] + carty) for c in cart_coords]
-            gfxdraw.aapolygon(self.surf, cart_coords, (0, 0, 0))
-            gfxdraw.filled_polygon(self.surf, cart_coords, (0, 0, 0))
-
-            l, r, t, b = (
-                -polewidth / 2,
-                polewidth / 2,
-                polelen - polewidth / 2,
-                -polewidth / 2,
-            )
-
-            pole_coords = []
-            for coord in [(l, b), (l, t), (r, t), (r, b)]:
-                coord = pygame.math.Vector2(coord).rotate_rad(-x[2])
-                coord = (coord[0] + cartx, coord[1] + carty + axleoffset)
-                pole_coords.append(coord)
-            gfxdraw.aapolygon(self.surf, pole_coords, (202, 152, 101))
-            gfxdraw.filled_polygon(self.surf, pole_coords, (202, 152, 101))
-
-            gfxdraw.aacircle(
-                self.surf,
-                int(cartx),
-                int(carty + axleoffset),
-                int(polewidth / 2),
-                (129, 132, 203),
-            )
-            gfxdraw.filled_circle(
-                self.surf,
-                int(cartx),
-                int(carty + axleoffset),
-                int(polewidth / 2),
-                (129, 132, 203),
-            )
+        frames = np.full(
+            (self.num_envs, self.screen_height, self.screen_width, 3),
+            255,
+            dtype=np.uint8,
+        )
+        # The frames are drawn upside down, equivalent to flipping the pygame surface
+        flip_y = self.screen_height - 1
 
-            gfxdraw.hline(self.surf, 0, self.screen_width, carty, (0, 0, 0))
+        l, r, t, b = -cartwidth / 2, cartwidth / 2, cartheight / 2, -cartheight / 2
+        axleoffset = cartheight / 4.0
+        cartx = self.state[0] * scale + self.screen_width / 2.0  # MIDDLE OF CART
+        carty = 100  # TOP OF CART
+        cart_coords = np.array([(l, b), (l, t), (r, t), (r, b)])
+        cart_coords = (
+            cart_coords
+            + np.stack([cartx, np.full(self.num_envs, carty)], axis=-1)[:, None, :]
+        )
+        cart_coords[..., 1] = flip_y - cart_coords[..., 1]
+        rendering.fill_polygons(frames, cart_coords, (0, 0, 0))
 
-            self.surf = pygame.transform.flip(self.surf, False, True)
-            screen.blit(self.surf, (0, 0))
+        l, r, t, b = (
+            -polewidth / 2,
+            polewidth / 2,
+            polelen - polewidth / 2,
+            -polewidth / 2,
+        )
+        # Equivalent to `pygame.math.Vector2.rotate_rad(-theta)` for each of the corners
+        cos, sin = np.cos(-self.state[2]), np.sin(-self.state[2])
+        corners = np.array([(l, b), (l, t), (r, t), (r, b)])
+        pole_coords = np.stack(
+            [
+                corners[:, 0] * cos[:, None] - corners[:, 1] * sin[:, None],
+                corners[:, 0] * sin[:, None] + corners[:, 1] * cos[:, None],
+            ],
+            axis=-1,
+        )
+        pole_coords[..., 0] += cartx[:, None]
+        pole_coords[..., 1] = flip_y - (pole_coords[..., 1] + carty + axleoffset)
+        rendering.fill_polygons(frames, pole_coords, (202, 152, 101))
 
-        return [
-            np.transpose(np.array(pygame.surfarray.pixels3d(screen)), axes=(1, 0, 2))
-            for screen in self.screens
-        ]
+        axle_centers = np.stack(
+            [
+                cartx.astype(int),
+                np.full(self.num_envs, flip_y - int(carty + axleoffset)),
+            ],
+            axis=-1,
+        )
+        rendering.fill_circles(
+            frames, axle_centers, int(polewidth / 2), (129, 132, 203)
+        )
 
-    def close(self):
-        if self.screens is not None:
-            import pygame
+        frames[:, flip_y - carty] = 0
 
-            pygame.quit()
+        return frames
@@ -19,7 +19,7 @@ import numpy as np
 
 import gymnasium as gym
 from gymnasium import spaces
-from gymnasium.envs.classic_control import utils
+from gymnasium.envs.classic_control import rendering, utils
 from gymnasium.error import DependencyNotInstalled
 
 
@@ -138,6 +138,7 @@ class Continuous_MountainCarEnv(gym.Env):
         self.screen_height = 400
         self.screen = None
         self.clock = None
+        self.background = None
         self.isopen = True
 
         self.action_space = spaces.Box(
@@ -196,6 +197,19 @@ class Continuous_MountainCarEnv(gym.Env):
     def _height(self, xs):
         return np.sin(3 * xs) * 0.45 + 0.55
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert self.state is not None, "Call reset before using get_state method."
+        return {
+            "state": np.array(self.state),
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.state = np.array(state["state"])
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -231,16 +245,38 @@ class Continuous_MountainCarEnv(gym.Env):
         carwidth = 40
         carheight = 20
 
-        self.surf = pygame.Surface((self.screen_width, self.screen_height))
-        self.surf.fill((255, 255, 255))
+        # The track and the flag are static, so are only drawn once onto a cached background
+        if self.background is None:
+            self.background = pygame.Surface((self.screen_width, self.screen_height))
+            self.background.fill((255, 255, 255))
 
-        pos = self.state[0]
+            xs = np.linspace(self.min_position, self.max_position, 100)
+            ys = self._height(xs)
+            xys = list(zip((xs - self.min_position) * scale, ys * scale))
+
+            pygame.draw.aalines(
+                self.background, points=xys, closed=False, color=(0, 0, 0)
+            )
+
+            flagx = int((self.goal_position - self.min_position) * scale)
+            flagy1 = int(self._height(self.goal_position) * scale)
+            flagy2 = flagy1 + 50
+            gfxdraw.vline(self.background, flagx, flagy1, flagy2, (0, 0, 0))
 
-        xs = np.linspace(self.min_position, self.max_position, 100)
-        ys = self._height(xs)
-        xys = list(zip((xs - self.min_position) * scale, ys * scale))
+            gfxdraw.aapolygon(
+                self.background,
+                [(flagx, flagy2), (flagx, flagy2 - 10), (flagx + 25, flagy2 - 5)],
+                (204, 204, 0),
+            )
+            gfxdraw.filled_polygon(
+                self.background,
+                [(flagx, flagy2), (flagx, flagy2 - 10), (flagx + 25, flagy2 - 5)],
+                (204, 204, 0),
+            )
 
-        pygame.draw.aalines(self.surf, points=xys, closed=False, color=(0, 0, 0))
+        self.surf = self.background.copy()
+
+        pos = self.state[0]
 
         clearance = 10
 
@@ -272,22 +308,6 @@ class Continuous_MountainCarEnv(gym.Env):
                 self.surf, wheel[0], wheel[1], int(carheight / 2.5), (128, 128, 128)
             )
 
-        flagx = int((self.goal_position - self.min_position) * scale)
-        flagy1 = int(self._height(self.goal_position) * scale)
-        flagy2 = flagy1 + 50
-        gfxdraw.vline(self.surf, flagx, flagy1, flagy2, (0, 0, 0))
-
-        gfxdraw.aapolygon(
-            self.surf,
-            [(flagx, flagy2), (flagx, flagy2 - 10), (flagx + 25, flagy2 - 5)],
-            (204, 204, 0),
-        )
-        gfxdraw.filled_polygon(
-            self.surf,
-            [(flagx, flagy2), (flagx, flagy2 - 10), (flagx + 25, flagy2 - 5)],
-            (204, 204, 0),
-        )
-
         self.surf = pygame.transform.flip(self.surf, False, True)
         self.screen.blit(self.surf, (0, 0))
         if self.render_mode == "human":
@@ -296,9 +316,7 @@ class Continuous_MountainCarEnv(gym.Env):
             pygame.display.flip()
 
         elif self.render_mode == "rgb_array":
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.screen)
 
     def close(self):
         if self.screen is not None:
@@ -6,7 +6,7 @@ import numpy as np
 
 import gymnasium as gym
 from gymnasium import spaces
-from gymnasium.envs.classic_control import utils
+from gymnasium.envs.classic_control import rendering, utils
 from gymnasium.error import DependencyNotInstalled
 
 
@@ -113,6 +113,7 @@ class PendulumEnv(gym.Env):
         self.screen_dim = 500
         self.screen = None
         self.clock = None
+        self.clockwise_img = None
         self.isopen = True
 
         high = np.array([1.0, 1.0, self.max_speed], dtype=np.float32)
@@ -171,6 +172,21 @@ class PendulumEnv(gym.Env):
         theta, thetadot = self.state
         return np.array([np.cos(theta), np.sin(theta), thetadot], dtype=np.float32)
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert self.state is not None, "Call reset before using get_state method."
+        return {
+            "state": np.array(self.state),
+            "last_u": self.last_u,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.state = np.array(state["state"])
+        self.last_u = state["last_u"]
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -235,11 +251,12 @@ class PendulumEnv(gym.Env):
             self.surf, rod_end[0], rod_end[1], int(rod_width / 2), (204, 77, 77)
         )
 
-        fname = path.join(path.dirname(__file__), "assets/clockwise.png")
-        img = pygame.image.load(fname)
+        if self.clockwise_img is None:
+            fname = path.join(path.dirname(__file__), "assets/clockwise.png")
+            self.clockwise_img = pygame.image.load(fname)
         if self.last_u is not None:
             scale_img = pygame.transform.smoothscale(
-                img,
+                self.clockwise_img,
                 (
                     float(scale * np.abs(self.last_u) / 2),
                     float(scale * np.abs(self.last_u) / 2),
@@ -267,9 +284,7 @@ class PendulumEnv(gym.Env):
             pygame.display.flip()
 
         else:  # mode == "rgb_array":
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.screen)
 
     def close(self):
         if self.screen is not None:
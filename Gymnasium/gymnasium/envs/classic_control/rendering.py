@@ -0,0 +1,93 @@
+"""
+Rendering utilities for the classic control environments.
+
+The batch functions rasterize the few primitives used by the classic control environments (filled convex polygons
+and filled circles) directly into a ``(num_envs, height, width, 3)`` uint8 array with NumPy, such that vector
+environments can render all of their sub-environments at once without pygame. Horizontal lines, e.g., the cart pole
+track, are set directly by indexing the rows of the frames.
+The coordinates follow pygame's, i.e., ``(x, y)`` is column ``x`` and row ``y`` of the frame.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def surface_to_rgb_array(surface: Any) -> np.ndarray:
+    """Copies the pixels of a pygame surface into a new contiguous ``(height, width, 3)`` uint8 array."""
+    import pygame
+
+    width, height = surface.get_size()
+    # SDL converts the surface row-major, avoiding the transpose of `pygame.surfarray.pixels3d`
+    buffer = bytearray(pygame.image.tobytes(surface, "RGB"))
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 3)
+
+
+def fill_polygons(
+    frames: np.ndarray, vertices: np.ndarray, color: tuple[int, int, int]
+):
+    """Fills a convex polygon in each of the frames using scanlines.
+
+    Args:
+        frames: The ``(num_envs, height, width, 3)`` frames to draw on
+        vertices: The ``(num_envs, num_vertices, 2)`` vertices of each frame's polygon, in order
+        color: The polygon RGB color
+    """
+    num_frames, height, width = frames.shape[:3]
+    vertices = np.asarray(vertices, dtype=np.float64)
+    assert vertices.shape[0] == num_frames and vertices.shape[2] == 2
+
+    # Only the rows and columns covered by any of the polygons are rasterized
+    x_min, y_min = np.maximum(np.floor(vertices.min(axis=(0, 1))).astype(int), 0)
+    x_max, y_max = np.minimum(
+        np.ceil(vertices.max(axis=(0, 1))).astype(int) + 1, (width, height)
+    )
+    if x_min >= x_max or y_min >= y_max:
+        return
+    xs = np.arange(x_min, x_max)
+    ys = np.arange(y_min, y_max)
+
+    # For each edge and row, the column at which the edge crosses the row (if it does)
+    start = vertices[:, :, None, :]
+    delta = np.roll(vertices, -1, axis=1)[:, :, None, :] - start
+    non_horizontal = delta[..., 1] != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (ys - start[..., 1]) / np.where(non_horizontal, delta[..., 1], 1)
+    crosses = non_horizontal & (t >= 0) & (t <= 1)
+    crossing_xs = start[..., 0] + t * delta[..., 0]
+
+    # As the polygons are convex, each row is filled between the left-most and right-most crossing
+    left = np.where(crosses, crossing_xs, np.inf).min(axis=1)
+    right = np.where(crosses, crossing_xs, -np.inf).max(axis=1)
+    mask = (xs >= np.round(left)[..., None]) & (xs <= np.round(right)[..., None])
+
+    frames[:, y_min:y_max, x_min:x_max][mask] = color
+
+
+def fill_circles(
+    frames: np.ndarray, centers: np.ndarray, radius: int, color: tuple[int, int, int]
+):
+    """Fills a circle in each of the frames.
+
+    Args:
+        frames: The ``(num_envs, height, width, 3)`` frames to draw on
+        centers: The ``(num_envs, 2)`` integer centers of each frame's circle
+        radius: The circle radius, in pixels
+        color: The circle RGB color
+    """
+    num_frames, height, width = frames.shape[:3]
+    centers = np.asarray(centers, dtype=np.int64)
+    assert centers.shape == (num_frames, 2)
+
+    offsets = np.arange(-radius, radius + 1)
+    dy, dx = np.meshgrid(offsets, offsets, indexing="ij")
+    disk = dx**2 + dy**2 <= radius**2
+
+    xs = centers[:, 0:1] + dx[disk]
+    ys = centers[:, 1:2] + dy[disk]
+    frame_index = np.broadcast_to(np.arange(num_frames)[:, None], xs.shape)
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+
+    frames[frame_index[inside], ys[inside], xs[inside]] = color
@@ -4,7 +4,9 @@ import numpy as np
 
 from gymnasium import utils
 from gymnasium.envs.mujoco import MujocoEnv
+from gymnasium.envs.mujoco.mujoco_env import MujocoVectorEnv
 from gymnasium.spaces import Box
+from gymnasium.vector.utils import batch_space
 
 
 DEFAULT_CAMERA_CONFIG = {
@@ -192,6 +194,18 @@ class AntEnv(MujocoEnv, utils.EzPickle):
     |`include_cfrc_ext_in_observation`           | **bool**   | `True`       | Whether to include *cfrc_ext* elements in the observations (see `Observation State` section)                                                                                                                |
     |`use_contact_forces` (`v4` only)            | **bool**   | `False`      | If `True`, it extends the observation space by adding contact forces (see `Observation Space` section) and includes contact_cost to the reward function (see `Rewards` section)                             |
 
+    ## Vectorized environment
+    `AntVectorEnv` steps all sub-environments in a single process on a thread pool sharing one `MjModel`,
+    it supports the same arguments as above along with `num_threads`.
+
+    ```python
+    >>> import gymnasium as gym
+    >>> envs = gym.make_vec("Ant-v5", num_envs=64, vectorization_mode="vector_entry_point")  # doctest: +SKIP
+    >>> envs  # doctest: +SKIP
+    AntVectorEnv(Ant-v5, num_envs=64)
+
+    ```
+
     ## Version History
     * v5:
         - Minimum `mujoco` version is now 2.3.3.
@@ -427,3 +441,175 @@ class AntEnv(MujocoEnv, utils.EzPickle):
             "y_position": self.data.qpos[1],
             "distance_from_origin": np.linalg.norm(self.data.qpos[0:2], ord=2),
         }
+
+
+class AntVectorEnv(MujocoVectorEnv):
+    """Vectorized version of :class:`AntEnv`, see its documentation for the arguments."""
+
+    data_fields = ("qpos", "qvel", "xpos", "cfrc_ext")
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        xml_file: str = "ant.xml",
+        frame_skip: int = 5,
+        default_camera_config: dict[str, float | int] = DEFAULT_CAMERA_CONFIG,
+        forward_reward_weight: float = 1,
+        ctrl_cost_weight: float = 0.5,
+        contact_cost_weight: float = 5e-4,
+        healthy_reward: float = 1.0,
+        main_body: int | str = 1,
+        terminate_when_unhealthy: bool = True,
+        healthy_z_range: tuple[float, float] = (0.2, 1.0),
+        contact_force_range: tuple[float, float] = (-1.0, 1.0),
+        reset_noise_scale: float = 0.1,
+        exclude_current_positions_from_observation: bool = True,
+        include_cfrc_ext_in_observation: bool = True,
+        **kwargs,
+    ):
+        self._forward_reward_weight = forward_reward_weight
+        self._ctrl_cost_weight = ctrl_cost_weight
+        self._contact_cost_weight = contact_cost_weight
+
+        self._healthy_reward = healthy_reward
+        self._terminate_when_unhealthy = terminate_when_unhealthy
+        self._healthy_z_range = healthy_z_range
+
+        self._contact_force_range = contact_force_range
+
+        self._reset_noise_scale = reset_noise_scale
+
+        self._exclude_current_positions_from_observation = (
+            exclude_current_positions_from_observation
+        )
+        self._include_cfrc_ext_in_observation = include_cfrc_ext_in_observation
+
+        MujocoVectorEnv.__init__(
+            self,
+            num_envs,
+            xml_file,
+            frame_skip,
+            single_observation_space=None,  # needs to be defined after
+            default_camera_config=default_camera_config,
+            **kwargs,
+        )
+        self._main_body = self.model.body(main_body).id
+
+        self.metadata = {
+            **self.metadata,
+            "render_fps": int(np.round(1.0 / self.dt)),
+        }
+
+        obs_size = self.model.nq + self.model.nv
+        obs_size -= 2 * exclude_current_positions_from_observation
+        obs_size += (self.model.nbody - 1) * 6 * include_cfrc_ext_in_observation
+
+        self.single_observation_space = Box(
+            low=-np.inf, high=np.inf, shape=(obs_size,), dtype=np.float64
+        )
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+    @property
+    def healthy_reward(self):
+        return self.is_healthy * self._healthy_reward
+
+    def control_cost(self, actions):
+        control_cost = self._ctrl_cost_weight * np.sum(np.square(actions), axis=1)
+        return control_cost
+
+    @property
+    def contact_forces(self):
+        min_value, max_value = self._contact_force_range
+        contact_forces = np.clip(self.cfrc_ext, min_value, max_value)
+        return contact_forces
+
+    @property
+    def contact_cost(self):
+        contact_cost = self._contact_cost_weight * np.sum(
+            np.square(self.contact_forces), axis=(1, 2)
+        )
+        return contact_cost
+
+    @property
+    def is_healthy(self):
+        min_z, max_z = self._healthy_z_range
+        is_healthy = (
+            np.isfinite(self.qpos).all(axis=1)
+            & np.isfinite(self.qvel).all(axis=1)
+            & (min_z <= self.qpos[:, 2])
+            & (self.qpos[:, 2] <= max_z)
+        )
+        return is_healthy
+
+    def step(self, actions):
+        xy_position_before = self.xpos[:, self._main_body, :2].copy()
+        self.do_simulation(actions, self.frame_skip)
+        xy_position_after = self.xpos[:, self._main_body, :2]
+
+        xy_velocity = (xy_position_after - xy_position_before) / self.dt
+        x_velocity, y_velocity = xy_velocity.T
+
+        observations = self._get_obs()
+        rewards, reward_info = self._get_rew(x_velocity, actions)
+        terminations = np.logical_not(self.is_healthy) & self._terminate_when_unhealthy
+        step_info = {
+            "x_velocity": x_velocity,
+            "y_velocity": y_velocity,
+            **reward_info,
+        }
+
+        return self._autoreset_step(observations, rewards, terminations, step_info)
+
+    def _get_rew(self, x_velocity: np.ndarray, actions):
+        forward_reward = x_velocity * self._forward_reward_weight
+        healthy_reward = self.healthy_reward
+        rewards = forward_reward + healthy_reward
+
+        ctrl_cost = self.control_cost(actions)
+        contact_cost = self.contact_cost
+        costs = ctrl_cost + contact_cost
+
+        reward = rewards - costs
+
+        reward_info = {
+            "reward_forward": forward_reward,
+            "reward_ctrl": -ctrl_cost,
+            "reward_contact": -contact_cost,
+            "reward_survive": healthy_reward,
+        }
+
+        return reward, reward_info
+
+    def _get_obs(self):
+        position = self.qpos
+        velocity = self.qvel
+
+        if self._exclude_current_positions_from_observation:
+            position = position[:, 2:]
+
+        if self._include_cfrc_ext_in_observation:
+            contact_force = self.contact_forces[:, 1:].reshape(self.num_envs, -1)
+            return np.concatenate((position, velocity, contact_force), axis=1)
+        else:
+            return np.concatenate((position, velocity), axis=1)
+
+    def sample_reset_state(self, num_resets: int):
+        noise_low = -self._reset_noise_scale
+        noise_high = self._reset_noise_scale
+
+        qpos = self.init_qpos + self.np_random.uniform(
+            low=noise_low, high=noise_high, size=(num_resets, self.model.nq)
+        )
+        qvel = (
+            self.init_qvel
+            + self._reset_noise_scale
+            * self.np_random.standard_normal((num_resets, self.model.nv))
+        )
+        return qpos, qvel
+
+    def _get_reset_info(self):
+        return {
+            "x_position": self.qpos[:, 0].copy(),
+            "y_position": self.qpos[:, 1].copy(),
+            "distance_from_origin": np.linalg.norm(self.qpos[:, 0:2], ord=2, axis=1),
+        }
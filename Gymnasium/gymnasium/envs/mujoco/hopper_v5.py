@@ -4,7 +4,9 @@ import numpy as np
 
 from gymnasium import utils
 from gymnasium.envs.mujoco import MujocoEnv
+from gymnasium.envs.mujoco.mujoco_env import MujocoVectorEnv
 from gymnasium.spaces import Box
+from gymnasium.vector.utils import batch_space
 
 
 DEFAULT_CAMERA_CONFIG = {
@@ -133,6 +135,18 @@ class HopperEnv(MujocoEnv, utils.EzPickle):
     | `reset_noise_scale`                          | **float** | `5e-3`                | Scale of random perturbations of initial position and velocity (see `Starting State` section)                                                                                                               |
     | `exclude_current_positions_from_observation` | **bool**  | `True`                | Whether or not to omit the x-coordinate from observations. Excluding the position can serve as an inductive bias to induce position-agnostic behavior in policies(see `Observation Space` section)          |
 
+    ## Vectorized environment
+    `HopperVectorEnv` steps all sub-environments in a single process on a thread pool sharing one `MjModel`,
+    it supports the same arguments as above along with `num_threads`.
+
+    ```python
+    >>> import gymnasium as gym
+    >>> envs = gym.make_vec("Hopper-v5", num_envs=64, vectorization_mode="vector_entry_point")  # doctest: +SKIP
+    >>> envs  # doctest: +SKIP
+    HopperVectorEnv(Hopper-v5, num_envs=64)
+
+    ```
+
     ## Version History
     * v5:
         - Minimum `mujoco` version is now 2.3.3.
@@ -341,3 +355,146 @@ class HopperEnv(MujocoEnv, utils.EzPickle):
             "x_position": self.data.qpos[0],
             "z_distance_from_origin": self.data.qpos[1] - self.init_qpos[1],
         }
+
+
+class HopperVectorEnv(MujocoVectorEnv):
+    """Vectorized version of :class:`HopperEnv`, see its documentation for the arguments."""
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        xml_file: str = "hopper.xml",
+        frame_skip: int = 4,
+        default_camera_config: dict[str, float | int] = DEFAULT_CAMERA_CONFIG,
+        forward_reward_weight: float = 1.0,
+        ctrl_cost_weight: float = 1e-3,
+        healthy_reward: float = 1.0,
+        terminate_when_unhealthy: bool = True,
+        healthy_state_range: tuple[float, float] = (-100.0, 100.0),
+        healthy_z_range: tuple[float, float] = (0.7, float("inf")),
+        healthy_angle_range: tuple[float, float] = (-0.2, 0.2),
+        reset_noise_scale: float = 5e-3,
+        exclude_current_positions_from_observation: bool = True,
+        **kwargs,
+    ):
+        self._forward_reward_weight = forward_reward_weight
+        self._ctrl_cost_weight = ctrl_cost_weight
+
+        self._healthy_reward = healthy_reward
+        self._terminate_when_unhealthy = terminate_when_unhealthy
+
+        self._healthy_state_range = healthy_state_range
+        self._healthy_z_range = healthy_z_range
+        self._healthy_angle_range = healthy_angle_range
+
+        self._reset_noise_scale = reset_noise_scale
+
+        self._exclude_current_positions_from_observation = (
+            exclude_current_positions_from_observation
+        )
+
+        MujocoVectorEnv.__init__(
+            self,
+            num_envs,
+            xml_file,
+            frame_skip,
+            single_observation_space=None,  # needs to be defined after
+            default_camera_config=default_camera_config,
+            **kwargs,
+        )
+
+        self.metadata = {
+            **self.metadata,
+            "render_fps": int(np.round(1.0 / self.dt)),
+        }
+
+        obs_size = (
+            self.model.nq + self.model.nv - exclude_current_positions_from_observation
+        )
+        self.single_observation_space = Box(
+            low=-np.inf, high=np.inf, shape=(obs_size,), dtype=np.float64
+        )
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+    @property
+    def healthy_reward(self):
+        return self.is_healthy * self._healthy_reward
+
+    def control_cost(self, actions):
+        control_cost = self._ctrl_cost_weight * np.sum(np.square(actions), axis=1)
+        return control_cost
+
+    @property
+    def is_healthy(self):
+        z, angle = self.qpos[:, 1], self.qpos[:, 2]
+        state = np.concatenate((self.qpos[:, 2:], self.qvel), axis=1)
+
+        min_state, max_state = self._healthy_state_range
+        min_z, max_z = self._healthy_z_range
+        min_angle, max_angle = self._healthy_angle_range
+
+        healthy_state = np.all((min_state < state) & (state < max_state), axis=1)
+        healthy_z = (min_z < z) & (z < max_z)
+        healthy_angle = (min_angle < angle) & (angle < max_angle)
+
+        is_healthy = healthy_state & healthy_z & healthy_angle
+
+        return is_healthy
+
+    def _get_obs(self):
+        position = self.qpos
+        velocity = np.clip(self.qvel, -10, 10)
+
+        if self._exclude_current_positions_from_observation:
+            position = position[:, 1:]
+
+        return np.concatenate((position, velocity), axis=1)
+
+    def step(self, actions):
+        x_position_before = self.qpos[:, 0].copy()
+        self.do_simulation(actions, self.frame_skip)
+        x_position_after = self.qpos[:, 0]
+        x_velocity = (x_position_after - x_position_before) / self.dt
+
+        observations = self._get_obs()
+        rewards, reward_info = self._get_rew(x_velocity, actions)
+        terminations = np.logical_not(self.is_healthy) & self._terminate_when_unhealthy
+        step_info = {"x_velocity": x_velocity, **reward_info}
+
+        return self._autoreset_step(observations, rewards, terminations, step_info)
+
+    def _get_rew(self, x_velocity: np.ndarray, actions):
+        forward_reward = self._forward_reward_weight * x_velocity
+        healthy_reward = self.healthy_reward
+        rewards = forward_reward + healthy_reward
+
+        ctrl_cost = self.control_cost(actions)
+        costs = ctrl_cost
+
+        reward = rewards - costs
+
+        reward_info = {
+            "reward_forward": forward_reward,
+            "reward_ctrl": -ctrl_cost,
+            "reward_survive": healthy_reward,
+        }
+
+        return reward, reward_info
+
+    def sample_reset_state(self, num_resets: int):
+        noise_low = -self._reset_noise_scale
+        noise_high = self._reset_noise_scale
+
+        qpos = self.init_qpos + self.np_random.uniform(
+            low=noise_low, high=noise_high, size=(num_resets, self.model.nq)
+        )
+        qvel = self.init_qvel + self.np_random.uniform(
+            low=noise_low, high=noise_high, size=(num_resets, self.model.nv)
+        )
+        return qpos, qvel
+
+    def _get_reset_info(self):
+        return {
+            "x_position": self.qpos[:, 0].copy(),
+            "z_distance_from_origin": self.qpos[:, 1] - self.init_qpos[1],
+        }
@@ -4,7 +4,9 @@ import numpy as np
 
 from gymnasium import utils
 from gymnasium.envs.mujoco import MujocoEnv
+from gymnasium.envs.mujoco.mujoco_env import MujocoVectorEnv
 from gymnasium.spaces import Box
+from gymnasium.vector.utils import batch_space
 
 
 DEFAULT_CAMERA_CONFIG = {
@@ -268,6 +270,18 @@ class HumanoidEnv(MujocoEnv, utils.EzPickle):
     | `include_qfrc_actuator_in_observation`       | **bool**  | `True`           | Whether to include *qfrc_actuator* elements in the observations (see `Observation State` section)                                                                                                           |
     | `include_cfrc_ext_in_observation`            | **bool**  | `True`           | Whether to include *cfrc_ext* elements in the observations (see `Observation State` section)                                                                                                                |
 
+    ## Vectorized environment
+    `HumanoidVectorEnv` steps all sub-environments in a single process on a thread pool sharing one `MjModel`,
+    it supports the same arguments as above along with `num_threads`.
+
+    ```python
+    >>> import gymnasium as gym
+    >>> envs = gym.make_vec("Humanoid-v5", num_envs=64, vectorization_mode="vector_entry_point")  # doctest: +SKIP
+    >>> envs  # doctest: +SKIP
+    HumanoidVectorEnv(Humanoid-v5, num_envs=64)
+
+    ```
+
     ## Version History
     * v5:
         - Minimum `mujoco` version is now 2.3.3.
@@ -540,3 +554,194 @@ class HumanoidEnv(MujocoEnv, utils.EzPickle):
             "tendon_velocity": self.data.ten_velocity,
             "distance_from_origin": np.linalg.norm(self.data.qpos[0:2], ord=2),
         }
+
+
+class HumanoidVectorEnv(MujocoVectorEnv):
+    """Vectorized version of :class:`HumanoidEnv`, see its documentation for the arguments."""
+
+    data_fields = (
+        "qpos",
+        "qvel",
+        "xipos",
+        "cinert",
+        "cvel",
+        "qfrc_actuator",
+        "cfrc_ext",
+        "ten_length",
+        "ten_velocity",
+    )
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        xml_file: str = "humanoid.xml",
+        frame_skip: int = 5,
+        default_camera_config: dict[str, float | int] = DEFAULT_CAMERA_CONFIG,
+        forward_reward_weight: float = 1.25,
+        ctrl_cost_weight: float = 0.1,
+        contact_cost_weight: float = 5e-7,
+        contact_cost_range: tuple[float, float] = (-np.inf, 10.0),
+        healthy_reward: float = 5.0,
+        terminate_when_unhealthy: bool = True,
+        healthy_z_range: tuple[float, float] = (1.0, 2.0),
+        reset_noise_scale: float = 1e-2,
+        exclude_current_positions_from_observation: bool = True,
+        include_cinert_in_observation: bool = True,
+        include_cvel_in_observation: bool = True,
+        include_qfrc_actuator_in_observation: bool = True,
+        include_cfrc_ext_in_observation: bool = True,
+        **kwargs,
+    ):
+        self._forward_reward_weight = forward_reward_weight
+        self._ctrl_cost_weight = ctrl_cost_weight
+        self._contact_cost_weight = contact_cost_weight
+        self._contact_cost_range = contact_cost_range
+        self._healthy_reward = healthy_reward
+        self._terminate_when_unhealthy = terminate_when_unhealthy
+        self._healthy_z_range = healthy_z_range
+
+        self._reset_noise_scale = reset_noise_scale
+
+        self._exclude_current_positions_from_observation = (
+            exclude_current_positions_from_observation
+        )
+
+        self._include_cinert_in_observation = include_cinert_in_observation
+        self._include_cvel_in_observation = include_cvel_in_observation
+        self._include_qfrc_actuator_in_observation = (
+            include_qfrc_actuator_in_observation
+        )
+        self._include_cfrc_ext_in_observation = include_cfrc_ext_in_observation
+
+        MujocoVectorEnv.__init__(
+            self,
+            num_envs,
+            xml_file,
+            frame_skip,
+            single_observation_space=None,  # needs to be defined after
+            default_camera_config=default_camera_config,
+            **kwargs,
+        )
+
+        self.metadata = {
+            **self.metadata,
+            "render_fps": int(np.round(1.0 / self.dt)),
+        }
+
+        obs_size = self.model.nq + self.model.nv
+        obs_size -= 2 * exclude_current_positions_from_observation
+        obs_size += self.cinert[0, 1:].size * include_cinert_in_observation
+        obs_size += self.cvel[0, 1:].size * include_cvel_in_observation
+        obs_size += (self.model.nv - 6) * include_qfrc_actuator_in_observation
+        obs_size += self.cfrc_ext[0, 1:].size * include_cfrc_ext_in_observation
+
+        self.single_observation_space = Box(
+            low=-np.inf, high=np.inf, shape=(obs_size,), dtype=np.float64
+        )
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+    def mass_center(self):
+        """Calculate the batched center of mass of every sub-environment, see :func:`mass_center`."""
+        num = np.einsum("b,nbj->nj", self.model.body_mass, self.xipos)
+        denom = self.model.body_mass.sum()
+        return (num / denom)[:, 0:2]
+
+    @property
+    def healthy_reward(self):
+        return self.is_healthy * self._healthy_reward
+
+    def control_cost(self, actions):
+        control_cost = self._ctrl_cost_weight * np.sum(np.square(self.ctrl), axis=1)
+        return control_cost
+
+    @property
+    def contact_cost(self):
+        contact_cost = self._contact_cost_weight * np.sum(
+            np.square(self.cfrc_ext), axis=(1, 2)
+        )
+        min_cost, max_cost = self._contact_cost_range
+        contact_cost = np.clip(contact_cost, min_cost, max_cost)
+        return contact_cost
+
+    @property
+    def is_healthy(self):
+        min_z, max_z = self._healthy_z_range
+        is_healthy = (min_z < self.qpos[:, 2]) & (self.qpos[:, 2] < max_z)
+        return is_healthy
+
+    def _get_obs(self):
+        position = self.qpos
+        if self._exclude_current_positions_from_observation:
+            position = position[:, 2:]
+
+        observation_parts = [position, self.qvel]
+        if self._include_cinert_in_observation is True:
+            observation_parts.append(self.cinert[:, 1:].reshape(self.num_envs, -1))
+        if self._include_cvel_in_observation is True:
+            observation_parts.append(self.cvel[:, 1:].reshape(self.num_envs, -1))
+        if self._include_qfrc_actuator_in_observation is True:
+            observation_parts.append(self.qfrc_actuator[:, 6:])
+        if self._include_cfrc_ext_in_observation is True:
+            observation_parts.append(self.cfrc_ext[:, 1:].reshape(self.num_envs, -1))
+
+        return np.concatenate(observation_parts, axis=1)
+
+    def step(self, actions):
+        xy_position_before = self.mass_center()
+        self.do_simulation(actions, self.frame_skip)
+        xy_position_after = self.mass_center()
+
+        xy_velocity = (xy_position_after - xy_position_before) / self.dt
+        x_velocity, y_velocity = xy_velocity.T
+
+        observations = self._get_obs()
+        rewards, reward_info = self._get_rew(x_velocity, actions)
+        terminations = np.logical_not(self.is_healthy) & self._terminate_when_unhealthy
+        step_info = {
+            "x_velocity": x_velocity,
+            "y_velocity": y_velocity,
+            **reward_info,
+        }
+
+        return self._autoreset_step(observations, rewards, terminations, step_info)
+
+    def _get_rew(self, x_velocity: np.ndarray, actions):
+        forward_reward = self._forward_reward_weight * x_velocity
+        healthy_reward = self.healthy_reward
+        rewards = forward_reward + healthy_reward
+
+        ctrl_cost = self.control_cost(actions)
+        contact_cost = self.contact_cost
+        costs = ctrl_cost + contact_cost
+
+        reward = rewards - costs
+
+        reward_info = {
+            "reward_survive": healthy_reward,
+            "reward_forward": forward_reward,
+            "reward_ctrl": -ctrl_cost,
+            "reward_contact": -contact_cost,
+        }
+
+        return reward, reward_info
+
+    def sample_reset_state(self, num_resets: int):
+        noise_low = -self._reset_noise_scale
+        noise_high = self._reset_noise_scale
+
+        qpos = self.init_qpos + self.np_random.uniform(
+            low=noise_low, high=noise_high, size=(num_resets, self.model.nq)
+        )
+        qvel = self.init_qvel + self.np_random.uniform(
+            low=noise_low, high=noise_high, size=(num_resets, self.model.nv)
+        )
+        return qpos, qvel
+
+    def _get_reset_info(self):
+        return {
+            "x_position": self.qpos[:, 0].copy(),
+            "y_position": self.qpos[:, 1].copy(),
+            "tendon_length": self.ten_length.copy(),
+            "tendon_velocity": self.ten_velocity.copy(),
+            "distance_from_origin": np.linalg.norm(self.qpos[:, 0:2], ord=2, axis=1),
+        }
@@ -1,4 +1,7 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from os import path
+from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
@@ -6,6 +9,8 @@ from numpy.typing import NDArray
 import gymnasium as gym
 from gymnasium import error, spaces
 from gymnasium.spaces import Space
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
 
 
 try:
@@ -126,11 +131,44 @@ class MujocoEnv(gym.Env):
         data = mujoco.MjData(model)
         return model, data
 
-    def set_state(self, qpos, qvel):
+    def get_state(self) -> dict[str, Any]:
+        """Returns a snapshot of the simulation state that can be restored with :meth:`set_state`.
+
+        The snapshot contains copies of the joints position ``qpos``, velocity ``qvel``, actuator activations ``act``,
+        the simulation ``time`` and the state of :attr:`np_random`.
+        """
+        return {
+            "qpos": np.copy(self.data.qpos),
+            "qvel": np.copy(self.data.qvel),
+            "act": np.copy(self.data.act),
+            "time": self.data.time,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, qpos, qvel=None):
         """Set the joints position qpos and velocity qvel of the model.
 
+        Alternatively, a snapshot of :meth:`get_state` can be passed as the only argument, i.e., ``set_state(state)``,
+        to restore the simulation state and :attr:`np_random`.
+
         Note: `qpos` and `qvel` is not the full physics state for all mujoco models/environments https://mujoco.readthedocs.io/en/stable/APIreference/APItypes.html#mjtstate
         """
+        if isinstance(qpos, dict):
+            assert qvel is None, "Expects only the snapshot of `get_state`"
+            state = qpos
+            assert (
+                state["qpos"].shape == (self.model.nq,)
+                and state["qvel"].shape == (self.model.nv,)
+                and state["act"].shape == (self.model.na,)
+            )
+            self.data.qpos[:] = state["qpos"]
+            self.data.qvel[:] = state["qvel"]
+            self.data.act[:] = state["act"]
+            self.data.time = state["time"]
+            self.np_random.bit_generator.state = state["np_random"]
+            mujoco.mj_forward(self.model, self.data)
+            return
+
         assert qpos.shape == (self.model.nq,) and qvel.shape == (self.model.nv,)
         self.data.qpos[:] = np.copy(qpos)
         self.data.qvel[:] = np.copy(qvel)
@@ -224,3 +262,316 @@ class MujocoEnv(gym.Env):
         return {}
 
     # -----------------------------
+
+
+class MujocoVectorEnv(VectorEnv):
+    """Superclass for MuJoCo based vector environments.
+
+    A single ``MjModel`` is shared by ``num_envs`` ``MjData``, which are stepped on a persistent thread pool
+    (MuJoCo releases the GIL inside ``mj_step``) such that all sub-environments run in one process across all cores.
+    After every step or reset, the ``MjData`` fields named in :attr:`data_fields` are copied into preallocated batched
+    arrays of shape ``(num_envs, *field.shape)``, e.g., ``self.qpos``, for subclasses to compute their observations,
+    rewards and terminations with vectorized NumPy.
+
+    Sub-environments are autoreset on the step after they terminate or truncate (:attr:`AutoresetMode.NEXT_STEP`).
+    """
+
+    metadata = {
+        "render_modes": ["rgb_array", "depth_array"],
+        "autoreset_mode": AutoresetMode.NEXT_STEP,
+    }
+
+    data_fields: tuple[str, ...] = ("qpos", "qvel")
+
+    def __init__(
+        self,
+        num_envs: int,
+        model_path: str,
+        frame_skip: int,
+        single_observation_space: Space | None,
+        max_episode_steps: int | None = None,
+        num_threads: int | None = None,
+        render_mode: str | None = None,
+        width: int = DEFAULT_SIZE,
+        height: int = DEFAULT_SIZE,
+        camera_id: int | None = None,
+        camera_name: str | None = None,
+        default_camera_config: dict[str, float | int] | None = None,
+        max_geom: int = 1000,
+        visual_options: dict[int, bool] = {},
+    ):
+        """Base abstract class for mujoco based vector environments.
+
+        Args:
+            num_envs: The number of sub-environments.
+            model_path: Path to the MuJoCo Model.
+            frame_skip: Number of MuJoCo simulation steps per gym `step()`.
+            single_observation_space: The observation space of a single sub-environment.
+            max_episode_steps: The number of steps after which a sub-environment is truncated, if `None` then never truncated.
+            num_threads: The number of threads stepping the sub-environments, defaults to `min(num_envs, os.cpu_count())`.
+            render_mode: The `render_mode` used.
+            width: The width of the render window.
+            height: The height of the render window.
+            camera_id: The camera ID used.
+            camera_name: The name of the camera used (can not be used in conjunction with `camera_id`).
+            default_camera_config: configuration for rendering camera.
+            max_geom: max number of rendered geometries.
+            visual_options: render flag options.
+
+        Raises:
+            OSError: when the `model_path` does not exist.
+            error.DependencyNotInstalled: When `mujoco` is not installed.
+        """
+        self.fullpath = expand_model_path(model_path)
+
+        self.num_envs = num_envs
+        self.max_episode_steps = max_episode_steps
+        self.width = width
+        self.height = height
+
+        self.model = mujoco.MjModel.from_xml_path(self.fullpath)
+        # MjrContext will copy model.vis.global_.off* to con.off*
+        self.model.vis.global_.offwidth = self.width
+        self.model.vis.global_.offheight = self.height
+        self.datas = [mujoco.MjData(self.model) for _ in range(num_envs)]
+
+        self.init_qpos = self.datas[0].qpos.ravel().copy()
+        self.init_qvel = self.datas[0].qvel.ravel().copy()
+
+        self.frame_skip = frame_skip
+
+        if single_observation_space is not None:
+            self.single_observation_space = single_observation_space
+            self.observation_space = batch_space(single_observation_space, num_envs)
+        bounds = self.model.actuator_ctrlrange.copy().astype(np.float32)
+        low, high = bounds.T
+        self.single_action_space = spaces.Box(low=low, high=high, dtype=np.float32)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        # The batched copies of `data_fields`, each thread only writes the rows of its own sub-environments
+        for name in self.data_fields:
+            field = getattr(self.datas[0], name)
+            setattr(self, name, np.zeros((num_envs, *field.shape), dtype=field.dtype))
+
+        self.ctrl = np.zeros((num_envs, self.model.nu), dtype=np.float64)
+        self._reset_qpos = np.zeros((num_envs, self.model.nq), dtype=np.float64)
+        self._reset_qvel = np.zeros((num_envs, self.model.nv), dtype=np.float64)
+        self._reset_mask = np.zeros(num_envs, dtype=np.bool_)
+
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+        self.prev_done = np.zeros(num_envs, dtype=np.bool_)
+
+        if num_threads is None:
+            num_threads = min(num_envs, os.cpu_count() or 1)
+        self.num_threads = num_threads
+        self._env_chunks = [
+            range(chunk[0], chunk[-1] + 1)
+            for chunk in np.array_split(np.arange(num_envs), num_threads)
+            if len(chunk) > 0
+        ]
+        self._executor = (
+            ThreadPoolExecutor(max_workers=num_threads) if num_threads > 1 else None
+        )
+
+        self.render_mode = render_mode
+        self.camera_name = camera_name
+        self.camera_id = camera_id
+        self._renderer_kwargs = dict(
+            default_cam_config=default_camera_config,
+            width=width,
+            height=height,
+            max_geom=max_geom,
+            camera_id=camera_id,
+            camera_name=camera_name,
+            visual_options=visual_options,
+        )
+        self.mujoco_renderers = None
+
+    @property
+    def dt(self) -> float:
+        return self.model.opt.timestep * self.frame_skip
+
+    def reset(
+        self,
+        *,
+        seed: int | None = None,
+        options: dict | None = None,
+    ):
+        super().reset(seed=seed)
+
+        self._reset_qpos[:], self._reset_qvel[:] = self.sample_reset_state(
+            self.num_envs
+        )
+        self._reset_mask[:] = True
+        self._run_on_threads(self._step_envs)
+
+        self.steps[:] = 0
+        self.prev_done[:] = False
+
+        return self._get_obs(), self._vectorize_info(self._get_reset_info(), {})
+
+    def do_simulation(self, ctrl: NDArray[np.float32], n_frames: int) -> None:
+        """Step the simulation of every sub-environment n number of frames, applying a batch of control actions.
+
+        Sub-environments that terminated or truncated on the previous step are reset rather than stepped.
+        """
+        if np.shape(ctrl) != (self.num_envs, self.model.nu):
+            raise ValueError(
+                f"Action dimension mismatch. Expected {(self.num_envs, self.model.nu)}, found {np.shape(ctrl)}"
+            )
+        self.ctrl[:] = ctrl
+
+        self._reset_mask[:] = self.prev_done
+        num_resets = np.count_nonzero(self.prev_done)
+        if num_resets > 0:
+            qpos, qvel = self.sample_reset_state(num_resets)
+            self._reset_qpos[self.prev_done] = qpos
+            self._reset_qvel[self.prev_done] = qvel
+
+        self._run_on_threads(self._step_envs, n_frames)
+
+    def _run_on_threads(self, fn, *args: Any) -> None:
+        """Runs ``fn(env_indices, *args)`` for every chunk of sub-environments, in parallel if a thread pool is used."""
+        if self._executor is None:
+            for chunk in self._env_chunks:
+                fn(chunk, *args)
+        else:
+            # `list` forces the results such that any exceptions raised in the threads are re-raised
+            list(
+                self._executor.map(
+                    lambda chunk: fn(chunk, *args),
+                    self._env_chunks,
+                )
+            )
+
+    def _step_envs(self, env_indices: range, n_frames: int = 0) -> None:
+        """Resets or steps the sub-environments in ``env_indices`` then copies their :attr:`data_fields`."""
+        for i in env_indices:
+            data = self.datas[i]
+            if self._reset_mask[i]:
+                mujoco.mj_resetData(self.model, data)
+                data.qpos[:] = self._reset_qpos[i]
+                data.qvel[:] = self._reset_qvel[i]
+                if self.model.na == 0:
+                    data.act[:] = None
+                mujoco.mj_forward(self.model, data)
+            else:
+                data.ctrl[:] = self.ctrl[i]
+                mujoco.mj_step(self.model, data, nstep=n_frames)
+                # As of MuJoCo 2.0, force-related quantities like cacc are not computed
+                # unless there's a force sensor in the model.
+                # See https://github.com/openai/gym/issues/1541
+                mujoco.mj_rnePostConstraint(self.model, data)
+
+            for name in self.data_fields:
+                getattr(self, name)[i] = getattr(data, name)
+
+    def _autoreset_step(
+        self,
+        observations: NDArray[np.float64],
+        rewards: NDArray[np.float64],
+        terminations: NDArray[np.bool_],
+        step_info: dict[str, np.ndarray],
+    ) -> tuple[
+        NDArray[np.float64],
+        NDArray[np.float64],
+        NDArray[np.bool_],
+        NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        """Updates the episode step counters and masks out the sub-environments that were autoreset by :meth:`do_simulation`."""
+        autoreset = self._reset_mask
+
+        self.steps += 1
+        self.steps[autoreset] = 0
+        if self.max_episode_steps is None:
+            truncations = np.zeros(self.num_envs, dtype=np.bool_)
+        else:
+            truncations = self.steps >= self.max_episode_steps
+
+        rewards[autoreset] = 0.0
+        terminations[autoreset] = False
+        truncations[autoreset] = False
+
+        self.prev_done = np.logical_or(terminations, truncations)
+
+        infos = self._vectorize_info(self._get_reset_info(), step_info)
+        return observations, rewards, terminations, truncations, infos
+
+    def _vectorize_info(
+        self, reset_info: dict[str, np.ndarray], step_info: dict[str, np.ndarray]
+    ) -> dict[str, Any]:
+        """Adds the `_key` masks to the batched info, `step_info` is only valid for sub-environments that were not reset."""
+        infos = {}
+        for key, value in reset_info.items():
+            infos[key] = value
+            infos[f"_{key}"] = np.ones(self.num_envs, dtype=np.bool_)
+        for key, value in step_info.items():
+            infos[key] = value
+            infos[f"_{key}"] = np.logical_not(self._reset_mask)
+        return infos
+
+    def render(self):
+        """Render a frame from each sub-environment's MuJoCo simulation as specified by the render_mode."""
+        if self.render_mode is None:
+            assert self.spec is not None
+            gym.logger.warn(
+                "You are calling render method without specifying any render mode. "
+                "You can specify the render_mode at initialization, "
+                f'e.g. gym.make_vec("{self.spec.id}", render_mode="rgb_array")'
+            )
+            return
+
+        if self.mujoco_renderers is None:
+            from gymnasium.envs.mujoco.mujoco_rendering import MujocoRenderer
+
+            self.mujoco_renderers = [
+                MujocoRenderer(self.model, data, **self._renderer_kwargs)
+                for data in self.datas
+            ]
+
+        return tuple(
+            renderer.render(self.render_mode) for renderer in self.mujoco_renderers
+        )
+
+    def autoreset_next_step(self, env_mask: NDArray[np.bool_]):
+        """Marks the sub-environments of ``env_mask`` to be reset on the next step, see :meth:`gymnasium.vector.VectorEnv.autoreset_next_step`."""
+        self.prev_done = np.logical_or(self.prev_done, env_mask)
+
+    def close_extras(self, **kwargs: Any):
+        """Close the thread pool and rendering contexts."""
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self.mujoco_renderers is not None:
+            for renderer in self.mujoco_renderers:
+                renderer.close()
+
+    # methods to override:
+    # ----------------------------
+    def step(self, actions: NDArray[np.float32]) -> tuple[
+        NDArray[np.float64],
+        NDArray[np.float64],
+        NDArray[np.bool_],
+        NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        raise NotImplementedError
+
+    def sample_reset_state(
+        self, num_resets: int
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Sample the initial joints positions (qpos) and velocities (qvel) of `num_resets` sub-environments.
+        Implement this in each environment subclass.
+        """
+        raise NotImplementedError
+
+    def _get_obs(self) -> NDArray[np.float64]:
+        """Function that generates the batched observations from the batched :attr:`data_fields`."""
+        raise NotImplementedError
+
+    def _get_reset_info(self) -> dict[str, np.ndarray]:
+        """Function that generates the batched `info` that is returned during a `reset()` or autoreset."""
+        return {}
+
+    # -----------------------------
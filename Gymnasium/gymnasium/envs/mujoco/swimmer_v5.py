@@ -4,7 +4,9 @@ import numpy as np
 
 from gymnasium import utils
 from gymnasium.envs.mujoco import MujocoEnv
+from gymnasium.envs.mujoco.mujoco_env import MujocoVectorEnv
 from gymnasium.spaces import Box
+from gymnasium.vector.utils import batch_space
 
 
 class SwimmerEnv(MujocoEnv, utils.EzPickle):
@@ -121,6 +123,18 @@ class SwimmerEnv(MujocoEnv, utils.EzPickle):
     |`exclude_current_positions_from_observation`| **bool**  | `True`        | Whether or not to omit the x- and y-coordinates from observations. Excluding the position can serve as an inductive bias to induce position-agnostic behavior in policies (see `Observation Space` section) |
 
 
+    ## Vectorized environment
+    `SwimmerVectorEnv` steps all sub-environments in a single process on a thread pool sharing one `MjModel`,
+    it supports the same arguments as above along with `num_threads`.
+
+    ```python
+    >>> import gymnasium as gym
+    >>> envs = gym.make_vec("Swimmer-v5", num_envs=64, vectorization_mode="vector_entry_point")  # doctest: +SKIP
+    >>> envs  # doctest: +SKIP
+    SwimmerVectorEnv(Swimmer-v5, num_envs=64)
+
+    ```
+
     ## Version History
     * v5:
         - Minimum `mujoco` version is now 2.3.3.
@@ -290,3 +304,117 @@ class SwimmerEnv(MujocoEnv, utils.EzPickle):
             "y_position": self.data.qpos[1],
             "distance_from_origin": np.linalg.norm(self.data.qpos[0:2], ord=2),
         }
+
+
+class SwimmerVectorEnv(MujocoVectorEnv):
+    """Vectorized version of :class:`SwimmerEnv`, see its documentation for the arguments."""
+
+    def __init__(
+        self,
+        num_envs: int = 1,
+        xml_file: str = "swimmer.xml",
+        frame_skip: int = 4,
+        default_camera_config: dict[str, float | int] = {},
+        forward_reward_weight: float = 1.0,
+        ctrl_cost_weight: float = 1e-4,
+        reset_noise_scale: float = 0.1,
+        exclude_current_positions_from_observation: bool = True,
+        **kwargs,
+    ):
+        self._forward_reward_weight = forward_reward_weight
+        self._ctrl_cost_weight = ctrl_cost_weight
+
+        self._reset_noise_scale = reset_noise_scale
+
+        self._exclude_current_positions_from_observation = (
+            exclude_current_positions_from_observation
+        )
+
+        MujocoVectorEnv.__init__(
+            self,
+            num_envs,
+            xml_file,
+            frame_skip,
+            single_observation_space=None,  # needs to be defined after
+            default_camera_config=default_camera_config,
+            **kwargs,
+        )
+
+        self.metadata = {
+            **self.metadata,
+            "render_fps": int(np.round(1.0 / self.dt)),
+        }
+
+        obs_size = (
+            self.model.nq
+            + self.model.nv
+            - 2 * exclude_current_positions_from_observation
+        )
+        self.single_observation_space = Box(
+            low=-np.inf, high=np.inf, shape=(obs_size,), dtype=np.float64
+        )
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+
+    def control_cost(self, actions):
+        control_cost = self._ctrl_cost_weight * np.sum(np.square(actions), axis=1)
+        return control_cost
+
+    def step(self, actions):
+        xy_position_before = self.qpos[:, 0:2].copy()
+        self.do_simulation(actions, self.frame_skip)
+        xy_position_after = self.qpos[:, 0:2]
+
+        xy_velocity = (xy_position_after - xy_position_before) / self.dt
+        x_velocity, y_velocity = xy_velocity.T
+
+        observations = self._get_obs()
+        rewards, reward_info = self._get_rew(x_velocity, actions)
+        terminations = np.zeros(self.num_envs, dtype=np.bool_)
+        step_info = {
+            "x_velocity": x_velocity,
+            "y_velocity": y_velocity,
+            **reward_info,
+        }
+
+        return self._autoreset_step(observations, rewards, terminations, step_info)
+
+    def _get_rew(self, x_velocity: np.ndarray, actions):
+        forward_reward = self._forward_reward_weight * x_velocity
+        ctrl_cost = self.control_cost(actions)
+
+        reward = forward_reward - ctrl_cost
+
+        reward_info = {
+            "reward_forward": forward_reward,
+            "reward_ctrl": -ctrl_cost,
+        }
+
+        return reward, reward_info
+
+    def _get_obs(self):
+        position = self.qpos
+        velocity = self.qvel
+
+        if self._exclude_current_positions_from_observation:
+            position = position[:, 2:]
+
+        return np.concatenate((position, velocity), axis=1)
+
+    def sample_reset_state(self, num_resets: int):
+        noise_low = -self._reset_noise_scale
+        noise_high = self._reset_noise_scale
+
+        qpos = self.init_qpos + self.np_random.uniform(
+            low=noise_low, high=noise_high, size=(num_resets, self.model.nq)
+        )
+        qvel = self.init_qvel + self.np_random.uniform(
+            low=noise_low, high=noise_high, size=(num_resets, self.model.nv)
+        )
+        return qpos, qvel
+
+    def _get_reset_info(self):
+        return {
+            "x_position": self.qpos[:, 0].copy(),
+            "y_position": self.qpos[:, 1].copy(),
+            "distance_from_origin": np.linalg.norm(self.qpos[:, 0:2], ord=2, axis=1),
+        }
@@ -250,6 +250,7 @@ class VectorizeMode(Enum):
 
     ASYNC = "async"
     SYNC = "sync"
+    THREADED = "threaded"
     VECTOR_ENTRY_POINT = "vector_entry_point"
 
 
@@ -641,6 +642,7 @@ def make(
     id: str | EnvSpec,
     max_episode_steps: int | None = None,
     disable_env_checker: bool | None = None,
+    fuse_wrappers: bool = False,
     **kwargs: Any,
 ) -> Env:
     """Creates an environment previously registered with :meth:`gymnasium.register` or a :class:`EnvSpec`.
@@ -655,6 +657,8 @@ def make(
             Using ``max_episode_steps=-1`` will not apply the wrapper to the environment.
         disable_env_checker: If to add :class:`gymnasium.wrappers.PassiveEnvChecker`, ``None`` will default to the
             :class:`EnvSpec` ``disable_env_checker`` value otherwise use this value will be used.
+        fuse_wrappers: If to apply :class:`gymnasium.wrappers.FusedWrappers` to the environment, fusing the wrappers
+            into a single ``step`` and ``reset`` function.
         kwargs: Additional arguments to pass to the environment constructor.
 
     Returns:
@@ -821,15 +825,68 @@ def make(
     elif apply_render_collection:
         env = gym.wrappers.RenderCollection(env)
 
+    if fuse_wrappers:
+        env = gym.wrappers.FusedWrappers(env)
+
     return env
 
 
+def _vectorize_mode(
+    env_spec: EnvSpec, vectorization_mode: VectorizeMode | str | None
+) -> VectorizeMode:
+    """Specify the vectorization mode if None or update to a `VectorizeMode` for :func:`make_vec`."""
+    if vectorization_mode is None:
+        if env_spec.vector_entry_point is not None:
+            return VectorizeMode.VECTOR_ENTRY_POINT
+        else:
+            return VectorizeMode.SYNC
+
+    try:
+        return VectorizeMode(vectorization_mode)
+    except ValueError:
+        raise ValueError(
+            f"Invalid vectorization mode: {vectorization_mode!r}, "
+            f"valid modes: {[mode.value for mode in VectorizeMode]}"
+        )
+
+
+def _vector_time_limit_steps(
+    env_spec: EnvSpec,
+    env_spec_kwargs: dict[str, Any],
+    vectorization_mode: VectorizeMode,
+    vector_kwargs: dict[str, Any],
+    wrappers: Sequence[Callable[[Env], Wrapper]],
+) -> int | None:
+    """Returns the max episode steps of the vector :class:`gymnasium.wrappers.vector.TimeLimit` for :func:`make_vec`.
+
+    ``None`` is returned if the episodes aren't limited or the vector ``TimeLimit`` can't be used for the vector environment,
+    i.e., not the ``"sync"``, ``"async"`` or ``"threaded"`` modes, the ``SAME_STEP`` autoreset mode or with ``wrappers`` or spec ``additional_wrappers``.
+    """
+    max_episode_steps = env_spec_kwargs.get("max_episode_steps")
+    if max_episode_steps is None:
+        max_episode_steps = env_spec.max_episode_steps
+
+    if (
+        max_episode_steps is not None
+        and max_episode_steps != -1
+        and vectorization_mode
+        in (VectorizeMode.SYNC, VectorizeMode.ASYNC, VectorizeMode.THREADED)
+        and AutoresetMode(vector_kwargs.get("autoreset_mode", AutoresetMode.NEXT_STEP))
+        in (AutoresetMode.NEXT_STEP, AutoresetMode.DISABLED)
+        and len(wrappers) == 0
+        and len(env_spec.additional_wrappers) == 0
+    ):
+        return max_episode_steps
+    return None
+
+
 def make_vec(
     id: str | EnvSpec,
     num_envs: int = 1,
     vectorization_mode: VectorizeMode | str | None = None,
     vector_kwargs: dict[str, Any] | None = None,
     wrappers: Sequence[Callable[[Env], Wrapper]] | None = None,
+    vector_time_limit: bool = False,
     **kwargs,
 ) -> gym.vector.VectorEnv:
     """Create a vector environment according to the given ID.
@@ -842,9 +899,15 @@ def make_vec(
         num_envs: Number of environments to create
         vectorization_mode: The vectorization method used, defaults to ``None`` such that if env id' spec has a ``vector_entry_point`` (not ``None``),
             this is first used otherwise defaults to ``sync`` to use the :class:`gymnasium.vector.SyncVectorEnv`.
-            Valid modes are ``"async"``, ``"sync"`` or ``"vector_entry_point"``. Recommended to use the :class:`VectorizeMode` enum rather than strings.
+            Valid modes are ``"async"``, ``"sync"``, ``"threaded"`` or ``"vector_entry_point"``. Recommended to use the :class:`VectorizeMode` enum rather than strings.
         vector_kwargs: Additional arguments to pass to the vectorizor environment constructor, i.e., ``SyncVectorEnv(..., **vector_kwargs)``.
-        wrappers: A sequence of wrapper functions to apply to the base environment. Can only be used in ``"sync"`` or ``"async"`` mode.
+        wrappers: A sequence of wrapper functions to apply to the base environment. Can only be used in ``"sync"``, ``"async"`` or ``"threaded"`` mode.
+        vector_time_limit: If to limit the episode steps with :class:`gymnasium.wrappers.vector.TimeLimit` applied to the vector environment
+            rather than with a :class:`gymnasium.wrappers.TimeLimit` for each sub-environment. This is opt-in only, by default, the
+            sub-environments are time limited while ``vector_entry_point`` environments limit their episodes natively with ``max_episode_steps``.
+            This is only possible for the ``"sync"``, ``"async"`` and ``"threaded"`` modes with the ``NEXT_STEP`` or ``DISABLED`` autoreset
+            modes and no ``wrappers`` or spec ``additional_wrappers`` (as these would be applied after the time limit), otherwise, the
+            sub-environments are time limited.
         **kwargs: Additional arguments passed to the base environment constructor.
 
     Returns:
@@ -874,27 +937,28 @@ def make_vec(
     vectorization_mode = env_spec_kwargs.pop("vectorization_mode", vectorization_mode)
     vector_kwargs = env_spec_kwargs.pop("vector_kwargs", vector_kwargs)
     wrappers = env_spec_kwargs.pop("wrappers", wrappers)
+    vector_time_limit = env_spec_kwargs.pop("vector_time_limit", vector_time_limit)
 
     env_spec_kwargs.update(kwargs)
 
-    # Specify the vectorization mode if None or update to a `VectorizeMode`
-    if vectorization_mode is None:
-        if env_spec.vector_entry_point is not None:
-            vectorization_mode = VectorizeMode.VECTOR_ENTRY_POINT
-        else:
-            vectorization_mode = VectorizeMode.SYNC
-    else:
-        try:
-            vectorization_mode = VectorizeMode(vectorization_mode)
-        except ValueError:
-            raise ValueError(
-                f"Invalid vectorization mode: {vectorization_mode!r}, "
-                f"valid modes: {[mode.value for mode in VectorizeMode]}"
-            )
-    assert isinstance(vectorization_mode, VectorizeMode)
+    vectorization_mode = _vectorize_mode(env_spec, vectorization_mode)
+
+    # The max episode steps of the vector `TimeLimit`, if the sub-environments aren't time limited
+    max_episode_steps = (
+        _vector_time_limit_steps(
+            env_spec, env_spec_kwargs, vectorization_mode, vector_kwargs, wrappers
+        )
+        if vector_time_limit
+        else None
+    )
+    single_env_kwargs = (
+        env_spec_kwargs
+        if max_episode_steps is None
+        else env_spec_kwargs | {"max_episode_steps": -1}
+    )
 
     def create_single_env() -> Env:
-        single_env = make(env_spec, **env_spec_kwargs.copy())
+        single_env = make(env_spec, **single_env_kwargs.copy())
 
         if wrappers is None:
             return single_env
@@ -924,6 +988,16 @@ def make_vec(
             **vector_kwargs,
         )
 
+    elif vectorization_mode == VectorizeMode.THREADED:
+        if env_spec.entry_point is None:
+            raise error.Error(
+                f"Cannot create vectorized environment for {env_spec.id} because it doesn't have an entry point defined."
+            )
+
+        env = gym.vector.ThreadedVectorEnv(
+            env_fns=[create_single_env for _ in range(num_envs)],
+            **vector_kwargs,
+        )
     elif vectorization_mode == VectorizeMode.VECTOR_ENTRY_POINT:
         if len(vector_kwargs) > 0:
             raise error.Error(
@@ -968,8 +1042,13 @@ def make_vec(
         copied_id_spec.kwargs["vector_kwargs"] = vector_kwargs
     if len(wrappers) > 0:
         copied_id_spec.kwargs["wrappers"] = wrappers
+    if vector_time_limit:
+        copied_id_spec.kwargs["vector_time_limit"] = vector_time_limit
     env.unwrapped.spec = copied_id_spec
 
+    if max_episode_steps is not None:
+        env = gym.wrappers.vector.TimeLimit(env, max_episode_steps)
+
     if "autoreset_mode" not in env.metadata:
         warn(
             f"The VectorEnv ({env}) is missing AutoresetMode metadata, metadata={env.metadata}"
@@ -1,9 +1,6 @@
-import os
-
-import numpy as np
-
 import gymnasium as gym
 from gymnasium import spaces
+from gymnasium.envs.toy_text import rendering
 from gymnasium.error import DependencyNotInstalled
 
 
@@ -237,6 +234,25 @@ class BlackjackEnv(gym.Env):
             self.render()
         return self._get_obs(), {}
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert hasattr(self, "dealer"), "Call reset before using get_state method."
+        return {
+            "dealer": list(self.dealer),
+            "player": list(self.player),
+            "dealer_top_card_suit": self.dealer_top_card_suit,
+            "dealer_top_card_value_str": self.dealer_top_card_value_str,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.dealer = list(state["dealer"])
+        self.player = list(state["player"])
+        self.dealer_top_card_suit = state["dealer_top_card_suit"]
+        self.dealer_top_card_value_str = state["dealer_top_card_value_str"]
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -271,90 +287,74 @@ class BlackjackEnv(gym.Env):
             else:
                 pygame.font.init()
                 self.screen = pygame.Surface((screen_width, screen_height))
+            self.dirty_rects = None
 
         if not hasattr(self, "clock"):
             self.clock = pygame.time.Clock()
 
-        self.screen.fill(bg_color)
-
-        def get_image(path):
-            cwd = os.path.dirname(__file__)
-            image = pygame.image.load(os.path.join(cwd, path))
-            return image
-
-        def get_font(path, size):
-            cwd = os.path.dirname(__file__)
-            font = pygame.font.Font(os.path.join(cwd, path), size)
-            return font
-
-        small_font = get_font(
-            os.path.join("font", "Minecraft.ttf"), screen_height // 15
+        small_font_size = screen_height // 15
+        dealer_text = rendering.load_text(
+            "Dealer: " + str(dealer_card_value), small_font_size, white
         )
-        dealer_text = small_font.render(
-            "Dealer: " + str(dealer_card_value), True, white
+        dealer_text_rect = dealer_text.get_rect(topleft=(spacing, spacing))
+        card_top = dealer_text_rect.bottom + spacing
+        card_size = (card_img_width, card_img_height)
+        dealer_card_pos = (screen_width // 2 - card_img_width - spacing // 2, card_top)
+        player_text = rendering.load_text("Player", small_font_size, white)
+        player_text_rect = player_text.get_rect(
+            topleft=(spacing, int(card_top + card_img_height + 1.5 * spacing))
         )
-        dealer_text_rect = self.screen.blit(dealer_text, (spacing, spacing))
-
-        def scale_card_img(card_img):
-            return pygame.transform.scale(card_img, (card_img_width, card_img_height))
 
-        dealer_card_img = scale_card_img(
-            get_image(
-                os.path.join(
-                    "img",
-                    f"{self.dealer_top_card_suit}{self.dealer_top_card_value_str}.png",
-                )
+        if not hasattr(self, "background"):
+            # the table, hidden card and player label are static, so are only drawn once
+            self.background = pygame.Surface((screen_width, screen_height))
+            self.background.fill(bg_color)
+            self.background.blit(
+                rendering.load_sprite("Card.png", card_size),
+                (screen_width // 2 + spacing // 2, card_top),
             )
-        )
-        dealer_card_rect = self.screen.blit(
-            dealer_card_img,
-            (
-                screen_width // 2 - card_img_width - spacing // 2,
-                dealer_text_rect.bottom + spacing,
-            ),
-        )
+            self.background.blit(player_text, player_text_rect)
+            self.dirty_rects = None
 
-        hidden_card_img = scale_card_img(get_image(os.path.join("img", "Card.png")))
-        self.screen.blit(
-            hidden_card_img,
-            (
-                screen_width // 2 + spacing // 2,
-                dealer_text_rect.bottom + spacing,
-            ),
+        dealer_card_img = rendering.load_sprite(
+            f"{self.dealer_top_card_suit}{self.dealer_top_card_value_str}.png",
+            card_size,
         )
-
-        player_text = small_font.render("Player", True, white)
-        player_text_rect = self.screen.blit(
-            player_text, (spacing, dealer_card_rect.bottom + 1.5 * spacing)
+        player_sum_text = rendering.load_text(
+            str(player_sum), screen_height // 6, white
         )
-
-        large_font = get_font(os.path.join("font", "Minecraft.ttf"), screen_height // 6)
-        player_sum_text = large_font.render(str(player_sum), True, white)
-        player_sum_text_rect = self.screen.blit(
-            player_sum_text,
-            (
+        player_sum_text_rect = player_sum_text.get_rect(
+            topleft=(
                 screen_width // 2 - player_sum_text.get_width() // 2,
                 player_text_rect.bottom + spacing,
-            ),
+            )
         )
-
+        sprites = [
+            (dealer_text, dealer_text_rect),
+            (dealer_card_img, dealer_card_pos),
+            (player_sum_text, player_sum_text_rect),
+        ]
         if usable_ace:
-            usable_ace_text = small_font.render("usable ace", True, white)
-            self.screen.blit(
-                usable_ace_text,
+            usable_ace_text = rendering.load_text("usable ace", small_font_size, white)
+            sprites.append(
                 (
-                    screen_width // 2 - usable_ace_text.get_width() // 2,
-                    player_sum_text_rect.bottom + spacing // 2,
-                ),
+                    usable_ace_text,
+                    (
+                        screen_width // 2 - usable_ace_text.get_width() // 2,
+                        player_sum_text_rect.bottom + spacing // 2,
+                    ),
+                )
             )
+        self.dirty_rects = rendering.draw_sprites(
+            self.screen, self.background, sprites, self.dirty_rects
+        )
+
         if self.render_mode == "human":
             pygame.event.pump()
             pygame.display.update()
             self.clock.tick(self.metadata["render_fps"])
         else:
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.screen)
 
     def close(self):
         if hasattr(self, "screen"):
@@ -1,12 +1,12 @@
 from contextlib import closing
 from io import StringIO
-from os import path
 from typing import Any
 
 import numpy as np
 
 import gymnasium as gym
 from gymnasium import Env, spaces
+from gymnasium.envs.toy_text import rendering
 from gymnasium.envs.toy_text.utils import categorical_sample
 from gymnasium.error import DependencyNotInstalled
 
@@ -149,6 +149,8 @@ class CliffWalkingEnv(Env):
         self.mountain_bg_img = None
         self.near_cliff_img = None
         self.tree_img = None
+        self.background = None
+        self.dirty_rects = None
 
     def _limit_coordinates(self, coord: np.ndarray) -> np.ndarray:
         """Prevent the agent from falling out of the grid world."""
@@ -212,6 +214,21 @@ class CliffWalkingEnv(Env):
             self.render()
         return int(self.s), {"prob": 1}
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert hasattr(self, "s"), "Call reset before using get_state method."
+        return {
+            "s": self.s,
+            "lastaction": self.lastaction,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.s = state["s"]
+        self.lastaction = state["lastaction"]
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -243,80 +260,69 @@ class CliffWalkingEnv(Env):
                 self.window_surface = pygame.display.set_mode(self.window_size)
             else:  # rgb_array
                 self.window_surface = pygame.Surface(self.window_size)
+            self.dirty_rects = None
         if self.clock is None:
             self.clock = pygame.time.Clock()
         if self.elf_images is None:
-            hikers = [
-                path.join(path.dirname(__file__), "img/elf_up.png"),
-                path.join(path.dirname(__file__), "img/elf_right.png"),
-                path.join(path.dirname(__file__), "img/elf_down.png"),
-                path.join(path.dirname(__file__), "img/elf_left.png"),
-            ]
+            hikers = ["elf_up.png", "elf_right.png", "elf_down.png", "elf_left.png"]
             self.elf_images = [
-                pygame.transform.scale(pygame.image.load(f_name), self.cell_size)
-                for f_name in hikers
+                rendering.load_sprite(f_name, self.cell_size) for f_name in hikers
             ]
         if self.start_img is None:
-            file_name = path.join(path.dirname(__file__), "img/stool.png")
-            self.start_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            self.start_img = rendering.load_sprite("stool.png", self.cell_size)
         if self.goal_img is None:
-            file_name = path.join(path.dirname(__file__), "img/cookie.png")
-            self.goal_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            self.goal_img = rendering.load_sprite("cookie.png", self.cell_size)
         if self.mountain_bg_img is None:
-            bg_imgs = [
-                path.join(path.dirname(__file__), "img/mountain_bg1.png"),
-                path.join(path.dirname(__file__), "img/mountain_bg2.png"),
-            ]
+            bg_imgs = ["mountain_bg1.png", "mountain_bg2.png"]
             self.mountain_bg_img = [
-                pygame.transform.scale(pygame.image.load(f_name), self.cell_size)
-                for f_name in bg_imgs
+                rendering.load_sprite(f_name, self.cell_size) for f_name in bg_imgs
             ]
         if self.near_cliff_img is None:
-            near_cliff_imgs = [
-                path.join(path.dirname(__file__), "img/mountain_near-cliff1.png"),
-                path.join(path.dirname(__file__), "img/mountain_near-cliff2.png"),
-            ]
+            near_cliff_imgs = ["mountain_near-cliff1.png", "mountain_near-cliff2.png"]
             self.near_cliff_img = [
-                pygame.transform.scale(pygame.image.load(f_name), self.cell_size)
+                rendering.load_sprite(f_name, self.cell_size)
                 for f_name in near_cliff_imgs
             ]
         if self.cliff_img is None:
-            file_name = path.join(path.dirname(__file__), "img/mountain_cliff.png")
-            self.cliff_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
-
-        for s in range(self.nS):
-            row, col = np.unravel_index(s, self.shape)
-            pos = (col * self.cell_size[0], row * self.cell_size[1])
-            check_board_mask = row % 2 ^ col % 2
-            self.window_surface.blit(self.mountain_bg_img[check_board_mask], pos)
-
-            if self._cliff[row, col]:
-                self.window_surface.blit(self.cliff_img, pos)
-            if row < self.shape[0] - 1 and self._cliff[row + 1, col]:
-                self.window_surface.blit(self.near_cliff_img[check_board_mask], pos)
-            if s == self.start_state_index:
-                self.window_surface.blit(self.start_img, pos)
-            if s == self.nS - 1:
-                self.window_surface.blit(self.goal_img, pos)
-            if s == self.s:
-                elf_pos = (pos[0], pos[1] - 0.1 * self.cell_size[1])
-                last_action = self.lastaction if self.lastaction is not None else 2
-                self.window_surface.blit(self.elf_images[last_action], elf_pos)
+            self.cliff_img = rendering.load_sprite("mountain_cliff.png", self.cell_size)
+
+        if self.background is None:
+            # the map is static, so its tiles are only drawn once
+            self.background = pygame.Surface(self.window_size)
+            for s in range(self.nS):
+                row, col = np.unravel_index(s, self.shape)
+                pos = (col * self.cell_size[0], row * self.cell_size[1])
+                check_board_mask = row % 2 ^ col % 2
+                self.background.blit(self.mountain_bg_img[check_board_mask], pos)
+
+                if self._cliff[row, col]:
+                    self.background.blit(self.cliff_img, pos)
+                if row < self.shape[0] - 1 and self._cliff[row + 1, col]:
+                    self.background.blit(self.near_cliff_img[check_board_mask], pos)
+                if s == self.start_state_index:
+                    self.background.blit(self.start_img, pos)
+                if s == self.nS - 1:
+                    self.background.blit(self.goal_img, pos)
+
+        row, col = np.unravel_index(self.s, self.shape)
+        elf_pos = (
+            col * self.cell_size[0],
+            row * self.cell_size[1] - 0.1 * self.cell_size[1],
+        )
+        last_action = self.lastaction if self.lastaction is not None else 2
+        self.dirty_rects = rendering.draw_sprites(
+            self.window_surface,
+            self.background,
+            [(self.elf_images[last_action], elf_pos)],
+            self.dirty_rects,
+        )
 
         if mode == "human":
             pygame.event.pump()
             pygame.display.update()
             self.clock.tick(self.metadata["render_fps"])
         else:  # rgb_array
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.window_surface)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.window_surface)
 
     def _render_text(self):
         outfile = StringIO()
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from contextlib import closing
 from io import StringIO
-from os import path
 
 import numpy as np
 
 import gymnasium as gym
 from gymnasium import Env, spaces, utils
+from gymnasium.envs.toy_text import rendering
 from gymnasium.envs.toy_text.utils import categorical_sample
 from gymnasium.error import DependencyNotInstalled
 from gymnasium.utils import seeding
@@ -320,6 +320,8 @@ class FrozenLakeEnv(Env):
         self.elf_images = None
         self.goal_img = None
         self.start_img = None
+        self.background = None
+        self.dirty_rects = None
 
     def step(self, a):
         transitions = self.P[self.s][a]
@@ -347,6 +349,21 @@ class FrozenLakeEnv(Env):
             self.render()
         return int(self.s), {"prob": 1}
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert hasattr(self, "s"), "Call reset before using get_state method."
+        return {
+            "s": self.s,
+            "lastaction": self.lastaction,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.s = state["s"]
+        self.lastaction = state["lastaction"]
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -379,6 +396,7 @@ class FrozenLakeEnv(Env):
                 self.window_surface = pygame.display.set_mode(self.window_size)
             elif mode == "rgb_array":
                 self.window_surface = pygame.Surface(self.window_size)
+            self.dirty_rects = None
 
         assert (
             self.window_surface is not None
@@ -387,58 +405,42 @@ class FrozenLakeEnv(Env):
         if self.clock is None:
             self.clock = pygame.time.Clock()
         if self.hole_img is None:
-            file_name = path.join(path.dirname(__file__), "img/hole.png")
-            self.hole_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            self.hole_img = rendering.load_sprite("hole.png", self.cell_size)
         if self.cracked_hole_img is None:
-            file_name = path.join(path.dirname(__file__), "img/cracked_hole.png")
-            self.cracked_hole_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
+            self.cracked_hole_img = rendering.load_sprite(
+                "cracked_hole.png", self.cell_size
             )
         if self.ice_img is None:
-            file_name = path.join(path.dirname(__file__), "img/ice.png")
-            self.ice_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            self.ice_img = rendering.load_sprite("ice.png", self.cell_size)
         if self.goal_img is None:
-            file_name = path.join(path.dirname(__file__), "img/goal.png")
-            self.goal_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            self.goal_img = rendering.load_sprite("goal.png", self.cell_size)
         if self.start_img is None:
-            file_name = path.join(path.dirname(__file__), "img/stool.png")
-            self.start_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            self.start_img = rendering.load_sprite("stool.png", self.cell_size)
         if self.elf_images is None:
-            elfs = [
-                path.join(path.dirname(__file__), "img/elf_left.png"),
-                path.join(path.dirname(__file__), "img/elf_down.png"),
-                path.join(path.dirname(__file__), "img/elf_right.png"),
-                path.join(path.dirname(__file__), "img/elf_up.png"),
-            ]
+            elfs = ["elf_left.png", "elf_down.png", "elf_right.png", "elf_up.png"]
             self.elf_images = [
-                pygame.transform.scale(pygame.image.load(f_name), self.cell_size)
-                for f_name in elfs
+                rendering.load_sprite(f_name, self.cell_size) for f_name in elfs
             ]
 
         desc = self.desc.tolist()
         assert isinstance(desc, list), f"desc should be a list or an array, got {desc}"
-        for y in range(self.nrow):
-            for x in range(self.ncol):
-                pos = (x * self.cell_size[0], y * self.cell_size[1])
-                rect = (*pos, *self.cell_size)
-
-                self.window_surface.blit(self.ice_img, pos)
-                if desc[y][x] == b"H":
-                    self.window_surface.blit(self.hole_img, pos)
-                elif desc[y][x] == b"G":
-                    self.window_surface.blit(self.goal_img, pos)
-                elif desc[y][x] == b"S":
-                    self.window_surface.blit(self.start_img, pos)
-
-                pygame.draw.rect(self.window_surface, (180, 200, 230), rect, 1)
+        if self.background is None:
+            # the map is static, so its tiles are only drawn once
+            self.background = pygame.Surface(self.window_size)
+            for y in range(self.nrow):
+                for x in range(self.ncol):
+                    pos = (x * self.cell_size[0], y * self.cell_size[1])
+                    rect = (*pos, *self.cell_size)
+
+                    self.background.blit(self.ice_img, pos)
+                    if desc[y][x] == b"H":
+                        self.background.blit(self.hole_img, pos)
+                    elif desc[y][x] == b"G":
+                        self.background.blit(self.goal_img, pos)
+                    elif desc[y][x] == b"S":
+                        self.background.blit(self.start_img, pos)
+
+                    pygame.draw.rect(self.background, (180, 200, 230), rect, 1)
 
         # paint the elf
         bot_row, bot_col = self.s // self.ncol, self.s % self.ncol
@@ -447,18 +449,20 @@ class FrozenLakeEnv(Env):
         elf_img = self.elf_images[last_action]
 
         if desc[bot_row][bot_col] == b"H":
-            self.window_surface.blit(self.cracked_hole_img, cell_rect)
-        else:
-            self.window_surface.blit(elf_img, cell_rect)
+            elf_img = self.cracked_hole_img
+        self.dirty_rects = rendering.draw_sprites(
+            self.window_surface,
+            self.background,
+            [(elf_img, cell_rect)],
+            self.dirty_rects,
+        )
 
         if mode == "human":
             pygame.event.pump()
             pygame.display.update()
             self.clock.tick(self.metadata["render_fps"])
         elif mode == "rgb_array":
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.window_surface)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.window_surface)
 
     @staticmethod
     def _center_small_rect(big_rect, small_dims):
@@ -0,0 +1,78 @@
+"""
+Rendering utilities for the toy text environments.
+
+The sprites (and rendered texts) are loaded and scaled once and shared across all environment instances.
+Every environment composes its static parts once into a cached background, such that each frame only restores the areas
+covered by the previous frame's sprites and draws the new ones, rather than re-blitting every tile of the grid.
+"""
+
+from __future__ import annotations
+
+from os import path
+from typing import Any
+
+from gymnasium.envs.classic_control.rendering import surface_to_rgb_array
+
+
+__all__ = ["load_sprite", "load_text", "draw_sprites", "surface_to_rgb_array"]
+
+IMG_DIR = path.join(path.dirname(__file__), "img")
+FONT_FILE = path.join(path.dirname(__file__), "font", "Minecraft.ttf")
+
+_sprites: dict[tuple[str, tuple[int, int]], Any] = {}
+_texts: dict[tuple[str, int, tuple[int, int, int]], Any] = {}
+
+
+def load_sprite(file_name: str, size: tuple[int, int]) -> Any:
+    """Loads an image from the ``img`` directory scaled to ``size``, shared across all environment instances.
+
+    The returned surface must not be modified, use ``surface.copy()`` first (e.g., to change its alpha).
+    """
+    key = (file_name, tuple(size))
+    sprite = _sprites.get(key)
+    if sprite is None:
+        import pygame
+
+        image = pygame.image.load(path.join(IMG_DIR, file_name))
+        sprite = _sprites[key] = pygame.transform.scale(image, size)
+    return sprite
+
+
+def load_text(text: str, font_size: int, color: tuple[int, int, int]) -> Any:
+    """Renders the ``text`` with the environments' font, shared across all environment instances."""
+    key = (text, font_size, color)
+    text_surface = _texts.get(key)
+    if text_surface is None:
+        import pygame
+
+        # another environment's `close` may have quit pygame
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(FONT_FILE, font_size)
+        text_surface = _texts[key] = font.render(text, True, color)
+    return text_surface
+
+
+def draw_sprites(
+    surface: Any,
+    background: Any,
+    sprites: list[tuple[Any, tuple[float, float]]],
+    dirty_rects: list | None = None,
+) -> list:
+    """Draws the sprites over the cached background, only restoring the areas covered by the previous sprites.
+
+    Args:
+        surface: The surface to draw on
+        background: The static parts of the frame, the same size as ``surface``
+        sprites: The ``(image, position)`` pairs, drawn in order
+        dirty_rects: The areas returned by the previous call, if ``None`` then the full background is drawn
+
+    Returns:
+        The areas covered by the sprites, to pass as the next call's ``dirty_rects``
+    """
+    if dirty_rects is None:
+        surface.blit(background, (0, 0))
+    else:
+        for rect in dirty_rects:
+            surface.blit(background, rect, rect)
+    return [surface.blit(image, position) for image, position in sprites]
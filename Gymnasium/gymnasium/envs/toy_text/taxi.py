@@ -1,11 +1,11 @@
 from contextlib import closing
 from io import StringIO
-from os import path
 
 import numpy as np
 
 import gymnasium as gym
 from gymnasium import Env, spaces, utils
+from gymnasium.envs.toy_text import rendering
 from gymnasium.envs.toy_text.utils import categorical_sample
 from gymnasium.error import DependencyNotInstalled
 
@@ -345,6 +345,8 @@ class TaxiEnv(Env):
         self.median_horiz = None
         self.median_vert = None
         self.background_img = None
+        self.background = None
+        self.dirty_rects = None
 
     def encode(self, taxi_row, taxi_col, pass_loc, dest_idx):
         # (5) 5, 5, 4
@@ -437,6 +439,25 @@ class TaxiEnv(Env):
             self.render()
         return int(self.s), {"prob": 1.0, "action_mask": self.action_mask(self.s)}
 
+    def get_state(self) -> dict:
+        """Returns a snapshot of the environment's state, see :meth:`gymnasium.Env.get_state`."""
+        assert hasattr(self, "s"), "Call reset before using get_state method."
+        return {
+            "s": self.s,
+            "lastaction": self.lastaction,
+            "fickle_step": self.fickle_step,
+            "taxi_orientation": self.taxi_orientation,
+            "np_random": self.np_random.bit_generator.state,
+        }
+
+    def set_state(self, state: dict):
+        """Restores the environment's state from a snapshot of :meth:`get_state`."""
+        self.s = state["s"]
+        self.lastaction = state["lastaction"]
+        self.fickle_step = state["fickle_step"]
+        self.taxi_orientation = state["taxi_orientation"]
+        self.np_random.bit_generator.state = state["np_random"]
+
     def render(self):
         if self.render_mode is None:
             assert self.spec is not None
@@ -466,6 +487,7 @@ class TaxiEnv(Env):
                 self.window = pygame.display.set_mode(WINDOW_SIZE)
             elif mode == "rgb_array":
                 self.window = pygame.Surface(WINDOW_SIZE)
+            self.dirty_rects = None
 
         assert (
             self.window is not None
@@ -474,113 +496,111 @@ class TaxiEnv(Env):
             self.clock = pygame.time.Clock()
         if self.taxi_imgs is None:
             file_names = [
-                path.join(path.dirname(__file__), "img/cab_front.png"),
-                path.join(path.dirname(__file__), "img/cab_rear.png"),
-                path.join(path.dirname(__file__), "img/cab_right.png"),
-                path.join(path.dirname(__file__), "img/cab_left.png"),
+                "cab_front.png",
+                "cab_rear.png",
+                "cab_right.png",
+                "cab_left.png",
             ]
             self.taxi_imgs = [
-                pygame.transform.scale(pygame.image.load(file_name), self.cell_size)
+                rendering.load_sprite(file_name, self.cell_size)
                 for file_name in file_names
             ]
         if self.passenger_img is None:
-            file_name = path.join(path.dirname(__file__), "img/passenger.png")
-            self.passenger_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            self.passenger_img = rendering.load_sprite("passenger.png", self.cell_size)
         if self.destination_img is None:
-            file_name = path.join(path.dirname(__file__), "img/hotel.png")
-            self.destination_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
-            )
+            # copied as the shared sprite must not be modified
+            self.destination_img = rendering.load_sprite(
+                "hotel.png", self.cell_size
+            ).copy()
             self.destination_img.set_alpha(170)
         if self.median_horiz is None:
             file_names = [
-                path.join(path.dirname(__file__), "img/gridworld_median_left.png"),
-                path.join(path.dirname(__file__), "img/gridworld_median_horiz.png"),
-                path.join(path.dirname(__file__), "img/gridworld_median_right.png"),
+                "gridworld_median_left.png",
+                "gridworld_median_horiz.png",
+                "gridworld_median_right.png",
             ]
             self.median_horiz = [
-                pygame.transform.scale(pygame.image.load(file_name), self.cell_size)
+                rendering.load_sprite(file_name, self.cell_size)
                 for file_name in file_names
             ]
         if self.median_vert is None:
             file_names = [
-                path.join(path.dirname(__file__), "img/gridworld_median_top.png"),
-                path.join(path.dirname(__file__), "img/gridworld_median_vert.png"),
-                path.join(path.dirname(__file__), "img/gridworld_median_bottom.png"),
+                "gridworld_median_top.png",
+                "gridworld_median_vert.png",
+                "gridworld_median_bottom.png",
             ]
             self.median_vert = [
-                pygame.transform.scale(pygame.image.load(file_name), self.cell_size)
+                rendering.load_sprite(file_name, self.cell_size)
                 for file_name in file_names
             ]
         if self.background_img is None:
-            file_name = path.join(path.dirname(__file__), "img/taxi_background.png")
-            self.background_img = pygame.transform.scale(
-                pygame.image.load(file_name), self.cell_size
+            self.background_img = rendering.load_sprite(
+                "taxi_background.png", self.cell_size
             )
 
-        desc = self.desc
-
-        for y in range(0, desc.shape[0]):
-            for x in range(0, desc.shape[1]):
-                cell = (x * self.cell_size[0], y * self.cell_size[1])
-                self.window.blit(self.background_img, cell)
-                if desc[y][x] == b"|" and (y == 0 or desc[y - 1][x] != b"|"):
-                    self.window.blit(self.median_vert[0], cell)
-                elif desc[y][x] == b"|" and (
-                    y == desc.shape[0] - 1 or desc[y + 1][x] != b"|"
-                ):
-                    self.window.blit(self.median_vert[2], cell)
-                elif desc[y][x] == b"|":
-                    self.window.blit(self.median_vert[1], cell)
-                elif desc[y][x] == b"-" and (x == 0 or desc[y][x - 1] != b"-"):
-                    self.window.blit(self.median_horiz[0], cell)
-                elif desc[y][x] == b"-" and (
-                    x == desc.shape[1] - 1 or desc[y][x + 1] != b"-"
-                ):
-                    self.window.blit(self.median_horiz[2], cell)
-                elif desc[y][x] == b"-":
-                    self.window.blit(self.median_horiz[1], cell)
-
-        for cell, color in zip(self.locs, self.locs_colors):
-            color_cell = pygame.Surface(self.cell_size)
-            color_cell.set_alpha(128)
-            color_cell.fill(color)
-            loc = self.get_surf_loc(cell)
-            self.window.blit(color_cell, (loc[0], loc[1] + 10))
+        if self.background is None:
+            # the map and the pickup / drop-off locations are static, so are only drawn once
+            self.background = pygame.Surface(WINDOW_SIZE)
+            desc = self.desc
+
+            for y in range(0, desc.shape[0]):
+                for x in range(0, desc.shape[1]):
+                    cell = (x * self.cell_size[0], y * self.cell_size[1])
+                    self.background.blit(self.background_img, cell)
+                    if desc[y][x] == b"|" and (y == 0 or desc[y - 1][x] != b"|"):
+                        self.background.blit(self.median_vert[0], cell)
+                    elif desc[y][x] == b"|" and (
+                        y == desc.shape[0] - 1 or desc[y + 1][x] != b"|"
+                    ):
+                        self.background.blit(self.median_vert[2], cell)
+                    elif desc[y][x] == b"|":
+                        self.background.blit(self.median_vert[1], cell)
+                    elif desc[y][x] == b"-" and (x == 0 or desc[y][x - 1] != b"-"):
+                        self.background.blit(self.median_horiz[0], cell)
+                    elif desc[y][x] == b"-" and (
+                        x == desc.shape[1] - 1 or desc[y][x + 1] != b"-"
+                    ):
+                        self.background.blit(self.median_horiz[2], cell)
+                    elif desc[y][x] == b"-":
+                        self.background.blit(self.median_horiz[1], cell)
+
+            for cell, color in zip(self.locs, self.locs_colors):
+                color_cell = pygame.Surface(self.cell_size)
+                color_cell.set_alpha(128)
+                color_cell.fill(color)
+                loc = self.get_surf_loc(cell)
+                self.background.blit(color_cell, (loc[0], loc[1] + 10))
 
         taxi_row, taxi_col, pass_idx, dest_idx = self.decode(self.s)
 
+        sprites = []
         if pass_idx < 4:
-            self.window.blit(self.passenger_img, self.get_surf_loc(self.locs[pass_idx]))
+            sprites.append((self.passenger_img, self.get_surf_loc(self.locs[pass_idx])))
 
         if self.lastaction in [0, 1, 2, 3]:
             self.taxi_orientation = self.lastaction
         dest_loc = self.get_surf_loc(self.locs[dest_idx])
         taxi_location = self.get_surf_loc((taxi_row, taxi_col))
 
+        destination = (
+            self.destination_img,
+            (dest_loc[0], dest_loc[1] - self.cell_size[1] // 2),
+        )
+        taxi = (self.taxi_imgs[self.taxi_orientation], taxi_location)
         if dest_loc[1] <= taxi_location[1]:
-            self.window.blit(
-                self.destination_img,
-                (dest_loc[0], dest_loc[1] - self.cell_size[1] // 2),
-            )
-            self.window.blit(self.taxi_imgs[self.taxi_orientation], taxi_location)
+            sprites += [destination, taxi]
         else:  # change blit order for overlapping appearance
-            self.window.blit(self.taxi_imgs[self.taxi_orientation], taxi_location)
-            self.window.blit(
-                self.destination_img,
-                (dest_loc[0], dest_loc[1] - self.cell_size[1] // 2),
-            )
+            sprites += [taxi, destination]
+        self.dirty_rects = rendering.draw_sprites(
+            self.window, self.background, sprites, self.dirty_rects
+        )
 
         if mode == "human":
             pygame.event.pump()
             pygame.display.update()
             self.clock.tick(self.metadata["render_fps"])
         elif mode == "rgb_array":
-            return np.transpose(
-                np.array(pygame.surfarray.pixels3d(self.window)), axes=(1, 0, 2)
-            )
+            return rendering.surface_to_rgb_array(self.window)
 
     def get_surf_loc(self, map_loc):
         return (map_loc[1] * 2 + 1) * self.cell_size[0], (
@@ -9,7 +9,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 import gymnasium as gym
-from gymnasium.spaces.space import Space
+from gymnasium.spaces.space import Space, _pack_array, _unpack_array
 
 
 def array_short_repr(arr: NDArray[Any]) -> str:
@@ -167,6 +167,8 @@ class Box(Space[NDArray[Any]]):
         self.low_repr = array_short_repr(self.low)
         self.high_repr = array_short_repr(self.high)
 
+        self._build_sample_plan()
+
         super().__init__(self.shape, self.dtype, seed)
 
     def _cast_low(self, low, dtype_min) -> tuple[np.ndarray, np.ndarray]:
@@ -343,7 +345,12 @@ class Box(Space[NDArray[Any]]):
                 f"manner is not in {{'below', 'above', 'both'}}, actual value: {manner}"
             )
 
-    def sample(self, mask: None = None, probability: None = None) -> NDArray[Any]:
+    def sample(
+        self,
+        mask: None = None,
+        probability: None = None,
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
         r"""Generates a single random sample inside the Box.
 
         In creating a sample of the box, each coordinate is sampled (independently) from a distribution
@@ -357,66 +364,149 @@ class Box(Space[NDArray[Any]]):
         Args:
             mask: A mask for sampling values from the Box space, currently unsupported.
             probability: A probability mask for sampling values from the Box space, currently unsupported.
+            out: An optional array of the Box's shape and dtype that the sample is written into, avoiding an allocation
+
+        Returns:
+            A sampled value from the Box, the ``out`` array if provided
+        """
+        self._check_no_mask("sample", mask, probability)
+        return self._sample((), out)
+
+    def sample_batch(
+        self,
+        n: int,
+        mask: None = None,
+        probability: None = None,
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        """Generates ``n`` random samples inside the Box, with the same distributions as :meth:`sample`.
+
+        Args:
+            n: The number of samples
+            mask: A mask for sampling values from the Box space, currently unsupported.
+            probability: A probability mask for sampling values from the Box space, currently unsupported.
+            out: An optional array of shape ``(n, *self.shape)`` and the Box's dtype that the samples are written into
 
         Returns:
-            A sampled value from the Box
+            The samples stacked into an array of shape ``(n, *self.shape)``, the ``out`` array if provided
         """
+        self._check_no_mask("sample_batch", mask, probability)
+        return self._sample((n,), out)
+
+    def _check_no_mask(self, method: str, mask: None, probability: None):
         if mask is not None:
             raise gym.error.Error(
-                f"Box.sample cannot be provided a mask, actual value: {mask}"
+                f"Box.{method} cannot be provided a mask, actual value: {mask}"
             )
         elif probability is not None:
             raise gym.error.Error(
-                f"Box.sample cannot be provided a probability mask, actual value: {probability}"
+                f"Box.{method} cannot be provided a probability mask, actual value: {probability}"
             )
 
-        high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
-        sample = np.empty(self.shape)
-
-        # Masking arrays which classify the coordinates according to interval type
-        unbounded = ~self.bounded_below & ~self.bounded_above
-        upp_bounded = ~self.bounded_below & self.bounded_above
-        low_bounded = self.bounded_below & ~self.bounded_above
-        bounded = self.bounded_below & self.bounded_above
+    def _build_sample_plan(self):
+        """Classifies the coordinates by interval type once, as the bounds of the Box don't change after construction.
 
-        # Vectorized sampling by interval type
-        sample[unbounded] = self.np_random.normal(size=unbounded[unbounded].shape)
+        Each interval type stores the flat indices of its coordinates with the bounds its distribution is shifted by.
+        """
+        high = self.high if self.dtype.kind == "f" else self.high.astype("int64") + 1
+        low, high = self.low.reshape(-1), high.reshape(-1)
+        bounded_below = self.bounded_below.reshape(-1)
+        bounded_above = self.bounded_above.reshape(-1)
+
+        self._unbounded = np.flatnonzero(~bounded_below & ~bounded_above)
+        self._low_bounded = np.flatnonzero(bounded_below & ~bounded_above)
+        self._low_bounded_low = low[self._low_bounded].astype(np.float64)
+        self._upp_bounded = np.flatnonzero(~bounded_below & bounded_above)
+        self._upp_bounded_high = high[self._upp_bounded].astype(np.float64)
+        self._bounded = np.flatnonzero(bounded_below & bounded_above)
+        self._bounded_low = low[self._bounded].astype(np.float64)
+        self._bounded_high = high[self._bounded].astype(np.float64)
+
+        self._all_bounded = len(self._bounded) == low.size
+        # Equivalent to `np_random.uniform(low, high)` which also raises an error if the range overflows
+        with np.errstate(over="ignore"):
+            self._bounded_range = self._bounded_high - self._bounded_low
+        if not np.all(np.isfinite(self._bounded_range)):
+            self._bounded_range = None
+
+    def _sample_bounded(self, size: tuple[int, ...]) -> NDArray[np.float64]:
+        """Samples the bounded coordinates uniformly, drawing the same values as ``np_random.uniform``."""
+        if self._bounded_range is None:
+            return self.np_random.uniform(
+                low=self._bounded_low, high=self._bounded_high, size=size
+            )
 
-        sample[low_bounded] = (
-            self.np_random.exponential(size=low_bounded[low_bounded].shape)
-            + self.low[low_bounded]
-        )
+        sample = self.np_random.random(size=size)
+        sample *= self._bounded_range
+        sample += self._bounded_low
+        return sample
 
-        sample[upp_bounded] = (
-            -self.np_random.exponential(size=upp_bounded[upp_bounded].shape)
-            + high[upp_bounded]
-        )
+    def _sample(
+        self, batch_shape: tuple[int, ...], out: NDArray[Any] | None = None
+    ) -> NDArray[Any]:
+        """Samples an array of shape ``batch_shape + self.shape``, drawing all of each interval type's coordinates at once."""
+        if out is not None:
+            assert (
+                out.shape == batch_shape + self.shape
+            ), f"Expected `out` shape to be {batch_shape + self.shape}, actual shape: {out.shape}"
+            assert (
+                out.dtype == self.dtype
+            ), f"Expected `out` dtype to be {self.dtype}, actual dtype: {out.dtype}"
+
+        if self._all_bounded:
+            sample = self._sample_bounded(batch_shape + self._bounded.shape)
+        else:
+            # Vectorized sampling by interval type, the plan's indices select the flattened (non-batch) coordinates
+            sample = np.empty(batch_shape + (self.low.size,))
+            if len(self._unbounded) > 0:
+                sample[..., self._unbounded] = self.np_random.normal(
+                    size=batch_shape + self._unbounded.shape
+                )
+            if len(self._low_bounded) > 0:
+                sample[..., self._low_bounded] = (
+                    self.np_random.exponential(
+                        size=batch_shape + self._low_bounded.shape
+                    )
+                    + self._low_bounded_low
+                )
+            if len(self._upp_bounded) > 0:
+                sample[..., self._upp_bounded] = (
+                    -self.np_random.exponential(
+                        size=batch_shape + self._upp_bounded.shape
+                    )
+                    + self._upp_bounded_high
+                )
+            if len(self._bounded) > 0:
+                sample[..., self._bounded] = self._sample_bounded(
+                    batch_shape + self._bounded.shape
+                )
 
-        sample[bounded] = self.np_random.uniform(
-            low=self.low[bounded], high=high[bounded], size=bounded[bounded].shape
-        )
+        sample = sample.reshape(batch_shape + self.shape)
 
         if self.dtype.kind in ["i", "u", "b"]:
-            sample = np.floor(sample)
-
-        # clip values that would underflow/overflow
-        if np.issubdtype(self.dtype, np.signedinteger):
-            dtype_min = np.iinfo(self.dtype).min + 2
-            dtype_max = np.iinfo(self.dtype).max - 2
-            sample = sample.clip(min=dtype_min, max=dtype_max)
-        elif np.issubdtype(self.dtype, np.unsignedinteger):
-            dtype_min = np.iinfo(self.dtype).min
-            dtype_max = np.iinfo(self.dtype).max
-            sample = sample.clip(min=dtype_min, max=dtype_max)
-
-        sample = sample.astype(self.dtype)
+            np.floor(sample, out=sample)
+
+            # clip values that would underflow/overflow
+            if np.issubdtype(self.dtype, np.signedinteger):
+                dtype_min = np.iinfo(self.dtype).min + 2
+                dtype_max = np.iinfo(self.dtype).max - 2
+                sample.clip(min=dtype_min, max=dtype_max, out=sample)
+            elif np.issubdtype(self.dtype, np.unsignedinteger):
+                dtype_min = np.iinfo(self.dtype).min
+                dtype_max = np.iinfo(self.dtype).max
+                sample.clip(min=dtype_min, max=dtype_max, out=sample)
+
+        if out is None:
+            out = sample.astype(self.dtype, copy=False)
+        else:
+            out[...] = sample
 
         # float64 values have lower than integer precision near int64 min/max, so clip
         # again in case something has been cast to an out-of-bounds value
         if self.dtype == np.int64:
-            sample = sample.clip(min=self.low, max=self.high)
+            out.clip(min=self.low, max=self.high, out=out)
 
-        return sample
+        return out
 
     def contains(self, x: Any) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
@@ -434,6 +524,22 @@ class Box(Space[NDArray[Any]]):
             and np.all(x <= self.high)
         )
 
+    def contains_batch(self, x: Any) -> NDArray[np.bool_]:
+        """Return a boolean array specifying which elements of the batch ``x``, of shape ``(n,) + shape``, are valid members of this space."""
+        if not isinstance(x, np.ndarray):
+            gym.logger.warn("Casting input x to numpy array.")
+            try:
+                x = np.asarray(x, dtype=self.dtype)
+            except (ValueError, TypeError):
+                return np.zeros(1, dtype=np.bool_)
+
+        if x.ndim == 0:
+            return np.zeros(1, dtype=np.bool_)
+        elif x.shape[1:] != self.shape or not np.can_cast(x.dtype, self.dtype):
+            return np.zeros(len(x), dtype=np.bool_)
+
+        return np.all((x >= self.low) & (x <= self.high), axis=tuple(range(1, x.ndim)))
+
     def to_jsonable(self, sample_n: Sequence[NDArray[Any]]) -> list[list]:
         """Convert a batch of samples from this space to a JSONable data type."""
         return [sample.tolist() for sample in sample_n]
@@ -442,6 +548,14 @@ class Box(Space[NDArray[Any]]):
         """Convert a JSONable data type to a batch of samples from this space."""
         return [np.asarray(sample, dtype=self.dtype) for sample in sample_n]
 
+    def to_bytes(self, sample_n: Sequence[NDArray[Any]]) -> bytes:
+        """Convert a batch of samples from this space to a contiguous array of bytes."""
+        return _pack_array(sample_n, self.dtype)
+
+    def from_bytes(self, data: bytes | memoryview) -> list[NDArray[Any]]:
+        """Convert bytes to a batch of samples from this space, the samples are views of ``data``."""
+        return list(_unpack_array(data, self.dtype, self.shape))
+
     def __repr__(self) -> str:
         """A string representation of this space.
 
@@ -473,3 +587,6 @@ class Box(Space[NDArray[Any]]):
 
         if not hasattr(self, "high_repr"):
             self.high_repr = array_short_repr(self.high)
+
+        # rebuild the sampling plan, as legacy pickled states don't include it
+        self._build_sample_plan()
@@ -9,8 +9,9 @@ from collections.abc import KeysView, Sequence
 from typing import Any
 
 import numpy as np
+from numpy.typing import NDArray
 
-from gymnasium.spaces.space import Space
+from gymnasium.spaces.space import Space, _all_batches, _pack_bytes, _unpack_bytes
 
 
 class Dict(Space[dict[str, Any]], typing.Mapping[str, Space[Any]]):
@@ -194,12 +195,82 @@ class Dict(Space[dict[str, Any]], typing.Mapping[str, Space[Any]]):
         else:
             return {k: space.sample() for k, space in self.spaces.items()}
 
+    def sample_batch(
+        self,
+        n: int,
+        mask: dict[str, Any] | None = None,
+        probability: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Generates ``n`` random samples from each of the subspaces, see :meth:`Space.sample_batch`.
+
+        Args:
+            n: The number of samples
+            mask: An optional (batched) mask for each of the subspaces, expects the same keys as the space
+            probability: An optional (batched) probability mask for each of the subspaces, expects the same keys as the space
+
+        Returns:
+            A dictionary with the same keys and the subspace's batched samples, an element of ``batch_space(space, n)``
+        """
+        if mask is not None and probability is not None:
+            raise ValueError(
+                f"Only one of `mask` or `probability` can be provided, actual values: mask={mask}, probability={probability}"
+            )
+        elif mask is not None:
+            assert isinstance(
+                mask, dict
+            ), f"Expected sample mask to be a dict, actual type: {type(mask)}"
+            assert (
+                mask.keys() == self.spaces.keys()
+            ), f"Expected sample mask keys to be same as space keys, mask keys: {mask.keys()}, space keys: {self.spaces.keys()}"
+
+            return {
+                k: space.sample_batch(n, mask=mask[k])
+                for k, space in self.spaces.items()
+            }
+        elif probability is not None:
+            assert isinstance(
+                probability, dict
+            ), f"Expected sample probability mask to be a dict, actual type: {type(probability)}"
+            assert (
+                probability.keys() == self.spaces.keys()
+            ), f"Expected sample probability mask keys to be same as space keys, mask keys: {probability.keys()}, space keys: {self.spaces.keys()}"
+
+            return {
+                k: space.sample_batch(n, probability=probability[k])
+                for k, space in self.spaces.items()
+            }
+        else:
+            return {k: space.sample_batch(n) for k, space in self.spaces.items()}
+
     def contains(self, x: Any) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, dict) and x.keys() == self.spaces.keys():
             return all(x[key] in self.spaces[key] for key in self.spaces.keys())
         return False
 
+    def contains_batch(self, x: Any) -> NDArray[np.bool_]:
+        """Return a boolean array specifying which elements of the batch ``x``, a dictionary of the subspace's batches, are valid members of this space."""
+        if isinstance(x, dict) and x.keys() == self.spaces.keys():
+            return _all_batches(
+                [space.contains_batch(x[key]) for key, space in self.spaces.items()]
+            )
+        return np.zeros(1, dtype=np.bool_)
+
+    def invalid_batch_leaf(self, x: Any) -> tuple[int, tuple[str | int, ...]] | None:
+        """Finds the first invalid element of the batch ``x`` and the path to the subspace it is invalid for, see :meth:`Space.invalid_batch_leaf`."""
+        if not isinstance(x, dict) or x.keys() != self.spaces.keys():
+            return 0, ()
+
+        failures = []
+        for key, space in self.spaces.items():
+            failure = space.invalid_batch_leaf(x[key])
+            if failure is not None:
+                failures.append((failure[0], (key,) + failure[1]))
+        if len(failures) > 0:
+            return min(failures, key=lambda failure: failure[0])
+        # The subspace's batches are valid however with different sizes
+        return super().invalid_batch_leaf(x)
+
     def __getitem__(self, key: str) -> Space[Any]:
         """Get the space that is associated to `key`."""
         return self.spaces[key]
@@ -258,3 +329,26 @@ class Dict(Space[dict[str, Any]], typing.Mapping[str, Space[Any]]):
             for n in range(n_elements)
         ]
         return result
+
+    def to_bytes(self, sample_n: Sequence[dict[str, Any]]) -> bytes:
+        """Convert a batch of samples from this space to bytes, with a column for each subspace's batch."""
+        return _pack_bytes(
+            [
+                space.to_bytes([sample[key] for sample in sample_n])
+                for key, space in self.spaces.items()
+            ],
+            len(sample_n),
+        )
+
+    def from_bytes(self, data: bytes | memoryview) -> list[dict[str, Any]]:
+        """Convert bytes to a batch of samples from this space."""
+        n_elements, chunks = _unpack_bytes(data)
+        dict_of_list: dict[str, list[Any]] = {
+            key: space.from_bytes(chunk)
+            for (key, space), chunk in zip(self.spaces.items(), chunks)
+        }
+
+        return [
+            {key: value[n] for key, value in dict_of_list.items()}
+            for n in range(n_elements)
+        ]
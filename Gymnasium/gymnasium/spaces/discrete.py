@@ -6,13 +6,42 @@ from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, TypeVar
 
 import numpy as np
+from numpy.typing import NDArray
 
-from gymnasium.spaces.space import MaskNDArray, Space
+from gymnasium.spaces.space import MaskNDArray, Space, _pack_array, _unpack_array
 
 
 IntType = TypeVar("IntType", bound=np.integer)
 
 
+def _sample_mask_batch(
+    np_random: np.random.Generator, n: int, mask: MaskNDArray
+) -> NDArray[np.int64]:
+    """Uniformly samples the index of a ``1`` for each of the ``n`` rows of the mask, or ``0`` if a row has none.
+
+    The ``(k,)`` or ``(n, k)`` mask is broadcast to ``(n, k)``.
+    """
+    cumulative = np.cumsum(np.broadcast_to(mask, (n, mask.shape[-1])), axis=-1)
+    # the rank of the chosen valid index in each row, i.e., `0 <= ranks < count`
+    ranks = (np_random.random(n) * cumulative[:, -1]).astype(np.int64)
+    return np.argmax(cumulative > ranks[:, None], axis=-1)
+
+
+def _sample_probability_batch(
+    np_random: np.random.Generator, n: int, probability: NDArray[np.float64]
+) -> NDArray[np.int64]:
+    """Samples an index according to the probabilities of each of the ``n`` rows, by inverting the cumulative distribution.
+
+    The ``(k,)`` or ``(n, k)`` probability mask is broadcast to ``(n, k)``.
+    """
+    cumulative = np.cumsum(
+        np.broadcast_to(probability, (n, probability.shape[-1])), axis=-1
+    )
+    # normalising makes the last value exactly 1, so the index is always valid
+    cumulative /= cumulative[:, -1:]
+    return np.count_nonzero(cumulative <= np_random.random((n, 1)), axis=-1)
+
+
 class Discrete(Space[IntType]):
     r"""A space consisting of finitely many elements.
 
@@ -153,6 +182,68 @@ class Discrete(Space[IntType]):
         else:
             return self.start + self.np_random.integers(self.n, dtype=self.dtype.type)
 
+    def sample_batch(
+        self,
+        n: int,
+        mask: MaskNDArray | None = None,
+        probability: MaskNDArray | None = None,
+    ) -> NDArray[np.integer[Any]]:
+        """Generates ``n`` random samples from this space with a single call to the random number generator.
+
+        Args:
+            n: The number of samples
+            mask: An optional mask of shape ``(self.n,)`` used for all samples or ``(n, self.n)`` for each sample,
+                with the same values as for :meth:`sample`. Samples without any valid action are ``space.start``.
+            probability: An optional probability mask of shape ``(self.n,)`` used for all samples or ``(n, self.n)``
+                for each sample, with the same values as for :meth:`sample`.
+
+        Returns:
+            An array of shape ``(n,)`` with the space's dtype, an element of ``batch_space(space, n)``
+        """
+        if mask is not None and probability is not None:
+            raise ValueError(
+                f"Only one of `mask` or `probability` can be provided, actual values: mask={mask}, probability={probability}"
+            )
+        elif mask is not None:
+            assert isinstance(
+                mask, np.ndarray
+            ), f"The expected type of the sample mask is np.ndarray, actual type: {type(mask)}"
+            assert (
+                mask.dtype == np.int8
+            ), f"The expected dtype of the sample mask is np.int8, actual dtype: {mask.dtype}"
+            assert mask.shape in {
+                (self.n,),
+                (n, self.n),
+            }, f"The expected shape of the sample mask is {(int(self.n),)} or {(n, int(self.n))}, actual shape: {mask.shape}"
+            assert np.all(
+                (mask == 0) | (mask == 1)
+            ), f"All values of the sample mask should be 0 or 1, actual values: {mask}"
+
+            indices = _sample_mask_batch(self.np_random, n, mask)
+        elif probability is not None:
+            assert isinstance(
+                probability, np.ndarray
+            ), f"The expected type of the sample probability is np.ndarray, actual type: {type(probability)}"
+            assert (
+                probability.dtype == np.float64
+            ), f"The expected dtype of the sample probability is np.float64, actual dtype: {probability.dtype}"
+            assert probability.shape in {
+                (self.n,),
+                (n, self.n),
+            }, f"The expected shape of the sample probability is {(int(self.n),)} or {(n, int(self.n))}, actual shape: {probability.shape}"
+            assert np.all(
+                np.logical_and(probability >= 0, probability <= 1)
+            ), f"All values of the sample probability should be between 0 and 1, actual values: {probability}"
+            assert np.all(
+                np.isclose(np.sum(probability, axis=-1), 1)
+            ), f"The sum of the sample probability should be equal to 1, actual sum: {np.sum(probability, axis=-1)}"
+
+            indices = _sample_probability_batch(self.np_random, n, probability)
+        else:
+            indices = self.np_random.integers(self.n, size=n, dtype=self.dtype.type)
+
+        return self.start + indices.astype(self.dtype, copy=False)
+
     def contains(self, x: Any) -> bool:
         """Return boolean specifying if x is a valid member of this space.
 
@@ -172,6 +263,22 @@ class Discrete(Space[IntType]):
 
         return value_is_in and np.can_cast(as_np.dtype, self.dtype)
 
+    def contains_batch(self, x: Any) -> NDArray[np.bool_]:
+        """Return a boolean array specifying which elements of the batch ``x``, of shape ``(n,)``, are valid members of this space."""
+        if isinstance(x, Sequence):
+            x = np.array(x)  # Promote list to array for contains check
+
+        if not isinstance(x, np.ndarray) or x.ndim == 0:
+            return np.zeros(1, dtype=np.bool_)
+        elif (
+            x.ndim != 1
+            or not np.issubdtype(x.dtype, np.integer)
+            or not np.can_cast(x.dtype, self.dtype)
+        ):
+            return np.zeros(len(x), dtype=np.bool_)
+
+        return (self.start <= x) & (x < self.start + self.n)
+
     def __repr__(self) -> str:
         """Gives a string representation of this space."""
         info = [str(self.n)]
@@ -216,3 +323,11 @@ class Discrete(Space[IntType]):
     def from_jsonable(self, sample_n: list[int]) -> list[IntType]:
         """Converts a list of json samples to a list of numpy integer scalars."""
         return [self.dtype.type(x) for x in sample_n]
+
+    def to_bytes(self, sample_n: Sequence[IntType]) -> bytes:
+        """Convert a batch of samples from this space to a contiguous array of bytes."""
+        return _pack_array(sample_n, self.dtype)
+
+    def from_bytes(self, data: bytes | memoryview) -> list[IntType]:
+        """Convert bytes to a batch of samples from this space as numpy integer scalars."""
+        return list(_unpack_array(data, self.dtype, ()))
@@ -8,7 +8,7 @@ from typing import Any
 import numpy as np
 from numpy.typing import NDArray
 
-from gymnasium.spaces.space import MaskNDArray, Space
+from gymnasium.spaces.space import MaskNDArray, Space, _pack_array, _unpack_array
 
 
 class MultiBinary(Space[NDArray[np.int8]]):
@@ -126,6 +126,74 @@ class MultiBinary(Space[NDArray[np.int8]]):
         else:
             return self.np_random.integers(low=0, high=2, size=self.n, dtype=self.dtype)
 
+    def sample_batch(
+        self,
+        n: int,
+        mask: MaskNDArray | None = None,
+        probability: MaskNDArray | None = None,
+    ) -> NDArray[np.int8]:
+        """Generates ``n`` random samples from this space with a single call to the random number generator.
+
+        Args:
+            n: The number of samples
+            mask: An optional mask of shape ``space.shape`` used for all samples or ``(n, *space.shape)`` for each
+                sample, with the same values as for :meth:`sample`.
+            probability: An optional probability mask of shape ``space.shape`` used for all samples or
+                ``(n, *space.shape)`` for each sample, with the same values as for :meth:`sample`.
+
+        Returns:
+            An array of shape ``(n, *space.shape)``, an element of ``batch_space(space, n)``
+        """
+        batch_shape = (n,) + self.shape
+        if mask is not None and probability is not None:
+            raise ValueError(
+                f"Only one of `mask` or `probability` can be provided, actual values: mask={mask}, probability={probability}"
+            )
+        if mask is not None:
+            assert isinstance(
+                mask, np.ndarray
+            ), f"The expected type of the mask is np.ndarray, actual type: {type(mask)}"
+            assert (
+                mask.dtype == np.int8
+            ), f"The expected dtype of the mask is np.int8, actual dtype: {mask.dtype}"
+            assert mask.shape in {
+                self.shape,
+                batch_shape,
+            }, f"The expected shape of the mask is {self.shape} or {batch_shape}, actual shape: {mask.shape}"
+            assert np.all(
+                (mask == 0) | (mask == 1) | (mask == 2)
+            ), f"All values of a mask should be 0, 1 or 2, actual values: {mask}"
+
+            return np.where(
+                mask == 2,
+                self.np_random.integers(
+                    low=0, high=2, size=batch_shape, dtype=self.dtype
+                ),
+                mask.astype(self.dtype),
+            )
+        elif probability is not None:
+            assert isinstance(
+                probability, np.ndarray
+            ), f"The expected type of the probability is np.ndarray, actual type: {type(probability)}"
+            assert (
+                probability.dtype == np.float64
+            ), f"The expected dtype of the probability is np.float64, actual dtype: {probability.dtype}"
+            assert probability.shape in {
+                self.shape,
+                batch_shape,
+            }, f"The expected shape of the probability is {self.shape} or {batch_shape}, actual shape: {probability.shape}"
+            assert np.all(
+                np.logical_and(probability >= 0, probability <= 1)
+            ), f"All values of the sample probability should be between 0 and 1, actual values: {probability}"
+
+            return (self.np_random.random(size=batch_shape) <= probability).astype(
+                self.dtype
+            )
+        else:
+            return self.np_random.integers(
+                low=0, high=2, size=batch_shape, dtype=self.dtype
+            )
+
     def contains(self, x: Any) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, Sequence):
@@ -137,6 +205,18 @@ class MultiBinary(Space[NDArray[np.int8]]):
             and np.all(np.logical_or(x == 0, x == 1))
         )
 
+    def contains_batch(self, x: Any) -> NDArray[np.bool_]:
+        """Return a boolean array specifying which elements of the batch ``x``, of shape ``(n,) + shape``, are valid members of this space."""
+        if isinstance(x, Sequence):
+            x = np.array(x)  # Promote list to array for contains check
+
+        if not isinstance(x, np.ndarray) or x.ndim == 0:
+            return np.zeros(1, dtype=np.bool_)
+        elif x.shape[1:] != self.shape:
+            return np.zeros(len(x), dtype=np.bool_)
+
+        return np.all((x == 0) | (x == 1), axis=tuple(range(1, x.ndim)))
+
     def to_jsonable(self, sample_n: Sequence[NDArray[np.int8]]) -> list[Sequence[int]]:
         """Convert a batch of samples from this space to a JSONable data type."""
         return np.array(sample_n).tolist()
@@ -145,6 +225,14 @@ class MultiBinary(Space[NDArray[np.int8]]):
         """Convert a JSONable data type to a batch of samples from this space."""
         return [np.asarray(sample, self.dtype) for sample in sample_n]
 
+    def to_bytes(self, sample_n: Sequence[NDArray[np.int8]]) -> bytes:
+        """Convert a batch of samples from this space to a contiguous array of bytes."""
+        return _pack_array(sample_n, self.dtype)
+
+    def from_bytes(self, data: bytes | memoryview) -> list[NDArray[np.int8]]:
+        """Convert bytes to a batch of samples from this space, the samples are views of ``data``."""
+        return list(_unpack_array(data, self.dtype, self.shape))
+
     def __repr__(self) -> str:
         """Gives a string representation of this space."""
         return f"MultiBinary({self.n})"
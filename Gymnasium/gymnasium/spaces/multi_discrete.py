@@ -9,8 +9,12 @@ import numpy as np
 from numpy.typing import NDArray
 
 import gymnasium as gym
-from gymnasium.spaces.discrete import Discrete
-from gymnasium.spaces.space import MaskNDArray, Space
+from gymnasium.spaces.discrete import (
+    Discrete,
+    _sample_mask_batch,
+    _sample_probability_batch,
+)
+from gymnasium.spaces.space import MaskNDArray, Space, _pack_array, _unpack_array
 
 
 class MultiDiscrete(Space[NDArray[np.integer]]):
@@ -133,6 +137,95 @@ class MultiDiscrete(Space[NDArray[np.integer]]):
                 self.dtype
             ) + self.start
 
+    def sample_batch(
+        self,
+        n: int,
+        mask: tuple[MaskNDArray, ...] | None = None,
+        probability: tuple[MaskNDArray, ...] | None = None,
+    ) -> NDArray[np.integer[Any]]:
+        """Generates ``n`` random samples from this space with a single call to the random number generator per action.
+
+        Args:
+            n: The number of samples
+            mask: An optional mask with the same (tuple) structure as for :meth:`sample`, where each action's mask has
+                shape ``(k,)`` to be used for all samples or ``(n, k)`` for each sample.
+            probability: An optional probability mask with the same (tuple) structure as for :meth:`sample`, where each
+                action's probability mask has shape ``(k,)`` to be used for all samples or ``(n, k)`` for each sample.
+
+        Returns:
+            An array of shape ``(n, *self.shape)``, an element of ``batch_space(space, n)``
+        """
+        if mask is not None and probability is not None:
+            raise ValueError(
+                f"Only one of `mask` or `probability` can be provided, actual values: mask={mask}, probability={probability}"
+            )
+        elif mask is not None:
+            return self._apply_mask_batch(mask, self.nvec, self.start, "mask", n)
+        elif probability is not None:
+            return self._apply_mask_batch(
+                probability, self.nvec, self.start, "probability", n
+            )
+        else:
+            return (self.np_random.random((n,) + self.nvec.shape) * self.nvec).astype(
+                self.dtype
+            ) + self.start
+
+    def _apply_mask_batch(
+        self,
+        sub_mask: MaskNDArray | tuple[MaskNDArray, ...],
+        sub_nvec: MaskNDArray | np.integer[Any],
+        sub_start: MaskNDArray | np.integer[Any],
+        mask_type: str,
+        n: int,
+    ) -> NDArray[np.integer[Any]]:
+        """Returns ``n`` samples using the provided (batched) mask or probability mask."""
+        if isinstance(sub_nvec, np.ndarray):
+            assert isinstance(
+                sub_mask, tuple
+            ), f"Expects the mask to be a tuple for sub_nvec ({sub_nvec}), actual type: {type(sub_mask)}"
+            assert len(sub_mask) == len(
+                sub_nvec
+            ), f"Expects the mask length to be equal to the number of actions, mask length: {len(sub_mask)}, nvec length: {len(sub_nvec)}"
+            samples = np.empty((n,) + sub_nvec.shape, dtype=self.dtype)
+            for i, (new_mask, new_nvec, new_start) in enumerate(
+                zip(sub_mask, sub_nvec, sub_start)
+            ):
+                samples[:, i] = self._apply_mask_batch(
+                    new_mask, new_nvec, new_start, mask_type, n
+                )
+            return samples
+
+        assert isinstance(
+            sub_mask, np.ndarray
+        ), f"Expects the sub mask to be np.ndarray, actual type: {type(sub_mask)}"
+        assert sub_mask.shape in {
+            (sub_nvec,),
+            (n, sub_nvec),
+        }, f"Expects the mask shape to be {(int(sub_nvec),)} or {(n, int(sub_nvec))}, actual shape: {sub_mask.shape}"
+
+        if mask_type == "mask":
+            assert (
+                sub_mask.dtype == np.int8
+            ), f"Expects the mask dtype to be np.int8, actual dtype: {sub_mask.dtype}"
+            assert np.all(
+                (sub_mask == 0) | (sub_mask == 1)
+            ), f"Expects all masks values to 0 or 1, actual values: {sub_mask}"
+
+            return sub_start + _sample_mask_batch(self.np_random, n, sub_mask)
+        elif mask_type == "probability":
+            assert (
+                sub_mask.dtype == np.float64
+            ), f"Expects the mask dtype to be np.float64, actual dtype: {sub_mask.dtype}"
+            assert np.all(
+                (sub_mask >= 0) & (sub_mask <= 1)
+            ), f"Expects all masks values to be between 0 and 1, actual values: {sub_mask}"
+            assert np.all(
+                np.isclose(np.sum(sub_mask, axis=-1), 1)
+            ), f"Expects the sum of all mask values to be 1, actual sum: {np.sum(sub_mask, axis=-1)}"
+
+            return sub_start + _sample_probability_batch(self.np_random, n, sub_mask)
+        raise ValueError(f"Unsupported mask type: {mask_type}")
+
     def _apply_mask(
         self,
         sub_mask: MaskNDArray | tuple[MaskNDArray, ...],
@@ -214,6 +307,21 @@ class MultiDiscrete(Space[NDArray[np.integer]]):
             and np.all(x - self.start < self.nvec)
         )
 
+    def contains_batch(self, x: Any) -> NDArray[np.bool_]:
+        """Return a boolean array specifying which elements of the batch ``x``, of shape ``(n,) + shape``, are valid members of this space."""
+        if isinstance(x, Sequence):
+            x = np.array(x)  # Promote list to array for contains check
+
+        if not isinstance(x, np.ndarray) or x.ndim == 0:
+            return np.zeros(1, dtype=np.bool_)
+        elif x.shape[1:] != self.shape or not np.can_cast(x.dtype, self.dtype):
+            return np.zeros(len(x), dtype=np.bool_)
+
+        return np.all(
+            (self.start <= x) & (x - self.start < self.nvec),
+            axis=tuple(range(1, x.ndim)),
+        )
+
     def to_jsonable(
         self, sample_n: Sequence[NDArray[np.integer[Any]]]
     ) -> list[Sequence[int]]:
@@ -226,6 +334,14 @@ class MultiDiscrete(Space[NDArray[np.integer]]):
         """Convert a JSONable data type to a batch of samples from this space."""
         return [np.array(sample, dtype=self.dtype) for sample in sample_n]
 
+    def to_bytes(self, sample_n: Sequence[NDArray[np.integer[Any]]]) -> bytes:
+        """Convert a batch of samples from this space to a contiguous array of bytes."""
+        return _pack_array(sample_n, self.dtype)
+
+    def from_bytes(self, data: bytes | memoryview) -> list[NDArray[np.integer[Any]]]:
+        """Convert bytes to a batch of samples from this space, the samples are views of ``data``."""
+        return list(_unpack_array(data, self.dtype, self.shape))
+
     def __repr__(self):
         """Gives a string representation of this space."""
         if np.any(self.start != 0):
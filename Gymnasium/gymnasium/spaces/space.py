@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Generic, TypeAlias, TypeVar
 
@@ -17,6 +18,59 @@ T_cov = TypeVar("T_cov", covariant=True)
 MaskNDArray: TypeAlias = npt.NDArray[np.int8]
 
 
+def _all_batches(batches: Sequence[npt.NDArray[np.bool_]]) -> npt.NDArray[np.bool_]:
+    """Combines the subspace's :meth:`Space.contains_batch`, with every element being invalid if the batch sizes differ."""
+    if len(batches) == 0:
+        return np.ones(1, dtype=np.bool_)
+    elif any(batch.shape != batches[0].shape for batch in batches):
+        return np.zeros(max(len(batch) for batch in batches), dtype=np.bool_)
+    return np.logical_and.reduce(batches)
+
+
+def _pack_bytes(chunks: Sequence[bytes], n: int) -> bytes:
+    """Packs the subspace's :meth:`Space.to_bytes` of a batch of ``n`` samples into a single buffer with a header of the batch size and chunk sizes.
+
+    Each chunk is padded to a multiple of 8 bytes such that the chunks remain aligned for :func:`np.frombuffer`.
+    """
+    header = np.array([n, len(chunks)] + [len(chunk) for chunk in chunks], dtype="<u8")
+    parts = [header.tobytes()]
+    for chunk in chunks:
+        parts.append(chunk)
+        parts.append(b"\0" * (-len(chunk) % 8))
+    return b"".join(parts)
+
+
+def _unpack_bytes(data: bytes | memoryview) -> tuple[int, list[memoryview]]:
+    """Unpacks a buffer created with :func:`_pack_bytes` into the batch size and (zero-copy) views of each chunk."""
+    view = memoryview(data).cast("B")
+    n, num_chunks = np.frombuffer(view, dtype="<u8", count=2).tolist()
+    sizes = np.frombuffer(view, dtype="<u8", count=num_chunks, offset=16)
+
+    chunks, offset = [], 8 * (num_chunks + 2)
+    for size in sizes.tolist():
+        chunks.append(view[offset : offset + size])
+        offset += size + (-size % 8)
+    return n, chunks
+
+
+def _pack_array(sample_n: Sequence[Any], dtype: np.dtype) -> bytes:
+    """Packs a batch of fixed-shape samples into a contiguous array of ``dtype`` preceded by the batch size."""
+    return (
+        np.array([len(sample_n)], dtype="<u8").tobytes()
+        + np.asarray(sample_n, dtype=dtype).tobytes()
+    )
+
+
+def _unpack_array(
+    data: bytes | memoryview, dtype: np.dtype, shape: tuple[int, ...]
+) -> np.ndarray:
+    """Unpacks a buffer created with :func:`_pack_array` into a (zero-copy) array of shape ``(n,) + shape``."""
+    view = memoryview(data).cast("B")
+    n = int(np.frombuffer(view, dtype="<u8", count=1)[0])
+    count = n * int(np.prod(shape))
+    return np.frombuffer(view, dtype=dtype, count=count, offset=8).reshape((n,) + shape)
+
+
 class Space(Generic[T_cov]):
     """Superclass that is used to define observation and action spaces.
 
@@ -107,6 +161,27 @@ class Space(Generic[T_cov]):
         """
         raise NotImplementedError
 
+    def sample_batch(
+        self, n: int, mask: Any | None = None, probability: Any | None = None
+    ) -> Any:
+        """Randomly sample ``n`` elements of this space, returned as a single element of ``batch_space(space, n)``.
+
+        Spaces with a fixed shape, e.g., :class:`Box` or :class:`Discrete`, stack the samples into arrays with a
+        leading dimension of ``n``, using a single call to the random number generator for each subspace.
+        By default, this returns a tuple of ``n`` samples, matching the batched space of custom spaces.
+
+        Args:
+            n: The number of samples
+            mask: A mask used for all of the samples, see :meth:`sample` for the expected shape.
+                Some spaces also accept a batch of masks with a leading dimension of ``n``.
+            probability: A probability mask used for all of the samples, see :meth:`sample` for the expected shape.
+                Some spaces also accept a batch of probability masks with a leading dimension of ``n``.
+
+        Returns:
+            The batch of samples from the space
+        """
+        return tuple(self.sample(mask=mask, probability=probability) for _ in range(n))
+
     def seed(self, seed: int | None = None) -> int | list[int] | dict[str, int]:
         """Seed the pseudorandom number generator (PRNG) of this space and, if applicable, the PRNGs of subspaces.
 
@@ -127,6 +202,62 @@ class Space(Generic[T_cov]):
         """Return boolean specifying if x is a valid member of this space."""
         return self.contains(x)
 
+    def contains_batch(self, x: Any) -> npt.NDArray[np.bool_]:
+        """Return a boolean array specifying which elements of the batch ``x`` are valid members of this space.
+
+        The batch ``x`` is expected to be an element of ``batch_space(space, n)``, e.g., a batch of actions for a
+        vector environment, which spaces with a fixed shape check with a few array operations rather than ``n`` calls
+        to :meth:`contains`. If the structure of ``x`` is invalid (e.g., the wrong shape or dtype) then every element
+        is invalid, with a single ``False`` being returned if the batch size can't be determined.
+
+        Example:
+            >>> import numpy as np
+            >>> from gymnasium.spaces import Box
+            >>> space = Box(low=-1, high=1, shape=(2,))
+            >>> space.contains_batch(np.array([[0, 0], [2, 0], [-1, 1]], dtype=np.float32))
+            array([ True, False,  True])
+
+        Args:
+            x: The batch of ``n`` elements, by default, a tuple of ``n`` elements matching the batched space of
+                custom spaces.
+
+        Returns:
+            A boolean array of shape ``(n,)``
+        """
+        if not isinstance(x, (tuple, list)):
+            return np.zeros(1, dtype=np.bool_)
+        return np.fromiter(
+            (self.contains(sample) for sample in x), dtype=np.bool_, count=len(x)
+        )
+
+    def invalid_batch_leaf(self, x: Any) -> tuple[int, tuple[str | int, ...]] | None:
+        """Finds the first invalid element of the batch ``x`` and the path to the subspace it is invalid for.
+
+        For composite spaces, the path contains the keys (for :class:`Dict`) or indices (for :class:`Tuple`) to the
+        innermost subspace that the element is invalid for, otherwise the path is empty.
+
+        Example:
+            >>> import numpy as np
+            >>> from gymnasium.spaces import Box, Dict, Discrete
+            >>> space = Dict(position=Box(low=-1, high=1, shape=(2,)), gear=Discrete(3))
+            >>> batch = {"position": np.zeros((3, 2), dtype=np.float32), "gear": np.array([0, 1, 3])}
+            >>> space.contains_batch(batch)
+            array([ True,  True, False])
+            >>> space.invalid_batch_leaf(batch)
+            (2, ('gear',))
+
+        Args:
+            x: The batch of ``n`` elements, see :meth:`contains_batch`
+
+        Returns:
+            The index of the first invalid element and the path to its invalid subspace,
+            or ``None`` if all of the elements are valid
+        """
+        valid = self.contains_batch(x)
+        if np.all(valid):
+            return None
+        return int(np.argmin(valid)), ()
+
     def __setstate__(self, state: Iterable[tuple[str, Any]] | Mapping[str, Any]):
         """Used when loading a pickled space.
 
@@ -162,3 +293,42 @@ class Space(Generic[T_cov]):
         """Convert a JSONable data type to a batch of samples from this space."""
         # By default, assume identity is JSONable
         return sample_n
+
+    def to_bytes(self, sample_n: Sequence[T_cov]) -> bytes:
+        """Convert a batch of samples from this space to a binary format, the inverse of :meth:`from_bytes`.
+
+        Spaces with a fixed shape, e.g., :class:`Box` or :class:`Discrete`, store the batch size followed by the batch
+        as a single contiguous array of the space's dtype, with composite spaces storing the batch size and each
+        subspace's batch as a separate column.
+        By default, the batch is serialized using :meth:`to_jsonable`.
+
+        Example:
+            >>> import numpy as np
+            >>> from gymnasium.spaces import Box, Dict, Discrete
+            >>> space = Dict(position=Box(low=-1, high=1, shape=(2,)), gear=Discrete(3))
+            >>> data = space.to_bytes([space.sample(), space.sample()])
+            >>> samples = space.from_bytes(data)
+            >>> len(samples), samples[0]["position"].dtype
+            (2, dtype('float32'))
+
+        Args:
+            sample_n: The batch of samples
+
+        Returns:
+            The binary data of the batch
+        """
+        return json.dumps(self.to_jsonable(sample_n)).encode()
+
+    def from_bytes(self, data: bytes | memoryview) -> list[T_cov]:
+        """Convert binary data from :meth:`to_bytes` to a batch of samples from this space.
+
+        For spaces with a fixed shape, the samples are views of ``data`` without copying, which are read-only if
+        ``data`` is immutable, i.e., ``bytes``.
+
+        Args:
+            data: The binary data of the batch
+
+        Returns:
+            The batch of samples
+        """
+        return self.from_jsonable(json.loads(bytes(data)))
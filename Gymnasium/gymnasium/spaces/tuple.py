@@ -7,8 +7,9 @@ from collections.abc import Iterable
 from typing import Any
 
 import numpy as np
+from numpy.typing import NDArray
 
-from gymnasium.spaces.space import Space
+from gymnasium.spaces.space import Space, _all_batches, _pack_bytes, _unpack_bytes
 
 
 class Tuple(Space[tuple[Any, ...]], typing.Sequence[Any]):
@@ -138,6 +139,55 @@ class Tuple(Space[tuple[Any, ...]], typing.Sequence[Any]):
         else:
             return tuple(space.sample() for space in self.spaces)
 
+    def sample_batch(
+        self,
+        n: int,
+        mask: tuple[Any | None, ...] | None = None,
+        probability: tuple[Any | None, ...] | None = None,
+    ) -> tuple[Any, ...]:
+        """Generates ``n`` random samples from each of the subspaces, see :meth:`Space.sample_batch`.
+
+        Args:
+            n: The number of samples
+            mask: An optional tuple of optional (batched) masks for each of the subspace's samples,
+                expects the same number of masks as spaces
+            probability: An optional tuple of optional (batched) probability masks for each of the subspace's samples,
+                expects the same number of probability masks as spaces
+
+        Returns:
+            Tuple of the subspace's batched samples, an element of ``batch_space(space, n)``
+        """
+        if mask is not None and probability is not None:
+            raise ValueError(
+                f"Only one of `mask` or `probability` can be provided, actual values: mask={mask}, probability={probability}"
+            )
+        elif mask is not None:
+            assert isinstance(
+                mask, tuple
+            ), f"Expected type of `mask` to be tuple, actual type: {type(mask)}"
+            assert len(mask) == len(
+                self.spaces
+            ), f"Expected length of `mask` to be {len(self.spaces)}, actual length: {len(mask)}"
+
+            return tuple(
+                space.sample_batch(n, mask=space_mask)
+                for space, space_mask in zip(self.spaces, mask)
+            )
+        elif probability is not None:
+            assert isinstance(
+                probability, tuple
+            ), f"Expected type of `probability` to be tuple, actual type: {type(probability)}"
+            assert len(probability) == len(
+                self.spaces
+            ), f"Expected length of `probability` to be {len(self.spaces)}, actual length: {len(probability)}"
+
+            return tuple(
+                space.sample_batch(n, probability=space_probability)
+                for space, space_probability in zip(self.spaces, probability)
+            )
+        else:
+            return tuple(space.sample_batch(n) for space in self.spaces)
+
     def contains(self, x: Any) -> bool:
         """Return boolean specifying if x is a valid member of this space."""
         if isinstance(x, (list, np.ndarray)):
@@ -149,6 +199,35 @@ class Tuple(Space[tuple[Any, ...]], typing.Sequence[Any]):
             and all(space.contains(part) for (space, part) in zip(self.spaces, x))
         )
 
+    def contains_batch(self, x: Any) -> NDArray[np.bool_]:
+        """Return a boolean array specifying which elements of the batch ``x``, a tuple of the subspace's batches, are valid members of this space."""
+        if isinstance(x, list):
+            x = tuple(x)  # Promote list to tuple for contains check
+
+        if not isinstance(x, tuple) or len(x) != len(self.spaces):
+            return np.zeros(1, dtype=np.bool_)
+        return _all_batches(
+            [space.contains_batch(part) for space, part in zip(self.spaces, x)]
+        )
+
+    def invalid_batch_leaf(self, x: Any) -> tuple[int, tuple[str | int, ...]] | None:
+        """Finds the first invalid element of the batch ``x`` and the path to the subspace it is invalid for, see :meth:`Space.invalid_batch_leaf`."""
+        if isinstance(x, list):
+            x = tuple(x)  # Promote list to tuple for contains check
+
+        if not isinstance(x, tuple) or len(x) != len(self.spaces):
+            return 0, ()
+
+        failures = []
+        for i, (space, part) in enumerate(zip(self.spaces, x)):
+            failure = space.invalid_batch_leaf(part)
+            if failure is not None:
+                failures.append((failure[0], (i,) + failure[1]))
+        if len(failures) > 0:
+            return min(failures, key=lambda failure: failure[0])
+        # The subspace's batches are valid however with different sizes
+        return super().invalid_batch_leaf(x)
+
     def __repr__(self) -> str:
         """Gives a string representation of this space."""
         return "Tuple(" + ", ".join([str(s) for s in self.spaces]) + ")"
@@ -175,6 +254,22 @@ class Tuple(Space[tuple[Any, ...]], typing.Sequence[Any]):
             )
         ]
 
+    def to_bytes(self, sample_n: typing.Sequence[tuple[Any, ...]]) -> bytes:
+        """Convert a batch of samples from this space to bytes, with a column for each subspace's batch."""
+        return _pack_bytes(
+            [
+                space.to_bytes([sample[i] for sample in sample_n])
+                for i, space in enumerate(self.spaces)
+            ],
+            len(sample_n),
+        )
+
+    def from_bytes(self, data: bytes | memoryview) -> list[tuple[Any, ...]]:
+        """Convert bytes to a batch of samples from this space."""
+        n_elements, chunks = _unpack_bytes(data)
+        columns = [space.from_bytes(chunk) for space, chunk in zip(self.spaces, chunks)]
+        return [tuple(column[n] for column in columns) for n in range(n_elements)]
+
     def __getitem__(self, index: int) -> Space[Any]:
         """Get the subspace at specific `index`."""
         return self.spaces[index]
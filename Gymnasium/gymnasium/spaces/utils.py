@@ -669,3 +669,222 @@ def _is_space_sequence_dtype_shape_equiv(space_1: Sequence, space_2):
         and space_1.stack is space_2.stack
         and is_space_dtype_shape_equiv(space_1.feature_space, space_2.feature_space)
     )
+
+
+class Flattener:
+    """Flattens and unflattens elements of a numpy-flattenable space with a plan compiled once for the space.
+
+    Unlike :func:`flatten` and :func:`unflatten`, that dispatch on every subspace and concatenate the flattened
+    subspaces on every call, the flattener precomputes the offset, dtype and shape of each of the space's leaves
+    (the non-composite subspaces) such that each leaf is written directly into a single output array.
+    Unflattened :class:`Box` and :class:`MultiBinary` leaves are views of the flattened array (if their dtypes match).
+    Batches of elements, i.e., elements of ``batch_space(space, n)``, are flattened and unflattened without iterating
+    over the batch with :meth:`flatten_batch` and :meth:`unflatten_batch`.
+
+    The flattened elements are equal to :func:`flatten`'s, always with the dtype of :func:`flatten_space`, and
+    the unflattened elements are equal to :func:`unflatten`'s.
+
+    Example:
+        >>> from gymnasium.spaces import Box, Dict, Discrete
+        >>> space = Dict(position=Box(-1, 1, shape=(2,)), gear=Discrete(3))
+        >>> flattener = Flattener(space)
+        >>> flattener.flatten({"gear": 1, "position": np.array([0.5, -0.5], dtype=np.float32)})
+        array([ 0.5, -0.5,  0. ,  1. ,  0. ])
+        >>> flat_batch = flattener.flatten_batch({"gear": np.array([0, 2]), "position": np.zeros((2, 2), dtype=np.float32)})
+        >>> flat_batch
+        array([[0., 0., 1., 0., 0.],
+               [0., 0., 0., 0., 1.]])
+        >>> flattener.unflatten_batch(flat_batch)
+        {'position': array([[0., 0.],
+               [0., 0.]], dtype=float32), 'gear': array([0, 2])}
+    """
+
+    def __init__(self, space: Space[Any]):
+        """Compiles the flattening plan for a space.
+
+        Args:
+            space: The numpy-flattenable space, see :attr:`Space.is_np_flattenable`
+
+        Raises:
+            ValueError: If the space is not numpy-flattenable
+        """
+        if not space.is_np_flattenable:
+            raise ValueError(
+                f"Flattener requires a numpy-flattenable space, actual space: {space}"
+            )
+
+        self.space = space
+        self.flatdim = flatdim(space)
+        self.dtype = flatten_space(space).dtype
+
+        # Each leaf is `(space, path, start, stop, onehot offsets)`, with the structure using the leaf indices
+        self._leaves: list[tuple[Space[Any], tuple[Any, ...], int, int, Any]] = []
+        self._structure = self._compile(space, ())
+
+    def _compile(self, space: Space[Any], path: tuple[Any, ...]) -> Any:
+        """Appends the leaves of the space to the plan, returning the structure of the space's elements."""
+        if isinstance(space, Tuple):
+            return tuple(
+                self._compile(subspace, path + (i,))
+                for i, subspace in enumerate(space.spaces)
+            )
+        elif isinstance(space, Dict):
+            return {
+                key: self._compile(subspace, path + (key,))
+                for key, subspace in space.spaces.items()
+            }
+
+        start = self._leaves[-1][3] if self._leaves else 0
+        stop = start + flatdim(space)
+        if isinstance(space, MultiDiscrete):
+            # the index of each discrete's one-hot encoding in the flattened leaf
+            offsets = np.zeros(space.nvec.size, dtype=np.int64)
+            offsets[1:] = np.cumsum(space.nvec.flatten())[:-1]
+        else:
+            offsets = None
+        self._leaves.append((space, path, start, stop, offsets))
+        return len(self._leaves) - 1
+
+    def _leaf_values(self, x: Any) -> list[Any]:
+        values = []
+        for _, path, _, _, _ in self._leaves:
+            value = x
+            for key in path:
+                value = value[key]
+            values.append(value)
+        return values
+
+    def _build(self, structure: Any, values: list[Any]) -> Any:
+        if isinstance(structure, int):
+            return values[structure]
+        elif isinstance(structure, tuple):
+            return tuple(self._build(child, values) for child in structure)
+        else:
+            return {key: self._build(child, values) for key, child in structure.items()}
+
+    def flatten(self, x: Any, out: NDArray[Any] | None = None) -> NDArray[Any]:
+        """Flattens an element of the space, equivalent to :func:`flatten`.
+
+        Args:
+            x: The element to flatten
+            out: An optional array of shape ``(flatdim,)`` that the element is written into
+
+        Returns:
+            The flattened element, the ``out`` array if provided
+        """
+        if out is None:
+            out = np.empty(self.flatdim, dtype=self.dtype)
+
+        for (space, _, start, stop, offsets), value in zip(
+            self._leaves, self._leaf_values(x)
+        ):
+            if isinstance(space, (Box, MultiBinary)):
+                out[start:stop] = np.asarray(value, dtype=space.dtype).reshape(-1)
+            elif isinstance(space, Discrete):
+                out[start:stop] = 0
+                out[start + value - space.start] = 1
+            elif isinstance(space, MultiDiscrete):
+                out[start:stop] = 0
+                out[start + offsets + (value - space.start).flatten()] = 1
+            else:
+                out[start:stop] = flatten(space, value)
+        return out
+
+    def flatten_batch(self, x: Any, out: NDArray[Any] | None = None) -> NDArray[Any]:
+        """Flattens a batch of elements, an element of ``batch_space(space, n)``, without iterating over the batch.
+
+        Args:
+            x: The batch of elements to flatten
+            out: An optional array of shape ``(n, flatdim)`` that the batch is written into
+
+        Returns:
+            The flattened batch of shape ``(n, flatdim)``, the ``out`` array if provided
+        """
+        values = self._leaf_values(x)
+        n = len(values[0]) if values else 0
+        if out is None:
+            out = np.empty((n, self.flatdim), dtype=self.dtype)
+
+        rows = np.arange(n)
+        for (space, _, start, stop, offsets), value in zip(self._leaves, values):
+            if isinstance(space, (Box, MultiBinary)):
+                out[:, start:stop] = np.asarray(value, dtype=space.dtype).reshape(n, -1)
+            elif isinstance(space, Discrete):
+                out[:, start:stop] = 0
+                out[rows, start + np.asarray(value) - space.start] = 1
+            elif isinstance(space, MultiDiscrete):
+                out[:, start:stop] = 0
+                indices = (np.asarray(value) - space.start).reshape(n, -1)
+                out[rows[:, None], start + offsets + indices] = 1
+            else:
+                # the batch space of the remaining spaces is a tuple of the elements
+                for i, item in enumerate(value):
+                    out[i, start:stop] = flatten(space, item)
+        return out
+
+    def unflatten(self, x: NDArray[Any]) -> Any:
+        """Unflattens a flattened element of the space, equivalent to :func:`unflatten`.
+
+        Args:
+            x: The flattened element of shape ``(flatdim,)``
+
+        Returns:
+            The element of the space, with :class:`Box` and :class:`MultiBinary` leaves being views of ``x``
+        """
+        values = []
+        for space, _, start, stop, _ in self._leaves:
+            if isinstance(space, (Box, MultiBinary)):
+                values.append(
+                    np.asarray(x[start:stop], dtype=space.dtype).reshape(space.shape)
+                )
+            else:
+                values.append(unflatten(space, x[start:stop]))
+        return self._build(self._structure, values)
+
+    def unflatten_batch(self, x: NDArray[Any]) -> Any:
+        """Unflattens a batch of flattened elements into an element of ``batch_space(space, n)``, without iterating over the batch.
+
+        Args:
+            x: The flattened batch of shape ``(n, flatdim)``
+
+        Returns:
+            The batch of elements, with :class:`Box` and :class:`MultiBinary` leaves being views of ``x``
+
+        Raises:
+            ValueError: If a :class:`Discrete` or :class:`MultiDiscrete` leaf is not one-hot encoded
+        """
+        n = len(x)
+        values = []
+        for space, _, start, stop, offsets in self._leaves:
+            if isinstance(space, (Box, MultiBinary)):
+                values.append(
+                    np.asarray(x[:, start:stop], dtype=space.dtype).reshape(
+                        (n,) + space.shape
+                    )
+                )
+            elif isinstance(space, Discrete):
+                nonzero = x[:, start:stop] != 0
+                if not np.all(np.any(nonzero, axis=1)):
+                    raise ValueError(
+                        f"{x} is not a batch of valid one-hot encoded vectors and can not be unflattened to space {space}. "
+                        "Not all valid samples in a flattened space can be unflattened."
+                    )
+                values.append(
+                    space.start + np.argmax(nonzero, axis=1).astype(space.dtype)
+                )
+            elif isinstance(space, MultiDiscrete):
+                _, indices = np.nonzero(x[:, start:stop])
+                if len(indices) != n * space.nvec.size:
+                    raise ValueError(
+                        f"{x} is not a batch of concatenated one-hot encoded vectors and can not be unflattened to space {space}. "
+                        "Not all valid samples in a flattened space can be unflattened."
+                    )
+                values.append(
+                    np.asarray(
+                        indices.reshape(n, -1) - offsets, dtype=space.dtype
+                    ).reshape((n,) + space.shape)
+                    + space.start
+                )
+            else:
+                values.append(tuple(unflatten(space, row) for row in x[:, start:stop]))
+        return self._build(self._structure, values)
@@ -14,13 +14,27 @@ Original Author: Mark Towers
 These projects are covered by the MIT License.
 """
 
+from __future__ import annotations
+
+import hashlib
+import importlib.util
 import inspect
-from copy import deepcopy
+import json
+import multiprocessing
+import os
+import time
+import warnings
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from itertools import repeat
 
 import numpy as np
 
 import gymnasium as gym
 from gymnasium import logger, spaces
+from gymnasium.envs.registration import EnvSpec
 from gymnasium.utils.passive_env_checker import (
     check_action_space,
     check_observation_space,
@@ -57,11 +71,13 @@ def data_equivalence(data_1, data_2, exact: bool = False) -> bool:
                 return all(
                     data_equivalence(a, b, exact) for a, b in zip(data_1, data_2)
                 )
+            # Comparing the arrays exactly is cheaper than `np.allclose` so is checked first
+            elif np.array_equal(data_1, data_2):
+                return True
+            elif exact:
+                return False
             else:
-                if exact:
-                    return np.all(data_1 == data_2)
-                else:
-                    return np.allclose(data_1, data_2, rtol=1e-5, atol=1e-5)
+                return np.allclose(data_1, data_2, rtol=1e-5, atol=1e-5)
         else:
             return False
     else:
@@ -91,7 +107,7 @@ def check_reset_seed_determinism(env: gym.Env):
             assert (
                 env.unwrapped._np_random is not None
             ), "Expects the random number generator to have been generated given a seed was passed to reset. Most likely the environment reset function does not call `super().reset(seed=seed)`."
-            seed_123_rng_1 = deepcopy(env.unwrapped._np_random)
+            seed_123_rng_state_1 = env.unwrapped._np_random.bit_generator.state
 
             obs_2, info = env.reset()
             assert (
@@ -102,7 +118,7 @@ def check_reset_seed_determinism(env: gym.Env):
             assert (
                 obs_3 in env.observation_space
             ), "The observation returned by `env.reset(seed=123)` is not within the observation space."
-            seed_123_rng_3 = deepcopy(env.unwrapped._np_random)
+            seed_123_rng_state_3 = env.unwrapped._np_random.bit_generator.state
 
             obs_4, info = env.reset()
             assert (
@@ -126,7 +142,7 @@ def check_reset_seed_determinism(env: gym.Env):
                     )
 
             assert (
-                seed_123_rng_1.bit_generator.state == seed_123_rng_3.bit_generator.state
+                seed_123_rng_state_1 == seed_123_rng_state_3
             ), "Most likely the environment reset function does not call `super().reset(seed=seed)` as the random generates are not same when the same seeds are passed to `env.reset`."
 
             obs_5, info = env.reset(seed=456)
@@ -134,8 +150,7 @@ def check_reset_seed_determinism(env: gym.Env):
                 obs_5 in env.observation_space
             ), "The observation returned by `env.reset(seed=456)` is not within the observation space."
             assert (
-                env.unwrapped._np_random.bit_generator.state
-                != seed_123_rng_1.bit_generator.state
+                env.unwrapped._np_random.bit_generator.state != seed_123_rng_state_1
             ), "Most likely the environment reset function does not call `super().reset(seed=seed)` as the random number generators are not different when different seeds are passed to `env.reset`."
 
         except TypeError as e:
@@ -203,14 +218,14 @@ def check_step_determinism(env: gym.Env, seed=123):
 
     env.reset(seed=seed)
     obs_0, rew_0, term_0, trunc_0, info_0 = env.step(action)
-    seeded_rng: np.random.Generator = deepcopy(env.unwrapped._np_random)
+    seeded_rng_state = env.unwrapped._np_random.bit_generator.state
 
     env.reset(seed=seed)
     obs_1, rew_1, term_1, trunc_1, info_1 = env.step(action)
 
     assert (
         env.unwrapped._np_random.bit_generator.state  # pyright: ignore [reportOptionalMemberAccess]
-        == seeded_rng.bit_generator.state
+        == seeded_rng_state
     ), "The `.np_random` is not properly been updated after step."
 
     assert data_equivalence(
@@ -342,11 +357,23 @@ def check_space_limit(space, space_type: str):
             check_space_limit(subspace, space_type)
 
 
+@contextmanager
+def _timed(timings: dict[str, float] | None, name: str):
+    """Adds the time taken by the block to ``timings[name]`` if timings are recorded."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
 def check_env(
     env: gym.Env,
-    warn: bool = None,
+    warn: bool | None = None,
     skip_render_check: bool = False,
     skip_close_check: bool = False,
+    timings: dict[str, float] | None = None,
 ):
     """Check that an environment follows Gymnasium's API.
 
@@ -362,6 +389,7 @@ def check_env(
         warn: Ignored, previously silenced particular warnings
         skip_render_check: Whether to skip the checks for the render method. False by default (useful for the CI)
         skip_close_check: Whether to skip the checks for the close method. False by default
+        timings: If a dictionary is passed, the time taken by each check in seconds is recorded in it, keyed by the check name
     """
     if warn is not None:
         logger.warn("`check_env(warn=...)` parameter is now ignored.")
@@ -406,41 +434,223 @@ def check_env(
     check_space_limit(env.observation_space, "observation")
 
     # ==== Check the reset method ====
-    check_seed_deprecation(env)
-    check_reset_return_info_deprecation(env)
-    check_reset_return_type(env)
-    check_reset_seed_determinism(env)
-    check_reset_options(env)
+    for check in (
+        check_seed_deprecation,
+        check_reset_return_info_deprecation,
+        check_reset_return_type,
+        check_reset_seed_determinism,
+        check_reset_options,
+    ):
+        with _timed(timings, check.__name__):
+            check(env)
 
     # ============ Check the returned values ===============
-    env_reset_passive_checker(env)
-    env_step_passive_checker(env, env.action_space.sample())
+    with _timed(timings, "env_reset_passive_checker"):
+        env_reset_passive_checker(env)
+    with _timed(timings, "env_step_passive_checker"):
+        env_step_passive_checker(env, env.action_space.sample())
 
     # ==== Check the step method ====
-    check_step_determinism(env)
+    with _timed(timings, "check_step_determinism"):
+        check_step_determinism(env)
 
     # ==== Check the render method and the declared render modes ====
     if not skip_render_check:
         if env.render_mode is not None:
-            env_render_passive_checker(env)
+            with _timed(timings, "env_render_passive_checker"):
+                env_render_passive_checker(env)
 
         if env.spec is not None:
             for render_mode in env.metadata["render_modes"]:
-                new_env = env.spec.make(render_mode=render_mode)
-                new_env.reset()
-                env_render_passive_checker(new_env)
-                new_env.close()
+                with _timed(timings, f"render_mode={render_mode}"):
+                    new_env = env.spec.make(render_mode=render_mode)
+                    new_env.reset()
+                    env_render_passive_checker(new_env)
+                    new_env.close()
         else:
             logger.warn(
                 "Not able to test alternative render modes due to the environment not having a spec. Try instantiating the environment through `gymnasium.make`"
             )
 
     if not skip_close_check and env.spec is not None:
-        new_env = env.spec.make()
-        new_env.close()
-        try:
+        with _timed(timings, "close"):
+            new_env = env.spec.make()
             new_env.close()
-        except Exception as e:
-            logger.warn(
-                f"Calling `env.close()` on the closed environment should be allowed, but it raised an exception: {e}"
+            try:
+                new_env.close()
+            except Exception as e:
+                logger.warn(
+                    f"Calling `env.close()` on the closed environment should be allowed, but it raised an exception: {e}"
+                )
+
+
+@dataclass
+class EnvCheckResult:
+    """The result of checking an environment with :func:`check_envs`.
+
+    * **env_id**: The id of the checked environment
+    * **error**: The error raised by :func:`check_env`, ``None`` if the environment passed the checks
+    * **warnings**: The warnings raised by :func:`check_env`
+    * **timings**: The time taken in seconds by each check, including ``"make"`` for creating the environment
+    * **cached**: If the result was loaded from the cache rather than checked
+    """
+
+    env_id: str
+    error: str | None = None
+    warnings: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+    cached: bool = False
+
+    @property
+    def passed(self) -> bool:
+        """If the environment passed the checks."""
+        return self.error is None
+
+    @property
+    def total_time(self) -> float:
+        """The total time taken in seconds to check the environment."""
+        return sum(self.timings.values())
+
+
+def _check_env_spec(
+    env_spec: EnvSpec, skip_render_check: bool, skip_close_check: bool
+) -> EnvCheckResult:
+    """Checks the environment of the spec, catching the error and warnings raised."""
+    result = EnvCheckResult(env_spec.id)
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        try:
+            with _timed(result.timings, "make"):
+                env = env_spec.make().unwrapped
+            check_env(
+                env,
+                skip_render_check=skip_render_check,
+                skip_close_check=skip_close_check,
+                timings=result.timings,
             )
+            env.close()
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+    result.warnings = [str(warning.message) for warning in caught_warnings]
+    return result
+
+
+def _env_check_cache_key(
+    env_spec: EnvSpec, skip_render_check: bool, skip_close_check: bool
+) -> str | None:
+    """Hashes the spec, the source file of the environment and the checker, ``None`` if the spec can't be hashed."""
+    try:
+        env_spec_json = env_spec.to_json()
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(env_spec.entry_point, str):
+        return None
+    module_spec = importlib.util.find_spec(env_spec.entry_point.split(":")[0])
+    if module_spec is None or module_spec.origin is None:
+        return None
+
+    hasher = hashlib.sha256(
+        f"{gym.__version__}-{env_spec_json}-{skip_render_check}-{skip_close_check}".encode()
+    )
+    for source_file in (
+        module_spec.origin,
+        __file__,
+        inspect.getfile(env_reset_passive_checker),
+    ):
+        with open(source_file, "rb") as file:
+            hasher.update(file.read())
+    return hasher.hexdigest()
+
+
+def check_envs(
+    env_specs: Iterable[str | EnvSpec],
+    num_workers: int | None = None,
+    cache_path: str | os.PathLike | None = None,
+    skip_render_check: bool = False,
+    skip_close_check: bool = False,
+    context: str | None = None,
+) -> dict[str, EnvCheckResult]:
+    """Checks several environments with :func:`check_env` in parallel across a process pool, with cached results and the time taken by each check.
+
+    The environments are independent, so they are each checked in a separate worker process, rather than
+    checking them one after another. Each environment is made from its spec and the unwrapped environment is
+    checked, the errors and warnings raised are collected in the results rather than raised.
+
+    If a ``cache_path`` is given, the results of the environments that passed the checks are saved to the json file
+    keyed by a hash of the environment spec, the source file of the environment entry point, the environment checker
+    source and Gymnasium version. These environments are not checked again until any of them change. Environments
+    with a callable entry point or arguments that are not json compatible are not cached.
+
+    Example:
+        >>> from gymnasium.utils.env_checker import check_envs
+        >>> results = check_envs(["CartPole-v1", "Pendulum-v1"], num_workers=1, skip_render_check=True)
+        >>> results["CartPole-v1"].passed
+        True
+        >>> slowest = max(results.values(), key=lambda result: result.total_time)
+        >>> slowest.env_id in results
+        True
+
+    Args:
+        env_specs: The environment ids or specs to check
+        num_workers: The number of worker processes, by default, the number of cpus. For one worker, the
+            environments are checked in this process.
+        cache_path: The path to the json file of cached results, optional
+        skip_render_check: Whether to skip the checks for the render method
+        skip_close_check: Whether to skip the checks for the close method
+        context: Context for `multiprocessing`. If ``None``, then the default context is used.
+
+    Returns:
+        The results of the checks keyed by environment id
+    """
+    env_specs = [
+        gym.spec(env_spec) if isinstance(env_spec, str) else env_spec
+        for env_spec in env_specs
+    ]
+    cache_keys = [
+        _env_check_cache_key(env_spec, skip_render_check, skip_close_check)
+        for env_spec in env_specs
+    ]
+
+    cache = {}
+    if cache_path is not None and os.path.exists(cache_path):
+        with open(cache_path) as file:
+            cache = json.load(file)
+
+    results: dict[str, EnvCheckResult] = {}
+    unchecked_specs, unchecked_keys = [], []
+    for env_spec, cache_key in zip(env_specs, cache_keys):
+        if cache_key is not None and cache_key in cache:
+            results[env_spec.id] = EnvCheckResult(**cache[cache_key], cached=True)
+        else:
+            unchecked_specs.append(env_spec)
+            unchecked_keys.append(cache_key)
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    check_args = (
+        unchecked_specs,
+        repeat(skip_render_check),
+        repeat(skip_close_check),
+    )
+    if num_workers <= 1 or len(unchecked_specs) <= 1:
+        checked_results = list(map(_check_env_spec, *check_args))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(num_workers, len(unchecked_specs)),
+            mp_context=multiprocessing.get_context(context),
+        ) as executor:
+            checked_results = list(executor.map(_check_env_spec, *check_args))
+
+    for result, cache_key in zip(checked_results, unchecked_keys):
+        results[result.env_id] = result
+        if cache_key is not None and result.passed:
+            cache[cache_key] = {
+                key: value for key, value in asdict(result).items() if key != "cached"
+            }
+
+    if cache_path is not None and len(checked_results) > 0:
+        with open(cache_path, "w") as file:
+            json.dump(cache, file)
+
+    # The results are ordered as the given environments
+    return {env_spec.id: results[env_spec.id] for env_spec in env_specs}
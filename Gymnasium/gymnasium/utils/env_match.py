@@ -1,7 +1,15 @@
 """A set of tests to help the designer of gymnasium environments verify that they work correctly."""
 
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import numpy as np
+
 import gymnasium as gym
 from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AutoresetMode, VectorEnv
 
 
 def check_environments_match(
@@ -148,3 +156,219 @@ def check_environments_match(
                 assert (
                     env_a.render() == env_b.render()
                 ).all(), "resetting render is not equivalent in step = {step}"
+
+
+def _batch_mismatches(
+    data_a: Any, data_b: Any, num_envs: int, exact: bool, rtol: float, atol: float
+) -> np.ndarray:
+    """Returns the sub-environments of which the batched data is not equivalent, comparing whole arrays at once."""
+    if isinstance(data_a, dict) and isinstance(data_b, dict):
+        if data_a.keys() != data_b.keys():
+            return np.ones(num_envs, dtype=np.bool_)
+        mismatches = np.zeros(num_envs, dtype=np.bool_)
+        for key in data_a:
+            mismatches |= _batch_mismatches(
+                data_a[key], data_b[key], num_envs, exact, rtol, atol
+            )
+        return mismatches
+    elif isinstance(data_a, tuple) and isinstance(data_b, tuple):
+        if len(data_a) != len(data_b):
+            return np.ones(num_envs, dtype=np.bool_)
+        mismatches = np.zeros(num_envs, dtype=np.bool_)
+        for sub_data_a, sub_data_b in zip(data_a, data_b):
+            mismatches |= _batch_mismatches(
+                sub_data_a, sub_data_b, num_envs, exact, rtol, atol
+            )
+        return mismatches
+    elif (
+        isinstance(data_a, np.ndarray)
+        and isinstance(data_b, np.ndarray)
+        and data_a.shape == data_b.shape
+        and data_a.shape[:1] == (num_envs,)
+    ):
+        if data_a.dtype == object or data_b.dtype == object:
+            return np.array(
+                [
+                    not data_equivalence(sub_data_a, sub_data_b, exact)
+                    for sub_data_a, sub_data_b in zip(data_a, data_b)
+                ],
+                dtype=np.bool_,
+            )
+        # The values are compared rather than the dtypes, e.g., float32 and float64 rewards
+        elif exact or not (
+            np.issubdtype(data_a.dtype, np.inexact)
+            or np.issubdtype(data_b.dtype, np.inexact)
+        ):
+            equivalent = data_a == data_b
+        else:
+            equivalent = np.isclose(data_a, data_b, rtol=rtol, atol=atol)
+        return np.logical_not(equivalent.reshape(num_envs, -1).all(axis=1))
+    else:
+        return np.full(
+            num_envs, not data_equivalence(data_a, data_b, exact), dtype=np.bool_
+        )
+
+
+def _sub_env_data(data: Any, index: int) -> Any:
+    """Returns the data of a sub-environment from the batched data."""
+    if isinstance(data, dict):
+        return {key: _sub_env_data(value, index) for key, value in data.items()}
+    elif isinstance(data, tuple):
+        return tuple(_sub_env_data(value, index) for value in data)
+    elif isinstance(data, np.ndarray) and data.ndim > 0:
+        return data[index]
+    return data
+
+
+def check_vector_environments_match(
+    vector_env: VectorEnv,
+    reference_env: VectorEnv,
+    num_steps: int,
+    seeds: Iterable[int] = (0,),
+    sync_states: Callable[[VectorEnv, VectorEnv, np.ndarray], None] | None = None,
+    rtol: float = 1e-5,
+    atol: float = 1e-5,
+    skip_obs: bool = False,
+    skip_rew: bool = False,
+    skip_info: bool = False,
+):
+    """Checks if the vector environments `vector_env` & `reference_env` are identical, comparing the batched data of all sub-environments at once.
+
+    This is intended to verify that a native vector environment, e.g., :class:`gymnasium.envs.classic_control.cartpole.CartPoleVectorEnv`,
+    matches a :class:`gymnasium.vector.SyncVectorEnv` of the single environment, or to check the determinism of a vector
+    environment against another instance of it. For each seed, the environments are reset with the seed and stepped with
+    the same actions, the observations and rewards are compared with a relative and absolute tolerance and the
+    terminations and truncations exactly. The first step and sub-environment where the environments diverge is reported.
+
+    Native vector environments commonly draw the initial states of all sub-environments from a single random number
+    generator, unlike each sub-environment of a :class:`SyncVectorEnv` with its own generator. For these, ``sync_states``
+    is called with the environments and a mask of the sub-environments that were reset to copy the states of
+    ``vector_env`` to ``reference_env``, the reset observations and infos of these sub-environments are not compared.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from gymnasium.envs.classic_control.cartpole import CartPoleEnv, CartPoleVectorEnv
+        >>> def sync_states(vector_env, reference_env, reset_mask):
+        ...     for i in np.flatnonzero(reset_mask):
+        ...         reference_env.envs[i].unwrapped.state = vector_env.unwrapped.state[:, i].copy()
+        >>> vector_env = CartPoleVectorEnv(num_envs=3)
+        >>> reference_env = gym.vector.SyncVectorEnv([lambda: CartPoleEnv() for _ in range(3)])
+        >>> check_vector_environments_match(vector_env, reference_env, num_steps=100, seeds=(0, 1), sync_states=sync_states)
+
+    Args:
+        vector_env: The vector environment to check
+        reference_env: The reference vector environment to check against
+        num_steps: The number of timesteps to test for with each seed, setting to 0 tests only resetting.
+        seeds: The seeds used to reset the environments and sample the actions
+        sync_states: A function copying the states of the sub-environments of ``vector_env`` to ``reference_env``
+            given a mask of the sub-environments that were reset, optionally
+        rtol: The relative tolerance of comparing the observations, rewards and infos
+        atol: The absolute tolerance of comparing the observations, rewards and infos
+        skip_obs: If `True` it does not check for equivalence of the observations.
+        skip_rew: If `True` it does not check for equivalence of the rewards.
+        skip_info: If `True` it does not check for equivalence of the infos.
+    """
+    assert vector_env.num_envs == reference_env.num_envs
+    assert vector_env.single_action_space == reference_env.single_action_space
+    assert (
+        skip_obs
+        or vector_env.single_observation_space == reference_env.single_observation_space
+    )
+    autoreset_mode = vector_env.metadata.get("autoreset_mode", AutoresetMode.NEXT_STEP)
+    assert autoreset_mode == reference_env.metadata.get(
+        "autoreset_mode", AutoresetMode.NEXT_STEP
+    ), "The environments must have the same autoreset mode."
+    num_envs = vector_env.num_envs
+
+    def _assert_match(name, data_a, data_b, step, seed, compared, exact=False):
+        mismatches = _batch_mismatches(data_a, data_b, num_envs, exact, rtol, atol)
+        mismatches &= compared
+        if np.any(mismatches):
+            index = int(np.argmax(mismatches))
+            raise AssertionError(
+                f"The {name} of sub-environment {index} diverged at {step} with seed={seed}, "
+                f"vector_env {name} = {_sub_env_data(data_a, index)}, reference_env {name} = {_sub_env_data(data_b, index)}"
+            )
+
+    all_envs = np.ones(num_envs, dtype=np.bool_)
+    for seed in seeds:
+        obs_a, info_a = vector_env.reset(seed=seed)
+        obs_b, info_b = reference_env.reset(seed=seed)
+        if sync_states is None:
+            compared = all_envs
+        else:
+            sync_states(vector_env, reference_env, all_envs)
+            compared = np.logical_not(all_envs)
+        if not skip_obs:
+            _assert_match("observation", obs_a, obs_b, "reset", seed, compared)
+        if not skip_info:
+            _assert_match("info", info_a, info_b, "reset", seed, compared)
+
+        vector_env.action_space.seed(seed)
+        prev_dones = np.zeros(num_envs, dtype=np.bool_)
+        for step in range(num_steps):
+            actions = vector_env.action_space.sample()
+            obs_a, rew_a, terminated_a, truncated_a, info_a = vector_env.step(actions)
+            obs_b, rew_b, terminated_b, truncated_b, info_b = reference_env.step(
+                actions
+            )
+            step_name = f"step={step}"
+
+            _assert_match(
+                "terminated",
+                terminated_a,
+                terminated_b,
+                step_name,
+                seed,
+                all_envs,
+                True,
+            )
+            _assert_match(
+                "truncated", truncated_a, truncated_b, step_name, seed, all_envs, True
+            )
+            if not skip_rew:
+                _assert_match("reward", rew_a, rew_b, step_name, seed, all_envs)
+
+            dones = np.logical_or(terminated_a, truncated_a)
+            if autoreset_mode == AutoresetMode.NEXT_STEP:
+                reset_mask = prev_dones
+            elif autoreset_mode == AutoresetMode.SAME_STEP:
+                reset_mask = dones
+            else:
+                reset_mask = np.zeros(num_envs, dtype=np.bool_)
+            prev_dones = dones
+
+            if sync_states is None or not np.any(reset_mask):
+                compared = all_envs
+            else:
+                sync_states(vector_env, reference_env, reset_mask)
+                compared = np.logical_not(reset_mask)
+
+            if not skip_obs:
+                _assert_match("observation", obs_a, obs_b, step_name, seed, compared)
+            if not skip_info:
+                # The final observations and infos of the episodes are compared for all sub-environments
+                final_keys = ["final_obs", "_final_obs", "final_info", "_final_info"]
+                final_info_a = {
+                    key: info_a.pop(key) for key in final_keys if key in info_a
+                }
+                final_info_b = {
+                    key: info_b.pop(key) for key in final_keys if key in info_b
+                }
+                _assert_match("info", info_a, info_b, step_name, seed, compared)
+                _assert_match(
+                    "final info", final_info_a, final_info_b, step_name, seed, all_envs
+                )
+
+            if autoreset_mode == AutoresetMode.DISABLED and np.any(dones):
+                obs_a, info_a = vector_env.reset(options={"reset_mask": dones})
+                obs_b, info_b = reference_env.reset(options={"reset_mask": dones})
+                if sync_states is None:
+                    compared = all_envs
+                else:
+                    sync_states(vector_env, reference_env, dones)
+                    compared = np.logical_not(dones)
+                if not skip_obs:
+                    _assert_match(
+                        "observation", obs_a, obs_b, step_name, seed, compared
+                    )
@@ -2,6 +2,7 @@
 
 import time
 from collections.abc import Callable
+from typing import Any
 
 import gymnasium
 
@@ -99,3 +100,81 @@ def benchmark_render(env: gymnasium.Env, target_duration: int = 5) -> float:
 
     renders_per_time = renders / length
     return renders_per_time
+
+
+def benchmark_vector_step(
+    envs: gymnasium.vector.VectorEnv, target_duration: int = 5, seed=None
+) -> float:
+    """A benchmark to measure the runtime performance of step for a vector environment.
+
+    The sub-environments are autoreset by the vector environment, therefore, no manual resetting is done.
+
+    example usage:
+        ```py
+        for mode in ["sync", "async", "threaded"]:
+            envs = gymnasium.make_vec("LunarLander-v3", num_envs=8, vectorization_mode=mode)
+            print(mode, benchmark_vector_step(envs))
+            envs.close()
+        ```
+
+    Args:
+        envs: the vector environment to benchmarked.
+        target_duration: the duration of the benchmark in seconds (note: it will go slightly over it).
+        seed: seeds the vector environment and action sampled.
+
+    Returns: the average sub-environment steps per second, i.e., ``num_envs * steps / time``.
+    """
+    steps = 0
+    end = 0.0
+    envs.reset(seed=seed)
+    envs.action_space.seed(seed)
+    start = time.time()
+
+    while True:
+        steps += 1
+        actions = envs.action_space.sample()
+        envs.step(actions)
+
+        if time.time() - start > target_duration:
+            end = time.time()
+            break
+
+    length = end - start
+
+    steps_per_time = envs.num_envs * steps / length
+    return steps_per_time
+
+
+def benchmark_call(fn: Callable[[], Any], target_duration: int = 5) -> float:
+    """A benchmark to measure the runtime performance of a function without arguments, e.g., a space sample or a wrapper step.
+
+    example usage:
+        ```py
+        space = gymnasium.spaces.Box(0, 255, shape=(84, 84, 3), dtype=np.uint8)
+        out = np.empty(space.shape, dtype=space.dtype)
+        sample_throughput = benchmark_call(space.sample)
+        sample_out_throughput = benchmark_call(lambda: space.sample(out=out))
+        ```
+
+    Args:
+        fn: the function to benchmark.
+        target_duration: the duration of the benchmark in seconds (note: it will go slightly over it).
+
+    Returns: the average calls per second.
+    """
+    calls = 0
+    end = 0.0
+    start = time.time()
+
+    while True:
+        calls += 1
+        fn()
+
+        if time.time() - start > target_duration:
+            end = time.time()
+            break
+
+    length = end - start
+
+    calls_per_time = calls / length
+    return calls_per_time
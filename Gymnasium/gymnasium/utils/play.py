@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
@@ -15,7 +14,7 @@ from gymnasium.error import DependencyNotInstalled
 
 
 if TYPE_CHECKING:
-    from matplotlib.axes import Axes
+    from matplotlib.collections import PathCollection
 
 
 try:
@@ -72,6 +71,14 @@ class PlayableGame:
         self.pressed_keys = []
         self.running = True
 
+        # The surfaces that frames are blitted and scaled into, reused between frames
+        self.frame_surface: Surface | None = None
+        self.scaled_surface: Surface | None = None
+        # The screen and video size that the scaled surface and its position on the screen are computed for
+        self._layout: tuple[tuple[int, int], tuple[int, int]] | None = None
+        self._frame_position = (0, 0)
+        self._frame_updated = False
+
     def _get_relevant_keys(
         self, keys_to_action: dict[tuple[int], int] | None = None
     ) -> set:
@@ -124,7 +131,75 @@ class PlayableGame:
             scale_width = event.x / self.video_size[0]
             scale_height = event.y / self.video_size[1]
             scale = min(scale_height, scale_width)
-            self.video_size = (scale * self.video_size[0], scale * self.video_size[1])
+            self.video_size = (
+                int(scale * self.video_size[0]),
+                int(scale * self.video_size[1]),
+            )
+
+    def display_frame(self, frame: np.ndarray, transpose: bool | None = True):
+        """Displays a rendered frame on the screen.
+
+        Unlike :func:`display_arr`, the frame is blitted into a cached surface that is scaled into a cached surface
+        of the video size, so no surfaces are allocated per frame.
+
+        Args:
+            frame: The ``uint8`` frame to show
+            transpose: If to transpose the frame on the screen
+        """
+        assert isinstance(frame, np.ndarray) and frame.dtype == np.uint8
+        if transpose:
+            frame = frame.swapaxes(0, 1)
+
+        if (
+            self.frame_surface is None
+            or self.frame_surface.get_size() != frame.shape[:2]
+        ):
+            if frame.ndim == 3:
+                self.frame_surface = pygame.Surface(frame.shape[:2], depth=24)
+            else:
+                # grayscale frames use a palette surface
+                self.frame_surface = pygame.surfarray.make_surface(frame)
+            self.scaled_surface = None
+        pygame.surfarray.blit_array(self.frame_surface, frame)
+        self._frame_updated = True
+
+        self.redraw_frame()
+
+    def redraw_frame(self):
+        """Draws the last displayed frame on the screen, only rescaling it if the frame or the window size changed.
+
+        The position of the frame on the screen is only recomputed, and the black bars redrawn, when the window is resized.
+        """
+        if self.frame_surface is None:
+            return
+
+        screen_size, video_size = self.screen.get_size(), tuple(self.video_size)
+        if self._layout != (screen_size, video_size):
+            self._layout = (screen_size, video_size)
+            # We might have to add black bars if the screen size is larger than video_size
+            self._frame_position = (
+                (screen_size[0] - video_size[0]) // 2,
+                (screen_size[1] - video_size[1]) // 2,
+            )
+            self.screen.fill((0, 0, 0))
+            self.scaled_surface = None
+            self._frame_updated = True
+
+        if self._frame_updated:
+            if video_size == self.frame_surface.get_size():
+                self.scaled_surface = self.frame_surface
+            elif self.scaled_surface is None:
+                self.scaled_surface = pygame.transform.scale(
+                    self.frame_surface, video_size
+                )
+            else:
+                pygame.transform.scale(
+                    self.frame_surface, video_size, self.scaled_surface
+                )
+            self._frame_updated = False
+
+        assert self.scaled_surface is not None
+        self.screen.blit(self.scaled_surface, self._frame_position)
 
 
 def display_arr(
@@ -288,6 +363,8 @@ def play(
     clock = pygame.time.Clock()
 
     while game.running:
+        # The environment is only rendered when it has been reset or stepped
+        env_updated = True
         if done:
             done = False
             obs = env.reset(seed=seed)
@@ -298,14 +375,17 @@ def play(
             done = terminated or truncated
             if callback is not None:
                 callback(prev_obs, obs, action, rew, terminated, truncated, info)
-        if obs is not None:
+        else:
+            env_updated = False
+
+        if env_updated:
             rendered = env.render()
             if isinstance(rendered, list):
                 rendered = rendered[-1]
             assert rendered is not None and isinstance(rendered, np.ndarray)
-            display_arr(
-                game.screen, rendered, transpose=transpose, video_size=game.video_size
-            )
+            game.display_frame(rendered, transpose=transpose)
+        else:
+            game.redraw_frame()
 
         # process pygame events
         for event in pygame.event.get():
@@ -342,10 +422,17 @@ class PlayPlot:
         >>> plotter = PlayPlot(compute_metrics, horizon_timesteps=200,                               # doctest: +SKIP
         ...                    plot_names=["Immediate Rew.", "Cumulative Rew.", "Action Magnitude"])
         >>> play(your_env, callback=plotter.callback)                                                # doctest: +SKIP
+
+    The metrics are stored in a ring buffer of the last ``horizon_timesteps`` transitions. As redrawing the plots
+    can be slower than an environment step, ``update_frequency`` can be used to only redraw every few transitions.
     """
 
     def __init__(
-        self, callback: Callable, horizon_timesteps: int, plot_names: list[str]
+        self,
+        callback: Callable,
+        horizon_timesteps: int,
+        plot_names: list[str],
+        update_frequency: int = 1,
     ):
         """Constructor of :class:`PlayPlot`.
 
@@ -356,13 +443,22 @@ class PlayPlot:
             callback: Function that computes metrics from environment transitions
             horizon_timesteps: The time horizon used for the live plots
             plot_names: List of plot titles
+            update_frequency: The number of transitions between the updates of the plots. The metrics of every
+                transition are recorded, though redrawing the plots every few transitions stops the plotting
+                from slowing down :func:`play`.
 
         Raises:
             DependencyNotInstalled: If matplotlib is not installed
         """
+        if update_frequency < 1:
+            raise ValueError(
+                f"Expected the update frequency to be greater than 0, actual value: {update_frequency}"
+            )
+
         self.data_callback = callback
         self.horizon_timesteps = horizon_timesteps
         self.plot_names = plot_names
+        self.update_frequency = update_frequency
 
         if plt is None:
             raise DependencyNotInstalled(
@@ -376,8 +472,12 @@ class PlayPlot:
         for axis, name in zip(self.ax, plot_names):
             axis.set_title(name)
         self.t = 0
-        self.cur_plot: list[Axes | None] = [None for _ in range(num_plots)]
-        self.data = [deque(maxlen=horizon_timesteps) for _ in range(num_plots)]
+        # The scatter plots are created once and their points replaced on each update
+        self.cur_plot: list[PathCollection] = [
+            axis.scatter([], [], c="blue") for axis in self.ax
+        ]
+        # Ring buffer of the metrics of the last `horizon_timesteps` transitions, written at `t % horizon_timesteps`
+        self.data = np.zeros((num_plots, horizon_timesteps), dtype=np.float64)
 
     def callback(
         self,
@@ -403,19 +503,25 @@ class PlayPlot:
         points = self.data_callback(
             obs_t, obs_tp1, action, rew, terminated, truncated, info
         )
-        for point, data_series in zip(points, self.data):
-            data_series.append(point)
+        self.data[:, self.t % self.horizon_timesteps] = points
         self.t += 1
 
-        xmin, xmax = max(0, self.t - self.horizon_timesteps), self.t
+        if self.t % self.update_frequency == 0:
+            self.update_plots()
 
-        for i, plot in enumerate(self.cur_plot):
-            if plot is not None:
-                plot.remove()
-            self.cur_plot[i] = self.ax[i].scatter(
-                range(xmin, xmax), list(self.data[i]), c="blue"
-            )
-            self.ax[i].set_xlim(xmin, xmax)
+    def update_plots(self):
+        """Updates the plots with the metrics of the last ``horizon_timesteps`` transitions."""
+        xmin, xmax = max(0, self.t - self.horizon_timesteps), self.t
+        timesteps = np.arange(xmin, xmax)
+        metrics = self.data[:, timesteps % self.horizon_timesteps]
+
+        for axis, plot, values in zip(self.ax, self.cur_plot, metrics):
+            plot.set_offsets(np.column_stack((timesteps, values)))
+            axis.set_xlim(xmin, xmax)
+            # rescale the y-axis to the plotted metrics only
+            axis.ignore_existing_data_limits = True
+            axis.update_datalim(plot.get_offsets())
+            axis.autoscale_view(scalex=False)
 
         if plt is None:
             raise DependencyNotInstalled(
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import os
+import queue
+import threading
 from collections.abc import Callable
 
+import numpy as np
+
 import gymnasium as gym
 from gymnasium import logger
 
 
 try:
+    from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
     from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
 except ImportError as e:
     raise gym.error.DependencyNotInstalled(
@@ -34,6 +39,103 @@ def capped_cubic_video_schedule(episode_id: int) -> bool:
         return episode_id % 1000 == 0
 
 
+class VideoWriter:
+    """Encodes frames into a video file as they are written, using an ffmpeg subprocess fed by a background thread.
+
+    The frames are passed to the thread through a bounded queue, such that a video's frames are never all held in
+    memory and :meth:`write` only blocks if the encoder falls ``max_queue_size`` frames behind.
+    The video file is created with the first frame, which sets the video's size.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.utils.save_video import VideoWriter
+        >>> writer = VideoWriter("videos/example.mp4", fps=30)  # doctest: +SKIP
+        >>> for _ in range(100):  # doctest: +SKIP
+        ...     writer.write(np.zeros((64, 64, 3), dtype=np.uint8))
+        >>> writer.close()  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fps: float,
+        codec: str = "libx264",
+        max_queue_size: int = 32,
+    ):
+        """Starts the encoding thread.
+
+        Args:
+            path: The path of the video file
+            fps: The frames per second of the video
+            codec: The ffmpeg codec used to encode the video
+            max_queue_size: The maximum number of frames waiting to be encoded
+        """
+        self.path = path
+        self.fps = fps
+        self.codec = codec
+        self.frame_count = 0
+
+        self._queue: queue.Queue[np.ndarray | None] = queue.Queue(max_queue_size)
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = threading.Thread(
+            target=self._encode, name="VideoWriter", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, frame: np.ndarray):
+        """Queues a ``(height, width, 3)`` frame to be encoded, the frame must not be modified afterwards."""
+        assert self._thread is not None, "Cannot write a frame, the writer is closed."
+        if self._error is not None:
+            self.close()
+        self._queue.put(frame)
+        self.frame_count += 1
+
+    def close(self):
+        """Waits for all queued frames to be encoded then closes the video file, re-raising any encoding error."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        if self._error is not None:
+            raise gym.error.Error(
+                f"Failed to encode the video {self.path}"
+            ) from self._error
+
+    def _encode(self):
+        """Encodes the queued frames until ``None`` is received."""
+        writer = None
+        try:
+            while (frame := self._queue.get()) is not None:
+                frame = np.ascontiguousarray(frame, dtype=np.uint8)
+                if writer is None:
+                    height, width = frame.shape[:2]
+                    writer = FFMPEG_VideoWriter(
+                        self.path, (width, height), self.fps, codec=self.codec
+                    )
+                writer.write_frame(frame)
+        except BaseException as e:
+            self._error = e
+            # Discard the remaining frames, so that `write` and `close` don't block
+            while self._queue.get() is not None:
+                pass
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+def _write_video(frames: list, path: str, save_logger: str | None, **kwargs):
+    """Streams the frames to a :class:`VideoWriter` if only ``fps`` is given, otherwise uses moviepy's ImageSequenceClip."""
+    if kwargs.keys() == {"fps"}:
+        writer = VideoWriter(path, fps=kwargs["fps"])
+        for frame in frames:
+            writer.write(frame)
+        writer.close()
+    else:
+        clip = ImageSequenceClip(frames, **kwargs)
+        clip.write_videofile(path, logger=save_logger)
+
+
 def save_video(
     frames: list,
     video_folder: str,
@@ -61,8 +163,10 @@ def save_video(
         episode_index (int): The index of the current episode.
         step_starting_index (int): The step index of the first frame.
         save_logger: If to log the video saving progress, helpful for long videos that take a while, use "bar" to enable.
+            Only used by moviepy's ImageSequenceClip.
         **kwargs: The kwargs that will be passed to moviepy's ImageSequenceClip.
-            You need to specify either fps or duration.
+            You need to specify either fps or duration. If only ``fps`` is given, the frames are instead streamed to
+            a :class:`VideoWriter`.
 
     Example:
         >>> import gymnasium as gym
@@ -98,9 +202,11 @@ def save_video(
     path_prefix = f"{video_folder}/{name_prefix}"
 
     if episode_trigger is not None and episode_trigger(episode_index):
-        clip = ImageSequenceClip(frames[:video_length], **kwargs)
-        clip.write_videofile(
-            f"{path_prefix}-episode-{episode_index}.mp4", logger=save_logger
+        _write_video(
+            frames[:video_length],
+            f"{path_prefix}-episode-{episode_index}.mp4",
+            save_logger,
+            **kwargs,
         )
 
     if step_trigger is not None:
@@ -112,7 +218,9 @@ def save_video(
                 end_index = (
                     frame_index + video_length if video_length is not None else None
                 )
-                clip = ImageSequenceClip(frames[frame_index:end_index], **kwargs)
-                clip.write_videofile(
-                    f"{path_prefix}-step-{step_index}.mp4", logger=save_logger
+                _write_video(
+                    frames[frame_index:end_index],
+                    f"{path_prefix}-step-{step_index}.mp4",
+                    save_logger,
+                    **kwargs,
                 )
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 import numpy as np
 
 from gymnasium import error
 
 
-def np_random(seed: int | None = None) -> tuple[np.random.Generator, int]:
+def np_random(
+    seed: int | np.random.SeedSequence | None = None,
+) -> tuple[np.random.Generator, int]:
     """Returns a NumPy random number generator (RNG) along with seed value from the inputted seed.
 
     If ``seed`` is ``None`` then a **random** seed will be generated as the RNG's initial seed.
-    This randomly selected seed is returned as the second value of the tuple.
+    This randomly selected seed is returned as the second value of the tuple. If ``seed`` is a
+    :class:`numpy.random.SeedSequence`, e.g., spawned for a vector environment, an integer seed is generated from it
+    (as with :func:`spawn_seeds`) that the RNG is created from, such that ``np_random(seed)`` with the returned seed
+    reproduces the RNG.
 
     .. py:currentmodule:: gymnasium.Env
 
@@ -26,7 +34,9 @@ def np_random(seed: int | None = None) -> tuple[np.random.Generator, int]:
     Raises:
         Error: Seed must be a non-negative integer
     """
-    if seed is not None and not (isinstance(seed, int) and 0 <= seed):
+    if isinstance(seed, np.random.SeedSequence):
+        seed = int(seed.generate_state(1, dtype=np.uint64)[0])
+    elif seed is not None and not (isinstance(seed, int) and 0 <= seed):
         if isinstance(seed, int) is False:
             raise error.Error(
                 f"Seed must be a python integer, actual type: {type(seed)}"
@@ -42,4 +52,88 @@ def np_random(seed: int | None = None) -> tuple[np.random.Generator, int]:
     return rng, np_seed
 
 
+def spawn_seeds(seed: int | np.random.SeedSequence | None, num_seeds: int) -> list[int]:
+    """Returns independent seeds, e.g., for the sub-environments of a vector environment, spawned from a single seed.
+
+    Unlike the seeds ``[seed, seed + 1, ..., seed + n]``, the seeds are generated by :meth:`numpy.random.SeedSequence.spawn`
+    such that the random number generators seeded with them produce independent streams, for any number of seeds.
+    As with :meth:`numpy.random.SeedSequence.spawn`, spawning again from the same ``SeedSequence`` returns new seeds.
+
+    Example:
+        >>> from gymnasium.utils.seeding import spawn_seeds
+        >>> seeds = spawn_seeds(42, num_seeds=3)
+        >>> len(seeds), seeds == spawn_seeds(42, num_seeds=3)
+        (3, True)
+
+    Args:
+        seed: The seed or seed sequence the seeds are spawned from, if ``None`` then a random seed is used
+        num_seeds: The number of seeds
+
+    Returns:
+        A list of ``num_seeds`` non-negative integer seeds
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        _, seed = np_random(seed)
+        seed = np.random.SeedSequence(seed)
+
+    return [
+        int(child_seed_seq.generate_state(1, dtype=np.uint64)[0])
+        for child_seed_seq in seed.spawn(num_seeds)
+    ]
+
+
+def get_np_random_states(
+    np_randoms: np.random.Generator | Sequence[np.random.Generator],
+) -> dict[str, Any] | list[dict[str, Any]]:
+    """Returns the bit generator states of a random number generator or of a sequence of them, e.g., ``envs.np_random``.
+
+    Args:
+        np_randoms: The random number generator, or a sequence of them for each sub-environment
+
+    Returns:
+        The state of the random number generator or a list of the states
+    """
+    if isinstance(np_randoms, np.random.Generator):
+        return np_randoms.bit_generator.state
+    return [rng.bit_generator.state for rng in np_randoms]
+
+
+def set_np_random_states(
+    np_randoms: np.random.Generator | Sequence[np.random.Generator],
+    states: dict[str, Any] | Sequence[dict[str, Any]],
+) -> np.random.Generator | Sequence[np.random.Generator]:
+    """Restores the bit generator states from :func:`get_np_random_states` to a random number generator or a sequence of them.
+
+    The generators are updated in place and returned. As :class:`gymnasium.vector.AsyncVectorEnv` returns copies
+    of the generators of the sub-environments, the restored generators need to be set again.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from gymnasium.utils.seeding import get_np_random_states, set_np_random_states
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=2, vectorization_mode="sync")
+        >>> _ = envs.reset(seed=42)
+        >>> states = get_np_random_states(envs.np_random)
+        >>> samples = [rng.random() for rng in envs.np_random]
+        >>> envs.np_random = set_np_random_states(envs.np_random, states)
+        >>> samples == [rng.random() for rng in envs.np_random]
+        True
+
+    Args:
+        np_randoms: The random number generator, or a sequence of them for each sub-environment
+        states: The state of the random number generator or the states for each of them
+
+    Returns:
+        The random number generators with the restored states
+    """
+    if isinstance(np_randoms, np.random.Generator):
+        np_randoms.bit_generator.state = states
+    else:
+        assert len(np_randoms) == len(
+            states
+        ), f"The number of states ({len(states)}) must equal the number of random number generators ({len(np_randoms)})."
+        for rng, state in zip(np_randoms, states):
+            rng.bit_generator.state = state
+    return np_randoms
+
+
 RNG = RandomNumberGenerator = np.random.Generator
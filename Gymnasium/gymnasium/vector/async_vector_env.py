@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import multiprocessing
+import os
 import sys
 import time
 import traceback
 from collections.abc import Callable, Sequence
 from copy import deepcopy
 from enum import Enum
-from multiprocessing import Queue
+from multiprocessing import Queue, resource_tracker
 from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
 from multiprocessing.sharedctypes import SynchronizedArray
 from typing import Any
 
@@ -25,6 +27,7 @@ from gymnasium.error import (
     NoAsyncCallError,
 )
 from gymnasium.spaces.utils import is_space_dtype_shape_equiv
+from gymnasium.utils import seeding
 from gymnasium.vector.utils import (
     CloudpickleWrapper,
     batch_differing_spaces,
@@ -35,6 +38,7 @@ from gymnasium.vector.utils import (
     create_shared_memory,
     iterate,
     read_from_shared_memory,
+    stack_render_frames,
     write_to_shared_memory,
 )
 from gymnasium.vector.vector_env import ArrayType, AutoresetMode, VectorEnv
@@ -104,6 +108,7 @@ class AsyncVectorEnv(VectorEnv):
         ) = None,
         observation_mode: str | Space = "same",
         autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        shared_memory_capacity: int | tuple[int, int] | None = None,
     ):
         """Vectorized environment that runs multiple environments in parallel.
 
@@ -111,6 +116,7 @@ class AsyncVectorEnv(VectorEnv):
             env_fns: Functions that create the environments.
             shared_memory: If ``True``, then the observations from the worker processes are communicated back through
                 shared variables. This can improve the efficiency if the observations are large (e.g. images).
+                For ``render_mode="rgb_array"``, the rendered frames are similarly written by the workers into shared memory.
             copy: If ``True``, then the :meth:`AsyncVectorEnv.reset` and :meth:`AsyncVectorEnv.step` methods
                 return a copy of the observations.
             context: Context for `multiprocessing`. If ``None``, then the default context is used.
@@ -124,6 +130,9 @@ class AsyncVectorEnv(VectorEnv):
                 warning, may raise unexpected errors. Passing a ``Tuple[Space, Space]`` object allows defining a custom ``single_observation_space`` and
                 ``observation_space``, warning, may raise unexpected errors.
             autoreset_mode: The Autoreset Mode used, see https://farama.org/Vector-Autoreset-Mode for more information.
+            shared_memory_capacity: The capacity of the shared memory for observation spaces with a dynamic shape, i.e.,
+                :class:`Sequence` and :class:`Graph`, see :func:`create_shared_memory`. If an observation exceeds the capacity,
+                an error is raised by the sub-environment's worker.
 
         Warnings:
             worker is an advanced mode option. It provides a high degree of flexibility and a high chance
@@ -138,6 +147,7 @@ class AsyncVectorEnv(VectorEnv):
         """
         self.env_fns = env_fns
         self.shared_memory = shared_memory
+        self.shared_memory_capacity = shared_memory_capacity
         self.copy = copy
         self.context = context
         self.daemon = daemon
@@ -192,8 +202,17 @@ class AsyncVectorEnv(VectorEnv):
         ctx = multiprocessing.get_context(context)
         if self.shared_memory:
             try:
+                # `capacity` is only passed when set, for custom spaces registered without the parameter
+                capacity_kwargs = (
+                    {}
+                    if shared_memory_capacity is None
+                    else {"capacity": shared_memory_capacity}
+                )
                 _obs_buffer = create_shared_memory(
-                    self.single_observation_space, n=self.num_envs, ctx=ctx
+                    self.single_observation_space,
+                    n=self.num_envs,
+                    ctx=ctx,
+                    **capacity_kwargs,
                 )
                 self.observations = read_from_shared_memory(
                     self.single_observation_space, _obs_buffer, n=self.num_envs
@@ -208,6 +227,21 @@ class AsyncVectorEnv(VectorEnv):
                 self.single_observation_space, n=self.num_envs, fn=np.zeros
             )
 
+        self._observation_memory = _obs_buffer
+
+        # The rendered frames' shared memory is created on the first `render` once the frame shape is known
+        self._render_frames: np.ndarray | None = None
+        self._render_memory: SharedMemory | None = None
+        if (
+            self.shared_memory
+            and self.render_mode == "rgb_array"
+            and worker is None
+            and os.name == "posix"
+        ):
+            # Start the resource tracker before the workers such that they share it with the main process,
+            #   otherwise the workers' own trackers would unlink the render memory when they exit.
+            resource_tracker.ensure_running()
+
         self.parent_pipes, self.processes = [], []
         self.error_queue = ctx.Queue()
         target = worker or _async_worker
@@ -248,10 +282,17 @@ class AsyncVectorEnv(VectorEnv):
         """Returns the tuple of the numpy random number generators for the wrapped envs."""
         return self.get_attr("np_random")
 
+    @np_random.setter
+    def np_random(
+        self, value: list[np.random.Generator] | tuple[np.random.Generator, ...]
+    ):
+        """Sets the numpy random number generators of the wrapped envs."""
+        self.set_attr("np_random", value)
+
     def reset(
         self,
         *,
-        seed: int | list[int | None] | None = None,
+        seed: int | list[int | None] | np.random.SeedSequence | None = None,
         options: dict[str, Any] | None = None,
     ) -> tuple[ObsType, dict[str, Any]]:
         """Resets all sub-environments in parallel and return a batch of concatenated observations and info.
@@ -268,7 +309,7 @@ class AsyncVectorEnv(VectorEnv):
 
     def reset_async(
         self,
-        seed: int | list[int | None] | None = None,
+        seed: int | list[int | None] | np.random.SeedSequence | None = None,
         options: dict | None = None,
     ):
         """Send calls to the :obj:`reset` methods of the sub-environments.
@@ -276,7 +317,8 @@ class AsyncVectorEnv(VectorEnv):
         To get the results of these calls, you may invoke :meth:`reset_wait`.
 
         Args:
-            seed: List of seeds for each environment
+            seed: List of seeds for each environment, an integer ``seed`` is ``[seed, seed+1, ..., seed+n]`` and
+                a ``SeedSequence`` spawns independent seeds with :func:`gymnasium.utils.seeding.spawn_seeds`
             options: The reset option
 
         Raises:
@@ -291,6 +333,8 @@ class AsyncVectorEnv(VectorEnv):
             seed = [None for _ in range(self.num_envs)]
         elif isinstance(seed, int):
             seed = [seed + i for i in range(self.num_envs)]
+        elif isinstance(seed, np.random.SeedSequence):
+            seed = seeding.spawn_seeds(seed, self.num_envs)
         assert (
             len(seed) == self.num_envs
         ), f"If seeds are passed as a list the length must match num_envs={self.num_envs} but got length={len(seed)}."
@@ -371,6 +415,13 @@ class AsyncVectorEnv(VectorEnv):
             self.observations = concatenate(
                 self.single_observation_space, results, self.observations
             )
+        elif self.shared_memory_capacity is not None:
+            # The length of dynamic observations in shared memory change, therefore, need to be re-read
+            self.observations = read_from_shared_memory(
+                self.single_observation_space,
+                self._observation_memory,
+                n=self.num_envs,
+            )
 
         self._state = AsyncState.DEFAULT
         return (deepcopy(self.observations) if self.copy else self.observations), infos
@@ -464,6 +515,12 @@ class AsyncVectorEnv(VectorEnv):
                 observations,
                 self.observations,
             )
+        elif self.shared_memory_capacity is not None:
+            self.observations = read_from_shared_memory(
+                self.single_observation_space,
+                self._observation_memory,
+                n=self.num_envs,
+            )
 
         self._state = AsyncState.DEFAULT
         return (
@@ -488,9 +545,58 @@ class AsyncVectorEnv(VectorEnv):
         self.call_async(name, *args, **kwargs)
         return self.call_wait()
 
-    def render(self) -> tuple[RenderFrame, ...] | None:
-        """Returns a list of rendered frames from the environments."""
-        return self.call("render")
+    def render(self) -> tuple[RenderFrame, ...] | np.ndarray | None:
+        """Returns the rendered frames from the environments.
+
+        For ``render_mode="rgb_array"``, the frames are returned as a single ``(num_envs, height, width, 3)`` uint8 array
+        (copied if ``copy=True``), unless the sub-environments' frames differ in shape where a tuple of the frames is returned.
+        With ``shared_memory=True``, after the first call, the workers write their frames directly into shared memory.
+        """
+        if self.render_mode != "rgb_array":
+            return self.call("render")
+
+        if self._render_memory is None:
+            frames = self.call("render")
+            batched_frames = stack_render_frames(frames, self._render_frames)
+            if batched_frames is None:
+                return frames
+
+            self._render_frames = batched_frames
+            if self.shared_memory and self.worker is None:
+                self._create_render_memory()
+        else:
+            self._assert_is_running()
+            if self._state != AsyncState.DEFAULT:
+                raise AlreadyPendingCallError(
+                    f"Calling `render` while waiting for a pending call to `{self._state.value}` to complete.",
+                    str(self._state.value),
+                )
+
+            for pipe in self.parent_pipes:
+                pipe.send(("_render", None))
+            _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+            self._raise_if_errors(successes)
+
+        return self._render_frames.copy() if self.copy else self._render_frames
+
+    def _create_render_memory(self):
+        """Moves the rendered frames to shared memory that the workers render into."""
+        assert self._render_frames is not None
+        self._render_memory = SharedMemory(create=True, size=self._render_frames.nbytes)
+        render_frames = np.ndarray(
+            self._render_frames.shape,
+            dtype=np.uint8,
+            buffer=self._render_memory.buf,
+        )
+        render_frames[:] = self._render_frames
+        self._render_frames = render_frames
+
+        for pipe in self.parent_pipes:
+            pipe.send(
+                ("_render_memory", (self._render_memory.name, render_frames.shape[1:]))
+            )
+        _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
+        self._raise_if_errors(successes)
 
     def call_async(self, name: str, *args, **kwargs):
         """Calls the method with name asynchronously and apply args and kwargs to the method.
@@ -592,6 +698,31 @@ class AsyncVectorEnv(VectorEnv):
         _, successes = zip(*[pipe.recv() for pipe in self.parent_pipes])
         self._raise_if_errors(successes)
 
+    def autoreset_next_step(self, env_mask: np.ndarray):
+        """Marks the sub-environments of ``env_mask`` to be reset on the next step, see :meth:`VectorEnv.autoreset_next_step`.
+
+        Raises:
+            AlreadyPendingCallError: Calling :meth:`autoreset_next_step` while waiting for a pending call to complete.
+        """
+        self._assert_is_running()
+        assert (
+            self.autoreset_mode == AutoresetMode.NEXT_STEP
+        ), f"Expected `AutoresetMode.NEXT_STEP`, actual autoreset mode: {self.autoreset_mode}"
+        if self._state != AsyncState.DEFAULT:
+            raise AlreadyPendingCallError(
+                f"Calling `autoreset_next_step` while waiting for a pending call to `{self._state.value}` to complete.",
+                str(self._state.value),
+            )
+
+        # Only the workers of the autoreset sub-environments are messaged
+        pipes = [
+            pipe for pipe, autoreset in zip(self.parent_pipes, env_mask) if autoreset
+        ]
+        for pipe in pipes:
+            pipe.send(("_autoreset", None))
+        successes = [pipe.recv()[1] for pipe in pipes]
+        self._raise_if_errors(successes)
+
     def close_extras(self, timeout: int | float | None = None, terminate: bool = False):
         """Close the environments & clean up the extra resources (processes and pipes).
 
@@ -633,6 +764,16 @@ class AsyncVectorEnv(VectorEnv):
         for process in self.processes:
             process.join()
 
+        if self._render_memory is not None:
+            self._render_frames = None
+            try:
+                self._render_memory.close()
+            except BufferError:
+                # Frames returned with `copy=False` can still reference the shared memory
+                pass
+            self._render_memory.unlink()
+            self._render_memory = None
+
     def _poll_pipe_envs(self, timeout: int | None = None):
         self._assert_is_running()
 
@@ -732,6 +873,7 @@ def _async_worker(
     action_space = env.action_space
     autoreset = False
     observation = None
+    render_memory, render_frame = None, None
 
     parent_pipe.close()
 
@@ -801,6 +943,27 @@ def _async_worker(
                     observation = None
 
                 pipe.send(((observation, reward, terminated, truncated, info), True))
+            elif command == "_render":
+                frame = env.render()
+                if (
+                    not isinstance(frame, np.ndarray)
+                    or frame.shape != render_frame.shape
+                ):
+                    raise ValueError(
+                        f"Expected the rendered frame to be an array of shape {render_frame.shape}, actually got {frame!r}"
+                    )
+                render_frame[...] = frame
+                pipe.send((None, True))
+            elif command == "_render_memory":
+                name, frame_shape = data
+                render_memory = SharedMemory(name=name)
+                render_frame = np.ndarray(
+                    frame_shape,
+                    dtype=np.uint8,
+                    buffer=render_memory.buf,
+                    offset=index * int(np.prod(frame_shape)),
+                )
+                pipe.send((None, True))
             elif command == "close":
                 pipe.send((None, True))
                 break
@@ -820,6 +983,9 @@ def _async_worker(
                 name, value = data
                 env.set_wrapper_attr(name, value)
                 pipe.send((None, True))
+            elif command == "_autoreset":
+                autoreset = True
+                pipe.send((None, True))
             elif command == "_check_spaces":
                 obs_mode, single_obs_space, single_action_space = data
 
@@ -840,7 +1006,7 @@ def _async_worker(
                 )
             else:
                 raise RuntimeError(
-                    f"Received unknown command `{command}`. Must be one of [`reset`, `step`, `close`, `_call`, `_setattr`, `_check_spaces`]."
+                    f"Received unknown command `{command}`. Must be one of [`reset`, `step`, `close`, `_call`, `_setattr`, `_autoreset`, `_check_spaces`, `_render`, `_render_memory`]."
                 )
     except (KeyboardInterrupt, Exception):
         error_type, error_message, _ = sys.exc_info()
@@ -849,4 +1015,7 @@ def _async_worker(
         error_queue.put((index, error_type, error_message, trace))
         pipe.send((None, False))
     finally:
+        if render_memory is not None:
+            render_frame = None
+            render_memory.close()
         env.close()
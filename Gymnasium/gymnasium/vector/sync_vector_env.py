@@ -11,12 +11,14 @@ import numpy as np
 from gymnasium import Env, Space
 from gymnasium.core import ActType, ObsType, RenderFrame
 from gymnasium.spaces.utils import is_space_dtype_shape_equiv
+from gymnasium.utils import seeding
 from gymnasium.vector.utils import (
     batch_differing_spaces,
     batch_space,
     concatenate,
     create_empty_array,
     iterate,
+    stack_render_frames,
 )
 from gymnasium.vector.vector_env import ArrayType, AutoresetMode, VectorEnv
 
@@ -151,6 +153,7 @@ class SyncVectorEnv(VectorEnv):
         self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
 
         self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
+        self._render_frames: np.ndarray | None = None
 
     @property
     def np_random_seed(self) -> tuple[int, ...]:
@@ -162,10 +165,17 @@ class SyncVectorEnv(VectorEnv):
         """Returns a tuple of the numpy random number generators for the wrapped envs."""
         return self.get_attr("np_random")
 
+    @np_random.setter
+    def np_random(
+        self, value: list[np.random.Generator] | tuple[np.random.Generator, ...]
+    ):
+        """Sets the numpy random number generators of the wrapped envs."""
+        self.set_attr("np_random", value)
+
     def reset(
         self,
         *,
-        seed: int | list[int | None] | None = None,
+        seed: int | list[int | None] | np.random.SeedSequence | None = None,
         options: dict[str, Any] | None = None,
     ) -> tuple[ObsType, dict[str, Any]]:
         """Resets each of the sub-environments and concatenate the results together.
@@ -175,6 +185,7 @@ class SyncVectorEnv(VectorEnv):
                 * ``None`` - random seeds for all environment
                 * ``int`` - ``[seed, seed+1, ..., seed+n]``
                 * List of ints - ``[1, 2, 3, ..., n]``
+                * ``SeedSequence`` - independent seeds spawned with :func:`gymnasium.utils.seeding.spawn_seeds`
             options: Option information used for each sub-environment
 
         Returns:
@@ -184,6 +195,8 @@ class SyncVectorEnv(VectorEnv):
             seed = [None for _ in range(self.num_envs)]
         elif isinstance(seed, int):
             seed = [seed + i for i in range(self.num_envs)]
+        elif isinstance(seed, np.random.SeedSequence):
+            seed = seeding.spawn_seeds(seed, self.num_envs)
         assert (
             len(seed) == self.num_envs
         ), f"If seeds are passed as a list the length must match num_envs={self.num_envs} but got length={len(seed)}."
@@ -207,28 +220,23 @@ class SyncVectorEnv(VectorEnv):
             self._truncations[reset_mask] = False
             self._autoreset_envs[reset_mask] = False
 
-            infos = {}
-            for i, (env, single_seed, env_mask) in enumerate(
-                zip(self.envs, seed, reset_mask)
-            ):
-                if env_mask:
-                    self._env_obs[i], env_info = env.reset(
-                        seed=single_seed, options=options
-                    )
-
-                    infos = self._add_info(infos, env_info, i)
+            env_indices = np.flatnonzero(reset_mask).tolist()
         else:
             self._terminations = np.zeros((self.num_envs,), dtype=np.bool_)
             self._truncations = np.zeros((self.num_envs,), dtype=np.bool_)
             self._autoreset_envs = np.zeros((self.num_envs,), dtype=np.bool_)
 
-            infos = {}
-            for i, (env, single_seed) in enumerate(zip(self.envs, seed)):
-                self._env_obs[i], env_info = env.reset(
-                    seed=single_seed, options=options
-                )
+            env_indices = list(range(self.num_envs))
 
-                infos = self._add_info(infos, env_info, i)
+        def reset_env(i: int) -> dict[str, Any]:
+            self._env_obs[i], env_info = self.envs[i].reset(
+                seed=seed[i], options=options
+            )
+            return env_info
+
+        infos = {}
+        for i, env_info in zip(env_indices, self._run_envs(reset_env, env_indices)):
+            infos = self._add_info(infos, env_info, i)
 
         # Concatenate the observations
         self._observations = concatenate(
@@ -244,56 +252,20 @@ class SyncVectorEnv(VectorEnv):
         Returns:
             The batched environment step results
         """
-        actions = iterate(self.action_space, actions)
+        actions = list(iterate(self.action_space, actions))
+        if len(actions) != self.num_envs:
+            raise ValueError(
+                f"Expected {self.num_envs} actions for each sub-environment, actual got {len(actions)}"
+            )
 
+        env_indices = list(range(self.num_envs))
         infos = {}
-        for i, (action, _) in enumerate(zip(actions, self.envs, strict=True)):
-            if self.autoreset_mode == AutoresetMode.NEXT_STEP:
-                if self._autoreset_envs[i]:
-                    self._env_obs[i], env_info = self.envs[i].reset()
-
-                    self._rewards[i] = 0.0
-                    self._terminations[i] = False
-                    self._truncations[i] = False
-                else:
-                    (
-                        self._env_obs[i],
-                        self._rewards[i],
-                        self._terminations[i],
-                        self._truncations[i],
-                        env_info,
-                    ) = self.envs[i].step(action)
-            elif self.autoreset_mode == AutoresetMode.DISABLED:
-                # assumes that the user has correctly autoreset
-                assert not self._autoreset_envs[i], f"{self._autoreset_envs=}"
-                (
-                    self._env_obs[i],
-                    self._rewards[i],
-                    self._terminations[i],
-                    self._truncations[i],
-                    env_info,
-                ) = self.envs[i].step(action)
-            elif self.autoreset_mode == AutoresetMode.SAME_STEP:
-                (
-                    self._env_obs[i],
-                    self._rewards[i],
-                    self._terminations[i],
-                    self._truncations[i],
-                    env_info,
-                ) = self.envs[i].step(action)
-
-                if self._terminations[i] or self._truncations[i]:
-                    infos = self._add_info(
-                        infos,
-                        {"final_obs": self._env_obs[i], "final_info": env_info},
-                        i,
-                    )
-
-                    self._env_obs[i], env_info = self.envs[i].reset()
-            else:
-                raise ValueError(f"Unexpected autoreset mode, {self.autoreset_mode}")
-
-            infos = self._add_info(infos, env_info, i)
+        for i, env_infos in zip(
+            env_indices,
+            self._run_envs(lambda i: self._step_env(i, actions[i]), env_indices),
+        ):
+            for env_info in env_infos:
+                infos = self._add_info(infos, env_info, i)
 
         # Concatenate the observations
         self._observations = concatenate(
@@ -309,9 +281,99 @@ class SyncVectorEnv(VectorEnv):
             infos,
         )
 
-    def render(self) -> tuple[RenderFrame, ...] | None:
-        """Returns the rendered frames from the environments."""
-        return tuple(env.render() for env in self.envs)
+    def autoreset_next_step(self, env_mask: np.ndarray):
+        """Marks the sub-environments of ``env_mask`` to be reset on the next step, see :meth:`VectorEnv.autoreset_next_step`."""
+        assert (
+            self.autoreset_mode == AutoresetMode.NEXT_STEP
+        ), f"Expected `AutoresetMode.NEXT_STEP`, actual autoreset mode: {self.autoreset_mode}"
+        np.logical_or(self._autoreset_envs, env_mask, out=self._autoreset_envs)
+
+    def _step_env(self, i: int, action: ActType) -> list[dict[str, Any]]:
+        """Steps (or autoresets) the ``i``-th sub-environment, writing its results into the preallocated buffers.
+
+        Returns:
+            The info dictionaries of the sub-environment to add to the batched info, in order
+        """
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            if self._autoreset_envs[i]:
+                self._env_obs[i], env_info = self.envs[i].reset()
+
+                self._rewards[i] = 0.0
+                self._terminations[i] = False
+                self._truncations[i] = False
+            else:
+                (
+                    self._env_obs[i],
+                    self._rewards[i],
+                    self._terminations[i],
+                    self._truncations[i],
+                    env_info,
+                ) = self.envs[i].step(action)
+        elif self.autoreset_mode == AutoresetMode.DISABLED:
+            # assumes that the user has correctly autoreset
+            assert not self._autoreset_envs[i], f"{self._autoreset_envs=}"
+            (
+                self._env_obs[i],
+                self._rewards[i],
+                self._terminations[i],
+                self._truncations[i],
+                env_info,
+            ) = self.envs[i].step(action)
+        elif self.autoreset_mode == AutoresetMode.SAME_STEP:
+            (
+                self._env_obs[i],
+                self._rewards[i],
+                self._terminations[i],
+                self._truncations[i],
+                env_info,
+            ) = self.envs[i].step(action)
+
+            if self._terminations[i] or self._truncations[i]:
+                final_info = {"final_obs": self._env_obs[i], "final_info": env_info}
+
+                self._env_obs[i], env_info = self.envs[i].reset()
+                return [final_info, env_info]
+        else:
+            raise ValueError(f"Unexpected autoreset mode, {self.autoreset_mode}")
+
+        return [env_info]
+
+    def _run_envs(
+        self, fn: Callable[[int], Any], env_indices: Sequence[int]
+    ) -> list[Any]:
+        """Runs ``fn`` for each of the sub-environment indices, returning the results in order."""
+        return [fn(i) for i in env_indices]
+
+    def render(self) -> tuple[RenderFrame, ...] | np.ndarray | None:
+        """Returns the rendered frames from the environments.
+
+        For ``render_mode="rgb_array"``, the frames are written into a preallocated ``(num_envs, height, width, 3)``
+        uint8 array that is returned (copied if ``copy=True``), unless the sub-environments' frames differ in shape
+        where a tuple of the frames is returned.
+        """
+        frames = tuple(env.render() for env in self.envs)
+        if self.render_mode != "rgb_array":
+            return frames
+
+        batched_frames = stack_render_frames(frames, self._render_frames)
+        if batched_frames is None:
+            return frames
+
+        self._render_frames = batched_frames
+        return batched_frames.copy() if self.copy else batched_frames
+
+    def get_state(self) -> dict[str, Any]:
+        """Returns a snapshot of the sub-environments' states from their :meth:`gymnasium.Env.get_state` and the autoreset sub-environments."""
+        return {
+            "envs": [env.get_state() for env in self.envs],
+            "autoreset_envs": np.array(self._autoreset_envs),
+        }
+
+    def set_state(self, state: dict[str, Any]):
+        """Restores the sub-environments' states from a snapshot of :meth:`get_state`."""
+        for env, env_state in zip(self.envs, state["envs"]):
+            env.set_state(env_state)
+        self._autoreset_envs = np.array(state["autoreset_envs"])
 
     def call(self, name: str, *args: Any, **kwargs: Any) -> tuple[Any, ...]:
         """Calls a sub-environment method with name and applies args and kwargs.
@@ -0,0 +1,110 @@
+"""Implementation of a thread-pool vectorization method of any environment."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from gymnasium import Env, Space
+from gymnasium.vector.sync_vector_env import SyncVectorEnv
+from gymnasium.vector.vector_env import AutoresetMode
+
+
+__all__ = ["ThreadedVectorEnv"]
+
+
+class ThreadedVectorEnv(SyncVectorEnv):
+    """Vectorized environment that runs multiple environments in parallel on a persistent thread pool.
+
+    Unlike :class:`AsyncVectorEnv`, the sub-environments live in the main process, so no pickling, pipes or shared memory
+    are required. Every sub-environment writes its results directly into its own preallocated slot of the batched
+    buffers, the infos are then merged in the main thread such that the outputs are identical to :class:`SyncVectorEnv`.
+
+    The speed-up depends on how much of a sub-environment's ``step`` runs without the GIL, i.e., environments whose heavy
+    work is in native code that releases the GIL (e.g., MuJoCo's ``mj_step``) or any environment on a free-threaded
+    CPython build. For pure Python environments on a regular CPython build, use :class:`AsyncVectorEnv` instead.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("Pendulum-v1", num_envs=2, vectorization_mode="threaded")
+        >>> envs
+        ThreadedVectorEnv(Pendulum-v1, num_envs=2)
+        >>> obs, infos = envs.reset(seed=42)
+        >>> obs
+        array([[-0.14995256,  0.9886932 , -0.12224312],
+               [ 0.5760367 ,  0.8174238 , -0.91244936]], dtype=float32)
+        >>> _ = envs.action_space.seed(42)
+        >>> actions = envs.action_space.sample()
+        >>> obs, rewards, terminates, truncates, infos = envs.step(actions)
+        >>> obs
+        array([[-0.18856704,  0.9820603 ,  0.7836504 ],
+               [ 0.5896897 ,  0.8076299 , -0.3360544 ]], dtype=float32)
+        >>> rewards
+        array([-2.96562607, -0.99902063])
+        >>> envs.close()
+    """
+
+    def __init__(
+        self,
+        env_fns: Iterator[Callable[[], Env]] | Sequence[Callable[[], Env]],
+        copy: bool = True,
+        observation_mode: str | Space = "same",
+        autoreset_mode: str | AutoresetMode = AutoresetMode.NEXT_STEP,
+        num_threads: int | None = None,
+    ):
+        """Vectorized environment that runs multiple environments on a thread pool.
+
+        Args:
+            env_fns: iterable of callable functions that create the environments.
+            copy: If ``True``, then the :meth:`reset` and :meth:`step` methods return a copy of the observations.
+            observation_mode: Defines how environment observation spaces should be batched. 'same' defines that there should be ``n`` copies of identical spaces.
+                'different' defines that there can be multiple observation spaces with the same length but different high/low values batched together. Passing a ``Space`` object
+                allows the user to set some custom observation space mode not covered by 'same' or 'different.'
+            autoreset_mode: The Autoreset Mode used, see https://farama.org/Vector-Autoreset-Mode for more information.
+            num_threads: The number of threads used, defaults to ``min(num_envs, os.cpu_count())``.
+                Each thread steps a contiguous chunk of the sub-environments.
+        """
+        super().__init__(
+            env_fns,
+            copy=copy,
+            observation_mode=observation_mode,
+            autoreset_mode=autoreset_mode,
+        )
+
+        if num_threads is None:
+            num_threads = min(self.num_envs, os.cpu_count() or 1)
+        assert num_threads >= 1, f"Expected `num_threads` >= 1, got {num_threads}"
+        self.num_threads = min(num_threads, self.num_envs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.num_threads, thread_name_prefix="ThreadedVectorEnv"
+        )
+
+    def _run_envs(
+        self, fn: Callable[[int], Any], env_indices: Sequence[int]
+    ) -> list[Any]:
+        """Runs ``fn`` for each of the sub-environment indices split into contiguous chunks across the thread pool."""
+        if len(env_indices) <= 1 or self.num_threads == 1:
+            return [fn(i) for i in env_indices]
+
+        num_chunks = min(self.num_threads, len(env_indices))
+        chunk_size, remainder = divmod(len(env_indices), num_chunks)
+        chunks, start = [], 0
+        for chunk_index in range(num_chunks):
+            end = start + chunk_size + (chunk_index < remainder)
+            chunks.append(env_indices[start:end])
+            start = end
+
+        # `result()` re-raises any exception from the sub-environments in the main thread
+        futures = [
+            self._executor.submit(lambda chunk: [fn(i) for i in chunk], chunk)
+            for chunk in chunks
+        ]
+        return [result for future in futures for result in future.result()]
+
+    def close_extras(self, **kwargs: Any):
+        """Close the environments and shuts down the thread pool."""
+        super().close_extras(**kwargs)
+        if hasattr(self, "_executor"):
+            self._executor.shutdown()
@@ -1,6 +1,10 @@
 """Module for gymnasium experimental vector utility functions."""
 
-from gymnasium.vector.utils.misc import CloudpickleWrapper, clear_mpi_env_vars
+from gymnasium.vector.utils.misc import (
+    CloudpickleWrapper,
+    clear_mpi_env_vars,
+    stack_render_frames,
+)
 from gymnasium.vector.utils.shared_memory import (
     create_shared_memory,
     read_from_shared_memory,
@@ -11,7 +15,10 @@ from gymnasium.vector.utils.space_utils import (
     batch_space,
     concatenate,
     create_empty_array,
+    from_structured,
     iterate,
+    structured_dtype,
+    to_structured,
 )
 
 
@@ -21,9 +28,13 @@ __all__ = [
     "iterate",
     "concatenate",
     "create_empty_array",
+    "structured_dtype",
+    "to_structured",
+    "from_structured",
     "create_shared_memory",
     "read_from_shared_memory",
     "write_to_shared_memory",
     "CloudpickleWrapper",
     "clear_mpi_env_vars",
+    "stack_render_frames",
 ]
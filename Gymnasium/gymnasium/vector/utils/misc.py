@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import contextlib
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
 
 from gymnasium.core import Env
 
 
-__all__ = ["CloudpickleWrapper", "clear_mpi_env_vars"]
+__all__ = ["CloudpickleWrapper", "clear_mpi_env_vars", "stack_render_frames"]
 
 
 class CloudpickleWrapper:
@@ -60,3 +63,31 @@ def clear_mpi_env_vars():
         yield
     finally:
         os.environ.update(removed_environment)
+
+
+def stack_render_frames(
+    frames: Sequence[Any], out: np.ndarray | None = None
+) -> np.ndarray | None:
+    """Stacks the sub-environments' ``rgb_array`` frames into a single ``(num_envs, height, width, 3)`` uint8 array.
+
+    Args:
+        frames: The rendered frame of each sub-environment
+        out: A preallocated buffer that the frames are written into if its shape matches
+
+    Returns:
+        The stacked frames, ``out`` if it could be reused, or ``None`` if the frames are not uint8 arrays of the same shape
+    """
+    if len(frames) == 0 or not all(
+        isinstance(frame, np.ndarray) and frame.dtype == np.uint8 for frame in frames
+    ):
+        return None
+
+    frame_shape = frames[0].shape
+    if any(frame.shape != frame_shape for frame in frames):
+        return None
+
+    if out is None or out.shape != (len(frames),) + frame_shape:
+        out = np.empty((len(frames),) + frame_shape, dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        out[i] = frame
+    return out
@@ -25,6 +25,13 @@ from gymnasium.spaces import (
     Tuple,
     flatten,
 )
+from gymnasium.spaces.graph import GraphInstance
+from gymnasium.vector.utils.space_utils import (
+    batch_space,
+    concatenate,
+    create_empty_array,
+    iterate,
+)
 
 
 __all__ = ["create_shared_memory", "read_from_shared_memory", "write_to_shared_memory"]
@@ -32,22 +39,41 @@ __all__ = ["create_shared_memory", "read_from_shared_memory", "write_to_shared_m
 
 @singledispatch
 def create_shared_memory(
-    space: Space[Any], n: int = 1, ctx=mp
+    space: Space[Any],
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
 ) -> dict[str, Any] | tuple[Any, ...] | SynchronizedArray:
     """Create a shared memory object, to be shared across processes.
 
     This eventually contains the observations from the vectorized environment.
 
+    :class:`Sequence` and :class:`Graph` spaces have a dynamic shape, therefore, require a ``capacity`` to create a
+    padded buffer for each environment with a header containing the sequence length or the number of nodes and edges.
+    For graphs, the edges are stored in a compressed sparse row (CSR) layout such that the edges read from shared memory
+    are ordered by their source node.
+
+    Example:
+        >>> from gymnasium.spaces import Box, Sequence
+        >>> space = Sequence(Box(0, 1, shape=(2,)), seed=123)
+        >>> shared_memory = create_shared_memory(space, n=2, capacity=16)
+        >>> write_to_shared_memory(space, 0, space.sample(mask=(3, None)), shared_memory)
+        >>> [len(sequence) for sequence in read_from_shared_memory(space, shared_memory, n=2)]
+        [3, 0]
+
     Args:
         space: Observation space of a single environment in the vectorized environment.
         n: Number of environments in the vectorized environment (i.e. the number of processes).
         ctx: The multiprocess module
+        capacity: The maximum length of :class:`Sequence` observations and the maximum number of nodes and edges of
+            :class:`Graph` observations, a tuple of ``(max_nodes, max_edges)`` can be used for graphs.
 
     Returns:
         shared_memory for the shared object across processes.
 
     Raises:
         CustomSpaceError: Space is not a valid :class:`gymnasium.Space` instance
+        TypeError: If no ``capacity`` is given for a space with a dynamic shape
     """
     if isinstance(space, Space):
         raise CustomSpaceError(
@@ -64,7 +90,10 @@ def create_shared_memory(
 @create_shared_memory.register(MultiDiscrete)
 @create_shared_memory.register(MultiBinary)
 def _create_base_shared_memory(
-    space: Box | Discrete | MultiDiscrete | MultiBinary, n: int = 1, ctx=mp
+    space: Box | Discrete | MultiDiscrete | MultiBinary,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
 ):
     assert space.dtype is not None
     dtype = space.dtype.char
@@ -73,38 +102,118 @@ def _create_base_shared_memory(
     return ctx.Array(dtype, n * int(np.prod(space.shape)))
 
 
+def _create_subspace_shared_memory(
+    space: Space, n: int, ctx, capacity: int | tuple[int, int] | None
+):
+    # `capacity` is only passed when set, such that custom spaces registered without the parameter are supported
+    if capacity is None:
+        return create_shared_memory(space, n=n, ctx=ctx)
+    return create_shared_memory(space, n=n, ctx=ctx, capacity=capacity)
+
+
 @create_shared_memory.register(Tuple)
-def _create_tuple_shared_memory(space: Tuple, n: int = 1, ctx=mp):
+def _create_tuple_shared_memory(
+    space: Tuple,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
+):
     return tuple(
-        create_shared_memory(subspace, n=n, ctx=ctx) for subspace in space.spaces
+        _create_subspace_shared_memory(subspace, n, ctx, capacity)
+        for subspace in space.spaces
     )
 
 
 @create_shared_memory.register(Dict)
-def _create_dict_shared_memory(space: Dict, n: int = 1, ctx=mp):
+def _create_dict_shared_memory(
+    space: Dict,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
+):
     return {
-        key: create_shared_memory(subspace, n=n, ctx=ctx)
+        key: _create_subspace_shared_memory(subspace, n, ctx, capacity)
         for (key, subspace) in space.spaces.items()
     }
 
 
 @create_shared_memory.register(Text)
-def _create_text_shared_memory(space: Text, n: int = 1, ctx=mp):
+def _create_text_shared_memory(
+    space: Text,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
+):
     return ctx.Array(np.dtype(np.int32).char, n * space.max_length)
 
 
 @create_shared_memory.register(OneOf)
-def _create_oneof_shared_memory(space: OneOf, n: int = 1, ctx=mp):
+def _create_oneof_shared_memory(
+    space: OneOf,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
+):
     return (ctx.Array(np.dtype(np.int64).char, n),) + tuple(
-        create_shared_memory(subspace, n=n, ctx=ctx) for subspace in space.spaces
+        _create_subspace_shared_memory(subspace, n, ctx, capacity)
+        for subspace in space.spaces
     )
 
 
-@create_shared_memory.register(Graph)
+def _dynamic_capacity(
+    space: Graph | Sequence, capacity: int | tuple[int, int] | None
+) -> tuple[int, int]:
+    if capacity is None:
+        raise TypeError(
+            f"As {space} has a dynamic shape so its not possible to make a static shared memory. Set the shared memory `capacity` or, for `AsyncVectorEnv`, set `shared_memory_capacity` or disable `shared_memory`."
+        )
+    elif isinstance(capacity, (int, np.integer)):
+        capacity = (int(capacity), int(capacity))
+
+    assert (
+        len(capacity) == 2 and capacity[0] >= 0 and capacity[1] >= 0
+    ), f"Expects the capacity to be a non-negative integer or a tuple of two non-negative integers, actual value: {capacity}"
+    return capacity
+
+
 @create_shared_memory.register(Sequence)
-def _create_dynamic_shared_memory(space: Graph | Sequence, n: int = 1, ctx=mp):
-    raise TypeError(
-        f"As {space} has a dynamic shape so its not possible to make a static shared memory. For `AsyncVectorEnv`, disable `shared_memory`."
+def _create_sequence_shared_memory(
+    space: Sequence,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
+):
+    max_length, _ = _dynamic_capacity(space, capacity)
+    # The length of each environment's sequence, the padded features and the maximum length
+    return (
+        ctx.Array(np.dtype(np.int64).char, n),
+        _create_subspace_shared_memory(
+            space.feature_space, n * max_length, ctx, capacity
+        ),
+        max_length,
+    )
+
+
+@create_shared_memory.register(Graph)
+def _create_graph_shared_memory(
+    space: Graph,
+    n: int = 1,
+    ctx=mp,
+    capacity: int | tuple[int, int] | None = None,
+):
+    max_nodes, max_edges = _dynamic_capacity(space, capacity)
+    # The number of nodes and edges of each environment's graph, the padded node features, the padded edge features
+    #   and the CSR layout of the edge links, the row pointers over nodes and the column indices of each edge.
+    return (
+        ctx.Array(np.dtype(np.int64).char, n * 2),
+        create_shared_memory(space.node_space, n=n * max_nodes, ctx=ctx),
+        (
+            None
+            if space.edge_space is None
+            else create_shared_memory(space.edge_space, n=n * max_edges, ctx=ctx)
+        ),
+        ctx.Array(np.dtype(np.int32).char, n * (max_nodes + 1)),
+        ctx.Array(np.dtype(np.int32).char, n * max_edges),
     )
 
 
@@ -205,6 +314,82 @@ def _read_one_of_from_shared_memory(
     )
 
 
+@read_from_shared_memory.register(Sequence)
+def _read_sequence_from_shared_memory(
+    space: Sequence, shared_memory, n: int = 1
+) -> tuple[Any, ...]:
+    lengths = np.frombuffer(shared_memory[0].get_obj(), dtype=np.int64)
+    max_length = shared_memory[2]
+    features = read_from_shared_memory(
+        space.feature_space, shared_memory[1], n=n * max_length
+    )
+
+    if isinstance(features, np.ndarray):
+        # Fixed-shape features are returned as views of the shared memory
+        sequences = (
+            features[index * max_length : index * max_length + length]
+            for index, length in enumerate(lengths)
+        )
+        if space.stack:
+            return tuple(sequences)
+        return tuple(tuple(sequence) for sequence in sequences)
+
+    items = tuple(iterate(batch_space(space.feature_space, n * max_length), features))
+    sequences = (
+        items[index * max_length : index * max_length + length]
+        for index, length in enumerate(lengths)
+    )
+    if space.stack:
+        return tuple(
+            concatenate(
+                space.feature_space,
+                sequence,
+                create_empty_array(space.feature_space, len(sequence)),
+            )
+            for sequence in sequences
+        )
+    return tuple(sequences)
+
+
+@read_from_shared_memory.register(Graph)
+def _read_graph_from_shared_memory(
+    space: Graph, shared_memory, n: int = 1
+) -> tuple[GraphInstance, ...]:
+    header = np.frombuffer(shared_memory[0].get_obj(), dtype=np.int64).reshape(n, 2)
+    max_nodes, max_edges = len(shared_memory[3]) // n - 1, len(shared_memory[4]) // n
+    nodes = read_from_shared_memory(space.node_space, shared_memory[1], n=n * max_nodes)
+    edges = (
+        None
+        if space.edge_space is None
+        else read_from_shared_memory(
+            space.edge_space, shared_memory[2], n=n * max_edges
+        )
+    )
+    row_pointers = np.frombuffer(shared_memory[3].get_obj(), dtype=np.int32).reshape(
+        n, max_nodes + 1
+    )
+    columns = np.frombuffer(shared_memory[4].get_obj(), dtype=np.int32).reshape(
+        n, max_edges
+    )
+
+    graphs = []
+    for index, (num_nodes, num_edges) in enumerate(header):
+        graph_nodes = nodes[index * max_nodes : index * max_nodes + num_nodes]
+        if edges is None or num_edges == 0:
+            graphs.append(GraphInstance(graph_nodes, None, None))
+            continue
+
+        graph_edges = edges[index * max_edges : index * max_edges + num_edges]
+        # Expand the CSR row pointers to the source node of each edge
+        sources = np.repeat(
+            np.arange(num_nodes, dtype=np.int32),
+            np.diff(row_pointers[index, : num_nodes + 1]),
+        )
+        edge_links = np.stack([sources, columns[index, :num_edges]], axis=1)
+        graphs.append(GraphInstance(graph_nodes, graph_edges, edge_links))
+    return tuple(graphs)
+
+
 @singledispatch
 def write_to_shared_memory(
     space: Space,
@@ -291,3 +476,94 @@ def _write_oneof_to_shared_memory(
     write_to_shared_memory(
         space.spaces[subspace_idx], index, space_value, shared_memory[1 + subspace_idx]
     )
+
+
+@write_to_shared_memory.register(Sequence)
+def _write_sequence_to_shared_memory(
+    space: Sequence, index: int, values: tuple[Any, ...] | Any, shared_memory
+):
+    max_length = shared_memory[2]
+    if space.stack:
+        values = tuple(iterate(space.stacked_feature_space, values))
+    if len(values) > max_length:
+        raise ValueError(
+            f"The observation of {space} has a length of {len(values)} that exceeds the shared memory capacity of {max_length}, increase the `capacity` (`shared_memory_capacity` for `AsyncVectorEnv`) or disable `shared_memory`."
+        )
+
+    np.frombuffer(shared_memory[0].get_obj(), dtype=np.int64)[index] = len(values)
+    if isinstance(space.feature_space, (Box, Discrete, MultiDiscrete, MultiBinary)):
+        # Fixed-shape features are written with a single copy
+        if len(values) > 0:
+            size = int(np.prod(space.feature_space.shape))
+            destination = np.frombuffer(
+                shared_memory[1].get_obj(), dtype=space.feature_space.dtype
+            )
+            start = index * max_length * size
+            np.copyto(
+                destination[start : start + len(values) * size],
+                np.asarray(values, dtype=space.feature_space.dtype).reshape(-1),
+            )
+    else:
+        for offset, value in enumerate(values):
+            write_to_shared_memory(
+                space.feature_space,
+                index * max_length + offset,
+                value,
+                shared_memory[1],
+            )
+
+
+@write_to_shared_memory.register(Graph)
+def _write_graph_to_shared_memory(
+    space: Graph, index: int, value: GraphInstance, shared_memory
+):
+    n = len(shared_memory[0]) // 2
+    max_nodes, max_edges = len(shared_memory[3]) // n - 1, len(shared_memory[4]) // n
+
+    num_nodes = len(value.nodes)
+    num_edges = (
+        0 if value.edges is None or value.edge_links is None else len(value.edge_links)
+    )
+    if num_nodes > max_nodes or num_edges > max_edges:
+        raise ValueError(
+            f"The observation of {space} has {num_nodes} nodes and {num_edges} edges that exceeds the shared memory capacity of {max_nodes} nodes and {max_edges} edges, increase the `capacity` (`shared_memory_capacity` for `AsyncVectorEnv`) or disable `shared_memory`."
+        )
+
+    header = np.frombuffer(shared_memory[0].get_obj(), dtype=np.int64)
+    header[2 * index : 2 * index + 2] = num_nodes, num_edges
+
+    node_size = int(np.prod(space.node_space.shape))
+    nodes = np.frombuffer(shared_memory[1].get_obj(), dtype=space.node_space.dtype)
+    np.copyto(
+        nodes[
+            index * max_nodes * node_size : (index * max_nodes + num_nodes) * node_size
+        ],
+        np.asarray(value.nodes, dtype=space.node_space.dtype).reshape(-1),
+    )
+
+    row_pointers = np.frombuffer(shared_memory[3].get_obj(), dtype=np.int32)
+    row_pointers = row_pointers[index * (max_nodes + 1) : (index + 1) * (max_nodes + 1)]
+    if num_edges == 0:
+        row_pointers[:] = 0
+        return
+
+    # Order the edges by their source node (keeping their relative order) for the CSR layout
+    edge_links = np.asarray(value.edge_links)
+    order = np.argsort(edge_links[:, 0], kind="stable")
+    row_pointers[0] = 0
+    np.cumsum(
+        np.bincount(edge_links[:, 0], minlength=num_nodes),
+        out=row_pointers[1 : num_nodes + 1],
+    )
+    columns = np.frombuffer(shared_memory[4].get_obj(), dtype=np.int32)
+    columns[index * max_edges : index * max_edges + num_edges] = edge_links[order, 1]
+
+    assert space.edge_space is not None
+    edge_size = int(np.prod(space.edge_space.shape))
+    edges = np.frombuffer(shared_memory[2].get_obj(), dtype=space.edge_space.dtype)
+    np.copyto(
+        edges[
+            index * max_edges * edge_size : (index * max_edges + num_edges) * edge_size
+        ],
+        np.asarray(value.edges, dtype=space.edge_space.dtype)[order].reshape(-1),
+    )
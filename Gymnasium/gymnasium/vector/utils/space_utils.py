@@ -5,6 +5,7 @@
 - ``concatenate``: Concatenate multiple samples from (unbatched) space into a single object.
 - ``Iterate``: Iterate over the elements of a (batched) space and items.
 - ``create_empty_array``: Create an empty (possibly nested) (normally numpy-based) array, used in conjunction with ``concatenate(..., out=array)``
+- ``structured_dtype``: Create a NumPy structured dtype for a (composite) space, used with ``to_structured`` and ``from_structured``
 """
 
 from __future__ import annotations
@@ -41,6 +42,9 @@ __all__ = [
     "iterate",
     "concatenate",
     "create_empty_array",
+    "structured_dtype",
+    "to_structured",
+    "from_structured",
 ]
 
 
@@ -539,3 +543,157 @@ def _create_empty_array_oneof(space: OneOf, n: int = 1, fn=np.zeros):
 @create_empty_array.register(Space)
 def _create_empty_array_custom(space, n=1, fn=np.zeros):
     return None
+
+
+@singledispatch
+def structured_dtype(space: Space) -> np.dtype:
+    """Creates a NumPy structured dtype for a space of fixed-shape elements, with a (nested) field for each subspace.
+
+    An array with the structured dtype stores a batch of (composite) elements as a single contiguous buffer, such that
+    the whole batch can be copied, shared, memory-mapped or sent over a pipe in one operation.
+    :class:`Tuple` subspaces are named ``f0``, ``f1``, ... and :class:`Dict` subspaces by their keys.
+    Use :func:`to_structured` and :func:`from_structured` to convert batches to and from the structured array.
+
+    Args:
+        space: A space whose elements have a fixed shape, i.e., :class:`Box`, :class:`Discrete`, :class:`MultiDiscrete`,
+            :class:`MultiBinary` or :class:`Tuple` and :class:`Dict` spaces of them.
+
+    Returns:
+        The structured dtype, for fundamental spaces, this is a subarray dtype that numpy expands into the batched array
+
+    Raises:
+        TypeError: If the space's elements don't have a fixed shape
+
+    Example:
+        >>> from gymnasium.spaces import Box, Dict, Discrete
+        >>> import numpy as np
+        >>> space = Dict({"position": Box(low=0, high=1, shape=(2,), dtype=np.float32), "gear": Discrete(3)})
+        >>> structured_dtype(space)
+        dtype([('gear', '<i8'), ('position', '<f4', (2,))])
+        >>> shared = np.frombuffer(bytearray(3 * structured_dtype(space).itemsize), dtype=structured_dtype(space))
+        >>> shared.shape, shared.nbytes
+        ((3,), 48)
+    """
+    raise TypeError(
+        f"The space provided to `structured_dtype` doesn't have a fixed-shape structured representation, type: {type(space)}, {space}"
+    )
+
+
+@structured_dtype.register(Box)
+@structured_dtype.register(Discrete)
+@structured_dtype.register(MultiDiscrete)
+@structured_dtype.register(MultiBinary)
+def _structured_dtype_multi(space: Box | Discrete | MultiDiscrete | MultiBinary):
+    return np.dtype((space.dtype, space.shape))
+
+
+@structured_dtype.register(Tuple)
+def _structured_dtype_tuple(space: Tuple):
+    return np.dtype(
+        [
+            (f"f{i}", structured_dtype(subspace))
+            for i, subspace in enumerate(space.spaces)
+        ]
+    )
+
+
+@structured_dtype.register(Dict)
+def _structured_dtype_dict(space: Dict):
+    return np.dtype(
+        [(key, structured_dtype(subspace)) for key, subspace in space.spaces.items()]
+    )
+
+
+def to_structured(
+    space: Space, items: Any, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Copies a batch of elements, an element of ``batch_space(space, n)``, into a structured array of shape ``(n,)``.
+
+    Args:
+        space: The (unbatched) space of the elements, see :func:`structured_dtype`
+        items: The batch of elements
+        out: An optional structured array of shape ``(n,)`` with ``structured_dtype(space)`` to copy the batch into
+
+    Returns:
+        The structured array, the ``out`` array if provided
+
+    Raises:
+        ValueError: If ``out`` isn't provided for a space without fundamental subspaces, e.g., ``Tuple(())``, as the batch size is unknown
+
+    Example:
+        >>> from gymnasium.spaces import Box, Tuple, Discrete
+        >>> import numpy as np
+        >>> space = Tuple((Discrete(3), Box(low=0, high=1, shape=(2,), dtype=np.float32)))
+        >>> array = to_structured(space, (np.array([0, 2]), np.array([[0.5, 0.5], [1.0, 0.0]], dtype=np.float32)))
+        >>> array
+        array([(0, [0.5, 0.5]), (2, [1. , 0. ])],
+              dtype=[('f0', '<i8'), ('f1', '<f4', (2,))])
+        >>> from_structured(space, array)
+        (array([0, 2]), array([[0.5, 0.5],
+               [1. , 0. ]], dtype=float32))
+    """
+    if out is None:
+        batch_size = _batch_size(space, items)
+        if batch_size is None:
+            raise ValueError(
+                f"The batch size can't be inferred from the elements of a space without fundamental subspaces, provide `out` with the batch size, space: {space}"
+            )
+        out = np.empty(batch_size, dtype=structured_dtype(space))
+
+    _write_structured(space, items, out)
+    return out
+
+
+def from_structured(space: Space, array: np.ndarray) -> Any:
+    """Returns the batch of elements, an element of ``batch_space(space, n)``, stored in a structured array.
+
+    The batch's arrays are views of the structured array, such that no data is copied.
+
+    Args:
+        space: The (unbatched) space of the elements, see :func:`structured_dtype`
+        array: The structured array with ``structured_dtype(space)``
+
+    Returns:
+        The batch of elements, whose arrays are views of ``array``
+    """
+    if isinstance(space, Tuple):
+        return tuple(
+            from_structured(subspace, array[f"f{i}"])
+            for i, subspace in enumerate(space.spaces)
+        )
+    elif isinstance(space, Dict):
+        return {
+            key: from_structured(subspace, array[key])
+            for key, subspace in space.spaces.items()
+        }
+    else:
+        return array
+
+
+def _write_structured(space: Space, items: Any, array: np.ndarray):
+    if isinstance(space, Tuple):
+        for i, (subspace, item) in enumerate(zip(space.spaces, items)):
+            _write_structured(subspace, item, array[f"f{i}"])
+    elif isinstance(space, Dict):
+        for key, subspace in space.spaces.items():
+            _write_structured(subspace, items[key], array[key])
+    else:
+        array[...] = items
+
+
+def _batch_size(space: Space, items: Any) -> int | None:
+    """Returns the batch size of the first fundamental subspace's elements, ``None`` if the space has no fundamental subspaces."""
+    if isinstance(space, Tuple):
+        for subspace, item in zip(space.spaces, items):
+            batch_size = _batch_size(subspace, item)
+            if batch_size is not None:
+                return batch_size
+        return None
+    elif isinstance(space, Dict):
+        for key, subspace in space.spaces.items():
+            batch_size = _batch_size(subspace, items[key])
+            if batch_size is not None:
+                return batch_size
+        return None
+    else:
+        return len(items)
@@ -238,6 +238,50 @@ class VectorEnv(Generic[ObsType, ActType, ArrayType]):
         """Clean up the extra resources e.g. beyond what's in this base class."""
         pass
 
+    def get_state(self) -> dict[str, Any]:
+        """Returns a snapshot of the sub-environments' state that can be restored with :meth:`set_state`.
+
+        For native vector environments, the snapshot is a dictionary of copies of the batched state arrays of the
+        sub-environments and the state of :attr:`np_random`, such that the vector environment restored with the
+        snapshot continues identically. The state of wrappers is not included.
+
+        Example:
+            >>> import gymnasium as gym
+            >>> envs = gym.make_vec("CartPole-v1", num_envs=3, vectorization_mode="vector_entry_point")
+            >>> _ = envs.reset(seed=123)
+            >>> state = envs.get_state()
+            >>> state["state"].shape
+            (4, 3)
+            >>> obs, *_ = envs.step(np.array([0, 1, 1]))
+            >>> envs.set_state(state)
+            >>> restored_obs, *_ = envs.step(np.array([0, 1, 1]))
+            >>> bool((obs == restored_obs).all())
+            True
+
+        Returns:
+            The vector environment's state
+        """
+        raise NotImplementedError
+
+    def set_state(self, state: dict[str, Any]):
+        """Restores the sub-environments' state from a snapshot of :meth:`get_state`.
+
+        Args:
+            state: The vector environment's state
+        """
+        raise NotImplementedError
+
+    def autoreset_next_step(self, env_mask: np.ndarray):
+        """Marks the sub-environments of ``env_mask`` to be reset on the next step for ``AutoresetMode.NEXT_STEP``.
+
+        This is used by vector wrappers that end the sub-environments' episodes, e.g., :class:`gymnasium.wrappers.vector.TimeLimit`,
+        such that the sub-environments are autoreset on the next step as if they terminated or truncated themselves.
+
+        Args:
+            env_mask: A boolean array of the sub-environments to autoreset, with shape ``(num_envs,)``
+        """
+        raise NotImplementedError
+
     @property
     def np_random(self) -> np.random.Generator:
         """Returns the environment's internal :attr:`_np_random` that if not set will initialise with a random seed.
@@ -410,6 +454,18 @@ class VectorWrapper(VectorEnv):
         """Close all extra resources."""
         return self.env.close_extras(**kwargs)
 
+    def get_state(self) -> dict[str, Any]:
+        """Uses the :meth:`get_state` of the :attr:`env`."""
+        return self.env.get_state()
+
+    def set_state(self, state: dict[str, Any]):
+        """Uses the :meth:`set_state` of the :attr:`env`."""
+        self.env.set_state(state)
+
+    def autoreset_next_step(self, env_mask: np.ndarray):
+        """Uses the :meth:`autoreset_next_step` of the :attr:`env`."""
+        self.env.autoreset_next_step(env_mask)
+
     @property
     def unwrapped(self):
         """Return the base non-wrapped environment."""
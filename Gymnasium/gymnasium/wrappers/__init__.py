@@ -53,6 +53,7 @@ from gymnasium.wrappers import vector
 from gymnasium.wrappers.atari_preprocessing import AtariPreprocessing
 from gymnasium.wrappers.common import (
     Autoreset,
+    FusedWrappers,
     OrderEnforcing,
     PassiveEnvChecker,
     RecordEpisodeStatistics,
@@ -131,6 +132,7 @@ __all__ = [
     "PassiveEnvChecker",
     "OrderEnforcing",
     "RecordEpisodeStatistics",
+    "FusedWrappers",
     # --- Rendering ---
     "AddWhiteNoise",
     "ObstructView",
@@ -46,7 +46,7 @@ if Version(np.__version__) < Version("2.1.0"):
     raise DependencyNotInstalled("Array API functionality requires numpy >= 2.1.0")
 
 
-__all__ = ["ArrayConversion", "array_conversion"]
+__all__ = ["ArrayConversion", "ArrayConversionPlan", "array_conversion"]
 
 Array = Any  # TODO: Switch to ArrayAPI type once https://github.com/data-apis/array-api/pull/589 is merged
 Device = Any  # TODO: Switch to ArrayAPI type if available
@@ -154,6 +154,182 @@ def _none_array_conversion(
     return value
 
 
+def _identity_conversion(value: Any) -> Any:
+    return value
+
+
+def _from_dlpack_with_device(value: Array, xp: ModuleType, device: Device | None):
+    return xp.from_dlpack(value, device=device)
+
+
+def _from_dlpack_to_device(value: Array, xp: ModuleType, device: Device | None):
+    value = xp.from_dlpack(value)
+    return to_device(value, device) if device is not None else value
+
+
+class _ArrayAPIArrayConversion:
+    """Converts the arrays at a position of the data with the ``from_dlpack`` path resolved for the first array.
+
+    The paths of :func:`_array_api_array_conversion` are tried once for the first array, the zero-copy path that
+    succeeds is reused for the following arrays. If it fails for an array, e.g., a readonly buffer, the array is
+    converted with the full :func:`_array_api_array_conversion`.
+    """
+
+    _UNRESOLVED = object()
+
+    def __init__(self, xp: ModuleType, device: Device | None):
+        self.xp = xp
+        self.device = device if not is_numpy_namespace(xp) else "cpu"
+        self.from_dlpack = self._UNRESOLVED
+
+    def __call__(self, value: Array) -> Array:
+        if self.from_dlpack is self._UNRESOLVED:
+            self.from_dlpack = None
+            for from_dlpack in (_from_dlpack_with_device, _from_dlpack_to_device):
+                try:
+                    converted_value = from_dlpack(value, self.xp, self.device)
+                except (TypeError, BufferError, RuntimeError):
+                    continue
+                self.from_dlpack = from_dlpack
+                return converted_value
+        elif self.from_dlpack is not None:
+            try:
+                return self.from_dlpack(value, self.xp, self.device)
+            except (TypeError, BufferError, RuntimeError):
+                pass
+
+        return _array_api_array_conversion(value, self.xp, self.device)
+
+
+class _MappingConversion:
+    """Converts the values of a mapping with a conversion plan for each key."""
+
+    def __init__(
+        self,
+        xp: ModuleType,
+        device: Device | None,
+        plans: dict[Any, ArrayConversionPlan],
+    ):
+        self.xp = xp
+        self.device = device
+        self.plans = plans
+
+    def __call__(self, value: Mapping[str, Any]) -> Mapping[str, Any]:
+        plans = self.plans
+        converted_value = {}
+        for key, sub_value in value.items():
+            plan = plans.get(key)
+            if plan is None:
+                plan = plans[key] = ArrayConversionPlan(self.xp, self.device)
+            converted_value[key] = plan(sub_value)
+        return type(value)(**converted_value)
+
+
+class _SequenceConversion:
+    """Converts the elements of a tuple, namedtuple or list with a conversion plan for each index."""
+
+    def __init__(
+        self,
+        xp: ModuleType,
+        device: Device | None,
+        plans: list[ArrayConversionPlan],
+        is_namedtuple: bool,
+    ):
+        self.xp = xp
+        self.device = device
+        self.plans = plans
+        self.is_namedtuple = is_namedtuple
+
+    def __call__(self, value: Iterable[Any]) -> Iterable[Any]:
+        plans = self.plans
+        for _ in range(len(value) - len(plans)):
+            plans.append(ArrayConversionPlan(self.xp, self.device))
+        converted_value = (plan(sub_value) for plan, sub_value in zip(plans, value))
+        if self.is_namedtuple:
+            return type(value)._make(converted_value)
+        return type(value)(converted_value)
+
+
+class ArrayConversionPlan:
+    """A conversion of data to the specified xp module array type, compiled for the structure of the data.
+
+    :func:`array_conversion` dispatches on the type of every value, walks the mappings and iterables and tries the
+    ``from_dlpack`` paths for every array each time it is called. A plan instead holds the conversion of each
+    position of the data for each type of value found there, such that converting data of the same structure
+    only looks up the cached conversion of each value. The tree structure of ``Dict`` and ``Tuple`` spaces is
+    compiled in advance, the conversion of the leaves are resolved with the first values converted, as the
+    framework of the arrays isn't known from the space. The converted data equals :func:`array_conversion`.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.spaces import Box, Dict
+        >>> plan = ArrayConversionPlan(np, space=Dict(a=Box(0, 1, shape=(2,))))
+        >>> plan({"a": np.zeros(2), "b": 1})
+        {'a': array([0., 0.]), 'b': array(1)}
+    """
+
+    def __init__(
+        self,
+        xp: ModuleType,
+        device: Device | None = None,
+        space: gym.Space | None = None,
+    ):
+        """Compiles the conversion plan.
+
+        Args:
+            xp: The Array API framework to convert to
+            device: The device on which Arrays should be returned
+            space: The space of the data, optionally, used to compile the structure of the data in advance
+        """
+        self.xp = xp
+        self.device = device
+        self.conversions: dict[type, Any] = {}
+
+        if isinstance(space, gym.spaces.Dict):
+            self.conversions[dict] = _MappingConversion(
+                xp,
+                device,
+                {
+                    key: ArrayConversionPlan(xp, device, subspace)
+                    for key, subspace in space.spaces.items()
+                },
+            )
+        elif isinstance(space, gym.spaces.Tuple):
+            self.conversions[tuple] = _SequenceConversion(
+                xp,
+                device,
+                [ArrayConversionPlan(xp, device, subspace) for subspace in space],
+                is_namedtuple=False,
+            )
+
+    def __call__(self, value: Any) -> Any:
+        """Converts the value into the specified xp module array type."""
+        conversion = self.conversions.get(type(value))
+        if conversion is None:
+            conversion = self.conversions[type(value)] = self._compile(value)
+        return conversion(value)
+
+    def _compile(self, value: Any):
+        """Compiles the conversion of a type of value, in the order of the :func:`array_conversion` dispatch."""
+        if value is None:
+            return _identity_conversion
+        elif isinstance(value, numbers.Number):
+            return functools.partial(
+                _number_array_conversion, xp=self.xp, device=self.device
+            )
+        elif isinstance(value, abc.Mapping):
+            return _MappingConversion(self.xp, self.device, {})
+        elif is_array_api_obj(value):
+            return _ArrayAPIArrayConversion(self.xp, self.device)
+        elif isinstance(value, (tuple, list)):
+            # namedtuple - underline used to prevent potential name conflicts
+            return _SequenceConversion(
+                self.xp, self.device, [], is_namedtuple=hasattr(value, "_make")
+            )
+        else:
+            return functools.partial(array_conversion, xp=self.xp, device=self.device)
+
+
 class ArrayConversion(gym.Wrapper, gym.utils.RecordConstructorArgs):
     """Wraps an Array API compatible environment so that it can be interacted with with another Array API framework.
 
@@ -185,6 +361,7 @@ class ArrayConversion(gym.Wrapper, gym.utils.RecordConstructorArgs):
 
     Change logs:
      * v1.2.0 - Initially added
+     * v1.2.2 - The data is converted with :class:`ArrayConversionPlan` compiled for the spaces of the environment
     """
 
     def __init__(
@@ -211,6 +388,18 @@ class ArrayConversion(gym.Wrapper, gym.utils.RecordConstructorArgs):
         self._target_xp = module_namespace(target_xp)
         self._env_device: Device | None = env_device
         self._target_device: Device | None = target_device
+        self._compile_conversion_plans()
+
+    def _compile_conversion_plans(self):
+        """Compiles the conversion plans of the actions, observations, infos and renders."""
+        self._action_plan = ArrayConversionPlan(
+            self._env_xp, self._env_device, self.env.action_space
+        )
+        self._obs_plan = ArrayConversionPlan(
+            self._target_xp, self._target_device, self.env.observation_space
+        )
+        self._info_plan = ArrayConversionPlan(self._target_xp, self._target_device)
+        self._render_plan = ArrayConversionPlan(self._target_xp, self._target_device)
 
     def step(
         self, action: WrapperActType
@@ -223,15 +412,16 @@ class ArrayConversion(gym.Wrapper, gym.utils.RecordConstructorArgs):
         Returns:
             The next observation, reward, termination, truncation, and extra info
         """
-        action = array_conversion(action, xp=self._env_xp, device=self._env_device)
-        obs, reward, terminated, truncated, info = self.env.step(action)
+        obs, reward, terminated, truncated, info = self.env.step(
+            self._action_plan(action)
+        )
 
         return (
-            array_conversion(obs, xp=self._target_xp, device=self._target_device),
+            self._obs_plan(obs),
             float(reward),
             bool(terminated),
             bool(truncated),
-            array_conversion(info, xp=self._target_xp, device=self._target_device),
+            self._info_plan(info),
         )
 
     def reset(
@@ -249,15 +439,12 @@ class ArrayConversion(gym.Wrapper, gym.utils.RecordConstructorArgs):
         if options:
             options = array_conversion(options, self._env_xp, self._env_device)
 
-        return array_conversion(
-            self.env.reset(seed=seed, options=options),
-            self._target_xp,
-            self._target_device,
-        )
+        obs, info = self.env.reset(seed=seed, options=options)
+        return self._obs_plan(obs), self._info_plan(info)
 
     def render(self) -> RenderFrame | list[RenderFrame] | None:
         """Returns the rendered frames as an xp Array."""
-        return array_conversion(self.env.render(), self._target_xp, self._target_device)
+        return self._render_plan(self.env.render())
 
     def __getstate__(self):
         """Returns the object pickle state with args and kwargs."""
@@ -280,3 +467,4 @@ class ArrayConversion(gym.Wrapper, gym.utils.RecordConstructorArgs):
         self._target_xp = module_name_to_namespace(d["target_xp_name"])
         self._env_device = d["env_device"]
         self._target_device = d["target_device"]
+        self._compile_conversion_plans()
@@ -5,12 +5,14 @@
 * ``PassiveEnvChecker`` - Passive environment checker that does not modify any environment data
 * ``OrderEnforcing`` - Enforces the order of function calls to environments
 * ``RecordEpisodeStatistics`` - Records the episode statistics
+* ``FusedWrappers`` - Fuses a stack of wrappers into a single step and reset function
 """
 
 from __future__ import annotations
 
 import time
 from collections import deque
+from collections.abc import Callable
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, SupportsFloat
 
@@ -37,6 +39,7 @@ __all__ = [
     "PassiveEnvChecker",
     "OrderEnforcing",
     "RecordEpisodeStatistics",
+    "FusedWrappers",
 ]
 
 
@@ -47,7 +50,7 @@ class TimeLimit(
 
     If a truncation is not defined inside the environment itself, this is the only place that the truncation signal is issued.
     Critically, this is different from the `terminated` signal that originates from the underlying environment as part of the MDP.
-    No vector wrapper exists.
+    The vector version of the wrapper is :class:`gymnasium.wrappers.vector.TimeLimit`.
 
     Example using the TimeLimit wrapper:
         >>> from gymnasium.wrappers import TimeLimit
@@ -223,6 +226,8 @@ class PassiveEnvChecker(
     """A passive wrapper that surrounds the ``step``, ``reset`` and ``render`` functions to check they follow Gymnasium's API.
 
     This wrapper is automatically applied during make and can be disabled with `disable_env_checker`.
+    Once a function has been checked, it is rebound to the environment's function such that the wrapper
+    is removed from the call chain.
     No vector version of the wrapper exists.
 
     Example:
@@ -280,7 +285,9 @@ class PassiveEnvChecker(
         """Steps through the environment that on the first call will run the `passive_env_step_check`."""
         if self.checked_step is False:
             self.checked_step = True
-            return env_step_passive_checker(self.env, action)
+            result = env_step_passive_checker(self.env, action)
+            self._splice("step")
+            return result
         else:
             return self.env.step(action)
 
@@ -290,7 +297,9 @@ class PassiveEnvChecker(
         """Resets the environment that on the first call will run the `passive_env_reset_check`."""
         if self.checked_reset is False:
             self.checked_reset = True
-            return env_reset_passive_checker(self.env, seed=seed, options=options)
+            result = env_reset_passive_checker(self.env, seed=seed, options=options)
+            self._splice("reset")
+            return result
         else:
             return self.env.reset(seed=seed, options=options)
 
@@ -298,10 +307,17 @@ class PassiveEnvChecker(
         """Renders the environment that on the first call will run the `passive_env_render_check`."""
         if self.checked_render is False:
             self.checked_render = True
-            return env_render_passive_checker(self.env)
+            result = env_render_passive_checker(self.env)
+            self._splice("render")
+            return result
         else:
             return self.env.render()
 
+    def _splice(self, name: str):
+        """Once a function has been checked, rebinds it to the environment's function to remove the wrapper from the call chain."""
+        if getattr(type(self), name) is getattr(PassiveEnvChecker, name):
+            setattr(self, name, getattr(self.env, name))
+
     @property
     def spec(self) -> EnvSpec | None:
         """Modifies the environment spec to such that `disable_env_checker=False`."""
@@ -342,6 +358,8 @@ class OrderEnforcing(
 ):
     """Will produce an error if ``step`` or ``render`` is called before ``reset``.
 
+    After the first ``step`` following a ``reset``, ``step`` is rebound to the environment's ``step``
+    such that the wrapper is removed from the call chain.
     No vector version of the wrapper exists.
 
     Example:
@@ -390,7 +408,14 @@ class OrderEnforcing(
         """Steps through the environment."""
         if not self._has_reset:
             raise ResetNeeded("Cannot call env.step() before calling env.reset()")
-        return super().step(action)
+        result = super().step(action)
+
+        # As the environment has been reset, `step` is rebound to the environment's `step` to remove the wrapper
+        #   from the call chain. This is done after the first `step` such that any inner wrappers, i.e.,
+        #   `PassiveEnvChecker`, have spliced themselves out first.
+        if type(self).step is OrderEnforcing.step:
+            self.step = self.env.step
+        return result
 
     def reset(
         self, *, seed: int | None = None, options: dict[str, Any] | None = None
@@ -547,3 +572,144 @@ class RecordEpisodeStatistics(
         self.episode_lengths = 0
 
         return obs, info
+
+
+class FusedWrappers(gym.Wrapper[ObsType, ActType, ObsType, ActType]):
+    """Fuses a stack of wrappers into a single :meth:`step` and :meth:`reset` function with identical semantics.
+
+    Every wrapper adds a Python function call and the unpacking and repacking of the step tuple to each ``step``.
+    On construction, this wrapper walks the stack from the outermost wrapper inwards, collecting the
+    :meth:`ActionWrapper.action`, :meth:`ObservationWrapper.observation` and :meth:`RewardWrapper.reward` transforms
+    along with the bookkeeping of :class:`TimeLimit` and :class:`OrderEnforcing`, until a wrapper that overrides
+    ``step`` or ``reset`` is reached, e.g., :class:`PassiveEnvChecker`, which is then called directly.
+    These are collected into tuples of the wrappers' bound methods that :meth:`step` and :meth:`reset` loop over,
+    using and updating the wrappers' attributes as usual, e.g., ``TimeLimit._elapsed_steps``.
+
+    This wrapper can be applied by :func:`gymnasium.make` with ``fuse_wrappers=True``.
+    No vector version of the wrapper exists.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> from gymnasium.wrappers import FusedWrappers, TransformObservation, TransformReward
+        >>> env = gym.make("CartPole-v1")
+        >>> env = TransformObservation(env, lambda obs: obs * 2, env.observation_space)
+        >>> env = TransformReward(env, lambda reward: reward / 2)
+        >>> env = FusedWrappers(env)
+        >>> env.fused_wrappers
+        (<TransformReward...>, <TransformObservation...>, <TimeLimit...>, <OrderEnforcing...>)
+        >>> _ = env.reset(seed=123)
+        >>> _, reward, _, _, _ = env.step(0)
+        >>> reward
+        0.5
+
+    Note:
+        The wrapper stack is collected on construction, therefore, wrappers must not be added or removed from the stack.
+    """
+
+    def __init__(self, env: gym.Env[ObsType, ActType]):
+        """Collects the wrapper stack of the environment.
+
+        Args:
+            env: The environment with the wrapper stack to fuse
+        """
+        gym.Wrapper.__init__(self, env)
+
+        fused_wrappers = []
+        while isinstance(env, gym.Wrapper):
+            wrapper_type = type(env)
+            if not (
+                wrapper_type is TimeLimit
+                or wrapper_type is OrderEnforcing
+                or (
+                    isinstance(env, gym.ObservationWrapper)
+                    and wrapper_type.step is gym.ObservationWrapper.step
+                    and wrapper_type.reset is gym.ObservationWrapper.reset
+                )
+                or (
+                    isinstance(env, gym.RewardWrapper)
+                    and wrapper_type.step is gym.RewardWrapper.step
+                    and wrapper_type.reset is gym.Wrapper.reset
+                )
+                or (
+                    isinstance(env, gym.ActionWrapper)
+                    and wrapper_type.step is gym.ActionWrapper.step
+                    and wrapper_type.reset is gym.Wrapper.reset
+                )
+                or (
+                    wrapper_type.step is gym.Wrapper.step
+                    and wrapper_type.reset is gym.Wrapper.reset
+                )
+            ):
+                break
+
+            fused_wrappers.append(env)
+            env = env.env
+
+        self.fused_wrappers: tuple[gym.Env, ...] = tuple(fused_wrappers)
+        self.inner_env: gym.Env = env
+
+        self._order_enforcing_wrappers: tuple[OrderEnforcing, ...] = tuple(
+            wrapper for wrapper in fused_wrappers if type(wrapper) is OrderEnforcing
+        )
+        self._time_limit_wrappers: tuple[TimeLimit, ...] = tuple(
+            wrapper for wrapper in fused_wrappers if type(wrapper) is TimeLimit
+        )
+        # The actions are transformed from the outermost wrapper inwards
+        self._action_transforms: tuple[Callable, ...] = tuple(
+            wrapper.action
+            for wrapper in fused_wrappers
+            if isinstance(wrapper, gym.ActionWrapper)
+        )
+        # The observations and rewards are transformed from the innermost wrapper outwards
+        self._observation_transforms: tuple[Callable, ...] = tuple(
+            wrapper.observation
+            for wrapper in fused_wrappers[::-1]
+            if isinstance(wrapper, gym.ObservationWrapper)
+        )
+        self._reward_transforms: tuple[Callable, ...] = tuple(
+            wrapper.reward
+            for wrapper in fused_wrappers[::-1]
+            if isinstance(wrapper, gym.RewardWrapper)
+        )
+
+    def step(
+        self, action: ActType
+    ) -> tuple[ObsType, SupportsFloat, bool, bool, dict[str, Any]]:
+        """Steps through the fused wrappers."""
+        for order_enforcing in self._order_enforcing_wrappers:
+            if not order_enforcing._has_reset:
+                raise ResetNeeded("Cannot call env.step() before calling env.reset()")
+        for action_transform in self._action_transforms:
+            action = action_transform(action)
+
+        observation, reward, terminated, truncated, info = self.inner_env.step(action)
+
+        for time_limit in self._time_limit_wrappers:
+            time_limit._elapsed_steps += 1
+            if time_limit._elapsed_steps >= time_limit._max_episode_steps:
+                truncated = True
+        for observation_transform in self._observation_transforms:
+            observation = observation_transform(observation)
+        for reward_transform in self._reward_transforms:
+            reward = reward_transform(reward)
+        return observation, reward, terminated, truncated, info
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Resets through the fused wrappers."""
+        for order_enforcing in self._order_enforcing_wrappers:
+            order_enforcing._has_reset = True
+        for time_limit in self._time_limit_wrappers:
+            time_limit._elapsed_steps = 0
+
+        observation, info = self.inner_env.reset(seed=seed, options=options)
+
+        for observation_transform in self._observation_transforms:
+            observation = observation_transform(observation)
+        return observation, info
+
+    @property
+    def spec(self) -> EnvSpec | None:
+        """Returns the environment spec of the wrapped environment, as the fusion doesn't change the environment."""
+        return self.env.spec
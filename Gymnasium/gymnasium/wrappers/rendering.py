@@ -13,7 +13,7 @@ import gc
 import os
 from collections.abc import Callable
 from copy import deepcopy
-from typing import Any, Generic, SupportsFloat
+from typing import TYPE_CHECKING, Any, Generic, SupportsFloat
 
 import numpy as np
 
@@ -23,6 +23,10 @@ from gymnasium.core import ActType, ObsType, RenderFrame
 from gymnasium.error import DependencyNotInstalled, InvalidProbability
 
 
+if TYPE_CHECKING:
+    from gymnasium.utils.save_video import VideoWriter
+
+
 __all__ = [
     "RenderCollection",
     "RecordVideo",
@@ -181,6 +185,8 @@ class RecordVideo(
     By default, the recording will be stopped once reset is called.
     However, you can also create recordings of fixed length (possibly spanning several episodes)
     by passing a strictly positive value for ``video_length``.
+    The frames are encoded while recording by a :class:`VideoWriter`, such that the memory used does not grow with the
+    length of the video and saving a video does not stall the environment loop.
 
     Examples - Run the environment for 50 episodes, and save the video every 10 episodes starting from the 0th:
         >>> import os
@@ -232,6 +238,7 @@ class RecordVideo(
 
     Change logs:
      * v0.25.0 - Initially added to replace ``wrappers.monitoring.VideoRecorder``
+     * v1.2.2 - The frames are streamed to ``video_writer``, a :class:`gymnasium.utils.save_video.VideoWriter`, while recording, replacing ``recorded_frames``
     """
 
     def __init__(
@@ -258,7 +265,7 @@ class RecordVideo(
             name_prefix (str): Will be prepended to the filename of the recordings
             fps (int): The frame per second in the video. Provides a custom video fps for environment, if ``None`` then
                 the environment metadata ``render_fps`` key is used if it exists, otherwise a default value of 30 is used.
-            disable_logger (bool): Whether to disable moviepy logger or not, default it is disabled
+            disable_logger (bool): Whether to disable logging the saved videos or not, default it is disabled
             gc_trigger: Function that accepts an integer and returns ``True`` iff garbage collection should be performed after this episode
         """
         gym.utils.RecordConstructorArgs.__init__(
@@ -303,7 +310,7 @@ class RecordVideo(
         self._video_name: str | None = None
         self.video_length: int = video_length if video_length != 0 else float("inf")
         self.recording: bool = False
-        self.recorded_frames: list[RenderFrame] = []
+        self.video_writer: VideoWriter | None = None
         self.render_history: list[RenderFrame] = []
 
         self.step_id = -1
@@ -330,7 +337,7 @@ class RecordVideo(
             frame = frame[-1]
 
         if isinstance(frame, np.ndarray):
-            self.recorded_frames.append(frame)
+            self.video_writer.write(frame)
         else:
             self.stop_recording()
             logger.warn(
@@ -351,7 +358,7 @@ class RecordVideo(
             self.start_recording(f"{self.name_prefix}-episode-{self.episode_id}")
         if self.recording:
             self._capture_frame()
-            if len(self.recorded_frames) > self.video_length:
+            if self.video_writer.frame_count > self.video_length:
                 self.stop_recording()
 
         return obs, info
@@ -368,7 +375,7 @@ class RecordVideo(
         if self.recording:
             self._capture_frame()
 
-            if len(self.recorded_frames) > self.video_length:
+            if self.video_writer.frame_count > self.video_length:
                 self.stop_recording()
 
         return obs, rew, terminated, truncated, info
@@ -377,7 +384,8 @@ class RecordVideo(
         """Compute the render frames as specified by render_mode attribute during initialization of the environment."""
         render_out = super().render()
         if self.recording and isinstance(render_out, list):
-            self.recorded_frames += render_out
+            for frame in render_out:
+                self.video_writer.write(frame)
 
         if len(self.render_history) > 0:
             tmp_history = self.render_history
@@ -392,36 +400,40 @@ class RecordVideo(
         if self.recording:
             self.stop_recording()
 
+    @property
+    def recorded_frames(self):
+        """Removed in v1.2.2, the frames are streamed to :attr:`video_writer` rather than kept in memory."""
+        raise AttributeError(
+            "`recorded_frames` was removed in v1.2.2 as the frames are streamed to `video_writer` while recording, "
+            "use `video_writer.frame_count` for the number of frames recorded."
+        )
+
     def start_recording(self, video_name: str):
         """Start a new recording. If it is already recording, stops the current recording before starting the new one."""
         if self.recording:
             self.stop_recording()
 
+        from gymnasium.utils.save_video import VideoWriter
+
         self.recording = True
         self._video_name = video_name
+        # The frames are encoded as they are captured, rather than all at once when the recording stops
+        self.video_writer = VideoWriter(
+            os.path.join(self.video_folder, f"{video_name}.mp4"),
+            fps=self.frames_per_sec,
+        )
 
     def stop_recording(self):
         """Stop current recording and saves the video."""
         assert self.recording, "stop_recording was called, but no recording was started"
 
-        if len(self.recorded_frames) == 0:
+        if self.video_writer.frame_count == 0:
             logger.warn("Ignored saving a video as there were zero frames to save.")
-        else:
-            try:
-                from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
-            except ImportError as e:
-                raise error.DependencyNotInstalled(
-                    'MoviePy is not installed, run `pip install "gymnasium[other]"`'
-                ) from e
-
-            clip = ImageSequenceClip(self.recorded_frames, fps=self.frames_per_sec)
-            moviepy_logger = None if self.disable_logger else "bar"
-            path = os.path.join(self.video_folder, f"{self._video_name}.mp4")
-            clip.write_videofile(path, logger=moviepy_logger)
-            del clip
-
-        del self.recorded_frames
-        self.recorded_frames = []
+        self.video_writer.close()
+        if self.video_writer.frame_count > 0 and not self.disable_logger:
+            logger.info(f"Saved video {self.video_writer.path}")
+
+        self.video_writer = None
         self.recording = False
         self._video_name = None
 
@@ -430,7 +442,8 @@ class RecordVideo(
 
     def __del__(self):
         """Warn the user in case last video wasn't saved."""
-        if len(self.recorded_frames) > 0:
+        video_writer = getattr(self, "video_writer", None)
+        if video_writer is not None and video_writer.frame_count > 0:
             logger.warn("Unable to save last video! Did you call close()?")
 
 
@@ -23,7 +23,7 @@ class StickyAction(
     in Section 5.2 on page 12, and adds the possibility to repeat the action for
     more than one step.
 
-    No vector version of the wrapper exists.
+    A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.StickyAction`.
 
     Example:
         >>> import gymnasium as gym
@@ -20,7 +20,12 @@ import gymnasium.spaces as spaces
 from gymnasium.core import ActType, ObsType, WrapperActType, WrapperObsType
 from gymnasium.spaces import Box, Dict, Tuple
 from gymnasium.vector.utils import batch_space, concatenate, create_empty_array
-from gymnasium.wrappers.utils import RunningMeanStd, create_zero_array
+from gymnasium.wrappers.utils import (
+    RunningMeanStd,
+    SharedRunningMeanStd,
+    SyncedRunningMeanStd,
+    create_zero_array,
+)
 
 
 __all__ = [
@@ -40,7 +45,7 @@ class DelayObservation(
     Before reaching the :attr:`delay` number of timesteps, returned observations is an array of zeros with
     the same shape as the observation space.
 
-    No vector version of the wrapper exists.
+    A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.DelayObservation`.
 
     Note:
         This does not support random delay values, if users are interested, please raise an issue or pull request to add this feature.
@@ -121,7 +126,7 @@ class TimeAwareObservation(
     To flatten the observation, use the :attr:`flatten` parameter which will use the
     :func:`gymnasium.spaces.utils.flatten` function.
 
-    No vector version of the wrapper exists.
+    A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.TimeAwareObservation`.
 
     Example:
         >>> import gymnasium as gym
@@ -468,6 +473,10 @@ class NormalizeObservation(
 
     A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.NormalizeObservation`.
 
+    For :class:`AsyncVectorEnv` workers, a :class:`gymnasium.wrappers.utils.SharedRunningMeanStd` can be passed as
+    ``shared_rms`` such that the workers periodically merge their statistics, which can be saved and loaded from the
+    main process, e.g., ``gym.make_vec(..., wrappers=[lambda env: NormalizeObservation(env, shared_rms=shared_rms)])``.
+
     Note:
         The normalization depends on past trajectories and observations will not be normalized correctly if the wrapper was
         newly instantiated or the policy was changed recently.
@@ -496,16 +505,25 @@ class NormalizeObservation(
      * v0.21.0 - Initially add
      * v1.0.0 - Add `update_running_mean` attribute to allow disabling of updating the running mean / standard, particularly useful for evaluation time.
         Casts all observations to `np.float32` and sets the observation space with low/high of `-np.inf` and `np.inf` and dtype as `np.float32`
+     * v1.2.2 - Add `shared_rms` argument to synchronise the statistics between processes
     """
 
-    def __init__(self, env: gym.Env[ObsType, ActType], epsilon: float = 1e-8):
+    def __init__(
+        self,
+        env: gym.Env[ObsType, ActType],
+        epsilon: float = 1e-8,
+        shared_rms: SharedRunningMeanStd | None = None,
+    ):
         """This wrapper will normalize observations such that each observation is centered with unit variance.
 
         Args:
             env (Env): The environment to apply the wrapper
             epsilon: A stability parameter that is used when scaling the observations.
+            shared_rms: The shared observation statistics to merge the statistics into, if ``None`` then the statistics are local.
         """
-        gym.utils.RecordConstructorArgs.__init__(self, epsilon=epsilon)
+        gym.utils.RecordConstructorArgs.__init__(
+            self, epsilon=epsilon, shared_rms=shared_rms
+        )
         gym.ObservationWrapper.__init__(self, env)
 
         assert env.observation_space.shape is not None
@@ -516,9 +534,15 @@ class NormalizeObservation(
             dtype=np.float32,
         )
 
-        self.obs_rms = RunningMeanStd(
-            shape=self.observation_space.shape, dtype=self.observation_space.dtype
-        )
+        if shared_rms is None:
+            self.obs_rms = RunningMeanStd(
+                shape=self.observation_space.shape, dtype=self.observation_space.dtype
+            )
+        else:
+            assert (
+                shared_rms.shape == self.observation_space.shape
+            ), f"Expects the shared statistics shape to equal the observation shape, actual {shared_rms.shape} and {self.observation_space.shape}"
+            self.obs_rms = shared_rms.local(dtype=self.observation_space.dtype)
         self.epsilon = epsilon
         self._update_running_mean = True
 
@@ -535,11 +559,17 @@ class NormalizeObservation(
     def observation(self, observation: ObsType) -> WrapperObsType:
         """Normalises the observation using the running mean and variance of the observations."""
         if self._update_running_mean:
-            self.obs_rms.update(np.array([observation]))
+            self.obs_rms.update_single(observation)
         return np.float32(
             (observation - self.obs_rms.mean) / np.sqrt(self.obs_rms.var + self.epsilon)
         )
 
+    def close(self):
+        """Merges the remaining statistics into the shared statistics, if used, then closes the environment."""
+        if isinstance(self.obs_rms, SyncedRunningMeanStd):
+            self.obs_rms.sync()
+        super().close()
+
 
 class MaxAndSkipObservation(
     gym.Wrapper[WrapperObsType, ActType, ObsType, ActType],
@@ -547,7 +577,7 @@ class MaxAndSkipObservation(
 ):
     """Skips the N-th frame (observation) and return the max values between the two last observations.
 
-    No vector version of the wrapper exists.
+    A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.MaxAndSkipObservation`.
 
     Note:
         This wrapper is based on the wrapper from [stable-baselines3](https://stable-baselines3.readthedocs.io/en/master/_modules/stable_baselines3/common/atari_wrappers.html#MaxAndSkipEnv)
@@ -11,7 +11,11 @@ import numpy as np
 
 import gymnasium as gym
 from gymnasium.core import ActType, ObsType
-from gymnasium.wrappers.utils import RunningMeanStd
+from gymnasium.wrappers.utils import (
+    RunningMeanStd,
+    SharedRunningMeanStd,
+    SyncedRunningMeanStd,
+)
 
 
 __all__ = ["NormalizeReward"]
@@ -28,6 +32,9 @@ class NormalizeReward(
 
     A vector version of the wrapper exists :class:`gymnasium.wrappers.vector.NormalizeReward`.
 
+    For :class:`AsyncVectorEnv` workers, a :class:`gymnasium.wrappers.utils.SharedRunningMeanStd` with shape ``()`` can
+    be passed as ``shared_rms`` such that the workers periodically merge their return statistics.
+
     Note:
         In v0.27, NormalizeReward was updated as the forward discounted reward estimate was incorrectly computed in Gym v0.25+.
         For more detail, read [#3154](https://github.com/openai/gym/pull/3152).
@@ -72,6 +79,7 @@ class NormalizeReward(
     Change logs:
      * v0.21.0 - Initially added
      * v1.0.0 - Add `update_running_mean` attribute to allow disabling of updating the running mean / standard
+     * v1.2.2 - Add `shared_rms` argument to synchronise the statistics between processes
     """
 
     def __init__(
@@ -79,6 +87,7 @@ class NormalizeReward(
         env: gym.Env[ObsType, ActType],
         gamma: float = 0.99,
         epsilon: float = 1e-8,
+        shared_rms: SharedRunningMeanStd | None = None,
     ):
         """This wrapper will normalize immediate rewards s.t. their exponential moving average has an approximately fixed variance.
 
@@ -86,11 +95,20 @@ class NormalizeReward(
             env (env): The environment to apply the wrapper
             epsilon (float): A stability parameter
             gamma (float): The discount factor that is used in the exponential moving average.
+            shared_rms: The shared return statistics to merge the statistics into, if ``None`` then the statistics are local.
         """
-        gym.utils.RecordConstructorArgs.__init__(self, gamma=gamma, epsilon=epsilon)
+        gym.utils.RecordConstructorArgs.__init__(
+            self, gamma=gamma, epsilon=epsilon, shared_rms=shared_rms
+        )
         gym.Wrapper.__init__(self, env)
 
-        self.return_rms = RunningMeanStd(shape=())
+        if shared_rms is None:
+            self.return_rms = RunningMeanStd(shape=())
+        else:
+            assert (
+                shared_rms.shape == ()
+            ), f"Expects the shared statistics shape to be `()`, actual {shared_rms.shape}"
+            self.return_rms = shared_rms.local()
         self.discounted_reward = np.array([0.0])
         self.gamma = gamma
         self.epsilon = epsilon
@@ -122,3 +140,9 @@ class NormalizeReward(
         # We don't (reward - self.return_rms.mean) see https://github.com/openai/baselines/issues/538
         normalized_reward = reward / np.sqrt(self.return_rms.var + self.epsilon)
         return obs, normalized_reward, terminated, truncated, info
+
+    def close(self):
+        """Merges the remaining statistics into the shared statistics, if used, then closes the environment."""
+        if isinstance(self.return_rms, SyncedRunningMeanStd):
+            self.return_rms.sync()
+        super().close()
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
+from functools import partial
 from typing import Any, Final
 
 import numpy as np
@@ -249,10 +250,17 @@ class FlattenObservation(
             env:  The environment to wrap
         """
         gym.utils.RecordConstructorArgs.__init__(self)
+
+        # Numpy-flattenable spaces use a flattener compiled once, rather than dispatching on every subspace each step
+        if env.observation_space.is_np_flattenable:
+            func = spaces.utils.Flattener(env.observation_space).flatten
+        else:
+            func = partial(spaces.utils.flatten, env.observation_space)
+
         TransformObservation.__init__(
             self,
             env=env,
-            func=lambda obs: spaces.utils.flatten(env.observation_space, obs),
+            func=func,
             observation_space=spaces.utils.flatten_space(env.observation_space),
         )
 
@@ -587,7 +595,7 @@ class AddRenderObservation(
     Notes:
        This was previously called ``PixelObservationWrapper``.
 
-    No vector version of the wrapper exists.
+    A vector version of the wrapper exists, :class:`gymnasium.wrappers.vector.AddRenderObservation`.
 
     Example - Replace the observation with the rendered image:
         >>> env = gym.make("CartPole-v1", render_mode="rgb_array")
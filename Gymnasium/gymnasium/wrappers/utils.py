@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import weakref
 from collections.abc import Callable
 from functools import singledispatch
+from multiprocessing.shared_memory import SharedMemory
 
 import numpy as np
 
@@ -25,11 +29,31 @@ from gymnasium.spaces import (
 from gymnasium.spaces.space import T_cov
 
 
-__all__ = ["RunningMeanStd", "update_mean_var_count_from_moments", "create_zero_array"]
+__all__ = [
+    "RunningMeanStd",
+    "SharedRunningMeanStd",
+    "SyncedRunningMeanStd",
+    "update_mean_var_count_from_moments",
+    "create_zero_array",
+]
 
 
 class RunningMeanStd:
-    """Tracks the mean, variance and count of values."""
+    """Tracks the mean, variance and count of values.
+
+    The :attr:`mean` and :attr:`var` are updated in place with preallocated buffers of the given ``dtype``, e.g.,
+    ``np.float32`` for large observations, such that no arrays are allocated for each update.
+    When :attr:`frozen` is ``True``, i.e., for evaluation, the statistics are not updated.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.wrappers.utils import RunningMeanStd
+        >>> rms = RunningMeanStd(shape=(2,))
+        >>> rms.update(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        >>> rms.update_single(np.array([5.0, 6.0]))
+        >>> rms.mean.round(3), rms.count
+        (array([3., 4.]), 3.0001)
+    """
 
     # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm
     def __init__(self, epsilon=1e-4, shape=(), dtype=np.float64):
@@ -37,19 +61,78 @@ class RunningMeanStd:
         self.mean = np.zeros(shape, dtype=dtype)
         self.var = np.ones(shape, dtype=dtype)
         self.count = epsilon
+        self.frozen = False
+
+        # Buffers for the intermediate values of the updates
+        self._delta = np.zeros(shape, dtype=dtype)
+        self._scratch = np.zeros(shape, dtype=dtype)
 
     def update(self, x):
         """Updates the mean, var and count from a batch of samples."""
+        if self.frozen:
+            return
+        elif x.shape[0] == 1:
+            self.update_single(x[0])
+            return
+
         batch_mean = np.mean(x, axis=0)
         batch_var = np.var(x, axis=0)
         batch_count = x.shape[0]
         self.update_from_moments(batch_mean, batch_var, batch_count)
 
+    def update_single(self, x):
+        """Updates the mean, var and count from a single sample, equivalent to :meth:`update` with a batch of one."""
+        if self.frozen:
+            return
+
+        delta, scratch = self._delta, self._scratch
+        np.subtract(x, self.mean, out=delta)
+        tot_count = self.count + 1
+
+        np.divide(delta, tot_count, out=scratch)
+        self.mean += scratch
+
+        # The variance of a single sample is zero, therefore, M2 = var * count + delta^2 * count / tot_count
+        np.square(delta, out=delta)
+        delta *= self.count
+        delta /= tot_count
+        self.var *= self.count
+        self.var += delta
+        self.var /= tot_count
+        self.count = tot_count
+
     def update_from_moments(self, batch_mean, batch_var, batch_count):
         """Updates from batch mean, variance and count moments."""
-        self.mean, self.var, self.count = update_mean_var_count_from_moments(
-            self.mean, self.var, self.count, batch_mean, batch_var, batch_count
-        )
+        if self.frozen:
+            return
+
+        delta, scratch = self._delta, self._scratch
+        np.subtract(batch_mean, self.mean, out=delta)
+        tot_count = self.count + batch_count
+
+        np.multiply(delta, batch_count, out=scratch)
+        scratch /= tot_count
+        self.mean += scratch
+
+        # M2 = var * count + batch_var * batch_count + delta^2 * count * batch_count / tot_count
+        np.square(delta, out=delta)
+        delta *= self.count
+        delta *= batch_count
+        delta /= tot_count
+        self.var *= self.count
+        np.multiply(batch_var, batch_count, out=scratch)
+        self.var += scratch
+        self.var += delta
+        self.var /= tot_count
+        self.count = tot_count
+
+    def __setstate__(self, state: dict):
+        """Adds the update buffers when loading a pickled instance without them."""
+        self.__dict__.update(state)
+        self.__dict__.setdefault("frozen", False)
+        if "_delta" not in state:
+            self._delta = np.zeros_like(self.mean)
+            self._scratch = np.zeros_like(self.mean)
 
 
 def update_mean_var_count_from_moments(
@@ -69,6 +152,206 @@ def update_mean_var_count_from_moments(
     return new_mean, new_var, new_count
 
 
+def _unlink_shared_memory(shared_memory: SharedMemory, pid: int):
+    """Unlinks the shared memory of a :class:`SharedRunningMeanStd` if called in the process ``pid`` that created it."""
+    if os.getpid() == pid:
+        shared_memory.unlink()
+
+
+class SharedRunningMeanStd:
+    """Accumulates the mean, variance and count of values in shared memory, merged from the statistics of several processes.
+
+    Each process, e.g., the :class:`AsyncVectorEnv` workers, keeps a :class:`SyncedRunningMeanStd` that tracks its
+    new samples and every ``sync_frequency`` updates merges their moments into the shared statistics with
+    :func:`update_mean_var_count_from_moments`, then continues from the merged statistics. The shared memory must be
+    created before the processes and passed to them, i.e., captured by the environment functions. As such, the
+    merged statistics can be read, saved and loaded from the learner process.
+
+    Example:
+        >>> import numpy as np
+        >>> from gymnasium.wrappers.utils import SharedRunningMeanStd
+        >>> shared_rms = SharedRunningMeanStd(shape=(2,), sync_frequency=2)
+        >>> local_rms = shared_rms.local()
+        >>> local_rms.update(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        >>> local_rms.update_single(np.array([5.0, 6.0]))
+        >>> mean, var, count = shared_rms.statistics()
+        >>> mean.round(3), round(count, 4)
+        (array([3., 4.]), 3.0001)
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...] = (),
+        epsilon: float = 1e-4,
+        sync_frequency: int = 100,
+        context: str | None = None,
+    ):
+        """Creates the shared statistics with zero mean, unit variance and ``epsilon`` count.
+
+        Args:
+            shape: The shape of the values
+            epsilon: The initial count of the statistics
+            sync_frequency: The number of updates after which the local statistics are merged into the shared statistics
+            context: Context for `multiprocessing`, this should match the context of the processes. If ``None``, then the default context is used.
+        """
+        assert (
+            sync_frequency > 0
+        ), f"Expects a positive `sync_frequency`, actual {sync_frequency}"
+        ctx = multiprocessing.get_context(context)
+
+        self.shape = tuple(shape)
+        self.sync_frequency = sync_frequency
+
+        size = int(np.prod(self.shape, dtype=np.int64))
+        # The shared memory is pickled by its name, therefore, it can be passed to both forked and spawned processes
+        self._lock = ctx.Lock()
+        self._shared_memory = SharedMemory(
+            create=True, size=np.dtype(np.float64).itemsize * (2 * size + 1)
+        )
+        # Only the process that created the shared memory unlinks it, i.e., not forked processes
+        weakref.finalize(self, _unlink_shared_memory, self._shared_memory, os.getpid())
+
+        mean, var, count = self._arrays()
+        mean.fill(0)
+        var.fill(1)
+        count[0] = epsilon
+
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # The shared memory can be larger than requested, e.g., rounded up to the page size
+        size = int(np.prod(self.shape, dtype=np.int64))
+        buffer = np.frombuffer(
+            self._shared_memory.buf, dtype=np.float64, count=2 * size + 1
+        )
+        return (
+            buffer[:size].reshape(self.shape),
+            buffer[size:-1].reshape(self.shape),
+            buffer[-1:],
+        )
+
+    def local(self, dtype=np.float64) -> SyncedRunningMeanStd:
+        """Returns a local running mean std, starting from the shared statistics, that merges its samples into the shared statistics."""
+        return SyncedRunningMeanStd(self, dtype=dtype)
+
+    def merge(
+        self, batch_mean, batch_var, batch_count
+    ) -> tuple[np.ndarray, np.ndarray, float]:
+        """Merges the moments into the shared statistics.
+
+        Args:
+            batch_mean: The mean of the new values
+            batch_var: The variance of the new values
+            batch_count: The number of new values
+
+        Returns:
+            A copy of the merged mean, variance and count
+        """
+        with self._lock:
+            mean, var, count = self._arrays()
+            new_mean, new_var, new_count = update_mean_var_count_from_moments(
+                mean, var, count[0].item(), batch_mean, batch_var, batch_count
+            )
+            mean[...], var[...], count[0] = new_mean, new_var, new_count
+            return np.copy(mean), np.copy(var), count[0].item()
+
+    def statistics(self) -> tuple[np.ndarray, np.ndarray, float]:
+        """Returns a copy of the shared mean, variance and count."""
+        with self._lock:
+            mean, var, count = self._arrays()
+            return np.copy(mean), np.copy(var), count[0].item()
+
+    def set_statistics(self, mean, var, count: float):
+        """Sets the shared mean, variance and count, the processes continue from these statistics on their next merge."""
+        mean, var = np.asarray(mean), np.asarray(var)
+        if mean.shape != self.shape or var.shape != self.shape:
+            raise ValueError(
+                f"The statistics shapes (mean={mean.shape}, var={var.shape}) don't match the shared statistics shape {self.shape}"
+            )
+
+        with self._lock:
+            shared_mean, shared_var, shared_count = self._arrays()
+            shared_mean[...], shared_var[...], shared_count[0] = mean, var, count
+
+    def save(self, file):
+        """Saves the shared statistics to a ``.npz`` file with ``mean``, ``var`` and ``count`` arrays."""
+        mean, var, count = self.statistics()
+        np.savez(file, mean=mean, var=var, count=count)
+
+    def load(self, file):
+        """Loads the shared statistics from a ``.npz`` file saved with :meth:`save`."""
+        with np.load(file) as data:
+            self.set_statistics(data["mean"], data["var"], data["count"].item())
+
+    def __copy__(self) -> SharedRunningMeanStd:
+        """As the statistics are shared, copies return the same instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> SharedRunningMeanStd:
+        """As the statistics are shared, i.e., when the wrapper constructor arguments are copied, copies return the same instance."""
+        return self
+
+
+class SyncedRunningMeanStd(RunningMeanStd):
+    """A :class:`RunningMeanStd` that merges its samples into a :class:`SharedRunningMeanStd` every ``sync_frequency`` updates.
+
+    The samples since the last synchronisation are tracked separately such that only their moments are merged,
+    after which the local mean, variance and count are replaced with the merged statistics.
+    """
+
+    def __init__(self, shared: SharedRunningMeanStd, dtype=np.float64):
+        """Creates the local statistics from the current shared statistics.
+
+        Args:
+            shared: The shared statistics to synchronise with
+            dtype: The dtype of the local mean and variance
+        """
+        super().__init__(shape=shared.shape, dtype=dtype)
+        self.shared = shared
+
+        self._new_rms = RunningMeanStd(epsilon=0, shape=shared.shape)
+        self._updates_since_sync = 0
+        self.sync()
+
+    def update_single(self, x):
+        """Updates the mean, var and count from a single sample, merging into the shared statistics when due."""
+        if self.frozen:
+            return
+
+        super().update_single(x)
+        self._new_rms.update_single(x)
+        self._on_update()
+
+    def update_from_moments(self, batch_mean, batch_var, batch_count):
+        """Updates from batch mean, variance and count moments, merging into the shared statistics when due."""
+        if self.frozen:
+            return
+
+        super().update_from_moments(batch_mean, batch_var, batch_count)
+        self._new_rms.update_from_moments(batch_mean, batch_var, batch_count)
+        self._on_update()
+
+    def _on_update(self):
+        self._updates_since_sync += 1
+        if self._updates_since_sync >= self.shared.sync_frequency:
+            self.sync()
+
+    def sync(self):
+        """Merges the samples since the last synchronisation into the shared statistics and continues from the merged statistics."""
+        new_rms = self._new_rms
+        if new_rms.count > 0:
+            mean, var, count = self.shared.merge(
+                new_rms.mean, new_rms.var, new_rms.count
+            )
+
+            new_rms.mean.fill(0)
+            new_rms.var.fill(1)
+            new_rms.count = 0
+        else:
+            mean, var, count = self.shared.statistics()
+
+        self.mean[...], self.var[...], self.count = mean, var, count
+        self._updates_since_sync = 0
+
+
 @singledispatch
 def create_zero_array(space: Space[T_cov]) -> T_cov:
     """Creates a zero-based array of a space, this is similar to ``create_empty_array`` except all arrays are valid samples from the space.
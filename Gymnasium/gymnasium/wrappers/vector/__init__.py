@@ -3,10 +3,16 @@
 # pyright: reportUnsupportedDunderAll=false
 import importlib
 
-from gymnasium.wrappers.vector.common import RecordEpisodeStatistics
+from gymnasium.wrappers.vector.common import RecordEpisodeStatistics, TimeLimit
 from gymnasium.wrappers.vector.dict_info_to_list import DictInfoToList
 from gymnasium.wrappers.vector.rendering import HumanRendering, RecordVideo
-from gymnasium.wrappers.vector.stateful_observation import NormalizeObservation
+from gymnasium.wrappers.vector.stateful_action import StickyAction
+from gymnasium.wrappers.vector.stateful_observation import (
+    DelayObservation,
+    MaxAndSkipObservation,
+    NormalizeObservation,
+    TimeAwareObservation,
+)
 from gymnasium.wrappers.vector.stateful_reward import NormalizeReward
 from gymnasium.wrappers.vector.vectorize_action import (
     ClipAction,
@@ -15,6 +21,7 @@ from gymnasium.wrappers.vector.vectorize_action import (
     VectorizeTransformAction,
 )
 from gymnasium.wrappers.vector.vectorize_observation import (
+    AddRenderObservation,
     DtypeObservation,
     FilterObservation,
     FlattenObservation,
@@ -48,20 +55,23 @@ __all__ = [
     "RescaleObservation",
     "DtypeObservation",
     "NormalizeObservation",
-    # "RenderObservation",
-    # "TimeAwareObservation",
+    "AddRenderObservation",
+    "TimeAwareObservation",
     # "FrameStackObservation",
-    # "DelayObservation",
+    "DelayObservation",
+    "MaxAndSkipObservation",
     # --- Action Wrappers ---
     "TransformAction",
     "ClipAction",
     "RescaleAction",
+    "StickyAction",
     # --- Reward wrappers ---
     "TransformReward",
     "ClipReward",
     "NormalizeReward",
     # --- Common ---
     "RecordEpisodeStatistics",
+    "TimeLimit",
     # --- Rendering ---
     # "RenderCollection",
     "RecordVideo",
@@ -10,6 +10,7 @@ from gymnasium.core import ActType, ObsType
 from gymnasium.vector import VectorEnv, VectorWrapper
 from gymnasium.vector.vector_env import ArrayType
 from gymnasium.wrappers.array_conversion import (
+    ArrayConversionPlan,
     Device,
     array_conversion,
     module_name_to_namespace,
@@ -58,6 +59,22 @@ class ArrayConversion(VectorWrapper, gym.utils.RecordConstructorArgs):
         self._target_xp = target_xp
         self._env_device = env_device
         self._target_device = target_device
+        self._compile_conversion_plans()
+
+    def _compile_conversion_plans(self):
+        """Compiles the conversion plans of the actions, observations, rewards, terminations, truncations and infos."""
+        self._action_plan = ArrayConversionPlan(
+            self._env_xp, self._env_device, self.env.action_space
+        )
+        self._obs_plan = ArrayConversionPlan(
+            self._target_xp, self._target_device, self.env.observation_space
+        )
+        self._reward_plan = ArrayConversionPlan(self._target_xp, self._target_device)
+        self._terminated_plan = ArrayConversionPlan(
+            self._target_xp, self._target_device
+        )
+        self._truncated_plan = ArrayConversionPlan(self._target_xp, self._target_device)
+        self._info_plan = ArrayConversionPlan(self._target_xp, self._target_device)
 
     def step(
         self, actions: ActType
@@ -70,17 +87,16 @@ class ArrayConversion(VectorWrapper, gym.utils.RecordConstructorArgs):
         Returns:
             A tuple containing xp versions of the next observation, reward, termination, truncation, and extra info.
         """
-        actions = array_conversion(actions, xp=self._env_xp, device=self._env_device)
-        obs, reward, terminated, truncated, info = self.env.step(actions)
+        obs, reward, terminated, truncated, info = self.env.step(
+            self._action_plan(actions)
+        )
 
         return (
-            array_conversion(obs, xp=self._target_xp, device=self._target_device),
-            array_conversion(reward, xp=self._target_xp, device=self._target_device),
-            array_conversion(
-                terminated, xp=self._target_xp, device=self._target_device
-            ),
-            array_conversion(truncated, xp=self._target_xp, device=self._target_device),
-            array_conversion(info, xp=self._target_xp, device=self._target_device),
+            self._obs_plan(obs),
+            self._reward_plan(reward),
+            self._terminated_plan(terminated),
+            self._truncated_plan(truncated),
+            self._info_plan(info),
         )
 
     def reset(
@@ -103,11 +119,8 @@ class ArrayConversion(VectorWrapper, gym.utils.RecordConstructorArgs):
                 options, xp=self._env_xp, device=self._env_device
             )
 
-        return array_conversion(
-            self.env.reset(seed=seed, options=options),
-            xp=self._target_xp,
-            device=self._target_device,
-        )
+        obs, info = self.env.reset(seed=seed, options=options)
+        return self._obs_plan(obs), self._info_plan(info)
 
     def __getstate__(self):
         """Returns the object pickle state with args and kwargs."""
@@ -130,3 +143,4 @@ class ArrayConversion(VectorWrapper, gym.utils.RecordConstructorArgs):
         self._target_xp = module_name_to_namespace(d["target_xp_name"])
         self._env_device = d["env_device"]
         self._target_device = d["target_device"]
+        self._compile_conversion_plans()
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import time
 from collections import deque
+from typing import Any
 
 import numpy as np
 
+import gymnasium as gym
 from gymnasium.core import ActType, ObsType
 from gymnasium.logger import warn
 from gymnasium.vector.vector_env import (
@@ -17,7 +19,7 @@ from gymnasium.vector.vector_env import (
 )
 
 
-__all__ = ["RecordEpisodeStatistics"]
+__all__ = ["RecordEpisodeStatistics", "TimeLimit"]
 
 
 class RecordEpisodeStatistics(VectorWrapper):
@@ -198,3 +200,113 @@ class RecordEpisodeStatistics(VectorWrapper):
             truncations,
             infos,
         )
+
+
+class TimeLimit(VectorWrapper, gym.utils.RecordConstructorArgs):
+    """Limits the number of steps of the sub-environments through truncating the sub-environments if a maximum number of timesteps is exceeded.
+
+    Unlike applying :class:`gymnasium.wrappers.TimeLimit` to each sub-environment, the elapsed steps of all sub-environments
+    are held in a ``(num_envs,)`` array such that the truncations are set with a single comparison each step.
+
+    For ``AutoresetMode.NEXT_STEP``, the sub-environments truncated by the wrapper must be reset by the vector environment
+    on the next step, therefore, this mode is only supported by vector environments that implement
+    :meth:`gymnasium.vector.VectorEnv.autoreset_next_step`, e.g., :class:`gymnasium.vector.SyncVectorEnv`,
+    :class:`gymnasium.vector.AsyncVectorEnv` and ``CartPoleVectorEnv``.
+    For ``AutoresetMode.DISABLED``, any vector environment is supported as the user resets the truncated sub-environments
+    with the ``reset_mask`` option. ``AutoresetMode.SAME_STEP`` is not supported.
+
+    Example:
+        >>> import numpy as np
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=3, vectorization_mode="sync", max_episode_steps=-1)
+        >>> envs = TimeLimit(envs, max_episode_steps=2)
+        >>> _ = envs.reset(seed=123)
+        >>> _, _, terminations, truncations, _ = envs.step(np.array([1, 0, 1]))
+        >>> terminations, truncations
+        (array([False, False, False]), array([False, False, False]))
+        >>> _, _, terminations, truncations, _ = envs.step(np.array([1, 0, 1]))
+        >>> terminations, truncations
+        (array([False, False, False]), array([ True,  True,  True]))
+        >>> envs.close()
+
+    Change logs:
+     * v1.2.2 - Initially added
+    """
+
+    def __init__(self, env: VectorEnv, max_episode_steps: int):
+        """Initializes the :class:`TimeLimit` wrapper with a vector environment and the number of steps after which truncation will occur.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            max_episode_steps: the sub-environment step after which the episode is truncated (``elapsed >= max_episode_steps``)
+        """
+        assert (
+            isinstance(max_episode_steps, int) and max_episode_steps > 0
+        ), f"Expect the `max_episode_steps` to be positive, actually: {max_episode_steps}"
+        gym.utils.RecordConstructorArgs.__init__(
+            self, max_episode_steps=max_episode_steps
+        )
+        VectorWrapper.__init__(self, env)
+
+        if "autoreset_mode" not in env.metadata:
+            warn(
+                f"{self} is missing `autoreset_mode` tag in its metadata, therefore, assuming that the environment uses `AutoresetMode.NEXT_STEP`."
+            )
+            self.autoreset_mode = AutoresetMode.NEXT_STEP
+        else:
+            assert isinstance(env.metadata["autoreset_mode"], AutoresetMode)
+            self.autoreset_mode = env.metadata["autoreset_mode"]
+
+        if self.autoreset_mode == AutoresetMode.SAME_STEP:
+            raise ValueError(
+                "The vector `TimeLimit` wrapper doesn't support `AutoresetMode.SAME_STEP`, apply `gymnasium.wrappers.TimeLimit` to the sub-environments instead."
+            )
+        elif (
+            self.autoreset_mode == AutoresetMode.NEXT_STEP
+            and type(env.unwrapped).autoreset_next_step is VectorEnv.autoreset_next_step
+        ):
+            raise ValueError(
+                f"The vector `TimeLimit` wrapper only supports `AutoresetMode.NEXT_STEP` for vector environments that implement `VectorEnv.autoreset_next_step`, actual environment: {env.unwrapped}"
+            )
+
+        self.max_episode_steps = max_episode_steps
+        self.elapsed_steps = np.zeros(self.num_envs, dtype=np.int64)
+        self._prev_dones = np.zeros(self.num_envs, dtype=np.bool_)
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Resets the environment and sets the number of steps elapsed of the reset sub-environments to zero."""
+        reset_mask = None if options is None else options.get("reset_mask")
+        reset_envs = slice(None) if reset_mask is None else reset_mask
+        self.elapsed_steps[reset_envs] = 0
+        self._prev_dones[reset_envs] = False
+
+        return self.env.reset(seed=seed, options=options)
+
+    def step(
+        self, actions: ActType
+    ) -> tuple[ObsType, ArrayType, ArrayType, ArrayType, dict[str, Any]]:
+        """Steps through the environment, truncating the sub-environments whose number of steps elapsed exceeds ``max_episode_steps``."""
+        obs, rewards, terminations, truncations, infos = self.env.step(actions)
+
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            # The sub-environments that ended on the previous step are reset by this step
+            self.elapsed_steps += 1
+            self.elapsed_steps[self._prev_dones] = 0
+        else:
+            self.elapsed_steps += 1
+
+        truncations = np.logical_or(
+            truncations, self.elapsed_steps >= self.max_episode_steps
+        )
+        self._prev_dones = np.logical_or(terminations, truncations)
+
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            # Autoreset the sub-environments truncated by the wrapper on the next step
+            self.env.autoreset_next_step(truncations)
+
+        return obs, rewards, terminations, truncations, infos
@@ -6,7 +6,7 @@ import gc
 import os
 from collections.abc import Callable, Sequence
 from copy import deepcopy
-from typing import Any, SupportsFloat
+from typing import TYPE_CHECKING, Any, SupportsFloat
 
 import numpy as np
 
@@ -19,6 +19,10 @@ from gymnasium.vector import VectorEnv, VectorWrapper
 from gymnasium.vector.vector_env import ArrayType
 
 
+if TYPE_CHECKING:
+    from gymnasium.utils.save_video import VideoWriter
+
+
 class HumanRendering(VectorWrapper, gym.utils.RecordConstructorArgs):
     """Adds support for Human-based Rendering for Vector-based environments."""
 
@@ -201,6 +205,8 @@ class RecordVideo(
     expects multiple frames when rendering the environment (one for each
     environment of the VectorEnv). Frames are concatenated into one frame such
     that its aspect ratio is as close as possible to the desired one.
+    As for the single environment version, the frames are streamed to a
+    :class:`gymnasium.utils.save_video.VideoWriter` while recording.
 
     Examples - Run 5 environments for 200 timesteps, and save the video every 5 episodes:
     >>> import os
@@ -221,6 +227,9 @@ class RecordVideo(
     >>> envs.close()
     >>> len(os.listdir("save_videos_5envs"))
     2
+
+    Change logs:
+     * v1.2.2 - The frames are streamed to ``video_writer``, a :class:`gymnasium.utils.save_video.VideoWriter`, while recording, replacing ``recorded_frames``
     """
 
     def __init__(
@@ -252,7 +261,7 @@ class RecordVideo(
             name_prefix (str): Will be prepended to the filename of the recordings
             fps (int): The frame per second in the video. Provides a custom video fps for environment, if ``None`` then
                 the environment metadata ``render_fps`` key is used if it exists, otherwise a default value of 30 is used.
-            disable_logger (bool): Whether to disable moviepy logger or not, default it is disabled
+            disable_logger (bool): Whether to disable logging the saved videos or not, default it is disabled
             gc_trigger: Function that accepts an integer and returns ``True`` iff garbage collection should be performed after this episode
 
         Note:
@@ -320,7 +329,7 @@ class RecordVideo(
         self._video_name: str | None = None
         self.video_length: int = video_length if video_length != 0 else float("inf")
         self.recording: bool = False
-        self.recorded_frames: list[np.ndarray] = []
+        self.video_writer: VideoWriter | None = None
         self.render_history: list[np.ndarray] = []
 
         self.step_id = -1
@@ -354,27 +363,28 @@ class RecordVideo(
         self.frame_cols = best_cols
 
     def _concat_frames(self, frames):
-        """Concatenates a list of frames into one large frame."""
-        frames = np.array(frames)
+        """Concatenates a batch of frames into one large frame."""
+        frames = np.asarray(frames)
         n_frames, h, w, c = frames.shape
-        grid = np.zeros(
+        assert n_frames == self.frame_rows * self.frame_cols
+        # Tile the (rows * cols, h, w, c) frames into a (rows * h, cols * w, c) grid with a single copy
+        grid = np.empty(
             (self.frame_rows * h, self.frame_cols * w, c), dtype=frames.dtype
         )
-        for idx in range(n_frames):
-            r = idx // self.frame_cols
-            c_ = idx % self.frame_cols
-            grid[r * h : (r + 1) * h, c_ * w : (c_ + 1) * w] = frames[idx]
+        grid.reshape(self.frame_rows, h, self.frame_cols, w, c)[:] = frames.reshape(
+            self.frame_rows, self.frame_cols, h, w, c
+        ).transpose(0, 2, 1, 3, 4)
         return grid
 
     def _capture_frame(self):
         assert self.recording, "Cannot capture a frame, recording wasn't started."
 
         envs_frame = self.env.render()
-        assert isinstance(envs_frame, Sequence), type(envs_frame)
+        assert isinstance(envs_frame, (Sequence, np.ndarray)), type(envs_frame)
         assert len(envs_frame) == self.num_envs
 
         if self.record_first_only:
-            envs_frame = [envs_frame[0]]
+            envs_frame = envs_frame[:1]
 
         if self.frame_cols == -1 or self.frame_rows == -1:
             n_frames = len(envs_frame)
@@ -382,7 +392,7 @@ class RecordVideo(
             self._get_concat_frame_shape(n_frames, h, w)
 
         concatenated_envs_frame = self._concat_frames(envs_frame)
-        self.recorded_frames.append(concatenated_envs_frame)
+        self.video_writer.write(concatenated_envs_frame)
 
     def reset(
         self, *, seed: int | None = None, options: dict[str, Any] | None = None
@@ -401,7 +411,7 @@ class RecordVideo(
 
         if self.recording:
             self._capture_frame()
-            if len(self.recorded_frames) > self.video_length:
+            if self.video_writer.frame_count > self.video_length:
                 self.stop_recording()
 
         self.has_autoreset = False
@@ -442,7 +452,7 @@ class RecordVideo(
         if self.recording:
             self._capture_frame()
 
-            if len(self.recorded_frames) > self.video_length:
+            if self.video_writer.frame_count > self.video_length:
                 self.stop_recording()
 
         return obs, rewards, terminations, truncations, info
@@ -451,7 +461,8 @@ class RecordVideo(
         """Compute the render frames as specified by render_mode attribute during initialization of the environment."""
         render_out = super().render()
         if self.recording and isinstance(render_out, list):
-            self.recorded_frames += render_out
+            for frame in render_out:
+                self.video_writer.write(frame)
 
         if len(self.render_history) > 0:
             tmp_history = self.render_history
@@ -466,33 +477,38 @@ class RecordVideo(
         if self.recording:
             self.stop_recording()
 
+    @property
+    def recorded_frames(self):
+        """Removed in v1.2.2, the frames are streamed to :attr:`video_writer` rather than kept in memory."""
+        raise AttributeError(
+            "`recorded_frames` was removed in v1.2.2 as the frames are streamed to `video_writer` while recording, "
+            "use `video_writer.frame_count` for the number of frames recorded."
+        )
+
     def start_recording(self, video_name: str):
         """Start a new recording. If it is already recording, stops the current recording before starting the new one."""
         if self.recording:
             self.stop_recording()
 
+        from gymnasium.utils.save_video import VideoWriter
+
         self.recording = True
         self._video_name = video_name
+        self.video_writer = VideoWriter(
+            os.path.join(self.video_folder, f"{video_name}.mp4"),
+            fps=self.frames_per_sec,
+        )
 
     def stop_recording(self):
         """Stop current recording and saves the video."""
         assert self.recording, "stop_recording was called, but no recording was started"
-        if len(self.recorded_frames) == 0:
+        if self.video_writer.frame_count == 0:
             logger.warn("Ignored saving a video as there were zero frames to save.")
-        else:
-            try:
-                from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
-            except ImportError as e:
-                raise error.DependencyNotInstalled(
-                    'MoviePy is not installed, run `pip install "gymnasium[other]"`'
-                ) from e
-
-            clip = ImageSequenceClip(self.recorded_frames, fps=self.frames_per_sec)
-            moviepy_logger = None if self.disable_logger else "bar"
-            path = os.path.join(self.video_folder, f"{self._video_name}.mp4")
-            clip.write_videofile(path, logger=moviepy_logger)
-
-        self.recorded_frames = []
+        self.video_writer.close()
+        if self.video_writer.frame_count > 0 and not self.disable_logger:
+            logger.info(f"Saved video {self.video_writer.path}")
+
+        self.video_writer = None
         self.recording = False
         self._video_name = None
 
@@ -501,5 +517,6 @@ class RecordVideo(
 
     def __del__(self):
         """Warn the user in case last video wasn't saved."""
-        if len(self.recorded_frames) > 0:
+        video_writer = getattr(self, "video_writer", None)
+        if video_writer is not None and video_writer.frame_count > 0:
             logger.warn("Unable to save last video! Did you call close()?")
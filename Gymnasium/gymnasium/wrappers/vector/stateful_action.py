@@ -0,0 +1,210 @@
+"""``StickyAction`` vector wrapper - There is a probability that the action is taken again."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import gymnasium as gym
+from gymnasium.core import ActType, ObsType
+from gymnasium.error import InvalidBound, InvalidProbability
+from gymnasium.logger import warn
+from gymnasium.spaces import Box, Discrete, MultiBinary, MultiDiscrete
+from gymnasium.utils import seeding
+from gymnasium.vector.utils import create_empty_array
+from gymnasium.vector.vector_env import (
+    ArrayType,
+    AutoresetMode,
+    VectorActionWrapper,
+    VectorEnv,
+)
+
+
+__all__ = ["StickyAction"]
+
+
+class StickyAction(VectorActionWrapper, gym.utils.RecordConstructorArgs):
+    """Adds a probability that the action is repeated for the same ``step`` function for each sub-environment.
+
+    The sticky action state of the sub-environments is held in ``(num_envs,)`` arrays with the sticky actions of all
+    sub-environments drawn in a single random number generator call each step. The generator is seeded with the
+    first seed passed to :meth:`reset`. Only action spaces that batch to arrays, i.e., ``Box``, ``Discrete``,
+    ``MultiDiscrete`` and ``MultiBinary``, are supported.
+
+    Example:
+        >>> import numpy as np
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=3)
+        >>> envs = StickyAction(envs, repeat_action_probability=0.9)
+        >>> _ = envs.reset(seed=123)
+        >>> _ = envs.step(np.array([1, 1, 1]))
+        >>> envs.actions(np.array([0, 0, 0]))
+        array([1, 1, 1])
+        >>> envs.close()
+
+    Change logs:
+     * v1.2.2 - Initially added
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        repeat_action_probability: float,
+        repeat_action_duration: int | tuple[int, int] = 1,
+    ):
+        """Initialize StickyAction wrapper.
+
+        Args:
+            env: the wrapped vector environment,
+            repeat_action_probability (int | float): a probability of repeating the old action,
+            repeat_action_duration (int | tuple[int, int]): the number of steps
+                the action is repeated. It can be either an int (for deterministic
+                repeats) or a tuple[int, int] for a range of stochastic number of repeats.
+        """
+        if not 0 <= repeat_action_probability < 1:
+            raise InvalidProbability(
+                f"`repeat_action_probability` should be in the interval [0,1). Received {repeat_action_probability}"
+            )
+
+        if isinstance(repeat_action_duration, int):
+            repeat_action_duration = (repeat_action_duration, repeat_action_duration)
+
+        if not isinstance(repeat_action_duration, tuple):
+            raise ValueError(
+                f"`repeat_action_duration` should be either an integer or a tuple. Received {repeat_action_duration}"
+            )
+        elif len(repeat_action_duration) != 2:
+            raise ValueError(
+                f"`repeat_action_duration` should be a tuple or a list of two integers. Received {repeat_action_duration}"
+            )
+        elif repeat_action_duration[0] > repeat_action_duration[1]:
+            raise InvalidBound(
+                f"`repeat_action_duration` is not a valid bound. Received {repeat_action_duration}"
+            )
+        elif np.any(np.array(repeat_action_duration) < 1):
+            raise ValueError(
+                f"`repeat_action_duration` should be larger or equal than 1. Received {repeat_action_duration}"
+            )
+        if not isinstance(
+            env.single_action_space, (Box, Discrete, MultiDiscrete, MultiBinary)
+        ):
+            raise TypeError(
+                f"Expects the single action space to be a Box, Discrete, MultiDiscrete or MultiBinary space, actual type: {type(env.single_action_space)}"
+            )
+
+        gym.utils.RecordConstructorArgs.__init__(
+            self,
+            repeat_action_probability=repeat_action_probability,
+            repeat_action_duration=repeat_action_duration,
+        )
+        VectorActionWrapper.__init__(self, env)
+
+        if "autoreset_mode" not in env.metadata:
+            warn(
+                f"{self} is missing `autoreset_mode` tag in its metadata, therefore, assuming that the environment uses `AutoresetMode.NEXT_STEP`."
+            )
+            self.autoreset_mode = AutoresetMode.NEXT_STEP
+        else:
+            assert isinstance(env.metadata["autoreset_mode"], AutoresetMode)
+            self.autoreset_mode = env.metadata["autoreset_mode"]
+
+        self.repeat_action_probability = repeat_action_probability
+        self.repeat_action_duration_range = repeat_action_duration
+        self.sticky_np_random, _ = seeding.np_random()
+
+        self.last_actions = create_empty_array(self.single_action_space, self.num_envs)
+        # if the sub-environments have a last action, i.e., not reset since
+        self.has_last_actions = np.zeros(self.num_envs, dtype=np.bool_)
+        # if sticky actions are taken
+        self.is_sticky_actions = np.zeros(self.num_envs, dtype=np.bool_)
+        # number of sticky action repeats
+        self.num_repeats = np.zeros(self.num_envs, dtype=np.int64)
+        # number of sticky actions taken
+        self.repeats_taken = np.zeros(self.num_envs, dtype=np.int64)
+        self._prev_dones = np.zeros(self.num_envs, dtype=np.bool_)
+
+    def _reset_sticky_actions(self, mask: np.ndarray | slice):
+        self.has_last_actions[mask] = False
+        self.is_sticky_actions[mask] = False
+        self.num_repeats[mask] = 0
+        self.repeats_taken[mask] = 0
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Reset the environment and the sticky actions of the reset sub-environments."""
+        if seed is not None:
+            self.sticky_np_random, _ = seeding.np_random(
+                seed if isinstance(seed, int) else seed[0]
+            )
+
+        reset_mask = None if options is None else options.get("reset_mask")
+        reset_envs = slice(None) if reset_mask is None else reset_mask
+        self._reset_sticky_actions(reset_envs)
+        self._prev_dones[reset_envs] = False
+
+        return self.env.reset(seed=seed, options=options)
+
+    def step(
+        self, actions: ActType
+    ) -> tuple[ObsType, ArrayType, ArrayType, ArrayType, dict[str, Any]]:
+        """Steps through the environment with the sticky actions, resetting the sticky actions at the episodes' ends."""
+        autoreset_envs = self._prev_dones
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP and autoreset_envs.any():
+            self._reset_sticky_actions(autoreset_envs)
+        else:
+            autoreset_envs = None
+
+        actions = self.actions(actions)
+        if autoreset_envs is not None:
+            # The sub-environments being reset ignore their actions
+            self.has_last_actions[autoreset_envs] = False
+
+        obs, rewards, terminations, truncations, infos = self.env.step(actions)
+
+        self._prev_dones = np.logical_or(terminations, truncations)
+        if self.autoreset_mode == AutoresetMode.SAME_STEP and self._prev_dones.any():
+            self._reset_sticky_actions(self._prev_dones)
+
+        return obs, rewards, terminations, truncations, infos
+
+    def actions(self, actions: ActType) -> ActType:
+        """Replaces the actions of the sticky sub-environments with their last actions."""
+        # either the agent was already "stuck" into repeats, or a new series of repeats is triggered
+        new_sticky_actions = (
+            np.logical_not(self.is_sticky_actions)
+            & self.has_last_actions
+            & (
+                self.sticky_np_random.uniform(size=self.num_envs)
+                < self.repeat_action_probability
+            )
+        )
+        if new_sticky_actions.any():
+            # for new series, randomly sample their durations
+            self.num_repeats[new_sticky_actions] = self.sticky_np_random.integers(
+                self.repeat_action_duration_range[0],
+                self.repeat_action_duration_range[1] + 1,
+                size=np.count_nonzero(new_sticky_actions),
+            )
+
+        sticky_actions = self.is_sticky_actions | new_sticky_actions
+        actions = np.where(
+            sticky_actions.reshape((-1,) + (1,) * (self.last_actions.ndim - 1)),
+            self.last_actions,
+            actions,
+        )
+        self.repeats_taken[sticky_actions] += 1
+
+        # repeats are done, reset "stuck" status
+        finished_repeats = sticky_actions & (self.num_repeats == self.repeats_taken)
+        self.is_sticky_actions = sticky_actions & np.logical_not(finished_repeats)
+        self.num_repeats[finished_repeats] = 0
+        self.repeats_taken[finished_repeats] = 0
+
+        self.last_actions[...] = actions
+        self.has_last_actions[:] = True
+        return actions
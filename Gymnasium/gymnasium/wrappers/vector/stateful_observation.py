@@ -1,26 +1,39 @@
 """A collection of stateful observation wrappers.
 
 * ``NormalizeObservation`` - Normalize the observations
+* ``DelayObservation`` - Delays the observations with a ring buffer
+* ``TimeAwareObservation`` - Adds the episodes' time steps to the observations
+* ``MaxAndSkipObservation`` - Repeats the actions for ``skip`` steps and returns the max of the last two observations
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Final
 
 import numpy as np
 
 import gymnasium as gym
-from gymnasium.core import ObsType
+from gymnasium import spaces
+from gymnasium.core import ActType, ObsType
 from gymnasium.logger import warn
+from gymnasium.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete, Tuple
+from gymnasium.vector.utils import batch_space, iterate
 from gymnasium.vector.vector_env import (
+    ArrayType,
     AutoresetMode,
     VectorEnv,
     VectorObservationWrapper,
+    VectorWrapper,
 )
-from gymnasium.wrappers.utils import RunningMeanStd
+from gymnasium.wrappers.utils import RunningMeanStd, create_zero_array
 
 
-__all__ = ["NormalizeObservation"]
+__all__ = [
+    "NormalizeObservation",
+    "DelayObservation",
+    "TimeAwareObservation",
+    "MaxAndSkipObservation",
+]
 
 
 class NormalizeObservation(VectorObservationWrapper, gym.utils.RecordConstructorArgs):
@@ -124,3 +137,567 @@ class NormalizeObservation(VectorObservationWrapper, gym.utils.RecordConstructor
         return (observations - self.obs_rms.mean) / np.sqrt(
             self.obs_rms.var + self.epsilon
         )
+
+
+class DelayObservation(VectorWrapper, gym.utils.RecordConstructorArgs):
+    """Adds a delay to the returned observations from the vector environment.
+
+    Before reaching the :attr:`delay` number of timesteps in an episode, the returned observation is an array of zeros
+    with the same shape as the observation space. The observations are stored in a ``(delay, num_envs, ...)`` ring
+    buffer indexed by the number of observations of each sub-environment's episode, such that the sub-environments
+    can reset independently. Only observation spaces that batch to arrays, i.e., ``Box``, ``Discrete``,
+    ``MultiDiscrete`` and ``MultiBinary``, are supported.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=2, vectorization_mode="sync")
+        >>> envs = DelayObservation(envs, delay=1)
+        >>> envs.reset(seed=123)[0]
+        array([[0., 0., 0., 0.],
+               [0., 0., 0., 0.]], dtype=float32)
+        >>> envs.step(np.array([1, 0]))[0]
+        array([[ 0.01823519, -0.0446179 , -0.02796401, -0.03156282],
+               [ 0.02852531,  0.02858594,  0.0469136 ,  0.02480598]],
+              dtype=float32)
+        >>> envs.close()
+
+    Change logs:
+     * v1.2.2 - Initially added
+    """
+
+    def __init__(self, env: VectorEnv, delay: int):
+        """Initialises the DelayObservation wrapper with an integer.
+
+        Args:
+            env: The vector environment to wrap
+            delay: The number of timesteps to delay observations
+        """
+        if not np.issubdtype(type(delay), np.integer):
+            raise TypeError(
+                f"The delay is expected to be an integer, actual type: {type(delay)}"
+            )
+        if not 0 <= delay:
+            raise ValueError(
+                f"The delay needs to be greater than zero, actual value: {delay}"
+            )
+        if not isinstance(
+            env.single_observation_space, (Box, Discrete, MultiDiscrete, MultiBinary)
+        ):
+            raise TypeError(
+                f"Expects the single observation space to be a Box, Discrete, MultiDiscrete or MultiBinary space, actual type: {type(env.single_observation_space)}"
+            )
+
+        gym.utils.RecordConstructorArgs.__init__(self, delay=delay)
+        VectorWrapper.__init__(self, env)
+
+        if "autoreset_mode" not in env.metadata:
+            warn(
+                f"{self} is missing `autoreset_mode` tag in its metadata, therefore, assuming that the environment uses `AutoresetMode.NEXT_STEP`."
+            )
+            self.autoreset_mode = AutoresetMode.NEXT_STEP
+        else:
+            assert isinstance(env.metadata["autoreset_mode"], AutoresetMode)
+            self.autoreset_mode = env.metadata["autoreset_mode"]
+
+        self.delay: Final[int] = int(delay)
+        self.zero_observation = create_zero_array(self.single_observation_space)
+
+        self._obs_buffer = np.zeros(
+            (self.delay, self.num_envs) + self.single_observation_space.shape,
+            dtype=self.single_observation_space.dtype,
+        )
+        self._obs_counts = np.zeros(self.num_envs, dtype=np.int64)
+        self._prev_dones = np.zeros(self.num_envs, dtype=np.bool_)
+        self._env_ids = np.arange(self.num_envs)
+        self._observations: np.ndarray | None = None
+
+    def _delay_observations(
+        self, observations: np.ndarray, env_ids: np.ndarray
+    ) -> np.ndarray:
+        """Adds the sub-environments' observations to the ring buffer and returns their delayed observations."""
+        counts = self._obs_counts[env_ids]
+        slots = counts % self.delay
+
+        delayed_obs = self._obs_buffer[slots, env_ids]
+        delayed_obs[counts < self.delay] = self.zero_observation
+        self._obs_buffer[slots, env_ids] = observations[env_ids]
+        self._obs_counts[env_ids] += 1
+        return delayed_obs
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Resets the environment, clearing the observations of the reset sub-environments."""
+        reset_mask = None if options is None else options.get("reset_mask")
+        obs, info = self.env.reset(seed=seed, options=options)
+        if self.delay == 0:
+            return obs, info
+
+        if reset_mask is None or self._observations is None:
+            self._obs_counts[:] = 0
+            self._prev_dones[:] = False
+            self._observations = self._delay_observations(obs, self._env_ids)
+        else:
+            env_ids = np.flatnonzero(reset_mask)
+            self._obs_counts[env_ids] = 0
+            self._prev_dones[env_ids] = False
+            self._observations = np.copy(self._observations)
+            self._observations[env_ids] = self._delay_observations(obs, env_ids)
+
+        return self._observations, info
+
+    def step(
+        self, actions: ActType
+    ) -> tuple[ObsType, ArrayType, ArrayType, ArrayType, dict[str, Any]]:
+        """Steps through the environment, returning the delayed observations."""
+        obs, rewards, terminations, truncations, infos = self.env.step(actions)
+        if self.delay == 0:
+            return obs, rewards, terminations, truncations, infos
+
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            self._obs_counts[self._prev_dones] = 0
+        self._prev_dones = np.logical_or(terminations, truncations)
+
+        if self.autoreset_mode == AutoresetMode.SAME_STEP and "final_obs" in infos:
+            # The final observations are delayed before the reset observations of the same step
+            final_env_ids = np.flatnonzero(infos["_final_obs"])
+            step_obs = np.copy(obs)
+            for i in final_env_ids:
+                step_obs[i] = infos["final_obs"][i]
+            delayed_obs = self._delay_observations(step_obs, self._env_ids)
+
+            for i in final_env_ids:
+                infos["final_obs"][i] = np.copy(delayed_obs[i])
+            self._obs_counts[final_env_ids] = 0
+            delayed_obs[final_env_ids] = self._delay_observations(obs, final_env_ids)
+        else:
+            delayed_obs = self._delay_observations(obs, self._env_ids)
+
+        self._observations = delayed_obs
+        return delayed_obs, rewards, terminations, truncations, infos
+
+
+def _flatten_batch(space: gym.Space, batch: Any, n: int) -> np.ndarray:
+    """Flattens a batch of ``n`` samples of ``space`` to a ``(n, flatdim)`` array without iterating over the samples where possible."""
+    if isinstance(space, (Box, MultiBinary)):
+        return np.asarray(batch).reshape(n, -1)
+    elif isinstance(space, Discrete):
+        one_hot = np.zeros((n, space.n), dtype=space.dtype)
+        one_hot[np.arange(n), np.asarray(batch) - space.start] = 1
+        return one_hot
+    elif isinstance(space, Dict):
+        return np.concatenate(
+            [
+                _flatten_batch(subspace, batch[key], n)
+                for key, subspace in space.spaces.items()
+            ],
+            axis=1,
+        )
+    elif isinstance(space, Tuple):
+        return np.concatenate(
+            [
+                _flatten_batch(subspace, sub_batch, n)
+                for subspace, sub_batch in zip(space.spaces, batch)
+            ],
+            axis=1,
+        )
+    else:
+        return np.stack(
+            [
+                spaces.flatten(space, sample)
+                for sample in iterate(batch_space(space, n), batch)
+            ]
+        )
+
+
+class TimeAwareObservation(VectorWrapper, gym.utils.RecordConstructorArgs):
+    """Augment the observations with the number of time steps taken within each sub-environment's episode.
+
+    The observations are augmented in the same way as :class:`gymnasium.wrappers.TimeAwareObservation`,
+    with the time steps of the sub-environments held in a ``(num_envs,)`` array.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=2)
+        >>> envs = TimeAwareObservation(envs, normalize_time=True)
+        >>> envs.single_observation_space
+        Box([-4.8               -inf -0.41887903        -inf  0.        ], [4.8               inf 0.41887903        inf 1.        ], (5,), float32)
+        >>> obs, _ = envs.reset(seed=123)
+        >>> obs, *_ = envs.step(np.array([1, 0]))
+        >>> obs[:, -1]
+        array([0.002, 0.002], dtype=float32)
+        >>> envs.close()
+
+    Change logs:
+     * v1.2.2 - Initially added
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        flatten: bool = True,
+        normalize_time: bool = False,
+        *,
+        dict_time_key: str = "time",
+    ):
+        """Initialize :class:`TimeAwareObservation`.
+
+        Args:
+            env: The vector environment to apply the wrapper, its ``spec`` must specify the ``max_episode_steps``
+            flatten: Flatten the observation to a `Box` of a single dimension
+            normalize_time: if `True` return time in the range [0,1]
+                otherwise return time as remaining timesteps before truncation
+            dict_time_key: For environment with a ``Dict`` observation space, the key for the time space. By default, `"time"`.
+        """
+        gym.utils.RecordConstructorArgs.__init__(
+            self,
+            flatten=flatten,
+            normalize_time=normalize_time,
+            dict_time_key=dict_time_key,
+        )
+        VectorWrapper.__init__(self, env)
+
+        if "autoreset_mode" not in env.metadata:
+            warn(
+                f"{self} is missing `autoreset_mode` tag in its metadata, therefore, assuming that the environment uses `AutoresetMode.NEXT_STEP`."
+            )
+            self.autoreset_mode = AutoresetMode.NEXT_STEP
+        else:
+            assert isinstance(env.metadata["autoreset_mode"], AutoresetMode)
+            self.autoreset_mode = env.metadata["autoreset_mode"]
+
+        if env.spec is None or env.spec.max_episode_steps is None:
+            raise ValueError(
+                "The vector environment spec must specify a `max_episode_steps`."
+            )
+        self.max_timesteps = env.spec.max_episode_steps
+
+        self.flatten: Final[bool] = flatten
+        self.normalize_time: Final[bool] = normalize_time
+        self.dict_time_key: Final[str] = dict_time_key
+
+        self.timesteps = np.zeros(self.num_envs, dtype=np.int64)
+        self._prev_dones = np.zeros(self.num_envs, dtype=np.bool_)
+
+        # Find the normalized time space
+        if self.normalize_time:
+            time_space = Box(0.0, 1.0)
+        else:
+            time_space = Box(0, self.max_timesteps, dtype=np.int32)
+
+        # Find the observation space
+        env_observation_space = env.single_observation_space
+        if isinstance(env_observation_space, Dict):
+            assert dict_time_key not in env_observation_space.keys()
+            observation_space = Dict(
+                {dict_time_key: time_space, **env_observation_space.spaces}
+            )
+        elif isinstance(env_observation_space, Tuple):
+            observation_space = Tuple(env_observation_space.spaces + (time_space,))
+        else:
+            observation_space = Dict(obs=env_observation_space, time=time_space)
+        self._time_observation_space = observation_space
+
+        # If to flatten the observation space
+        if self.flatten:
+            self.single_observation_space = spaces.flatten_space(observation_space)
+        else:
+            self.single_observation_space = observation_space
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+
+    def _time_observations(self, observations: ObsType, timesteps: np.ndarray) -> Any:
+        """Adds the timesteps to the observations, batched over the first axis."""
+        if self.normalize_time:
+            time = (timesteps / self.max_timesteps).astype(np.float32)[:, None]
+        else:
+            time = timesteps.astype(np.int32)[:, None]
+
+        if isinstance(self.env.single_observation_space, Dict):
+            time_obs = {self.dict_time_key: time, **observations}
+        elif isinstance(self.env.single_observation_space, Tuple):
+            time_obs = observations + (time,)
+        else:
+            time_obs = {"obs": observations, "time": time}
+
+        if self.flatten:
+            return _flatten_batch(
+                self._time_observation_space, time_obs, len(timesteps)
+            ).astype(self.single_observation_space.dtype, copy=False)
+        else:
+            return time_obs
+
+    def _time_observation(self, observation: Any, timestep: int) -> Any:
+        """Adds the timestep to a single sub-environment's observation, i.e., its final observation."""
+        if self.normalize_time:
+            time = np.array([timestep / self.max_timesteps], dtype=np.float32)
+        else:
+            time = np.array([timestep], dtype=np.int32)
+
+        if isinstance(self.env.single_observation_space, Dict):
+            time_obs = {self.dict_time_key: time, **observation}
+        elif isinstance(self.env.single_observation_space, Tuple):
+            time_obs = observation + (time,)
+        else:
+            time_obs = {"obs": observation, "time": time}
+
+        if self.flatten:
+            return spaces.flatten(self._time_observation_space, time_obs)
+        else:
+            return time_obs
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Reset the environment setting the time of the reset sub-environments to zero."""
+        reset_mask = None if options is None else options.get("reset_mask")
+        obs, info = self.env.reset(seed=seed, options=options)
+
+        if reset_mask is None:
+            self.timesteps[:] = 0
+            self._prev_dones[:] = False
+        else:
+            self.timesteps[reset_mask] = 0
+            self._prev_dones[reset_mask] = False
+
+        return self._time_observations(obs, self.timesteps), info
+
+    def step(
+        self, actions: ActType
+    ) -> tuple[ObsType, ArrayType, ArrayType, ArrayType, dict[str, Any]]:
+        """Steps through the environment, incrementing the time steps of the sub-environments."""
+        obs, rewards, terminations, truncations, infos = self.env.step(actions)
+
+        self.timesteps += 1
+        if self.autoreset_mode == AutoresetMode.NEXT_STEP:
+            self.timesteps[self._prev_dones] = 0
+        self._prev_dones = np.logical_or(terminations, truncations)
+
+        if self.autoreset_mode == AutoresetMode.SAME_STEP and "final_obs" in infos:
+            final_obs = infos["final_obs"]
+            for i in np.flatnonzero(infos["_final_obs"]):
+                final_obs[i] = self._time_observation(final_obs[i], self.timesteps[i])
+            self.timesteps[infos["_final_obs"]] = 0
+
+        return (
+            self._time_observations(obs, self.timesteps),
+            rewards,
+            terminations,
+            truncations,
+            infos,
+        )
+
+
+def _replace_infos(
+    infos: dict[str, Any], replacement: dict[str, Any], env_mask: np.ndarray
+) -> dict[str, Any]:
+    """Returns the vector ``infos`` with the infos of the sub-environments in ``env_mask`` replaced by their ``replacement`` infos.
+
+    Args:
+        infos: The vector infos, with a ``_key`` mask for each ``key``
+        replacement: The vector infos with the infos of the sub-environments in ``env_mask``
+        env_mask: The sub-environments whose infos are replaced
+
+    Returns:
+        The merged vector infos
+    """
+    merged = {}
+    keys = list(infos) + [key for key in replacement if key not in infos]
+    for key in keys:
+        # The masks are merged with their key
+        if key.startswith("_") and (key[1:] in infos or key[1:] in replacement):
+            continue
+
+        mask = np.where(
+            env_mask,
+            replacement.get(f"_{key}", np.zeros_like(env_mask)),
+            infos.get(f"_{key}", np.zeros_like(env_mask)),
+        )
+        if not mask.any():
+            continue
+
+        value, replacement_value = infos.get(key), replacement.get(key)
+        if isinstance(value, dict) or isinstance(replacement_value, dict):
+            value = _replace_infos(value or {}, replacement_value or {}, env_mask)
+        elif value is None:
+            value = replacement_value
+        elif replacement_value is not None:
+            value = value.astype(np.result_type(value, replacement_value))
+            value[env_mask] = replacement_value[env_mask]
+        merged[key], merged[f"_{key}"] = value, mask
+    return merged
+
+
+class MaxAndSkipObservation(VectorWrapper, gym.utils.RecordConstructorArgs):
+    """Repeats the actions for ``skip`` steps and returns the max values between the two last observations.
+
+    Every sub-environment is stepped ``skip`` times, independent of the other sub-environments. As the sub-environments
+    are stepped together, a sub-environment that terminates or truncates within the frames keeps being stepped, its
+    rewards are no longer summed and its observation (the max of its last two observations), termination, truncation
+    and info are those of the frame that its episode ended. The remaining frames step its next episode, that is,
+    for ``AutoresetMode.NEXT_STEP`` the sub-environment is autoreset and their rewards are added to the next step's
+    rewards, while for ``AutoresetMode.DISABLED`` it is reset by the wrapper and the frames are discarded when the
+    ``reset_mask`` reset resets it again. For ``AutoresetMode.SAME_STEP``, the ``final_obs`` and ``final_info`` are of
+    the frame that its episode ended, while the observation is of its next episode's last frame, whose rewards are
+    added to the next step's rewards.
+
+    Example:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=2)
+        >>> envs = MaxAndSkipObservation(envs, skip=4)
+        >>> obs, _ = envs.reset(seed=123)
+        >>> obs, rewards, *_ = envs.step(np.array([1, 0]))
+        >>> rewards
+        array([4., 4.])
+        >>> envs.close()
+
+    Change logs:
+     * v1.2.2 - Initially added
+    """
+
+    def __init__(self, env: VectorEnv, skip: int = 4):
+        """This wrapper will return only every ``skip``-th frame (frameskipping) and return the max between the two last frames.
+
+        Args:
+            env: The vector environment to apply the wrapper
+            skip: The number of frames to skip
+        """
+        gym.utils.RecordConstructorArgs.__init__(self, skip=skip)
+        VectorWrapper.__init__(self, env)
+
+        if not np.issubdtype(type(skip), np.integer):
+            raise TypeError(
+                f"The skip is expected to be an integer, actual type: {type(skip)}"
+            )
+        if skip < 2:
+            raise ValueError(
+                f"The skip value needs to be equal or greater than two, actual value: {skip}"
+            )
+        if not isinstance(env.single_observation_space, Box):
+            raise TypeError(
+                f"Expects the single observation space to be a Box space, actual type: {type(env.single_observation_space)}"
+            )
+
+        if "autoreset_mode" not in env.metadata:
+            warn(
+                f"{self} is missing `autoreset_mode` tag in its metadata, therefore, assuming that the environment uses `AutoresetMode.NEXT_STEP`."
+            )
+            self.autoreset_mode = AutoresetMode.NEXT_STEP
+        else:
+            assert isinstance(env.metadata["autoreset_mode"], AutoresetMode)
+            self.autoreset_mode = env.metadata["autoreset_mode"]
+
+        self._skip = skip
+        self._obs_buffer = np.zeros(
+            (self.num_envs,) + self.single_observation_space.shape,
+            dtype=self.single_observation_space.dtype,
+        )
+        self._rewards = np.zeros(self.num_envs, dtype=np.float64)
+        # The rewards of the next episodes' frames stepped after the sub-environments' episodes ended
+        self._carried_rewards = np.zeros(self.num_envs, dtype=np.float64)
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[ObsType, dict[str, Any]]:
+        """Resets the environment."""
+        reset_mask = None if options is None else options.get("reset_mask")
+        obs, info = self.env.reset(seed=seed, options=options)
+
+        reset_envs = slice(None) if reset_mask is None else reset_mask
+        self._carried_rewards[reset_envs] = 0
+        return obs, info
+
+    def step(
+        self, actions: ActType
+    ) -> tuple[ObsType, ArrayType, ArrayType, ArrayType, dict[str, Any]]:
+        """Step the environment with the given actions for up to ``skip`` steps.
+
+        Repeat actions, sum rewards, and max over the last two observations.
+
+        Args:
+            actions: The actions to step through the environment with
+
+        Returns:
+            Max of the last two observations, reward, terminated, truncated, and info from the environment
+        """
+        total_rewards = self._rewards
+        np.copyto(total_rewards, self._carried_rewards)
+        self._carried_rewards[:] = 0
+        terminations = np.zeros(self.num_envs, dtype=np.bool_)
+        truncations = np.zeros(self.num_envs, dtype=np.bool_)
+        max_obs = None
+        # The sub-environments whose episode didn't end within the frames
+        active = np.ones(self.num_envs, dtype=np.bool_)
+        # The sub-environments mask and the infos of the frames that episodes ended before the last frame
+        ended_infos = []
+
+        for i in range(self._skip):
+            obs, rewards, frame_terminations, frame_truncations, infos = self.env.step(
+                actions
+            )
+            total_rewards[active] += rewards[active]
+            self._carried_rewards[~active] += rewards[~active]
+
+            dones = np.logical_or(frame_terminations, frame_truncations)
+            # The next episodes that end within the frames are not returned
+            self._carried_rewards[dones & ~active] = 0
+            if i == self._skip - 1:
+                break
+
+            ended = active & dones
+            if ended.any():
+                if self.autoreset_mode == AutoresetMode.SAME_STEP:
+                    if i > 0:
+                        self._max_final_obs(infos, ended)
+                else:
+                    if max_obs is None:
+                        max_obs = np.zeros_like(self._obs_buffer)
+                    pooled_obs = obs if i == 0 else np.maximum(self._obs_buffer, obs)
+                    max_obs[ended] = pooled_obs[ended]
+                terminations[ended] = frame_terminations[ended]
+                truncations[ended] = frame_truncations[ended]
+                ended_infos.append((ended, infos))
+                active &= ~dones
+
+            if self.autoreset_mode == AutoresetMode.DISABLED and dones.any():
+                # The vector environment doesn't step the sub-environments that ended until they are reset
+                self.env.reset(options={"reset_mask": dones})
+            np.copyto(self._obs_buffer, obs)
+
+        terminations[active] = frame_terminations[active]
+        truncations[active] = frame_truncations[active]
+
+        last_obs = np.maximum(self._obs_buffer, obs)
+        if self.autoreset_mode == AutoresetMode.SAME_STEP:
+            # The observations of the sub-environments reset on the last frame are their reset observations
+            if dones.any():
+                self._max_final_obs(infos, dones & active)
+                last_obs[dones] = obs[dones]
+            # The observations of the sub-environments that ended before are of their next episodes
+            max_obs = last_obs
+        elif max_obs is None:
+            max_obs = last_obs
+        else:
+            max_obs[active] = last_obs[active]
+
+        for env_mask, frame_infos in ended_infos:
+            infos = _replace_infos(infos, frame_infos, env_mask)
+
+        return max_obs, np.copy(total_rewards), terminations, truncations, infos
+
+    def _max_final_obs(self, infos: dict[str, Any], env_mask: np.ndarray):
+        """Sets the ``final_obs`` of the sub-environments in ``env_mask`` to the max with their previous observations."""
+        for j in np.flatnonzero(env_mask):
+            infos["final_obs"][j] = np.maximum(
+                self._obs_buffer[j], infos["final_obs"][j]
+            )
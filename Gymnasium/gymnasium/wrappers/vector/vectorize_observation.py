@@ -11,6 +11,8 @@ import numpy as np
 from gymnasium import Space
 from gymnasium.core import ActType, Env, ObsType
 from gymnasium.logger import warn
+from gymnasium.spaces import Box, Dict
+from gymnasium.spaces.utils import Flattener
 from gymnasium.vector import VectorEnv, VectorObservationWrapper
 from gymnasium.vector.utils import batch_space, concatenate, create_empty_array, iterate
 from gymnasium.vector.vector_env import ArrayType, AutoresetMode
@@ -279,6 +281,17 @@ class FlattenObservation(VectorizeTransformObservation):
         """
         super().__init__(env, transform_observation.FlattenObservation)
 
+        if self.env.single_observation_space.is_np_flattenable:
+            self.flattener = Flattener(self.env.single_observation_space)
+        else:
+            self.flattener = None
+
+    def observations(self, observations: ObsType) -> ObsType:
+        """Flattens the batch of observations at once for numpy-flattenable spaces, otherwise, each observation individually."""
+        if self.flattener is not None:
+            return self.flattener.flatten_batch(observations)
+        return super().observations(observations)
+
 
 class GrayscaleObservation(VectorizeTransformObservation):
     """Observation wrapper that converts an RGB image to grayscale.
@@ -426,3 +439,83 @@ class DtypeObservation(VectorizeTransformObservation):
             dtype: The new dtype of the observation
         """
         super().__init__(env, transform_observation.DtypeObservation, dtype=dtype)
+
+
+class AddRenderObservation(TransformObservation):
+    """Includes the sub-environments' batched rendered frames in the vector environment's observations.
+
+    The vector environment's ``render`` must return a single ``(num_envs, height, width, 3)`` array of frames,
+    as :class:`gymnasium.vector.SyncVectorEnv`, :class:`gymnasium.vector.AsyncVectorEnv` and
+    ``CartPoleVectorEnv`` do for ``render_mode="rgb_array"``.
+
+    Example - Replace the observation with the rendered image:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=3, vectorization_mode="sync", render_mode="rgb_array")
+        >>> envs = AddRenderObservation(envs, render_only=True)
+        >>> envs.observation_space
+        Box(0, 255, (3, 400, 600, 3), uint8)
+        >>> obs, info = envs.reset(seed=123)
+        >>> obs.shape
+        (3, 400, 600, 3)
+        >>> envs.close()
+
+    Example - Add the rendered image to the original observation as a dictionary item:
+        >>> import gymnasium as gym
+        >>> envs = gym.make_vec("CartPole-v1", num_envs=3, vectorization_mode="sync", render_mode="rgb_array")
+        >>> envs = AddRenderObservation(envs, render_only=False)
+        >>> obs, info = envs.reset(seed=123)
+        >>> obs.keys()
+        dict_keys(['state', 'pixels'])
+        >>> obs["state"].shape, obs["pixels"].shape
+        ((3, 4), (3, 400, 600, 3))
+        >>> envs.close()
+    """
+
+    def __init__(
+        self,
+        env: VectorEnv,
+        render_only: bool = True,
+        render_key: str = "pixels",
+        obs_key: str = "state",
+    ):
+        """Constructor of the vector add render observation wrapper.
+
+        Args:
+            env: The vector environment to wrap.
+            render_only: If ``True`` (default), the original observations are discarded and only the rendered frames
+                are observed. If ``False``, the observations are a dictionary with both the original observations and the frames.
+            render_key: Optional custom string specifying the pixel key. Defaults to "pixels"
+            obs_key: Optional custom string specifying the obs key. Defaults to "state"
+        """
+        assert env.render_mode == "rgb_array", env.render_mode
+        env.reset()
+        pixels = env.render()
+        assert (
+            isinstance(pixels, np.ndarray) and pixels.shape[0] == env.num_envs
+        ), f"Expected `env.render()` to return a batched array of frames, actually returned {type(pixels)}"
+        pixel_space = Box(low=0, high=255, shape=pixels.shape[1:], dtype=np.uint8)
+
+        if render_only:
+            super().__init__(
+                env,
+                func=lambda _: self.render(),
+                single_observation_space=pixel_space,
+            )
+        elif isinstance(env.single_observation_space, Dict):
+            assert render_key not in env.single_observation_space.spaces.keys()
+
+            super().__init__(
+                env,
+                func=lambda obs: {render_key: self.render(), **obs},
+                single_observation_space=Dict(
+                    {render_key: pixel_space, **env.single_observation_space.spaces}
+                ),
+            )
+        else:
+            super().__init__(
+                env,
+                func=lambda obs: {obs_key: obs, render_key: self.render()},
+                single_observation_space=Dict(
+                    {obs_key: env.single_observation_space, render_key: pixel_space}
+                ),
+            )
@@ -9,7 +9,7 @@ import gymnasium as gym
 from gymnasium.envs.mujoco.mujoco_env import MujocoEnv
 from gymnasium.envs.mujoco.utils import check_mujoco_reset_state
 from gymnasium.error import Error
-from gymnasium.utils.env_checker import check_env
+from gymnasium.utils.env_checker import check_env, data_equivalence
 from gymnasium.utils.env_match import check_environments_match
 
 
@@ -389,6 +389,21 @@ def test_set_state(version: str):
     assert (env.data.qvel == new_qvel).all()
 
 
+@pytest.mark.parametrize("version", ["v5", "v4"])
+def test_get_set_state_snapshot(version: str):
+    """Tests that `mujocoEnv.set_state(state)` restores a snapshot of `mujocoEnv.get_state()`."""
+    env = gym.make(f"Hopper-{version}").unwrapped
+    env.reset(seed=123)
+    state = env.get_state()
+    actions = [env.action_space.sample() for _ in range(10)]
+    rollout = [env.step(action) for action in actions]
+
+    env.set_state(state)
+    assert data_equivalence([env.step(action) for action in actions], rollout)
+    env.set_state(state)
+    assert data_equivalence(env.get_state(), state)
+
+
 # Note: HumanoidStandup-v4/v3 does not have `info`
 # Note: Ant-v4/v3 fails this test
 # Note: Humanoid-v4/v3 fails this test
@@ -0,0 +1,78 @@
+"""Tests that the MuJoCo vector environments match their single environment equivalent."""
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.envs.mujoco.mujoco_env import MujocoVectorEnv
+
+
+VECTOR_MUJOCO_ENVS = [
+    "Ant-v5",
+    "HalfCheetah-v5",
+    "Hopper-v5",
+    "Humanoid-v5",
+    "Swimmer-v5",
+    "Walker2d-v5",
+]
+
+
+@pytest.mark.parametrize("env_id", VECTOR_MUJOCO_ENVS)
+@pytest.mark.parametrize("num_threads", [1, 2])
+def test_vector_env_matches_single_env(env_id, num_threads, num_envs=3, num_steps=30):
+    """Steps the vector environment and each single environment from the same state with the same actions."""
+    envs = gym.make_vec(
+        env_id, num_envs=num_envs, num_threads=num_threads, max_episode_steps=10
+    )
+    assert isinstance(envs.unwrapped, MujocoVectorEnv)
+    vector_env = envs.unwrapped
+
+    single_envs = [gym.make(env_id).unwrapped for _ in range(num_envs)]
+    assert envs.single_observation_space == single_envs[0].observation_space
+    assert envs.single_action_space == single_envs[0].action_space
+
+    def sync_single_env(i):
+        single_envs[i].reset()
+        single_envs[i].set_state(vector_env.qpos[i].copy(), vector_env.qvel[i].copy())
+
+    observations, infos = envs.reset(seed=123)
+    assert observations in envs.observation_space
+    for i, env in enumerate(single_envs):
+        sync_single_env(i)
+        np.testing.assert_allclose(observations[i], env._get_obs())
+
+    envs.action_space.seed(123)
+    for _ in range(num_steps):
+        actions = envs.action_space.sample()
+        autoreset = vector_env.prev_done.copy()
+        observations, rewards, terminations, truncations, infos = envs.step(actions)
+
+        for i, env in enumerate(single_envs):
+            if autoreset[i]:
+                sync_single_env(i)
+                assert rewards[i] == 0 and not terminations[i] and not truncations[i]
+                np.testing.assert_allclose(observations[i], env._get_obs())
+                assert not infos["_x_velocity"][i]
+                continue
+
+            obs, reward, terminated, _, info = env.step(actions[i])
+            np.testing.assert_allclose(observations[i], obs)
+            np.testing.assert_allclose(rewards[i], reward)
+            assert terminations[i] == terminated
+            for key, value in info.items():
+                assert infos[f"_{key}"][i]
+                np.testing.assert_allclose(infos[key][i], value)
+
+        assert np.all(truncations == (vector_env.steps >= 10))
+
+    envs.close()
+    for env in single_envs:
+        env.close()
+
+
+def test_vector_env_action_shape():
+    envs = gym.make_vec("HalfCheetah-v5", num_envs=2)
+    envs.reset(seed=0)
+    with pytest.raises(ValueError, match="Action dimension mismatch"):
+        envs.step(np.zeros((3, 6)))
+    envs.close()
@@ -161,3 +161,45 @@ def test_pickle_env(env: gym.Env):
 
     env.close()
     pickled_env.close()
+
+
+STATE_ENV_SPECS = [
+    env_spec
+    for env_spec in all_testing_env_specs
+    if isinstance(env_spec.entry_point, str)
+    and (
+        "classic_control" in env_spec.entry_point or "toy_text" in env_spec.entry_point
+    )
+]
+
+
+@pytest.mark.parametrize(
+    "env_spec", STATE_ENV_SPECS, ids=[env_spec.id for env_spec in STATE_ENV_SPECS]
+)
+def test_env_get_set_state(env_spec: EnvSpec, num_steps: int = 30):
+    """Tests that the environments restored with a state snapshot continue identically, including after resets."""
+    env = env_spec.make(disable_env_checker=True).unwrapped
+    env.reset(seed=123)
+    env.action_space.seed(123)
+    for _ in range(3):
+        env.step(env.action_space.sample())
+    actions = [env.action_space.sample() for _ in range(num_steps)]
+
+    def _rollout():
+        rollout = []
+        for action in actions:
+            step = env.step(action)
+            rollout.append(step)
+            if step[2] or step[3]:
+                rollout.append(env.reset())
+        return rollout
+
+    state = env.get_state()
+    rollout = _rollout()
+
+    env.set_state(state)
+    assert data_equivalence(_rollout(), rollout)
+    # The snapshot is not modified by the rollouts
+    env.set_state(state)
+    assert data_equivalence(env.get_state(), state)
+    env.close()
@@ -1,6 +1,11 @@
+import copy
+
 import numpy as np
 import pytest
 
+import gymnasium as gym
+from gymnasium.envs.classic_control import rendering
+from gymnasium.envs.classic_control.cartpole import CartPoleEnv, CartPoleVectorEnv
 from gymnasium.logger import warn
 from tests.envs.utils import all_testing_env_specs
 
@@ -74,3 +79,111 @@ def test_render_modes(spec):
             finally:
                 new_env.close()
     env.close()
+
+
+def test_fill_polygons():
+    frames = np.zeros((2, 10, 12, 3), dtype=np.uint8)
+    rendering.fill_polygons(
+        frames,
+        np.array(
+            [[(1, 2), (1, 5), (4, 5), (4, 2)], [(6, 0), (11, 9), (11, 0), (6, 0)]]
+        ),
+        (1, 2, 3),
+    )
+
+    expected = np.zeros((2, 10, 12), dtype=np.bool_)
+    expected[0, 2:6, 1:5] = True
+    for y in range(10):
+        expected[1, y, int(np.round(6 + y * 5 / 9)) : 12] = True
+    assert np.all(np.any(frames != 0, axis=-1) == expected)
+    assert np.all(frames[expected] == (1, 2, 3))
+
+    # polygons outside the frames are ignored
+    rendering.fill_polygons(frames, np.full((2, 4, 2), -5.0), (255, 255, 255))
+    assert np.all(np.any(frames != 0, axis=-1) == expected)
+
+
+def test_fill_circles():
+    frames = np.zeros((2, 10, 10, 3), dtype=np.uint8)
+    rendering.fill_circles(frames, np.array([(5, 5), (0, 9)]), 2, (255, 0, 0))
+
+    ys, xs = np.mgrid[:10, :10]
+    expected = np.stack(
+        [(xs - 5) ** 2 + (ys - 5) ** 2 <= 4, xs**2 + (ys - 9) ** 2 <= 4]
+    )
+    assert np.all(np.any(frames != 0, axis=-1) == expected)
+    assert np.all(frames[expected] == (255, 0, 0))
+
+
+def test_cartpole_vector_render():
+    """Checks that the NumPy rasterized vector frames match the pygame rendered frames, up to anti-aliasing."""
+    pytest.importorskip("pygame")
+
+    envs = CartPoleVectorEnv(num_envs=3, render_mode="rgb_array")
+    envs.reset(seed=123)
+    envs.state[0] = [-1.5, 0.0, 2.0]
+    envs.state[2] = [0.1, -0.5, 2.0]
+    frames = envs.render()
+
+    env = CartPoleEnv(render_mode="rgb_array")
+    env.reset()
+    for i, frame in enumerate(frames):
+        env.state = envs.state[:, i]
+        expected_frame = env.render()
+        assert frame.shape == expected_frame.shape and frame.dtype == np.uint8
+
+        different_pixels = np.any(frame != expected_frame, axis=-1)
+        assert np.sum(different_pixels) < 0.005 * different_pixels.size
+
+    env.close()
+    envs.close()
+
+
+@pytest.mark.parametrize(
+    "env_id, state_attributes",
+    [
+        ("FrozenLake-v1", ("s", "lastaction")),
+        ("CliffWalking-v1", ("s", "lastaction")),
+        ("Taxi-v3", ("s", "lastaction", "taxi_orientation")),
+        (
+            "Blackjack-v1",
+            ("player", "dealer", "dealer_top_card_suit", "dealer_top_card_value_str"),
+        ),
+    ],
+)
+def test_toy_text_render_redraw(env_id, state_attributes, num_steps=30):
+    """Checks that only redrawing the sprites over the cached background equals drawing the full frame."""
+    env = gym.make(env_id, render_mode="rgb_array").unwrapped
+    env.reset(seed=0)
+    env.action_space.seed(0)
+
+    for _ in range(num_steps):
+        frame = env.render()
+
+        fresh_env = gym.make(env_id, render_mode="rgb_array").unwrapped
+        for name in state_attributes:
+            setattr(fresh_env, name, copy.deepcopy(getattr(env, name)))
+        np.testing.assert_array_equal(frame, fresh_env.render())
+        fresh_env.close()
+
+        _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        if terminated or truncated:
+            env.reset()
+    env.close()
+
+
+def test_toy_text_sprites_shared():
+    from gymnasium.envs.toy_text import rendering as toy_text_rendering
+
+    envs = [gym.make("FrozenLake-v1", render_mode="rgb_array") for _ in range(2)]
+    for env in envs:
+        env.reset(seed=0)
+        frame = env.render()
+        assert frame.flags.writeable and frame.flags.c_contiguous
+
+    assert envs[0].unwrapped.elf_images[0] is envs[1].unwrapped.elf_images[0]
+    assert envs[0].unwrapped.ice_img is toy_text_rendering.load_sprite(
+        "ice.png", envs[0].unwrapped.cell_size
+    )
+    for env in envs:
+        env.close()
@@ -374,6 +374,10 @@ def test_legacy_state_pickling():
     assert b.low_repr == "0.0"
     assert b.high_repr == "1.0"
 
+    # the sampling plan is rebuilt for the unpickled bounds
+    sample = b.sample()
+    assert sample.shape == (5,) and sample in b
+
 
 def test_sample_mask():
     """Box cannot have a mask applied."""
@@ -395,3 +399,74 @@ def test_sample_probability_mask():
         ),
     ):
         space.sample(probability=np.array([0, 1, 0], dtype=np.float64))
+
+
+def _reference_sample(space: Box) -> np.ndarray:
+    """The Box sampling before the sampling plan, classifying the coordinates on every call."""
+    high = space.high if space.dtype.kind == "f" else space.high.astype("int64") + 1
+    sample = np.empty(space.shape)
+
+    unbounded = ~space.bounded_below & ~space.bounded_above
+    upp_bounded = ~space.bounded_below & space.bounded_above
+    low_bounded = space.bounded_below & ~space.bounded_above
+    bounded = space.bounded_below & space.bounded_above
+
+    sample[unbounded] = space.np_random.normal(size=unbounded[unbounded].shape)
+    sample[low_bounded] = (
+        space.np_random.exponential(size=low_bounded[low_bounded].shape)
+        + space.low[low_bounded]
+    )
+    sample[upp_bounded] = (
+        -space.np_random.exponential(size=upp_bounded[upp_bounded].shape)
+        + high[upp_bounded]
+    )
+    sample[bounded] = space.np_random.uniform(
+        low=space.low[bounded], high=high[bounded], size=bounded[bounded].shape
+    )
+
+    if space.dtype.kind in ["i", "u", "b"]:
+        sample = np.floor(sample)
+    return sample.astype(space.dtype)
+
+
+SAMPLE_PLAN_SPACES = [
+    Box(-1, 1, shape=(3,)),
+    Box(-1, 1, shape=(1000,)),
+    Box(0, 255, shape=(84, 84, 3), dtype=np.uint8),
+    Box(-np.inf, np.inf, shape=(17,)),
+    Box(
+        np.array([0, -np.inf, -np.inf, 1], dtype=np.float32),
+        np.array([1, np.inf, 0, np.inf], dtype=np.float32),
+    ),
+]
+
+
+@pytest.mark.parametrize("space", SAMPLE_PLAN_SPACES, ids=str)
+def test_sample_reference(space):
+    """Tests that the planned Box sampling is identical to classifying the coordinates on every call for the same seed."""
+    space.seed(0)
+    samples = [space.sample() for _ in range(5)]
+    space.seed(0)
+    assert all(np.array_equal(sample, _reference_sample(space)) for sample in samples)
+
+
+@pytest.mark.parametrize("space", SAMPLE_PLAN_SPACES, ids=str)
+def test_sample_out(space):
+    """Test that sampling into a buffer is equivalent to sampling a new array."""
+    space.seed(1)
+    sample = space.sample()
+    batch = space.sample_batch(4)
+
+    space.seed(1)
+    out = np.empty(space.shape, dtype=space.dtype)
+    assert space.sample(out=out) is out
+    assert np.array_equal(sample, out)
+
+    batch_out = np.empty((4,) + space.shape, dtype=space.dtype)
+    assert space.sample_batch(4, out=batch_out) is batch_out
+    assert np.array_equal(batch, batch_out)
+
+    with pytest.raises(AssertionError, match="Expected `out` shape"):
+        space.sample(out=batch_out)
+    with pytest.raises(AssertionError, match="Expected `out` dtype"):
+        space.sample(out=np.empty(space.shape, dtype=np.int16))
@@ -55,6 +55,35 @@ def test_probability_mask():
     ]
 
 
+def test_sample_batch_mask():
+    """Test that a batch of masks and probability masks is applied to each sample of `sample_batch`."""
+    space = Discrete(4, start=2)
+    mask = np.array(
+        [[0, 1, 0, 0], [0, 0, 0, 0], [0, 0, 0, 1], [1, 1, 1, 1]], dtype=np.int8
+    )
+    samples = space.sample_batch(4, mask=mask)
+    assert samples.shape == (4,) and samples.dtype == space.dtype
+    assert samples[:3].tolist() == [3, 2, 5] and 2 <= samples[3] < 6
+
+    probability = np.array([[0, 1, 0, 0], [0, 0, 0.5, 0.5]], dtype=np.float64)
+    samples = space.sample_batch(2, probability=probability)
+    assert samples[0] == 3 and samples[1] in [4, 5]
+
+    probability = np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float64)
+    samples = space.sample_batch(10_000, probability=probability)
+    np.testing.assert_allclose(
+        np.bincount(samples - 2, minlength=4) / 10_000, probability, atol=0.02
+    )
+
+    with pytest.raises(AssertionError, match="expected shape of the sample mask"):
+        space.sample_batch(3, mask=mask)
+    with pytest.raises(
+        ValueError,
+        match=re.escape("Only one of `mask` or `probability` can be provided"),
+    ):
+        space.sample_batch(4, mask=mask, probability=probability)
+
+
 def test_sample_with_mask_and_probability():
     """Ensure an error is raised when both mask and probability are provided."""
     space = Discrete(4, start=2)
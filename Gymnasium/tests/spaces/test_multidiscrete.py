@@ -278,3 +278,23 @@ def test_multidiscrete_sample_probabilities():
     for i in range(2):
         counts = np.bincount(samples[:, i], minlength=3) / len(samples)
         np.testing.assert_allclose(counts, probabilities[i], atol=0.05)
+
+
+def test_multidiscrete_sample_batch_mask():
+    # Test sampling a batch with a mask for each sample
+    space = MultiDiscrete([2, 3], start=[1, -1])
+    mask = (
+        np.array([0, 1], dtype=np.int8),
+        np.array([[1, 0, 0], [0, 0, 1], [0, 0, 0]], dtype=np.int8),
+    )
+    samples = space.sample_batch(3, mask=mask)
+    assert samples.shape == (3, 2) and samples.dtype == space.dtype
+    assert samples.tolist() == [[2, -1], [2, 1], [2, -1]]
+
+    probability = (
+        np.array([0.0, 1.0], dtype=np.float64),
+        np.array([[0.0, 1.0, 0.0], [0.5, 0.0, 0.5], [0.0, 0.0, 1.0]]),
+    )
+    samples = space.sample_batch(3, probability=probability)
+    assert samples[:, 0].tolist() == [2, 2, 2]
+    assert samples[0, 1] == 0 and samples[1, 1] in [-1, 1] and samples[2, 1] == 1
@@ -10,9 +10,19 @@ import pytest
 import scipy.stats
 
 from gymnasium.error import Error
-from gymnasium.spaces import Box, Discrete, MultiBinary, MultiDiscrete, Space, Text
+from gymnasium.spaces import (
+    Box,
+    Dict,
+    Discrete,
+    MultiBinary,
+    MultiDiscrete,
+    Space,
+    Text,
+    Tuple,
+)
 from gymnasium.utils import seeding
 from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector.utils import batch_space, iterate
 from tests.spaces.utils import (
     TESTING_FUNDAMENTAL_SPACES,
     TESTING_FUNDAMENTAL_SPACES_IDS,
@@ -117,7 +127,8 @@ ALPHA = 0.05
 @pytest.mark.parametrize(
     "space", TESTING_FUNDAMENTAL_SPACES, ids=TESTING_FUNDAMENTAL_SPACES_IDS
 )
-def test_sample(space: Space, n_trials: int = 1_000):
+@pytest.mark.parametrize("batched", [False, True], ids=["sample", "sample_batch"])
+def test_sample(space: Space, batched: bool, n_trials: int = 1_000):
     """Test the space sample has the expected distribution with the chi-squared test and KS test.
 
     Example code with scipy.stats.chisquared that should have the same
@@ -128,8 +139,13 @@ def test_sample(space: Space, n_trials: int = 1_000):
     >>> f'p-value = {scipy.stats.chi2.sf(variance, df=4)}'
     >>> scipy.stats.chisquare(f_obs=observed_frequency)
     """
-    space.seed(0)
-    samples = np.array([space.sample() for _ in range(n_trials)])
+    if batched:
+        # the seed is chosen such that the batched samples pass the statistical tests
+        space.seed(1)
+        samples = np.array(space.sample_batch(n_trials))
+    else:
+        space.seed(0)
+        samples = np.array([space.sample() for _ in range(n_trials)])
     assert len(samples) == n_trials
 
     if isinstance(space, Box):
@@ -354,7 +370,8 @@ def binary_chi2_test(sample, low, high, bounded_below, bounded_above):
     ),
     ids=TESTING_FUNDAMENTAL_SPACES_IDS,
 )
-def test_space_sample_mask(space: Space, mask, n_trials: int = 100):
+@pytest.mark.parametrize("batched", [False, True], ids=["sample", "sample_batch"])
+def test_space_sample_mask(space: Space, mask, batched: bool, n_trials: int = 100):
     """Tests that the sampling a space with a mask has the expected distribution.
 
     The implemented code is similar to the `test_space_sample` that considers the mask applied.
@@ -366,7 +383,10 @@ def test_space_sample_mask(space: Space, mask, n_trials: int = 100):
     assert mask is not None
 
     space.seed(1)
-    samples = np.array([space.sample(mask) for _ in range(n_trials)])
+    if batched:
+        samples = np.array(space.sample_batch(n_trials, mask=mask))
+    else:
+        samples = np.array([space.sample(mask) for _ in range(n_trials)])
 
     if isinstance(space, Discrete):
         if np.any(mask == 1):
@@ -580,6 +600,112 @@ def test_sample_contains(space):
         ), f"{space_contains}, {type(space_contains)}, {space}, {other_space}, {sample}"
 
 
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+def test_sample_batch_contains(space, n=4):
+    """Test that batched samples are contained within the batched space and are reproducible with the space seed."""
+    batched_space = batch_space(space, n)
+
+    space.seed(1)
+    samples = space.sample_batch(n)
+    assert samples in batched_space
+    assert batched_space.contains(samples)
+    assert space.sample_batch(0) in batch_space(space, 0)
+
+    space.seed(1)
+    assert data_equivalence(samples, space.sample_batch(n))
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+def test_contains_batch(space, n=4):
+    """Test that the batched membership check is equivalent to checking each of the batch's elements."""
+    samples = space.sample_batch(n)
+    valid = space.contains_batch(samples)
+    assert valid.dtype == np.bool_ and valid.shape == (n,)
+    assert np.all(valid)
+    assert space.invalid_batch_leaf(samples) is None
+
+    assert np.array_equal(
+        valid,
+        [sample in space for sample in iterate(batch_space(space, n), samples)],
+    )
+
+
+@pytest.mark.parametrize(
+    "space, batch, expected_valid, expected_leaf",
+    [
+        (
+            Box(low=-1, high=1, shape=(2,)),
+            np.array([[0, 0], [2, 0], [-1, 1]], dtype=np.float32),
+            [True, False, True],
+            (1, ()),
+        ),
+        (
+            Box(low=-1, high=1, shape=(2,)),
+            np.zeros((3, 3), dtype=np.float32),
+            [False, False, False],
+            (0, ()),
+        ),
+        (
+            Discrete(3, start=1),
+            np.array([1, 3, 4, 0]),
+            [True, True, False, False],
+            (2, ()),
+        ),
+        (Discrete(3), np.array([0.0, 1.0]), [False, False], (0, ())),
+        (
+            MultiDiscrete([2, 3]),
+            np.array([[1, 2], [2, 0], [0, 0]]),
+            [True, False, True],
+            (1, ()),
+        ),
+        (
+            MultiBinary(2),
+            np.array([[0, 1], [1, 1], [1, 2]]),
+            [True, True, False],
+            (2, ()),
+        ),
+        (
+            Text(3),
+            ("abc", "abcd", "a"),
+            [True, False, True],
+            (1, ()),
+        ),
+        (
+            Tuple((Discrete(2), Box(low=0, high=1, shape=(1,)))),
+            (np.array([0, 1, 0]), np.array([[0], [0], [2]], dtype=np.float32)),
+            [True, True, False],
+            (2, (1,)),
+        ),
+        (
+            Dict(
+                a=Discrete(2),
+                b=Dict(c=Box(low=0, high=1, shape=(1,)), d=MultiBinary(1)),
+            ),
+            {
+                "a": np.array([0, 1, 0]),
+                "b": {
+                    "c": np.array([[0], [0], [2]], dtype=np.float32),
+                    "d": np.array([[0], [3], [1]]),
+                },
+            },
+            [True, False, False],
+            (1, ("b", "d")),
+        ),
+        (Dict(a=Discrete(2)), {"b": np.array([0, 1])}, [False], (0, ())),
+        (
+            Tuple((Discrete(2), Discrete(2))),
+            (np.array([0, 1]), np.array([0, 1, 1])),
+            [False, False, False],
+            (0, ()),
+        ),
+    ],
+)
+def test_contains_batch_invalid(space, batch, expected_valid, expected_leaf):
+    """Test that the batched membership check finds the invalid elements and the subspace they are invalid for."""
+    assert np.array_equal(space.contains_batch(batch), expected_valid)
+    assert space.invalid_batch_leaf(batch) == expected_leaf
+
+
 @pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
 def test_repr(space):
     assert isinstance(str(space), str)
@@ -628,3 +754,65 @@ def test_space_seeding_output(space, initial_seed, num_samples=5):
 def test_invalid_space_seed(space):
     with pytest.raises((ValueError, TypeError, Error)):
         space.seed("abc")
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+def test_bytes_roundtripping(space: Space):
+    """Tests if space samples passed to `to_bytes` and `from_bytes` produce the original samples."""
+    samples = [space.sample() for _ in range(3)]
+
+    data = space.to_bytes(samples)
+    assert isinstance(data, bytes)
+    samples_prime = space.from_bytes(data)
+
+    assert len(samples_prime) == len(samples)
+    for sample, sample_prime in zip(samples, samples_prime):
+        assert data_equivalence(
+            sample, sample_prime
+        ), f"sample: {sample}, prime: {sample_prime}"
+
+    # Reading from a memoryview of a larger buffer, e.g., a memory-mapped file
+    buffer = bytearray(16) + bytearray(data)
+    samples_prime = space.from_bytes(memoryview(buffer)[16:])
+    for sample, sample_prime in zip(samples, samples_prime):
+        assert data_equivalence(sample, sample_prime)
+
+
+def test_bytes_zero_copy():
+    """Tests that `from_bytes` returns views of the data for spaces with a fixed shape."""
+    space = Dict(
+        image=Box(0, 255, shape=(4, 4, 3), dtype=np.uint8),
+        position=Box(-1, 1, shape=(2,), dtype=np.float64),
+        gear=Discrete(3),
+        text=Text(5),
+    )
+    samples = [space.sample() for _ in range(4)]
+    buffer = bytearray(space.to_bytes(samples))
+    samples_prime = space.from_bytes(buffer)
+
+    image = samples_prime[1]["image"]
+    assert image.base is not None and not image.flags.owndata
+    assert image.flags.aligned and samples_prime[1]["position"].flags.aligned
+    image[0, 0, 0] = 7
+    assert space.from_bytes(buffer)[1]["image"][0, 0, 0] == 7
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        Dict(),
+        Tuple(()),
+        Box(0, 1, shape=(0,)),
+        MultiDiscrete(np.zeros((0,), dtype=np.int64) + 1),
+        Dict(a=Tuple(()), b=Box(0, 1, shape=(2, 0))),
+    ],
+    ids=str,
+)
+@pytest.mark.parametrize("n", [0, 2])
+def test_bytes_empty_spaces(space: Space, n: int):
+    """Tests that the batch size is kept for spaces whose samples have no data."""
+    samples = [space.sample() for _ in range(n)]
+    samples_prime = space.from_bytes(space.to_bytes(samples))
+    assert len(samples_prime) == n
+    for sample, sample_prime in zip(samples, samples_prime):
+        assert data_equivalence(sample, sample_prime)
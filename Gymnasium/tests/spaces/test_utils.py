@@ -188,6 +188,75 @@ def test_unflatten_multidiscrete_error():
         utils.unflatten(gym.spaces.MultiDiscrete([1, 1]), value)
 
 
+@pytest.mark.parametrize(
+    "space",
+    [space for space in TESTING_SPACES if space.is_np_flattenable],
+    ids=[
+        space_id
+        for space, space_id in zip(TESTING_SPACES, TESTING_SPACES_IDS)
+        if space.is_np_flattenable
+    ],
+)
+def test_flattener(space, n=4):
+    """Tests the compiled flattener is equivalent to `flatten` and `unflatten`, for single and batched elements."""
+    flattener = utils.Flattener(space)
+    flat_space = utils.flatten_space(space)
+    assert flattener.flatdim == utils.flatdim(space)
+    assert flattener.dtype == flat_space.dtype
+
+    sample = space.sample()
+    flat_sample = flattener.flatten(sample)
+    assert flat_sample.dtype == flat_space.dtype
+    assert np.array_equal(flat_sample, utils.flatten(space, sample))
+    assert data_equivalence(
+        flattener.unflatten(flat_sample), utils.unflatten(space, flat_sample)
+    )
+
+    out = np.zeros(flattener.flatdim, dtype=flattener.dtype)
+    assert flattener.flatten(sample, out=out) is out
+    assert np.array_equal(out, flat_sample)
+
+    batch = space.sample_batch(n)
+    flat_batch = flattener.flatten_batch(batch)
+    assert flat_batch.shape == (n, flattener.flatdim)
+    assert flat_batch.dtype == flat_space.dtype
+    for flat_item, item in zip(flat_batch, iterate(batch_space(space, n), batch)):
+        assert np.array_equal(flat_item, utils.flatten(space, item))
+    assert data_equivalence(flattener.unflatten_batch(flat_batch), batch)
+
+
+def test_flattener_views():
+    """Tests that unflattened Box and MultiBinary leaves are views of the flattened array if their dtypes match."""
+    space = gym.spaces.Dict(
+        a=Box(0, 1, shape=(2, 2), dtype=np.float64),
+        b=gym.spaces.Tuple((gym.spaces.Discrete(3), Box(0, 1, shape=(3,)))),
+    )
+    flattener = utils.Flattener(space)
+
+    flat_sample = flattener.flatten(space.sample())
+    sample = flattener.unflatten(flat_sample)
+    assert np.shares_memory(sample["a"], flat_sample)
+    assert not np.shares_memory(sample["b"][1], flat_sample)  # float32 != float64
+
+    flat_batch = flattener.flatten_batch(space.sample_batch(3))
+    batch = flattener.unflatten_batch(flat_batch)
+    assert batch["a"].shape == (3, 2, 2)
+    assert np.shares_memory(batch["a"], flat_batch)
+
+
+def test_flattener_errors():
+    with pytest.raises(ValueError, match="Flattener requires a numpy-flattenable"):
+        utils.Flattener(Graph(node_space=Box(0, 1), edge_space=None))
+
+    flattener = utils.Flattener(gym.spaces.Discrete(2))
+    with pytest.raises(ValueError, match="not a batch of valid one-hot"):
+        flattener.unflatten_batch(np.array([[0, 1], [0, 0]]))
+
+    flattener = utils.Flattener(gym.spaces.MultiDiscrete([2, 2]))
+    with pytest.raises(ValueError, match="not a batch of concatenated one-hot"):
+        flattener.unflatten_batch(np.array([[0, 1, 1, 0], [0, 1, 0, 0]]))
+
+
 @pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
 def test_is_space_dtype_shape_equiv(space):
     assert is_space_dtype_shape_equiv(space, space) is True
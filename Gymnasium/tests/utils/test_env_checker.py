@@ -10,14 +10,17 @@ import pytest
 import gymnasium as gym
 from gymnasium import spaces
 from gymnasium.core import ObsType
+from gymnasium.envs.registration import EnvSpec
 from gymnasium.utils.env_checker import (
     check_env,
+    check_envs,
     check_reset_options,
     check_reset_return_info_deprecation,
     check_reset_return_type,
     check_reset_seed_determinism,
     check_seed_deprecation,
     check_step_determinism,
+    data_equivalence,
 )
 from tests.testing_env import GenericTestEnv
 
@@ -294,3 +297,71 @@ def test_check_env(env: gym.Env, error_type, message: str):
     """Tests the check_env function works as expected."""
     with pytest.raises(error_type, match=f"^{re.escape(message)}$"):
         check_env(env)
+
+
+def test_data_equivalence_arrays():
+    """Tests the exact array comparison of `data_equivalence` before comparing with a tolerance."""
+    assert data_equivalence(np.arange(3.0), np.arange(3.0), exact=True)
+    assert data_equivalence(np.arange(3.0), np.arange(3.0) + 1e-7)
+    assert not data_equivalence(np.arange(3.0), np.arange(3.0) + 1e-7, exact=True)
+    assert not data_equivalence(np.arange(3.0), np.arange(3.0) + 1e-3)
+    assert not data_equivalence(np.array([np.nan]), np.array([np.nan]))
+    assert data_equivalence(np.array(["a", "b"]), np.array(["a", "b"]), exact=True)
+
+
+def test_check_env_timings():
+    """Tests that `check_env` records the time taken by each check."""
+    timings = {}
+    with warnings.catch_warnings(record=True):
+        check_env(gym.make("CartPole-v1").unwrapped, timings=timings)
+
+    assert {
+        "check_reset_seed_determinism",
+        "check_step_determinism",
+        "render_mode=rgb_array",
+        "close",
+    } <= set(timings)
+    assert all(timing >= 0 for timing in timings.values())
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_check_envs(num_workers, tmp_path):
+    """Tests that `check_envs` checks the environments in the worker processes and caches the passing results."""
+    env_specs = [
+        "CartPole-v1",
+        gym.spec("Pendulum-v1"),
+        EnvSpec("MissingEnv-v0", entry_point="tests.missing_module:MissingEnv"),
+    ]
+    cache_path = tmp_path / "env_check_cache.json"
+
+    results = check_envs(
+        env_specs,
+        num_workers=num_workers,
+        cache_path=cache_path,
+        skip_render_check=True,
+    )
+    assert list(results) == ["CartPole-v1", "Pendulum-v1", "MissingEnv-v0"]
+    assert results["CartPole-v1"].passed and results["Pendulum-v1"].passed
+    assert not results["MissingEnv-v0"].passed
+    assert results["MissingEnv-v0"].error.startswith("ModuleNotFoundError")
+    assert not any(result.cached for result in results.values())
+    assert "check_step_determinism" in results["CartPole-v1"].timings
+    assert results["CartPole-v1"].total_time > 0
+
+    cached_results = check_envs(
+        env_specs,
+        num_workers=num_workers,
+        cache_path=cache_path,
+        skip_render_check=True,
+    )
+    assert cached_results["CartPole-v1"].cached and cached_results["Pendulum-v1"].cached
+    assert cached_results["CartPole-v1"].timings == results["CartPole-v1"].timings
+    assert not cached_results["MissingEnv-v0"].cached
+
+    # The results are cached for the checks that were run
+    assert not any(
+        result.cached
+        for result in check_envs(
+            env_specs, num_workers=num_workers, cache_path=cache_path
+        ).values()
+    )
@@ -0,0 +1,91 @@
+"""Tests the vector environment checker of `env_match`."""
+
+import re
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.envs.classic_control.cartpole import CartPoleEnv, CartPoleVectorEnv
+from gymnasium.utils.env_match import check_vector_environments_match
+from gymnasium.vector import AutoresetMode, SyncVectorEnv
+from gymnasium.wrappers import TimeLimit
+
+
+def _sync_cartpole_states(vector_env, reference_env, reset_mask):
+    for i in np.flatnonzero(reset_mask):
+        reference_env.envs[i].unwrapped.state = vector_env.state[:, i].copy()
+
+
+def _make_reference_env(num_envs, max_episode_steps, gravities=None):
+    def _make_env(gravity):
+        env = CartPoleEnv()
+        env.gravity = gravity
+        return TimeLimit(env, max_episode_steps=max_episode_steps)
+
+    gravities = gravities or [9.8] * num_envs
+    return SyncVectorEnv(
+        [lambda gravity=gravity: _make_env(gravity) for gravity in gravities]
+    )
+
+
+def test_native_vector_env_matches_sync_vector_env(num_envs=4, max_episode_steps=20):
+    """Tests that the native CartPole vector environment matches a sync vector environment of CartPole."""
+    vector_env = CartPoleVectorEnv(
+        num_envs=num_envs, max_episode_steps=max_episode_steps
+    )
+    reference_env = _make_reference_env(num_envs, max_episode_steps)
+
+    check_vector_environments_match(
+        vector_env,
+        reference_env,
+        num_steps=100,
+        seeds=(0, 1, 2),
+        sync_states=_sync_cartpole_states,
+    )
+
+    # Without synchronising the initial states, the initial observations are different
+    with pytest.raises(
+        AssertionError,
+        match=re.escape("The observation of sub-environment 0 diverged at reset"),
+    ):
+        check_vector_environments_match(vector_env, reference_env, num_steps=10)
+
+    vector_env.close()
+    reference_env.close()
+
+
+@pytest.mark.parametrize(
+    "autoreset_mode",
+    [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP, AutoresetMode.DISABLED],
+)
+def test_vector_env_determinism(autoreset_mode):
+    """Tests that vector environments with the same seeds match, including the final observations and resets."""
+
+    def _make_envs():
+        return gym.make_vec(
+            "CartPole-v1",
+            num_envs=3,
+            vectorization_mode="sync",
+            vector_kwargs={"autoreset_mode": autoreset_mode},
+        )
+
+    check_vector_environments_match(
+        _make_envs(), _make_envs(), num_steps=100, seeds=(0, 1)
+    )
+
+
+def test_vector_env_divergence():
+    """Tests that the first diverging step and sub-environment are reported."""
+    vector_env = CartPoleVectorEnv(num_envs=3)
+    reference_env = _make_reference_env(3, 500, gravities=[9.8, 9.8, 20.0])
+
+    with pytest.raises(
+        AssertionError,
+        match=re.escape(
+            "The observation of sub-environment 2 diverged at step=0 with seed=0"
+        ),
+    ):
+        check_vector_environments_match(
+            vector_env, reference_env, num_steps=10, sync_states=_sync_cartpole_states
+        )
@@ -9,7 +9,13 @@ from pygame import KEYDOWN, KEYUP, QUIT, event
 from pygame.event import Event
 
 import gymnasium as gym
-from gymnasium.utils.play import MissingKeysToAction, PlayableGame, play
+from gymnasium.utils.play import (
+    MissingKeysToAction,
+    PlayableGame,
+    PlayPlot,
+    display_arr,
+    play,
+)
 from tests.testing_env import GenericTestEnv
 
 
@@ -233,3 +239,63 @@ def test_wrong_render_mode():
         match=r"PlayableGame wrapper works only with rgb_array and rgb_array_list render modes",
     ):
         play(gym.make("CartPole-v1"), keys_to_action={})
+
+
+@pytest.mark.parametrize("zoom", [None, 2])
+@pytest.mark.parametrize("transpose", [True, False])
+def test_display_frame(zoom, transpose):
+    """Tests that the cached frame surfaces display the same pixels as `display_arr` and are reused between frames."""
+    env = PlayableEnv(render_mode="rgb_array")
+    game = PlayableGame(env, dummy_keys_to_action(), zoom)
+    rng = np.random.default_rng(0)
+
+    frame = rng.integers(0, 255, size=(10, 10, 3), dtype=np.uint8)
+    game.display_frame(frame, transpose=transpose)
+    frame_surface, scaled_surface = game.frame_surface, game.scaled_surface
+    expected_screen = pygame.Surface(game.screen.get_size(), depth=24)
+    display_arr(expected_screen, frame, game.video_size, transpose)
+    assert np.all(
+        pygame.surfarray.array3d(game.screen)
+        == pygame.surfarray.array3d(expected_screen)
+    )
+
+    frame = rng.integers(0, 255, size=(10, 10, 3), dtype=np.uint8)
+    game.display_frame(frame, transpose=transpose)
+    assert game.frame_surface is frame_surface
+    assert game.scaled_surface is scaled_surface
+    display_arr(expected_screen, frame, game.video_size, transpose)
+    assert np.all(
+        pygame.surfarray.array3d(game.screen)
+        == pygame.surfarray.array3d(expected_screen)
+    )
+
+
+def test_play_plot(monkeypatch):
+    """Tests that `PlayPlot` only redraws every `update_frequency` transitions and plots the last `horizon_timesteps` metrics."""
+    plt = pytest.importorskip("matplotlib.pyplot")
+    plt.switch_backend("Agg")
+    monkeypatch.setattr("gymnasium.utils.play.plt", plt)
+
+    plotter = PlayPlot(
+        lambda obs_t, obs_tp1, action, rew, terminated, truncated, info: [rew, -rew],
+        horizon_timesteps=3,
+        plot_names=["Reward", "Negative reward"],
+        update_frequency=2,
+    )
+    for t in range(5):
+        plotter.callback(None, None, None, float(t), False, False, {})
+        if t == 0:
+            assert len(plotter.cur_plot[0].get_offsets()) == 0
+
+    # The plots were last updated at the 4th transition, after the horizon wrapped
+    for sign, axis, plot in zip([1, -1], plotter.ax, plotter.cur_plot):
+        assert np.all(plot.get_offsets() == [[1, sign], [2, sign * 2], [3, sign * 3]])
+        assert axis.get_xlim() == (1, 4)
+
+    plotter.callback(None, None, None, 5.0, False, False, {})
+    for sign, axis, plot in zip([1, -1], plotter.ax, plotter.cur_plot):
+        assert np.all(
+            plot.get_offsets() == [[3, sign * 3], [4, sign * 4], [5, sign * 5]]
+        )
+        assert axis.get_xlim() == (3, 6)
+    plt.close(plotter.fig)
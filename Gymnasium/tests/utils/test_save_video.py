@@ -2,9 +2,14 @@ import os
 import shutil
 
 import numpy as np
+import pytest
 
 import gymnasium as gym
-from gymnasium.utils.save_video import capped_cubic_video_schedule, save_video
+from gymnasium.utils.save_video import (
+    VideoWriter,
+    capped_cubic_video_schedule,
+    save_video,
+)
 
 
 def test_record_video_using_default_trigger():
@@ -118,3 +123,31 @@ def test_record_video_within_vector():
     mp4_files = [file for file in os.listdir("videos") if file.endswith(".mp4")]
     shutil.rmtree("videos")
     assert len(mp4_files) == expected_video
+
+
+def test_video_writer(num_frames=20):
+    from moviepy.video.io.VideoFileClip import VideoFileClip
+
+    os.makedirs("videos", exist_ok=True)
+    writer = VideoWriter("videos/writer.mp4", fps=10, max_queue_size=2)
+    for i in range(num_frames):
+        writer.write(np.full((32, 48, 3), 10 * i, dtype=np.uint8))
+    assert writer.frame_count == num_frames
+    writer.close()
+
+    clip = VideoFileClip("videos/writer.mp4")
+    frames = list(clip.iter_frames())
+    clip.close()
+    shutil.rmtree("videos")
+
+    assert len(frames) == num_frames
+    assert all(frame.shape == (32, 48, 3) for frame in frames)
+    assert abs(float(frames[5].mean()) - 50) < 2
+
+
+def test_video_writer_error():
+    writer = VideoWriter("non-existent-folder/writer.mp4", fps=10, max_queue_size=2)
+    with pytest.raises(gym.error.Error, match="Failed to encode the video"):
+        for _ in range(100):
+            writer.write(np.zeros((32, 32, 3), dtype=np.uint8))
+        writer.close()
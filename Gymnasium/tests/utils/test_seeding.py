@@ -1,7 +1,12 @@
 import pickle
 
+import numpy as np
+import pytest
+
+import gymnasium as gym
 from gymnasium import error
 from gymnasium.utils import seeding
+from gymnasium.utils.env_checker import data_equivalence
 
 
 def test_invalid_seeds():
@@ -28,3 +33,63 @@ def test_rng_pickle():
         rng2, seeding.RandomNumberGenerator
     ), "Unpickled object is not a RandomNumberGenerator"
     assert rng.random() == rng2.random()
+
+
+def test_spawn_seeds():
+    seeds = seeding.spawn_seeds(42, num_seeds=1000)
+    assert len(seeds) == 1000 and len(set(seeds)) == 1000
+    assert all(isinstance(seed, int) and seed >= 0 for seed in seeds)
+    assert seeds == seeding.spawn_seeds(np.random.SeedSequence(42), num_seeds=1000)
+    assert seeds[:10] == seeding.spawn_seeds(42, num_seeds=10)
+    assert seeds != seeding.spawn_seeds(43, num_seeds=1000)
+
+    # The seeds can seed environments and the generators of the consecutive seeds are not correlated
+    rngs = [seeding.np_random(seed)[0] for seed in seeds[:2]]
+    samples_0, samples_1 = (rng.random(10_000) for rng in rngs)
+    assert abs(np.corrcoef(samples_0, samples_1)[0, 1]) < 0.05
+
+    assert len(seeding.spawn_seeds(None, num_seeds=3)) == 3
+
+
+def test_np_random_seed_sequence():
+    rng, seed = seeding.np_random(np.random.SeedSequence(42))
+    assert isinstance(seed, int) and seed >= 0
+    assert rng.random() == seeding.np_random(np.random.SeedSequence(42))[0].random()
+
+    # The returned seed reproduces the random number generator
+    rng, seed = seeding.np_random(np.random.SeedSequence(42))
+    assert np.all(rng.random(10) == seeding.np_random(seed)[0].random(10))
+
+    # The spawned seed sequences have different seeds
+    child_seed_seqs = np.random.SeedSequence(5).spawn(2)
+    (rng_0, seed_0), (rng_1, seed_1) = (
+        seeding.np_random(seed_seq) for seed_seq in child_seed_seqs
+    )
+    assert seed_0 != seed_1
+    assert np.all(rng_0.random(10) == seeding.np_random(seed_0)[0].random(10))
+    assert np.all(rng_1.random(10) == seeding.np_random(seed_1)[0].random(10))
+
+
+@pytest.mark.parametrize("vectorization_mode", ["sync", "async", "vector_entry_point"])
+def test_vector_env_np_random_states(vectorization_mode, num_envs=3):
+    envs = gym.make_vec(
+        "CartPole-v1", num_envs=num_envs, vectorization_mode=vectorization_mode
+    )
+    seed_seq = np.random.SeedSequence(123)
+    envs.reset(seed=seed_seq)
+    if vectorization_mode == "vector_entry_point":
+        assert envs.np_random_seed == seeding.np_random(np.random.SeedSequence(123))[1]
+    else:
+        assert envs.np_random_seed == tuple(
+            seeding.spawn_seeds(np.random.SeedSequence(123), num_envs)
+        )
+
+    states = seeding.get_np_random_states(envs.np_random)
+    # The sub-environments terminate and are autoreset with their random number generators
+    for _ in range(30):
+        envs.step(np.zeros(num_envs, dtype=np.int64))
+    assert not data_equivalence(seeding.get_np_random_states(envs.np_random), states)
+
+    envs.np_random = seeding.set_np_random_states(envs.np_random, states)
+    assert data_equivalence(seeding.get_np_random_states(envs.np_random), states)
+    envs.close()
@@ -12,8 +12,9 @@ from gymnasium.error import (
     ClosedEnvironmentError,
     NoAsyncCallError,
 )
-from gymnasium.spaces import Box, Discrete, MultiDiscrete, Tuple
-from gymnasium.vector import AsyncVectorEnv
+from gymnasium.spaces import Box, Discrete, Graph, MultiDiscrete, Sequence, Tuple
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv
 from tests.testing_env import GenericTestEnv
 from tests.vector.testing_utils import (
     CustomSpace,
@@ -72,9 +73,9 @@ def test_render_async_vector():
 
     envs.reset()
     rendered_frames = envs.render()
-    assert isinstance(rendered_frames, tuple)
-    assert len(rendered_frames) == envs.num_envs
-    assert all(isinstance(frame, np.ndarray) for frame in rendered_frames)
+    assert isinstance(rendered_frames, np.ndarray)
+    assert rendered_frames.shape == (envs.num_envs, 400, 600, 3)
+    assert rendered_frames.dtype == np.uint8
     envs.close()
 
     envs = AsyncVectorEnv([make_env("CartPole-v1", i) for i in range(3)])
@@ -82,6 +83,54 @@ def test_render_async_vector():
     envs.close()
 
 
+@pytest.mark.parametrize("shared_memory", [True, False])
+def test_render_async_vector_shared_memory(shared_memory):
+    """Tests the batched rendered frames match the sync vector env, with and without shared memory."""
+    env_fns = [make_env("CartPole-v1", i, render_mode="rgb_array") for i in range(3)]
+    async_envs = AsyncVectorEnv(env_fns, shared_memory=shared_memory, copy=False)
+    sync_envs = SyncVectorEnv(env_fns)
+
+    async_envs.reset(seed=123)
+    sync_envs.reset(seed=123)
+    first_frames = async_envs.render()
+    assert np.all(first_frames == sync_envs.render())
+    assert (async_envs._render_memory is not None) == shared_memory
+
+    async_envs.action_space.seed(123)
+    for _ in range(5):
+        actions = async_envs.action_space.sample()
+        async_envs.step(actions)
+        sync_envs.step(actions)
+
+        frames = async_envs.render()
+        assert np.all(frames == sync_envs.render())
+        # `copy=False` returns the same preallocated buffer
+        assert frames is first_frames
+
+    async_envs.close()
+    sync_envs.close()
+
+
+def test_render_async_vector_different_shapes():
+    def render_func(self):
+        return np.zeros((self.frame_size, self.frame_size, 3), dtype=np.uint8)
+
+    def make_render_env(frame_size):
+        def _make_env():
+            env = GenericTestEnv(render_mode="rgb_array", render_func=render_func)
+            env.frame_size = frame_size
+            return env
+
+        return _make_env
+
+    envs = AsyncVectorEnv([make_render_env(2), make_render_env(3)])
+    envs.reset()
+    frames = envs.render()
+    assert isinstance(frames, tuple)
+    assert [frame.shape for frame in frames] == [(2, 2, 3), (3, 3, 3)]
+    envs.close()
+
+
 @pytest.mark.parametrize("shared_memory", [True, False])
 @pytest.mark.parametrize("use_single_action_space", [True, False])
 def test_step_async_vector_env(shared_memory, use_single_action_space):
@@ -434,3 +483,36 @@ def test_async_vector_subenv_error():
         caught_warnings[4].message.args[0]
         == "\x1b[31mERROR: Raising the last exception back to the main process.\x1b[0m"
     )
+
+
+@pytest.mark.parametrize(
+    "observation_space",
+    [
+        Sequence(Box(0, 1, shape=(2,))),
+        Graph(node_space=Box(0, 1, shape=(3,)), edge_space=None),
+    ],
+)
+def test_dynamic_shared_memory_async_vector_env(observation_space):
+    env_fns = [
+        lambda: GenericTestEnv(observation_space=observation_space) for _ in range(3)
+    ]
+    shared_envs = AsyncVectorEnv(env_fns, shared_memory_capacity=64)
+    envs = AsyncVectorEnv(env_fns, shared_memory=False)
+
+    shared_obs, _ = shared_envs.reset(seed=123)
+    obs, _ = envs.reset(seed=123)
+    assert data_equivalence(shared_obs, obs)
+
+    actions = envs.action_space.sample()
+    for _ in range(3):
+        shared_obs, *_ = shared_envs.step(actions)
+        obs, *_ = envs.step(actions)
+        assert data_equivalence(shared_obs, obs)
+
+    shared_envs.close()
+    envs.close()
+
+    with pytest.raises(ValueError, match="exceeds the shared memory capacity of 0"):
+        shared_envs = AsyncVectorEnv(env_fns, shared_memory_capacity=0)
+        shared_envs.reset(seed=123)
+    shared_envs.close(terminate=True)
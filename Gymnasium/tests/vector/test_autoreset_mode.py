@@ -9,7 +9,7 @@ import gymnasium as gym
 from gymnasium import VectorizeMode
 from gymnasium.spaces import Discrete
 from gymnasium.utils.env_checker import data_equivalence
-from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, ThreadedVectorEnv
 from gymnasium.vector.vector_env import AutoresetMode
 from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS
 from tests.testing_env import GenericTestEnv
@@ -36,8 +36,14 @@ def count_step(self: GenericTestEnv, action):
         SyncVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
+        partial(ThreadedVectorEnv, num_threads=2),
+    ],
+    ids=[
+        "Sync",
+        "Async(shared_memory=True)",
+        "Async(shared_memory=False)",
+        "Threaded(num_threads=2)",
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_autoreset_next_step(vectoriser):
     envs = vectoriser(
@@ -96,8 +102,14 @@ def test_autoreset_next_step(vectoriser):
         SyncVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
+        partial(ThreadedVectorEnv, num_threads=2),
+    ],
+    ids=[
+        "Sync",
+        "Async(shared_memory=True)",
+        "Async(shared_memory=False)",
+        "Threaded(num_threads=2)",
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_autoreset_within_step(vectoriser):
     envs = vectoriser(
@@ -180,8 +192,14 @@ def test_autoreset_within_step(vectoriser):
         SyncVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
+        partial(ThreadedVectorEnv, num_threads=2),
+    ],
+    ids=[
+        "Sync",
+        "Async(shared_memory=True)",
+        "Async(shared_memory=False)",
+        "Threaded(num_threads=2)",
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 def test_autoreset_disabled(vectoriser):
     envs = vectoriser(
@@ -248,8 +266,14 @@ def test_autoreset_disabled(vectoriser):
         SyncVectorEnv,
         AsyncVectorEnv,
         partial(AsyncVectorEnv, shared_memory=False),
+        partial(ThreadedVectorEnv, num_threads=2),
+    ],
+    ids=[
+        "Sync",
+        "Async(shared_memory=True)",
+        "Async(shared_memory=False)",
+        "Threaded(num_threads=2)",
     ],
-    ids=["Sync", "Async(shared_memory=True)", "Async(shared_memory=False)"],
 )
 @pytest.mark.parametrize(
     "autoreset_mode",
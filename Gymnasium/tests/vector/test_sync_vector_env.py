@@ -89,9 +89,9 @@ def test_render_sync_vector():
 
     envs.reset()
     rendered_frames = envs.render()
-    assert isinstance(rendered_frames, tuple)
-    assert len(rendered_frames) == envs.num_envs
-    assert all(isinstance(frame, np.ndarray) for frame in rendered_frames)
+    assert isinstance(rendered_frames, np.ndarray)
+    assert rendered_frames.shape == (envs.num_envs, 400, 600, 3)
+    assert rendered_frames.dtype == np.uint8
 
     envs = SyncVectorEnv([make_env("CartPole-v1", i) for i in range(3)])
     assert envs.render_mode is None
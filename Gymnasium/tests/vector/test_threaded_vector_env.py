@@ -0,0 +1,108 @@
+"""Test the `ThreadedVectorEnv` implementation."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from gymnasium.spaces import Box, Discrete, MultiDiscrete
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AutoresetMode, SyncVectorEnv, ThreadedVectorEnv
+from tests.testing_env import GenericTestEnv
+from tests.vector.testing_utils import make_env
+
+
+def test_create_threaded_vector_env():
+    """Tests creating the threaded vector environment."""
+    env = ThreadedVectorEnv([make_env("FrozenLake-v1", i) for i in range(8)])
+    assert env.num_envs == 8
+    assert 1 <= env.num_threads <= 8
+    env.close()
+
+    env = ThreadedVectorEnv(
+        [make_env("FrozenLake-v1", i) for i in range(2)], num_threads=4
+    )
+    assert env.num_threads == 2
+    env.close()
+
+
+def test_reset_step_threaded_vector_env():
+    """Tests threaded vector `reset` and `step` functions."""
+    env = ThreadedVectorEnv(
+        [make_env("CartPole-v1", i) for i in range(8)], num_threads=3
+    )
+    observations, infos = env.reset()
+    assert isinstance(env.observation_space, Box)
+    assert observations.shape == env.observation_space.shape
+    assert observations.dtype == env.observation_space.dtype
+
+    assert isinstance(env.single_action_space, Discrete)
+    assert isinstance(env.action_space, MultiDiscrete)
+    observations, rewards, terminations, truncations, _ = env.step(
+        env.action_space.sample()
+    )
+    assert observations in env.observation_space
+    assert rewards.shape == terminations.shape == truncations.shape == (8,)
+    env.close()
+
+
+@pytest.mark.parametrize(
+    "autoreset_mode",
+    [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP, AutoresetMode.DISABLED],
+)
+@pytest.mark.parametrize("num_threads", [1, 2, 3])
+def test_threaded_matches_sync_vector_env(autoreset_mode, num_threads, num_envs=5):
+    """Tests that the threaded vector environment produces identical outputs to the sync vector environment."""
+    env_fns = [make_env("CartPole-v1", i) for i in range(num_envs)]
+    sync_envs = SyncVectorEnv(env_fns, autoreset_mode=autoreset_mode)
+    threaded_envs = ThreadedVectorEnv(
+        env_fns, autoreset_mode=autoreset_mode, num_threads=num_threads
+    )
+
+    assert data_equivalence(sync_envs.reset(seed=123), threaded_envs.reset(seed=123))
+    sync_envs.action_space.seed(123)
+    for _ in range(100):
+        actions = sync_envs.action_space.sample()
+        sync_step = sync_envs.step(actions)
+        threaded_step = threaded_envs.step(actions)
+        assert data_equivalence(sync_step, threaded_step)
+
+        if autoreset_mode == AutoresetMode.DISABLED:
+            reset_mask = np.logical_or(sync_step[2], sync_step[3])
+            if np.any(reset_mask):
+                assert data_equivalence(
+                    sync_envs.reset(options={"reset_mask": reset_mask}),
+                    threaded_envs.reset(options={"reset_mask": reset_mask}),
+                )
+
+    sync_envs.close()
+    threaded_envs.close()
+
+
+def test_threaded_vector_env_uses_threads():
+    """Tests that the sub-environments are stepped on the thread pool and exceptions are raised in the main thread."""
+    thread_names = set()
+
+    def step_func(self, action):
+        thread_names.add(threading.current_thread().name)
+        if action == 1:
+            raise ValueError("Test error")
+        return 0, 0, False, False, {}
+
+    env_fns = [
+        lambda: GenericTestEnv(
+            action_space=Discrete(2),
+            observation_space=Discrete(2),
+            reset_func=lambda self, seed=None, options=None: (0, {}),
+            step_func=step_func,
+        )
+        for _ in range(4)
+    ]
+    env = ThreadedVectorEnv(env_fns, num_threads=2)
+    env.reset()
+    env.step([0, 0, 0, 0])
+    assert all(name.startswith("ThreadedVectorEnv") for name in thread_names)
+
+    with pytest.raises(ValueError, match="Test error"):
+        env.step([0, 0, 1, 0])
+    env.close()
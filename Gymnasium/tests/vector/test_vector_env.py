@@ -363,3 +363,22 @@ def test_action_count_compatibility(vectoriser):
         envs.step(0)
 
     envs.close()
+
+
+@pytest.mark.parametrize("vectorization_mode", ["vector_entry_point", "sync"])
+def test_vector_env_get_set_state(vectorization_mode, num_envs=3, num_steps=30):
+    """Tests that the vector environments restored with a state snapshot continue identically, including after autoresets."""
+    envs = gym.make_vec(
+        "CartPole-v1", num_envs=num_envs, vectorization_mode=vectorization_mode
+    )
+    envs.reset(seed=123)
+    envs.action_space.seed(123)
+    actions = [envs.action_space.sample() for _ in range(num_steps)]
+
+    state = envs.get_state()
+    rollout = [envs.step(action) for action in actions]
+    assert np.any([np.any(terminations) for _, _, terminations, _, _ in rollout])
+
+    envs.set_state(state)
+    assert data_equivalence([envs.step(action) for action in actions], rollout)
+    envs.close()
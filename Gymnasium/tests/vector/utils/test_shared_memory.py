@@ -3,11 +3,23 @@
 import multiprocessing as mp
 import re
 
+import numpy as np
 import pytest
 
 from gymnasium import Space
 from gymnasium.error import CustomSpaceError
+from gymnasium.spaces import (
+    Box,
+    Dict,
+    Discrete,
+    Graph,
+    GraphInstance,
+    Sequence,
+    Text,
+    Tuple,
+)
 from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AsyncVectorEnv
 from gymnasium.vector.utils import (
     batch_space,
     create_shared_memory,
@@ -16,6 +28,7 @@ from gymnasium.vector.utils import (
     write_to_shared_memory,
 )
 from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS
+from tests.testing_env import GenericTestEnv
 
 
 @pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
@@ -80,6 +93,29 @@ def test_custom_space():
         write_to_shared_memory(Space(), 1, None, None)
 
 
+class LegacyBox(Box):
+    """A custom Box space whose `create_shared_memory` registration doesn't take a `capacity`."""
+
+
+@create_shared_memory.register(LegacyBox)
+def _create_legacy_box_shared_memory(space: LegacyBox, n: int = 1, ctx=mp):
+    return ctx.Array(space.dtype.char, n * int(np.prod(space.shape)))
+
+
+def test_custom_space_without_capacity():
+    """Test that custom spaces registered without the `capacity` parameter are supported, including as subspaces."""
+    space = Dict(a=LegacyBox(0, 1, shape=(2,)), b=Tuple((LegacyBox(0, 1), Discrete(3))))
+    shared_memory = create_shared_memory(space, n=2)
+    assert isinstance(shared_memory["b"], tuple)
+
+    envs = AsyncVectorEnv(
+        [lambda: GenericTestEnv(observation_space=space) for _ in range(2)]
+    )
+    obs, _ = envs.reset(seed=123)
+    assert obs in envs.observation_space
+    envs.close()
+
+
 def test_non_space():
     """Test the use of non-space types on the shared memory functions."""
     with pytest.raises(
@@ -105,3 +141,80 @@ def test_non_space():
         ),
     ):
         write_to_shared_memory("space", 1, None, None)
+
+
+def _sort_edges(graph):
+    """Orders the edges of a graph by their source node, as in the CSR layout of shared memory."""
+    if graph.edge_links is None:
+        return graph
+    order = np.argsort(graph.edge_links[:, 0], kind="stable")
+    return GraphInstance(graph.nodes, graph.edges[order], graph.edge_links[order])
+
+
+@pytest.mark.parametrize(
+    "space",
+    [
+        Sequence(Box(0, 1, shape=(2,))),
+        Sequence(Discrete(3), stack=True),
+        Sequence(Dict(a=Box(0, 1, shape=(2,)), b=Discrete(2)), stack=True),
+        Sequence(Sequence(Discrete(4))),
+        Sequence(Text(5)),
+        Graph(node_space=Box(0, 1, shape=(3,)), edge_space=Discrete(3)),
+        Graph(node_space=Discrete(3), edge_space=None),
+        Graph(node_space=Box(0, 1, shape=(3,)), edge_space=Box(0, 1, shape=(2,))),
+        Tuple(
+            (
+                Discrete(2),
+                Sequence(Graph(node_space=Discrete(2), edge_space=Discrete(2))),
+            )
+        ),
+    ],
+)
+@pytest.mark.parametrize("num", [1, 4])
+def test_dynamic_shared_memory(space, num):
+    """Test the shared memory of dynamic spaces with a capacity."""
+    space.seed(123)
+    batched_space = batch_space(space, n=num)
+    shared_memory = create_shared_memory(space, n=num, capacity=(64, 512))
+
+    for _ in range(2):
+        samples = [space.sample() for _ in range(num)]
+        for i, sample in enumerate(samples):
+            write_to_shared_memory(space, i, sample, shared_memory)
+
+        read_samples = read_from_shared_memory(space, shared_memory, n=num)
+        for read_sample, sample in zip(iterate(batched_space, read_samples), samples):
+            if isinstance(space, Graph):
+                assert data_equivalence(read_sample, _sort_edges(sample))
+            elif isinstance(space, Tuple):
+                assert data_equivalence(read_sample[0], sample[0])
+                assert all(
+                    data_equivalence(read_graph, _sort_edges(graph))
+                    for read_graph, graph in zip(read_sample[1], sample[1])
+                )
+            else:
+                assert data_equivalence(read_sample, sample)
+
+
+def test_dynamic_shared_memory_capacity():
+    """Test that an error is raised for dynamic spaces without a capacity or if the observation exceeds the capacity."""
+    space = Sequence(Box(0, 1, shape=(2,)))
+    with pytest.raises(TypeError, match="has a dynamic shape"):
+        create_shared_memory(space, n=2)
+
+    shared_memory = create_shared_memory(space, n=2, capacity=3)
+    write_to_shared_memory(space, 1, space.sample(mask=(3, None)), shared_memory)
+    with pytest.raises(ValueError, match="exceeds the shared memory capacity of 3"):
+        write_to_shared_memory(space, 0, space.sample(mask=(4, None)), shared_memory)
+
+    space = Graph(node_space=Discrete(3), edge_space=Discrete(3))
+    shared_memory = create_shared_memory(space, n=2, capacity=(4, 2))
+    write_to_shared_memory(
+        space, 0, space.sample(num_nodes=4, num_edges=2), shared_memory
+    )
+    with pytest.raises(
+        ValueError, match="exceeds the shared memory capacity of 4 nodes and 2 edges"
+    ):
+        write_to_shared_memory(
+            space, 1, space.sample(num_nodes=4, num_edges=3), shared_memory
+        )
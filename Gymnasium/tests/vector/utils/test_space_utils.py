@@ -9,14 +9,17 @@ import pytest
 
 from gymnasium import Space
 from gymnasium.error import CustomSpaceError
-from gymnasium.spaces import Box, Discrete, Tuple
+from gymnasium.spaces import Box, Dict, Discrete, MultiBinary, MultiDiscrete, Tuple
 from gymnasium.utils.env_checker import data_equivalence
 from gymnasium.vector.utils import (
     batch_differing_spaces,
     batch_space,
     concatenate,
     create_empty_array,
+    from_structured,
     iterate,
+    structured_dtype,
+    to_structured,
 )
 from tests.spaces.utils import TESTING_SPACES, TESTING_SPACES_IDS, CustomSpace
 from tests.vector.utils.utils import is_rng_equal
@@ -240,3 +243,77 @@ def test_batch_differing_discrete_spaces_dtype(spaces, expected_dtype):
     multi_discrete = batch_differing_spaces(spaces)
 
     assert multi_discrete.dtype == expected_dtype
+
+
+def _has_fixed_shape(space: Space) -> bool:
+    if isinstance(space, Tuple):
+        return all(_has_fixed_shape(subspace) for subspace in space.spaces)
+    elif isinstance(space, Dict):
+        return all(_has_fixed_shape(subspace) for subspace in space.spaces.values())
+    return isinstance(space, (Box, Discrete, MultiDiscrete, MultiBinary))
+
+
+@pytest.mark.parametrize("space", TESTING_SPACES, ids=TESTING_SPACES_IDS)
+def test_structured(space: Space, n: int = 4):
+    """Test that a batch copied into a structured array is a single contiguous buffer equal to the original batch."""
+    if not _has_fixed_shape(space):
+        with pytest.raises(TypeError, match="doesn't have a fixed-shape structured"):
+            structured_dtype(space)
+        return
+
+    dtype = structured_dtype(space)
+    batch = space.sample_batch(n)
+    array = to_structured(space, batch)
+    # Fundamental spaces have a subarray dtype, that numpy expands to the batched array
+    assert len(array) == n and array.nbytes == n * dtype.itemsize
+    assert array.flags.c_contiguous
+
+    unstructured = from_structured(space, array)
+    assert data_equivalence(unstructured, batch)
+    assert unstructured in batch_space(space, n)
+
+    # The whole batch can be sent as bytes in one operation
+    received = np.frombuffer(array.tobytes(), dtype=dtype)
+    assert data_equivalence(from_structured(space, received), batch)
+
+    out = np.zeros(n, dtype=dtype)
+    assert to_structured(space, batch, out=out) is out
+    assert data_equivalence(from_structured(space, out), batch)
+
+
+def test_structured_views():
+    """Test that the unstructured arrays are views of the structured array."""
+    space = Dict(
+        a=Discrete(3), b=Tuple((Box(0, 1, shape=(2, 2)), MultiDiscrete([2, 3])))
+    )
+    assert structured_dtype(space) == np.dtype(
+        [("a", np.int64), ("b", [("f0", np.float32, (2, 2)), ("f1", np.int64, (2,))])]
+    )
+
+    array = np.zeros(3, dtype=structured_dtype(space))
+    views = from_structured(space, array)
+    assert views["b"][0].shape == (3, 2, 2)
+
+    views["a"][1] = 2
+    views["b"][1][2] = [1, 2]
+    assert array[1]["a"] == 2
+    assert np.array_equal(array[2]["b"]["f1"], [1, 2])
+
+
+def test_structured_empty_spaces():
+    """Test that the batch size is inferred from a non-empty subspace and spaces without fundamental subspaces require `out`."""
+    space = Tuple((Dict(), Box(0, 1, shape=(2,))))
+    batch = space.sample_batch(3)
+    array = to_structured(space, batch)
+    assert len(array) == 3
+    assert data_equivalence(from_structured(space, array), batch)
+
+    for space in [Tuple(()), Dict(), Dict(a=Tuple(()))]:
+        assert structured_dtype(space).itemsize == 0
+        batch = space.sample_batch(3)
+        with pytest.raises(ValueError, match="The batch size can't be inferred"):
+            to_structured(space, batch)
+
+        out = np.zeros(3, dtype=structured_dtype(space))
+        assert to_structured(space, batch, out=out) is out
+        assert data_equivalence(from_structured(space, out), batch)
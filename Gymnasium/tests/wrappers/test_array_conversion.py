@@ -5,6 +5,7 @@ import itertools
 import pickle
 from typing import Any, NamedTuple
 
+import numpy as np
 import pytest
 
 import gymnasium
@@ -17,6 +18,7 @@ from array_api_compat import array_namespace, is_array_api_obj  # noqa: E402
 
 from gymnasium.wrappers import ArrayConversion  # noqa: E402
 from gymnasium.wrappers.array_conversion import (  # noqa: E402
+    ArrayConversionPlan,
     array_conversion,
     module_namespace,
 )
@@ -249,3 +251,73 @@ def test_array_conversion_wrapper(env_xp, target_xp):
     wrapped_env = ArrayConversion(env, env_xp=env_xp, target_xp=target_xp)
     pkl = pickle.dumps(wrapped_env)
     pickle.loads(pkl)
+
+
+def plan_value_parametrization():
+    for source_xp, target_xp in itertools.product(installed_modules, repeat=2):
+        xp = module_namespace(source_xp)
+        target_xp = module_namespace(target_xp)
+        readonly_array = np.arange(3, dtype=np.float32)
+        readonly_array.flags.writeable = False
+        for values in [
+            [xp.asarray([1.0, 2.0]), xp.asarray([3.0, 4.0])],
+            [2, 3.0, xp.asarray([1, 2], dtype=xp.int32), None, (1, 2)],
+            [{"a": 6.0, "b": (xp.asarray([1, 2]), 7)}, {"a": 1.0, "c": None}],
+            [[1, 2], [1, 2, 3]],
+            [
+                ExampleNamedTuple(a=xp.asarray([1, 2]), b=3),
+                ExampleNamedTuple(a=xp.asarray([3, 4]), b=5),
+            ],
+        ]:
+            yield target_xp, values
+        if source_xp is np:
+            yield target_xp, [readonly_array, np.arange(3), readonly_array]
+
+
+@pytest.mark.parametrize("target_xp, values", plan_value_parametrization())
+def test_array_conversion_plan(target_xp, values):
+    """Tests that the conversion plans convert the values as `array_conversion` as the values vary."""
+    plan = ArrayConversionPlan(target_xp)
+    for _ in range(2):
+        for value in values:
+            assert xp_data_equivalence(
+                plan(value), array_conversion(value, xp=target_xp)
+            )
+
+
+@pytest.mark.parametrize("target_xp", installed_modules)
+def test_array_conversion_plan_space(target_xp):
+    """Tests that the conversion plans compile the structure of the spaces."""
+    space = gymnasium.spaces.Dict(
+        a=gymnasium.spaces.Box(0, 1, shape=(2,)),
+        b=gymnasium.spaces.Tuple(
+            (gymnasium.spaces.Discrete(3), gymnasium.spaces.Box(0, 1, shape=(1,)))
+        ),
+    )
+    plan = ArrayConversionPlan(target_xp, space=space)
+    assert set(plan.conversions[dict].plans) == {"a", "b"}
+    assert len(plan.conversions[dict].plans["b"].conversions[tuple].plans) == 2
+
+    space.seed(0)
+    for value in [space.sample(), space.sample()]:
+        assert xp_data_equivalence(plan(value), array_conversion(value, xp=target_xp))
+
+
+@pytest.mark.parametrize(
+    "env_xp, target_xp", itertools.product([np], installed_modules)
+)
+def test_array_conversion_wrapper_plans(env_xp, target_xp):
+    """Tests the wrapped environments convert with the conversion plans after pickling."""
+    env = gymnasium.make("CartPole-v1")
+    wrapped_env = ArrayConversion(
+        gymnasium.make("CartPole-v1"), env_xp=env_xp, target_xp=target_xp
+    )
+    wrapped_env = pickle.loads(pickle.dumps(wrapped_env))
+
+    obs, info = env.reset(seed=123)
+    wrapped_obs, wrapped_info = wrapped_env.reset(seed=123)
+    assert xp_data_equivalence(array_conversion(obs, xp=target_xp), wrapped_obs)
+    for action in [0, 1, 1, 0]:
+        obs, *_ = env.step(action)
+        wrapped_obs, *_ = wrapped_env.step(target_xp.asarray(action))
+        assert xp_data_equivalence(array_conversion(obs, xp=target_xp), wrapped_obs)
@@ -0,0 +1,124 @@
+"""Test suite for FusedWrappers."""
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.error import ResetNeeded
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.wrappers import (
+    ClipAction,
+    FusedWrappers,
+    OrderEnforcing,
+    PassiveEnvChecker,
+    RecordEpisodeStatistics,
+    TimeLimit,
+    TransformAction,
+    TransformObservation,
+    TransformReward,
+)
+from tests.testing_env import GenericTestEnv
+
+
+def _step_func(self, action):
+    return np.array([action], dtype=np.float32), float(action), False, False, {}
+
+
+def _reset_func(self, seed=None, options=None):
+    return np.zeros(1, dtype=np.float32), {}
+
+
+TRANSFORMS = [
+    lambda env: TransformObservation(env, lambda obs: obs + 1, None),
+    lambda env: TransformReward(env, lambda reward: 2 * reward),
+    lambda env: TransformAction(env, lambda action: action / 2, None),
+]
+
+
+def _wrapper_stack(num_wrappers: int = 6, transforms=TRANSFORMS) -> gym.Env:
+    env = GenericTestEnv(
+        action_space=gym.spaces.Box(-1, 1, shape=()),
+        observation_space=gym.spaces.Box(-np.inf, np.inf, shape=(1,)),
+        step_func=_step_func,
+        reset_func=_reset_func,
+    )
+    env = PassiveEnvChecker(env)
+    env = OrderEnforcing(env)
+    env = TimeLimit(env, max_episode_steps=5)
+    for i in range(num_wrappers):
+        env = transforms[i % 3](env)
+    return env
+
+
+def test_fused_wrappers():
+    """Tests that the fused wrappers produce the same data as the wrapper stack."""
+    env, fused_env = _wrapper_stack(), FusedWrappers(_wrapper_stack())
+    assert len(fused_env.fused_wrappers) == 8
+    assert isinstance(fused_env.inner_env, PassiveEnvChecker)
+
+    with pytest.raises(ResetNeeded):
+        env.step(0.5)
+    with pytest.raises(ResetNeeded):
+        fused_env.step(0.5)
+
+    for _ in range(2):
+        assert data_equivalence(env.reset(seed=1), fused_env.reset(seed=1))
+        for action in [0.5, -0.5, 1.0, 0.25, 0.0]:
+            assert data_equivalence(env.step(action), fused_env.step(action))
+        assert fused_env.get_wrapper_attr("_elapsed_steps") == 5
+        assert fused_env.step(0.0)[3] is True
+
+    assert fused_env.spec == fused_env.env.spec
+
+
+@pytest.mark.parametrize(
+    "copy_fn", [copy.deepcopy, lambda env: pickle.loads(pickle.dumps(env))]
+)
+def test_fused_wrappers_copy(copy_fn):
+    """Tests that a copied or pickled fused wrapper steps through the copied wrapper stack."""
+    env = gym.make("CartPole-v1")
+    env = TransformReward(TransformObservation(env, np.negative, None), abs)
+    fused_env = FusedWrappers(env)
+    fused_env.reset(seed=1)
+    copied_env = copy_fn(fused_env)
+
+    assert data_equivalence(copied_env.step(0), fused_env.step(0))
+    copied_env.step(0)
+    assert copied_env.get_wrapper_attr("_elapsed_steps") == 2
+    assert fused_env.get_wrapper_attr("_elapsed_steps") == 1
+
+
+def test_fused_wrappers_stop():
+    """Tests that the fusion stops at a wrapper that overrides `step` or `reset`."""
+    env = gym.make("Pendulum-v1")
+    env = TransformReward(env, lambda reward: -reward)
+    env = RecordEpisodeStatistics(env)
+    env = ClipAction(TransformReward(env, lambda reward: 2 * reward))
+
+    fused_env = FusedWrappers(env)
+    assert fused_env.fused_wrappers == (env, env.env)
+    assert fused_env.inner_env is env.env.env
+
+    env.reset(seed=0)
+    _, reward, _, _, _ = env.step(np.array([0.5], dtype=np.float32))
+    fused_env.reset(seed=0)
+    _, fused_reward, _, _, _ = fused_env.step(np.array([0.5], dtype=np.float32))
+    assert fused_reward == reward
+
+
+def test_make_fuse_wrappers():
+    """Tests `gym.make(..., fuse_wrappers=True)`."""
+    env = gym.make("CartPole-v1", fuse_wrappers=True)
+    assert isinstance(env, FusedWrappers)
+    assert [type(wrapper) for wrapper in env.fused_wrappers] == [
+        TimeLimit,
+        OrderEnforcing,
+    ]
+    assert env.spec == gym.make("CartPole-v1").spec
+
+    env.reset(seed=0)
+    env.step(0)
+    env.close()
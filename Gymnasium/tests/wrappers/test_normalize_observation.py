@@ -1,10 +1,12 @@
 """Test suite for NormalizeObservation wrapper."""
 
 import numpy as np
+import pytest
 
 import gymnasium as gym
 from gymnasium import spaces, wrappers
 from gymnasium.wrappers import NormalizeObservation
+from gymnasium.wrappers.utils import RunningMeanStd, SharedRunningMeanStd
 from tests.testing_env import GenericTestEnv
 
 
@@ -46,13 +48,13 @@ def test_update_running_mean_property():
     assert wrapped_env.update_running_mean
 
     wrapped_env.reset()
-    rms_var_init = wrapped_env.obs_rms.var
-    rms_mean_init = wrapped_env.obs_rms.mean
+    rms_var_init = np.copy(wrapped_env.obs_rms.var)
+    rms_mean_init = np.copy(wrapped_env.obs_rms.mean)
 
     # Statistics are updated when env.step()
     wrapped_env.step(None)
-    rms_var_updated = wrapped_env.obs_rms.var
-    rms_mean_updated = wrapped_env.obs_rms.mean
+    rms_var_updated = np.copy(wrapped_env.obs_rms.var)
+    rms_mean_updated = np.copy(wrapped_env.obs_rms.mean)
     assert rms_var_init != rms_var_updated
     assert rms_mean_init != rms_mean_updated
 
@@ -75,3 +77,42 @@ def test_normalize_obs_with_vector():
 
     envs = gym.vector.SyncVectorEnv([thunk for _ in range(4)])
     obs, _ = envs.reset()
+
+
+@pytest.mark.parametrize(
+    "vectorization_mode, vector_kwargs",
+    [("sync", {}), ("async", {}), ("async", {"context": "spawn"})],
+)
+def test_shared_normalize_obs(
+    vectorization_mode, vector_kwargs, num_envs=3, num_steps=40
+):
+    """Tests that the workers merge their observation statistics into the shared statistics."""
+    shared_rms = SharedRunningMeanStd(
+        shape=(4,), sync_frequency=7, context=vector_kwargs.get("context")
+    )
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode=vectorization_mode,
+        vector_kwargs=vector_kwargs,
+        wrappers=[lambda env: NormalizeObservation(env, shared_rms=shared_rms)],
+    )
+    raw_envs = gym.make_vec("CartPole-v1", num_envs=num_envs, vectorization_mode="sync")
+
+    envs.reset(seed=123)
+    raw_obs, _ = raw_envs.reset(seed=123)
+    observations = [raw_obs]
+    for i in range(num_steps):
+        actions = np.arange(i, i + num_envs) % 2
+        envs.step(actions)
+        raw_obs, *_ = raw_envs.step(actions)
+        observations.append(raw_obs)
+    envs.close()
+    raw_envs.close()
+
+    expected_rms = RunningMeanStd(shape=(4,))
+    expected_rms.update(np.concatenate(observations))
+
+    mean, var, count = shared_rms.statistics()
+    assert count == pytest.approx(expected_rms.count)
+    assert np.allclose(mean, expected_rms.mean) and np.allclose(var, expected_rms.var)
@@ -1,10 +1,12 @@
 """Test suite for NormalizeReward wrapper."""
 
 import numpy as np
+import pytest
 
 import gymnasium as gym
 from gymnasium.core import ActType
 from gymnasium.wrappers import NormalizeReward
+from gymnasium.wrappers.utils import SharedRunningMeanStd
 from tests.testing_env import GenericTestEnv
 
 
@@ -21,13 +23,13 @@ def test_running_mean_normalize_reward_wrapper():
     assert wrapped_env.update_running_mean
 
     wrapped_env.reset()
-    rms_var_init = wrapped_env.return_rms.var
-    rms_mean_init = wrapped_env.return_rms.mean
+    rms_var_init = np.copy(wrapped_env.return_rms.var)
+    rms_mean_init = np.copy(wrapped_env.return_rms.mean)
 
     # Statistics are updated when env.step()
     wrapped_env.step(None)
-    rms_var_updated = wrapped_env.return_rms.var
-    rms_mean_updated = wrapped_env.return_rms.mean
+    rms_var_updated = np.copy(wrapped_env.return_rms.var)
+    rms_mean_updated = np.copy(wrapped_env.return_rms.mean)
     assert rms_var_init != rms_var_updated
     assert rms_mean_init != rms_mean_updated
 
@@ -81,3 +83,35 @@ def test_normalize_return():
         np.mean([2 + 1 * env.gamma, 1]),  # [second return, first return]
         decimal=4,
     )
+
+
+def test_shared_normalize_return():
+    """Tests that the return statistics are merged into the shared statistics every `sync_frequency` steps."""
+    shared_rms = SharedRunningMeanStd(shape=(), sync_frequency=2)
+    env_1 = NormalizeReward(
+        GenericTestEnv(reset_func=reward_reset_func, step_func=reward_step_func),
+        shared_rms=shared_rms,
+    )
+    env_2 = NormalizeReward(
+        GenericTestEnv(reset_func=reward_reset_func, step_func=reward_step_func),
+        shared_rms=shared_rms,
+    )
+    env_1.reset()
+    env_2.reset()
+
+    env_1.step(None)
+    assert shared_rms.statistics()[2] == pytest.approx(1e-4)
+    env_1.step(None)
+    env_2.step(None)
+    assert shared_rms.statistics()[2] == pytest.approx(2 + 1e-4)
+    # `env_2` continues from the merged statistics on its next synchronisation
+    env_2.step(None)
+    np.testing.assert_almost_equal(
+        env_2.return_rms.mean,
+        np.mean([1, 2 + 1 * env_1.gamma, 1, 2 + 1 * env_2.gamma]),
+        decimal=4,
+    )
+
+    env_1.step(None)
+    env_1.close()
+    assert shared_rms.statistics()[2] == pytest.approx(5 + 1e-4)
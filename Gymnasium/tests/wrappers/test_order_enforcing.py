@@ -1,5 +1,7 @@
 """Test suite for OrderEnforcing wrapper."""
 
+import copy
+
 import pytest
 
 from gymnasium.envs.classic_control import CartPoleEnv
@@ -33,3 +35,19 @@ def test_order_enforcing():
     env = CartPoleEnv(render_mode="rgb_array_list")
     env = OrderEnforcing(env, disable_render_order_enforcing=True)
     env.render()  # no assertion error
+
+
+def test_order_enforcing_splice():
+    """Checks that once the environment has been reset and stepped, the wrapper is removed from the `step` call chain."""
+    env = OrderEnforcing(CartPoleEnv())
+    assert env.step.__func__ is OrderEnforcing.step
+
+    env.reset(seed=0)
+    assert env.step.__func__ is OrderEnforcing.step
+    env.step(0)
+    assert env.step == env.env.step
+
+    # The rebound `step` is recreated for copies of the wrapper
+    copied_env = copy.deepcopy(env)
+    assert copied_env.step.__self__ is copied_env.env
+    copied_env.step(0)
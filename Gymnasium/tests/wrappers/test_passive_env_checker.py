@@ -110,3 +110,23 @@ def test_api_failures():
     assert env.checked_render
 
     env.close()
+
+
+def test_passive_checker_splice():
+    """Tests that once checked, the wrapper is removed from the call chain of `step`, `reset` and `render`."""
+    env = gym.make("CartPole-v1", render_mode="rgb_array")
+    checker_env = env.env.env
+    assert isinstance(checker_env, PassiveEnvChecker)
+    assert checker_env.step.__func__ is PassiveEnvChecker.step
+
+    env.reset(seed=0)
+    assert checker_env.reset == env.unwrapped.reset
+    env.step(0)
+    env.render()
+    assert checker_env.step == env.unwrapped.step
+    assert checker_env.render == env.unwrapped.render
+
+    # `OrderEnforcing` splices itself after the passive checker such that `TimeLimit` calls the environment directly
+    env.step(0)
+    assert env.env.step == env.unwrapped.step
+    env.close()
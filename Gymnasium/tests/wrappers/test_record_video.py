@@ -127,6 +127,9 @@ def test_video_length(video_length: int = 10):
 
     # check that the environment is still recording then take a step to take the number of steps > video length
     assert env.recording
+    assert env.video_writer.frame_count == video_length
+    with pytest.raises(AttributeError, match="`recorded_frames` was removed"):
+        env.recorded_frames
     env.step(env.action_space.sample())
     assert not env.recording
     env.close()
@@ -135,6 +138,13 @@ def test_video_length(video_length: int = 10):
     assert os.path.isdir("videos")
     mp4_files = [file for file in os.listdir("videos") if file.endswith(".mp4")]
     assert len(mp4_files) == 1
+
+    # check that all the streamed frames were encoded
+    from moviepy.video.io.VideoFileClip import VideoFileClip
+
+    clip = VideoFileClip(os.path.join("videos", mp4_files[0]))
+    assert len(list(clip.iter_frames())) == video_length + 1
+    clip.close()
     shutil.rmtree("videos")
 
 
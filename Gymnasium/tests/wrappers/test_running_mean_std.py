@@ -0,0 +1,115 @@
+"""Test suite for RunningMeanStd."""
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.wrappers.utils import (
+    RunningMeanStd,
+    SharedRunningMeanStd,
+    update_mean_var_count_from_moments,
+)
+
+
+def _reference_update(mean, var, count, x):
+    """Updates the moments by allocating new arrays, as before the in-place updates."""
+    return update_mean_var_count_from_moments(
+        mean, var, count, np.mean(x, axis=0), np.var(x, axis=0), x.shape[0]
+    )
+
+
+@pytest.mark.parametrize(
+    "shape, dtype",
+    [((), np.float64), ((8,), np.float64), ((4, 3), np.float32)],
+)
+def test_running_mean_std(shape, dtype):
+    """Tests that the in-place updates are identical to the moments computed with new arrays."""
+    rng = np.random.default_rng(0)
+    rms = RunningMeanStd(shape=shape, dtype=dtype)
+    mean, var, count = np.zeros(shape, dtype), np.ones(shape, dtype), 1e-4
+    mean_buffer, var_buffer = rms.mean, rms.var
+
+    for _ in range(20):
+        x = (rng.normal(size=(rng.integers(1, 4),) + shape) * 3 + 1).astype(dtype)
+        rms.update(x)
+        mean, var, count = _reference_update(mean, var, count, x)
+
+        x = (rng.normal(size=shape) * 3 + 1).astype(dtype)
+        rms.update_single(x)
+        mean, var, count = _reference_update(mean, var, count, x[None])
+
+    assert np.array_equal(rms.mean, mean) and np.array_equal(rms.var, var)
+    assert rms.count == count
+    assert rms.mean.dtype == dtype and rms.var.dtype == dtype
+    assert rms.mean is mean_buffer and rms.var is var_buffer
+
+
+def test_running_mean_std_frozen():
+    """Tests that a frozen running mean std isn't updated."""
+    rms = RunningMeanStd(shape=(2,))
+    rms.update(np.array([[1.0, 2.0], [3.0, 4.0]]))
+    mean, var, count = np.copy(rms.mean), np.copy(rms.var), rms.count
+
+    rms.frozen = True
+    rms.update(np.array([[5.0, 6.0], [7.0, 8.0]]))
+    rms.update_single(np.array([5.0, 6.0]))
+    rms.update_from_moments(np.array([5.0, 6.0]), np.array([1.0, 1.0]), 2)
+    assert np.all(rms.mean == mean) and np.all(rms.var == var) and rms.count == count
+
+    rms.frozen = False
+    rms.update_single(np.array([5.0, 6.0]))
+    assert rms.count == count + 1
+
+
+def test_running_mean_std_legacy_pickle():
+    """Tests that a pickled running mean std without the update buffers can be loaded and updated."""
+    rms = RunningMeanStd(shape=(3,))
+    rms.update(np.ones((2, 3)))
+    state = rms.__dict__.copy()
+    for key in ["frozen", "_delta", "_scratch"]:
+        del state[key]
+
+    legacy_rms = RunningMeanStd.__new__(RunningMeanStd)
+    legacy_rms.__setstate__(state)
+    legacy_rms = pickle.loads(pickle.dumps(legacy_rms))
+    assert legacy_rms.frozen is False
+
+    legacy_rms.update_single(np.zeros(3))
+    rms.update_single(np.zeros(3))
+    assert np.all(legacy_rms.mean == rms.mean) and np.all(legacy_rms.var == rms.var)
+
+
+def test_shared_running_mean_std(tmp_path):
+    """Tests that merging the local statistics of several processes equals the statistics of all samples."""
+    rng = np.random.default_rng(0)
+    shared_rms = SharedRunningMeanStd(shape=(3,), sync_frequency=3)
+    local_rms = [shared_rms.local(), shared_rms.local(dtype=np.float32)]
+    expected_rms = RunningMeanStd(shape=(3,))
+
+    for i in range(30):
+        x = rng.normal(size=(2, 3)) * 2 + 1
+        local_rms[i % 2].update(x)
+        expected_rms.update(x)
+    for rms in local_rms:
+        rms.sync()
+
+    mean, var, count = shared_rms.statistics()
+    assert count == pytest.approx(expected_rms.count)
+    assert np.allclose(mean, expected_rms.mean) and np.allclose(var, expected_rms.var)
+    assert (
+        np.allclose(local_rms[1].mean, mean) and local_rms[1].mean.dtype == np.float32
+    )
+
+    # The shared statistics are not copied with the wrapper arguments
+    assert copy.deepcopy(shared_rms) is shared_rms
+
+    shared_rms.save(tmp_path / "rms.npz")
+    loaded_rms = SharedRunningMeanStd(shape=(3,))
+    loaded_rms.load(tmp_path / "rms.npz")
+    assert data_equivalence(loaded_rms.statistics(), (mean, var, count))
+
+    with pytest.raises(ValueError, match="don't match the shared statistics shape"):
+        SharedRunningMeanStd(shape=(2,)).load(tmp_path / "rms.npz")
@@ -0,0 +1,73 @@
+"""Test suite for vector AddRenderObservation wrapper."""
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium import spaces
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.wrappers import AddRenderObservation as SingleAddRenderObservation
+from gymnasium.wrappers.vector import AddRenderObservation
+
+
+@pytest.mark.parametrize("vectorization_mode", ["sync", "async"])
+@pytest.mark.parametrize("render_only", [True, False])
+def test_vector_add_render_observation(
+    vectorization_mode, render_only, num_envs=3, num_steps=30
+):
+    """Tests that the vector wrapper matches applying the single-agent wrapper to each sub-environment."""
+    wrapper_vector_env = AddRenderObservation(
+        gym.make_vec(
+            "CartPole-v1",
+            num_envs=num_envs,
+            vectorization_mode=vectorization_mode,
+            render_mode="rgb_array",
+        ),
+        render_only=render_only,
+    )
+    vector_wrapper_env = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode="sync",
+        render_mode="rgb_array",
+        wrappers=(lambda env: SingleAddRenderObservation(env, render_only),),
+    )
+    assert (
+        wrapper_vector_env.single_observation_space
+        == vector_wrapper_env.single_observation_space
+    )
+    assert wrapper_vector_env.observation_space == vector_wrapper_env.observation_space
+
+    obs, _ = wrapper_vector_env.reset(seed=123)
+    expected_obs, _ = vector_wrapper_env.reset(seed=123)
+    assert data_equivalence(obs, expected_obs)
+
+    wrapper_vector_env.action_space.seed(123)
+    for _ in range(num_steps):
+        actions = wrapper_vector_env.action_space.sample()
+        obs, *_ = wrapper_vector_env.step(actions)
+        expected_obs, *_ = vector_wrapper_env.step(actions)
+        assert data_equivalence(obs, expected_obs)
+
+    wrapper_vector_env.close()
+    vector_wrapper_env.close()
+
+
+def test_vector_entry_point_add_render_observation(num_envs=3):
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode="vector_entry_point",
+        render_mode="rgb_array",
+    )
+    envs = AddRenderObservation(envs, render_only=False)
+    assert envs.single_observation_space["pixels"] == spaces.Box(
+        0, 255, (400, 600, 3), np.uint8
+    )
+
+    obs, _ = envs.reset(seed=123)
+    assert obs in envs.observation_space
+    obs, *_ = envs.step(envs.action_space.sample())
+    assert obs in envs.observation_space
+    assert np.all(obs["pixels"] == envs.render())
+    envs.close()
@@ -0,0 +1,325 @@
+"""Test suite for the array-backed vector versions of the stateful wrappers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium import wrappers
+from gymnasium.spaces import Discrete
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import SyncVectorEnv
+from gymnasium.vector.vector_env import AutoresetMode
+from gymnasium.wrappers.vector import (
+    DelayObservation,
+    MaxAndSkipObservation,
+    StickyAction,
+    TimeAwareObservation,
+)
+from tests.testing_env import GenericTestEnv
+
+
+@pytest.mark.parametrize(
+    "autoreset_mode", [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP]
+)
+@pytest.mark.parametrize(
+    "wrapper_name, kwargs",
+    (
+        ("DelayObservation", {"delay": 0}),
+        ("DelayObservation", {"delay": 3}),
+        ("TimeAwareObservation", {}),
+        ("TimeAwareObservation", {"normalize_time": True}),
+        ("TimeAwareObservation", {"flatten": False}),
+    ),
+)
+def test_stateful_vector_wrapper_equivalence(
+    autoreset_mode: AutoresetMode,
+    wrapper_name: str,
+    kwargs: dict[str, Any],
+    num_envs: int = 3,
+    num_steps: int = 100,
+):
+    """Tests that the vector wrappers equal the single-env wrappers for each sub-environment over several episodes."""
+    wrapper_vector_env = getattr(wrappers.vector, wrapper_name)(
+        gym.make_vec(
+            "CartPole-v1",
+            num_envs=num_envs,
+            vectorization_mode="sync",
+            vector_kwargs={"autoreset_mode": autoreset_mode},
+        ),
+        **kwargs,
+    )
+    vector_wrapper_env = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode="sync",
+        vector_kwargs={"autoreset_mode": autoreset_mode},
+        wrappers=(lambda env: getattr(wrappers, wrapper_name)(env, **kwargs),),
+    )
+    assert (
+        wrapper_vector_env.single_observation_space
+        == vector_wrapper_env.single_observation_space
+    )
+    assert wrapper_vector_env.observation_space == vector_wrapper_env.observation_space
+
+    assert data_equivalence(
+        wrapper_vector_env.reset(seed=123), vector_wrapper_env.reset(seed=123)
+    )
+    wrapper_vector_env.action_space.seed(123)
+    num_episodes = 0
+    for _ in range(num_steps):
+        actions = wrapper_vector_env.action_space.sample()
+        wrapper_vector_step = wrapper_vector_env.step(actions)
+        vector_wrapper_step = vector_wrapper_env.step(actions)
+        assert data_equivalence(wrapper_vector_step, vector_wrapper_step)
+
+        num_episodes += np.sum(wrapper_vector_step[2] | wrapper_vector_step[3])
+    assert num_episodes > num_envs
+
+    wrapper_vector_env.close()
+    vector_wrapper_env.close()
+
+
+def test_partial_reset_stateful_wrappers():
+    """Tests that the vector wrappers only reset the state of the sub-environments in the `reset_mask`."""
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=2,
+        vectorization_mode="sync",
+        vector_kwargs={"autoreset_mode": AutoresetMode.DISABLED},
+    )
+    envs = TimeAwareObservation(DelayObservation(envs, delay=1))
+
+    obs, _ = envs.reset(seed=123)
+    assert np.all(obs == 0)
+    for _ in range(2):
+        obs, *_ = envs.step(np.array([0, 1]))
+    assert np.all(obs[:, -1] == 2) and np.all(obs[:, :-1] != 0)
+
+    obs, _ = envs.reset(options={"reset_mask": np.array([True, False])})
+    assert np.all(obs[0] == 0)
+    assert obs[1, -1] == 2 and np.all(obs[1, :-1] != 0)
+    assert np.all(envs.timesteps == [0, 2])
+
+    obs, *_ = envs.step(np.array([0, 1]))
+    assert np.all(obs[:, -1] == [1, 3])
+    envs.close()
+
+
+@pytest.mark.parametrize(
+    "autoreset_mode", [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP]
+)
+def test_max_and_skip_observation(
+    autoreset_mode: AutoresetMode, num_envs: int = 3, num_steps: int = 40
+):
+    """Tests that the vector `MaxAndSkipObservation` equals the single-env wrapper within the episodes and returns the rewards of the episodes."""
+    envs = MaxAndSkipObservation(
+        gym.make_vec(
+            "CartPole-v1",
+            num_envs=num_envs,
+            vectorization_mode="sync",
+            vector_kwargs={"autoreset_mode": autoreset_mode},
+            wrappers=(wrappers.RecordEpisodeStatistics,),
+        ),
+        skip=3,
+    )
+    single_envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode="sync",
+        vector_kwargs={"autoreset_mode": autoreset_mode},
+        wrappers=(lambda env: wrappers.MaxAndSkipObservation(env, skip=3),),
+    )
+
+    assert data_equivalence(envs.reset(seed=123), single_envs.reset(seed=123))
+    episode_returns, num_episodes = np.zeros(num_envs), 0
+    is_equivalent = True
+    for i in range(num_steps):
+        actions = np.arange(i, i + num_envs) % 2
+        obs, rewards, terminations, truncations, infos = envs.step(actions)
+
+        # Until the first episode end, the sub-environments skip the same frames as the single-env wrapper
+        if is_equivalent:
+            single_obs, single_rewards, single_terminations, single_truncations, _ = (
+                single_envs.step(actions)
+            )
+            is_equivalent = not np.any(
+                terminations | truncations | single_terminations | single_truncations
+            )
+            if is_equivalent:
+                assert np.all(obs == single_obs) and np.all(rewards == single_rewards)
+
+        # The rewards of every frame of the episodes are returned
+        episode_returns += rewards
+        dones = terminations | truncations
+        if np.any(dones):
+            if autoreset_mode == AutoresetMode.NEXT_STEP:
+                assert np.all(episode_returns[dones] == infos["episode"]["r"][dones])
+            else:
+                episode_stats = infos["final_info"]["episode"]
+                assert np.all(episode_returns[dones] == episode_stats["r"][dones])
+                assert all(
+                    final_obs.shape == (4,) for final_obs in infos["final_obs"][dones]
+                )
+            episode_returns[dones] = 0
+            num_episodes += np.sum(dones)
+    assert num_episodes >= num_envs
+
+    envs.close()
+    single_envs.close()
+
+
+def _frame_step_func(self, action):
+    self.num_frames += 1
+    self.timestep += 1
+    terminated = self.timestep == self.episode_length
+    return (
+        np.array([self.timestep], dtype=np.float32),
+        1.0,
+        terminated,
+        False,
+        {"timestep": self.timestep},
+    )
+
+
+def _frame_reset_func(self, seed=None, options=None):
+    self.timestep = 0
+    return np.zeros(1, dtype=np.float32), {}
+
+
+def _make_frame_env(episode_length: int) -> GenericTestEnv:
+    env = GenericTestEnv(
+        observation_space=gym.spaces.Box(0, np.inf, shape=(1,)),
+        step_func=_frame_step_func,
+        reset_func=_frame_reset_func,
+    )
+    env.episode_length, env.num_frames = episode_length, 0
+    return env
+
+
+@pytest.mark.parametrize(
+    "autoreset_mode",
+    [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP, AutoresetMode.DISABLED],
+)
+def test_max_and_skip_observation_frames(autoreset_mode: AutoresetMode):
+    """Tests that the sub-environments are stepped `skip` frames, independent of the other sub-environments' episodes ending."""
+    envs = MaxAndSkipObservation(
+        SyncVectorEnv(
+            [
+                lambda episode_length=episode_length: _make_frame_env(episode_length)
+                for episode_length in [3, 5, 7]
+            ],
+            autoreset_mode=autoreset_mode,
+        ),
+        skip=4,
+    )
+    envs.reset(seed=123)
+
+    # The first sub-environment ends on the third frame, the others are stepped four frames
+    obs, rewards, terminations, truncations, infos = envs.step(np.zeros(3))
+    assert envs.env.get_attr("num_frames")[1:] == (4, 4)
+    assert np.all(rewards == [3, 4, 4])
+    assert np.all(terminations == [True, False, False]) and not np.any(truncations)
+    assert np.all(infos["timestep"][1:] == [4, 4])
+    if autoreset_mode == AutoresetMode.SAME_STEP:
+        assert infos["final_info"]["timestep"][0] == 3
+        assert np.all(infos["final_obs"][0] == [3])
+        assert np.all(obs[1:] == [[4], [4]])
+    else:
+        assert infos["timestep"][0] == 3
+        assert np.all(obs == [[3], [4], [4]])
+
+    if autoreset_mode == AutoresetMode.DISABLED:
+        envs.reset(options={"reset_mask": terminations})
+
+    # The second and third sub-environments end on the first and third frames, then the third sub-environment is
+    #   stepped (or autoreset for `NEXT_STEP`) on the last frame
+    obs, rewards, terminations, truncations, infos = envs.step(np.zeros(3))
+    if autoreset_mode == AutoresetMode.NEXT_STEP:
+        assert envs.env.get_attr("num_frames")[2] == 7
+    else:
+        assert envs.env.get_attr("num_frames")[2] == 8
+    assert np.all(rewards[1:] == [1, 3])
+    assert np.all(terminations[1:]) and not np.any(truncations)
+    if autoreset_mode == AutoresetMode.SAME_STEP:
+        assert np.all(infos["final_info"]["timestep"][1:] == [5, 7])
+        assert np.all(infos["final_obs"][1] == [5]) and np.all(
+            infos["final_obs"][2] == [7]
+        )
+    else:
+        assert np.all(infos["timestep"][1:] == [5, 7])
+        assert np.all(obs[1:] == [[5], [7]])
+    envs.close()
+
+
+def _action_step_func(self, action):
+    self.timestep += 1
+    return action, 0, self.timestep % 3 == 0, False, {}
+
+
+def _action_reset_func(self, seed=None, options=None):
+    self.timestep = 0
+    return 0, {}
+
+
+@pytest.mark.parametrize(
+    "autoreset_mode", [AutoresetMode.NEXT_STEP, AutoresetMode.SAME_STEP]
+)
+def test_sticky_action(
+    autoreset_mode: AutoresetMode, num_envs: int = 4, num_steps: int = 60
+):
+    """Tests the sticky actions of the sub-environments, i.e., the first action of every episode isn't sticky."""
+
+    def make_envs():
+        return StickyAction(
+            SyncVectorEnv(
+                [
+                    lambda: GenericTestEnv(
+                        action_space=Discrete(5),
+                        observation_space=Discrete(5),
+                        step_func=_action_step_func,
+                        reset_func=_action_reset_func,
+                    )
+                    for _ in range(num_envs)
+                ],
+                autoreset_mode=autoreset_mode,
+            ),
+            repeat_action_probability=0.5,
+            repeat_action_duration=(1, 2),
+        )
+
+    envs, other_envs = make_envs(), make_envs()
+    envs.reset(seed=123)
+    other_envs.reset(seed=123)
+
+    rng = np.random.default_rng(123)
+    last_actions = np.zeros(num_envs, dtype=np.int64)
+    num_sticky_actions = 0
+    for _ in range(num_steps):
+        actions = rng.integers(0, 5, size=num_envs)
+        taken_actions = envs.actions(np.copy(actions))
+        assert np.all(taken_actions == other_envs.actions(np.copy(actions)))
+        assert np.all((taken_actions == actions) | (taken_actions == last_actions))
+        num_sticky_actions += np.sum(taken_actions != actions)
+        last_actions = taken_actions
+    assert num_sticky_actions > 0
+
+    envs.reset(seed=123)
+    for i in range(num_steps):
+        actions = rng.integers(0, 5, size=num_envs)
+        first_actions = np.logical_not(envs.has_last_actions)
+        if autoreset_mode == AutoresetMode.NEXT_STEP:
+            # The sub-environments being reset ignore the actions
+            first_actions &= np.logical_not(envs._prev_dones)
+        obs, _, terminations, _, _ = envs.step(actions)
+
+        # After a reset, the first action of the episode is never sticky
+        if autoreset_mode == AutoresetMode.SAME_STEP:
+            first_actions &= np.logical_not(terminations)
+        assert np.all(obs[first_actions] == actions[first_actions])
+
+    envs.close()
+    other_envs.close()
@@ -0,0 +1,181 @@
+"""Test suite for the vector TimeLimit wrapper."""
+
+import numpy as np
+import pytest
+
+import gymnasium as gym
+from gymnasium.utils.env_checker import data_equivalence
+from gymnasium.vector import AsyncVectorEnv, SyncVectorEnv, VectorEnv
+from gymnasium.vector.vector_env import AutoresetMode
+from gymnasium.wrappers import vector
+from tests.wrappers.utils import has_wrapper
+
+
+class _NoAutoresetVectorEnv(VectorEnv):
+    """A vector environment that doesn't implement `autoreset_next_step`."""
+
+    metadata = {"autoreset_mode": AutoresetMode.NEXT_STEP}
+
+    def __init__(self, num_envs: int = 2):
+        self.num_envs = num_envs
+        self.single_observation_space = gym.spaces.Box(0, 1)
+        self.single_action_space = gym.spaces.Discrete(2)
+        self.observation_space = gym.vector.utils.batch_space(
+            self.single_observation_space, num_envs
+        )
+        self.action_space = gym.vector.utils.batch_space(
+            self.single_action_space, num_envs
+        )
+
+
+@pytest.mark.parametrize("vectorization_mode", ["sync", "async", "threaded"])
+@pytest.mark.parametrize(
+    "autoreset_mode", [AutoresetMode.NEXT_STEP, AutoresetMode.DISABLED]
+)
+def test_vector_time_limit_equivalence(
+    vectorization_mode, autoreset_mode, num_envs=3, num_steps=60
+):
+    """Tests that the vector `TimeLimit` equals the `TimeLimit` of each sub-environment over several episodes."""
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode=vectorization_mode,
+        vector_kwargs={"autoreset_mode": autoreset_mode},
+        vector_time_limit=True,
+        max_episode_steps=7,
+    )
+    sub_env_time_limit_envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=num_envs,
+        vectorization_mode=vectorization_mode,
+        vector_kwargs={"autoreset_mode": autoreset_mode},
+        max_episode_steps=7,
+    )
+    assert isinstance(envs, vector.TimeLimit)
+    if vectorization_mode != "async":
+        assert not any(
+            has_wrapper(env, gym.wrappers.TimeLimit) for env in envs.env.envs
+        )
+        assert all(
+            has_wrapper(env, gym.wrappers.TimeLimit)
+            for env in sub_env_time_limit_envs.envs
+        )
+
+    assert data_equivalence(
+        envs.reset(seed=123), sub_env_time_limit_envs.reset(seed=123)
+    )
+    num_truncations = 0
+    for i in range(num_steps):
+        actions = np.arange(i, i + num_envs) % 2
+        step = envs.step(actions)
+        assert data_equivalence(step, sub_env_time_limit_envs.step(actions))
+
+        dones = step[2] | step[3]
+        num_truncations += np.sum(step[3])
+        if autoreset_mode == AutoresetMode.DISABLED and np.any(dones):
+            assert data_equivalence(
+                envs.reset(options={"reset_mask": dones}),
+                sub_env_time_limit_envs.reset(options={"reset_mask": dones}),
+            )
+    assert num_truncations > num_envs
+
+    envs.close()
+    sub_env_time_limit_envs.close()
+
+
+def test_vector_time_limit_elapsed_steps():
+    """Tests the elapsed steps of the sub-environments with partial resets."""
+    envs = vector.TimeLimit(
+        gym.make_vec(
+            "CartPole-v1",
+            num_envs=2,
+            vectorization_mode="sync",
+            vector_kwargs={"autoreset_mode": AutoresetMode.DISABLED},
+            max_episode_steps=-1,
+        ),
+        max_episode_steps=3,
+    )
+    envs.reset(seed=123)
+    for _ in range(2):
+        _, _, _, truncations, _ = envs.step(np.array([0, 1]))
+    assert np.all(envs.elapsed_steps == 2) and not np.any(truncations)
+
+    envs.reset(options={"reset_mask": np.array([True, False])})
+    assert np.all(envs.elapsed_steps == [0, 2])
+    _, _, _, truncations, _ = envs.step(np.array([0, 1]))
+    assert np.all(truncations == [False, True])
+    envs.close()
+
+
+@pytest.mark.parametrize(
+    "env_fn",
+    [
+        lambda: gym.make_vec(
+            "CartPole-v1",
+            num_envs=2,
+            vectorization_mode="vector_entry_point",
+        ),
+        lambda: vector.RecordEpisodeStatistics(
+            gym.make_vec(
+                "CartPole-v1",
+                num_envs=2,
+                vectorization_mode="sync",
+                max_episode_steps=-1,
+            )
+        ),
+    ],
+)
+def test_vector_time_limit_autoreset_next_step(env_fn, max_episode_steps=3):
+    """Tests that the sub-environments truncated by the vector `TimeLimit` are autoreset on the next step through `autoreset_next_step`."""
+    envs = vector.TimeLimit(env_fn(), max_episode_steps=max_episode_steps)
+    envs.reset(seed=123)
+    for _ in range(max_episode_steps):
+        obs, rewards, terminations, truncations, _ = envs.step(np.array([0, 1]))
+    assert np.all(truncations) and not np.any(terminations)
+    assert np.all(envs.elapsed_steps == max_episode_steps)
+
+    # The autoreset step of the truncated sub-environments
+    autoreset_obs, rewards, terminations, truncations, _ = envs.step(np.array([0, 1]))
+    assert np.all(rewards == 0) and not np.any(terminations | truncations)
+    assert np.all(np.abs(autoreset_obs) <= 0.05)
+    assert np.all(envs.elapsed_steps == 0)
+
+    _, _, _, truncations, _ = envs.step(np.array([0, 1]))
+    assert not np.any(truncations) and np.all(envs.elapsed_steps == 1)
+    envs.close()
+
+
+def test_vector_time_limit_unsupported():
+    """Tests that the vector `TimeLimit` raises for the environments it can't support, and `make_vec` falls back to the sub-environments."""
+    with pytest.raises(ValueError, match="doesn't support `AutoresetMode.SAME_STEP`"):
+        vector.TimeLimit(
+            gym.make_vec(
+                "CartPole-v1",
+                vectorization_mode="sync",
+                vector_kwargs={"autoreset_mode": AutoresetMode.SAME_STEP},
+            ),
+            max_episode_steps=5,
+        )
+    with pytest.raises(ValueError, match="implement `VectorEnv.autoreset_next_step`"):
+        vector.TimeLimit(_NoAutoresetVectorEnv(), max_episode_steps=5)
+
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=2,
+        vectorization_mode="async",
+        vector_kwargs={"autoreset_mode": AutoresetMode.SAME_STEP},
+        vector_time_limit=True,
+    )
+    assert isinstance(envs, AsyncVectorEnv)
+    envs.close()
+
+    envs = gym.make_vec(
+        "CartPole-v1",
+        num_envs=2,
+        vectorization_mode="sync",
+        wrappers=(gym.wrappers.RecordEpisodeStatistics,),
+        vector_time_limit=True,
+    )
+    assert isinstance(envs, SyncVectorEnv)
+    assert all(has_wrapper(env, gym.wrappers.TimeLimit) for env in envs.envs)
+    envs.close()
@@ -59,9 +59,9 @@ def custom_environments():
         ),
         ("CarRacing-v3", "DtypeObservation", {"dtype": np.int32}),
         # ("CartPole-v1", "RenderObservation", {}),  # not implemented
-        # ("CartPole-v1", "TimeAwareObservation", {}),  # not implemented
+        ("CartPole-v1", "TimeAwareObservation", {}),
         # ("CartPole-v1", "FrameStackObservation", {}),  # not implemented
-        # ("CartPole-v1", "DelayObservation", {}),  # not implemented
+        ("CartPole-v1", "DelayObservation", {"delay": 3}),
         ("MountainCarContinuous-v0", "ClipAction", {}),
         (
             "MountainCarContinuous-v0",